@@ -332,14 +332,19 @@ class LabLinkClient:
         )
 
     async def start_acquisition_stream(
-        self, acquisition_id: str, interval_ms: int = 100, num_samples: int = 100
+        self,
+        acquisition_id: str,
+        interval_ms: int = 100,
+        num_samples: int = 100,
+        format: str = "binary",
     ):
         """Start streaming acquisition data.
 
         Args:
             acquisition_id: Acquisition session ID
             interval_ms: Update interval in milliseconds
-            num_samples: Number of samples per update
+            num_samples: Latest samples sent when the stream starts
+            format: "binary" (NumPy arrays) or "json"
         """
         if not self.ws_manager:
             raise RuntimeError("WebSocket manager not available")
@@ -348,6 +353,7 @@ class LabLinkClient:
             acquisition_id=acquisition_id,
             interval_ms=interval_ms,
             num_samples=num_samples,
+            format=format,
         )
 
     async def stop_acquisition_stream(self, acquisition_id: str):
@@ -734,7 +740,7 @@ class LabLinkClient:
 
         Args:
             acquisition_id: Acquisition session ID
-            format: Export format (csv, hdf5, npy, json)
+            format: Export format (csv, hdf5, npy, json, parquet)
             filepath: Optional file path for export
 
         Returns:
@@ -51,6 +51,7 @@ class ExportFormat(str, Enum):
     HDF5 = "hdf5"
     NUMPY = "npy"
     JSON = "json"
+    PARQUET = "parquet"
 
 
 class TrendType(str, Enum):
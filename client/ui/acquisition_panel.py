@@ -948,7 +948,7 @@ Samples Collected: {session.get('sample_count', 0)}
                 self,
                 "Export Acquisition Data",
                 "",
-                "CSV Files (*.csv);;HDF5 Files (*.h5);;NumPy Files (*.npy);;JSON Files (*.json)",
+                "CSV Files (*.csv);;HDF5 Files (*.h5);;NumPy Files (*.npy);;JSON Files (*.json);;Parquet Files (*.parquet)",
             )
 
             if filename:
@@ -959,6 +959,8 @@ Samples Collected: {session.get('sample_count', 0)}
                     fmt = "hdf5"
                 elif filename.endswith(".npy"):
                     fmt = "npy"
+                elif filename.endswith(".parquet"):
+                    fmt = "parquet"
                 else:
                     fmt = "json"
 
@@ -3,10 +3,13 @@
 import asyncio
 import json
 import logging
+import struct
 from dataclasses import dataclass
 from enum import Enum
 from typing import Any, Callable, Dict, List, Optional
 
+import numpy as np
+
 try:
     import websockets
     from websockets.client import WebSocketClientProtocol
@@ -16,6 +19,69 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Binary acquisition frames (layout documented in server/websocket/frames.py)
+FRAME_MAGIC = b"LLAF"
+FRAME_VERSION = 1
+_FRAME_HEADER = struct.Struct("<4sBBBBIH2xId")
+_FRAME_DTYPES = {1: np.dtype("<f4"), 2: np.dtype("<f8")}
+
+
+def decode_acquisition_frame(frame: bytes) -> Dict[str, Any]:
+    """Decode a binary acquisition frame into an acquisition_stream message.
+
+    The message matches the JSON form, except that data["timestamps"] is a
+    float64 array of Unix timestamps and data["values"] maps each channel to
+    a read-only array viewing the frame.
+
+    Args:
+        frame: Binary WebSocket message
+
+    Returns:
+        Decoded message
+
+    Raises:
+        ValueError: If the frame is not an acquisition frame of a known version
+    """
+    (
+        magic,
+        version,
+        time_code,
+        value_code,
+        _,
+        meta_len,
+        num_channels,
+        num_samples,
+        t0,
+    ) = _FRAME_HEADER.unpack_from(frame, 0)
+    if magic != FRAME_MAGIC or version != FRAME_VERSION:
+        raise ValueError(
+            f"Not an acquisition frame (magic {magic!r}, version {version})"
+        )
+
+    meta_end = _FRAME_HEADER.size + meta_len
+    message = json.loads(frame[_FRAME_HEADER.size : meta_end])
+    if num_samples == 0:
+        message["data"] = None
+        return message
+
+    time_dtype = _FRAME_DTYPES[time_code]
+    time_offset = (meta_end + 7) & ~7
+    values_offset = time_offset + num_samples * time_dtype.itemsize
+
+    offsets = np.frombuffer(frame, time_dtype, num_samples, time_offset)
+    values = np.frombuffer(
+        frame, _FRAME_DTYPES[value_code], num_channels * num_samples, values_offset
+    ).reshape(num_channels, num_samples)
+
+    message["data"] = {
+        "timestamps": t0 + offsets.astype(np.float64),
+        "values": {
+            channel: values[i] for i, channel in enumerate(message["channels"])
+        },
+        "count": num_samples,
+    }
+    return message
+
 
 class StreamType(str, Enum):
     """Types of data streams."""
@@ -33,6 +99,7 @@ class MessageType(str, Enum):
     STOP_STREAM = "stop_stream"
     START_ACQUISITION_STREAM = "start_acquisition_stream"
     STOP_ACQUISITION_STREAM = "stop_acquisition_stream"
+    RESYNC_ACQUISITION_STREAM = "resync_acquisition_stream"
     PING = "ping"
 
     # Server -> Client
@@ -110,10 +177,16 @@ class WebSocketManager:
         # Active streams tracking
         self._active_streams: Dict[str, StreamConfig] = {}
 
+        # Acquisition stream positions: next expected sample sequence per
+        # acquisition, and acquisitions waiting for a resync answer
+        self._acquisition_sequences: Dict[str, int] = {}
+        self._acquisition_resyncing: set = set()
+
         # Statistics
         self.messages_received = 0
         self.messages_sent = 0
         self.errors = 0
+        self.acquisition_resyncs = 0
 
     # ==================== Connection Management ====================
 
@@ -199,10 +272,13 @@ class WebSocketManager:
             async for message in self._connection:
                 try:
                     self.messages_received += 1
-                    data = json.loads(message)
+                    if isinstance(message, bytes):
+                        data = decode_acquisition_frame(message)
+                    else:
+                        data = json.loads(message)
                     await self._handle_message(data)
 
-                except json.JSONDecodeError as e:
+                except (json.JSONDecodeError, ValueError) as e:
                     logger.error(f"Failed to decode message: {e}")
                     self.errors += 1
 
@@ -269,38 +345,90 @@ class WebSocketManager:
         """
         msg_type = data.get("type")
 
+        if msg_type == MessageType.ACQUISITION_STREAM:
+            if not await self._check_acquisition_sequence(data):
+                return
+
         # Call specific handlers
-        if msg_type in self._message_handlers:
-            for handler in self._message_handlers[msg_type]:
-                try:
-                    # Check if handler is async
-                    if asyncio.iscoroutinefunction(handler):
-                        await handler(data)
-                    else:
-                        handler(data)
-                except Exception as e:
-                    logger.error(f"Error in message handler: {e}")
+        await self._call_handlers(
+            self._message_handlers.get(msg_type, []), data, "message"
+        )
 
         # Call stream data handlers for stream_data messages
         if msg_type == "stream_data":
-            for handler in self._stream_data_handlers:
-                try:
-                    if asyncio.iscoroutinefunction(handler):
-                        await handler(data)
-                    else:
-                        handler(data)
-                except Exception as e:
-                    logger.error(f"Error in stream data handler: {e}")
+            await self._call_handlers(self._stream_data_handlers, data, "stream data")
 
         # Call generic handlers
-        for handler in self._generic_callbacks:
+        await self._call_handlers(self._generic_callbacks, data, "generic")
+
+    @staticmethod
+    async def _call_handlers(handlers, data: Dict[str, Any], kind: str):
+        """Call sync or async handlers in order, logging their errors.
+
+        Args:
+            handlers: Handlers to call with the message
+            data: Parsed message data
+            kind: Handler kind for error messages
+        """
+        for handler in handlers:
             try:
+                # Check if handler is async
                 if asyncio.iscoroutinefunction(handler):
                     await handler(data)
                 else:
                     handler(data)
             except Exception as e:
-                logger.error(f"Error in generic handler: {e}")
+                logger.error(f"Error in {kind} handler: {e}")
+
+    async def _check_acquisition_sequence(self, data: Dict[str, Any]) -> bool:
+        """Track the stream position of an acquisition update.
+
+        Updates carry only new samples, so a missed update leaves a hole.
+        When an update does not start where the previous one ended, ask the
+        server to resend from the expected sample, and drop updates until
+        the answer arrives.
+
+        Args:
+            data: acquisition_stream message
+
+        Returns:
+            True if the update should be handled, False to drop it
+        """
+        acquisition_id = data.get("acquisition_id")
+        sequence = data.get("sequence")
+        if sequence is None:
+            # Server without stream positions
+            return True
+
+        if acquisition_id in self._acquisition_resyncing:
+            if not data.get("resync"):
+                return False  # Sent before the server saw the resync request
+            self._acquisition_resyncing.discard(acquisition_id)
+        else:
+            expected = self._acquisition_sequences.get(acquisition_id)
+            if expected is not None and sequence - data.get("gap", 0) != expected:
+                logger.warning(
+                    f"Missed acquisition updates for {acquisition_id} "
+                    f"(expected sample {expected}, got {sequence}); resyncing"
+                )
+                self._acquisition_resyncing.add(acquisition_id)
+                self.acquisition_resyncs += 1
+                await self._send_message(
+                    {
+                        "type": MessageType.RESYNC_ACQUISITION_STREAM,
+                        "acquisition_id": acquisition_id,
+                        "sequence": expected,
+                    }
+                )
+                return False
+
+        if data.get("gap"):
+            logger.warning(
+                f"{data['gap']} samples of {acquisition_id} were overwritten "
+                f"before they could be sent"
+            )
+        self._acquisition_sequences[acquisition_id] = data["next_sequence"]
+        return True
 
     async def _route_message(self, data: Dict[str, Any]):
         """Alias for _handle_message for backward compatibility.
@@ -402,22 +530,38 @@ class WebSocketManager:
     # ==================== Acquisition Streaming ====================
 
     async def start_acquisition_stream(
-        self, acquisition_id: str, interval_ms: int = 100, num_samples: int = 100
+        self,
+        acquisition_id: str,
+        interval_ms: int = 100,
+        num_samples: int = 100,
+        format: str = "binary",
+        timestamp_dtype: str = "float64",
     ):
         """Start streaming acquisition data.
 
         Args:
             acquisition_id: Acquisition session ID
             interval_ms: Update interval in milliseconds
-            num_samples: Number of samples to send per update
+            num_samples: Latest samples sent when the stream starts; later
+                updates carry only new samples
+            format: "binary" for columnar frames decoded into NumPy arrays,
+                or "json"
+            timestamp_dtype: Timestamp precision of binary frames
+                ("float64" or "float32")
         """
         message = {
             "type": MessageType.START_ACQUISITION_STREAM,
             "acquisition_id": acquisition_id,
             "interval_ms": interval_ms,
             "num_samples": num_samples,
+            "format": format,
+            "timestamp_dtype": timestamp_dtype,
         }
 
+        # The server starts a new stream from the latest samples
+        self._acquisition_sequences.pop(acquisition_id, None)
+        self._acquisition_resyncing.discard(acquisition_id)
+
         await self._send_message(message)
         logger.info(f"Started acquisition stream for {acquisition_id}")
 
@@ -433,6 +577,8 @@ class WebSocketManager:
         }
 
         await self._send_message(message)
+        self._acquisition_sequences.pop(acquisition_id, None)
+        self._acquisition_resyncing.discard(acquisition_id)
         logger.info(f"Stopped acquisition stream for {acquisition_id}")
 
     # ==================== Callback Registration ====================
@@ -567,6 +713,7 @@ class WebSocketManager:
             "messages_received": self.messages_received,
             "messages_sent": self.messages_sent,
             "errors": self.errors,
+            "acquisition_resyncs": self.acquisition_resyncs,
             "active_streams": len(self._active_streams),
             "stream_list": list(self._active_streams.keys()),
             "message_handlers": len(self._message_handlers),
@@ -1,16 +1,21 @@
 """Data acquisition subsystem."""
 
+from .export import ExportFormatUnavailable
 from .manager import acquisition_manager
 from .models import (AcquisitionConfig, AcquisitionMode, AcquisitionSession,
                      AcquisitionState, AcquisitionStats, CircularBuffer,
-                     DataPoint, ExportFormat, TriggerConfig, TriggerEdge,
-                     TriggerType)
-from .statistics import (DataQuality, FrequencyAnalysis, PeakInfo,
-                         RollingStats, StatisticsEngine, TrendAnalysis,
-                         TrendType, stats_engine)
-from .synchronization import (SyncConfig, SynchronizationGroup,
+                     DataPoint, ExportFormat, RunningStatistics, TimingPolicy,
+                     TriggerConfig, TriggerEdge, TriggerType)
+from .statistics import (DataQuality, FrequencyAnalysis, LiveAnalytics,
+                         PeakInfo, RollingStats, SlidingWindowStats,
+                         StatisticsEngine, TrendAnalysis, TrendType,
+                         stats_engine)
+from .synchronization import (AlignedData, ResampleMethod, SkewStats,
+                              SyncConfig, SynchronizationGroup,
                               SynchronizationManager, SyncState, SyncStatus,
                               sync_manager)
+from .tiered_buffer import TieredBuffer
+from .timing import DeadlineScheduler
 
 __all__ = [
     "AcquisitionMode",
@@ -18,12 +23,17 @@ __all__ = [
     "TriggerType",
     "TriggerEdge",
     "ExportFormat",
+    "ExportFormatUnavailable",
+    "TimingPolicy",
     "AcquisitionConfig",
     "TriggerConfig",
     "DataPoint",
     "AcquisitionStats",
     "AcquisitionSession",
     "CircularBuffer",
+    "RunningStatistics",
+    "TieredBuffer",
+    "DeadlineScheduler",
     "acquisition_manager",
     "TrendType",
     "RollingStats",
@@ -32,11 +42,16 @@ __all__ = [
     "DataQuality",
     "PeakInfo",
     "StatisticsEngine",
+    "SlidingWindowStats",
+    "LiveAnalytics",
     "stats_engine",
     "SyncState",
     "SyncConfig",
     "SyncStatus",
     "SynchronizationGroup",
     "SynchronizationManager",
+    "ResampleMethod",
+    "SkewStats",
+    "AlignedData",
     "sync_manager",
 ]
@@ -0,0 +1,327 @@
+"""Streaming exporters for acquisition data.
+
+Exporters consume the buffer in fixed-size chunks and are meant to run in a
+worker thread, so large sessions neither block the event loop nor need a
+second in-memory copy of the whole dataset.
+"""
+
+import csv
+import importlib.util
+import json
+import logging
+import zipfile
+from datetime import datetime
+from pathlib import Path
+from typing import IO, Iterable, Iterator, List, Tuple
+
+import numpy as np
+
+from .models import AcquisitionSession, ExportFormat
+
+logger = logging.getLogger(__name__)
+
+# Samples per channel written per chunk
+EXPORT_CHUNK_SIZE = 65536
+
+# Parquet column compression codec
+PARQUET_COMPRESSION = "zstd"
+
+Segment = Tuple[np.ndarray, np.ndarray]
+
+
+class ExportFormatUnavailable(RuntimeError):
+    """Raised when an export format's optional dependency is not installed."""
+
+
+def check_format_available(format: ExportFormat):
+    """
+    Check that the libraries a format needs are installed.
+
+    Raises:
+        ExportFormatUnavailable: If the format cannot be written
+    """
+    if format == ExportFormat.PARQUET and importlib.util.find_spec("pyarrow") is None:
+        raise ExportFormatUnavailable(
+            "Parquet export requires pyarrow (pip install pyarrow)"
+        )
+
+
+def export_segments(
+    format: ExportFormat,
+    filepath: Path,
+    session: AcquisitionSession,
+    segments: List[Segment],
+    chunk_size: int = EXPORT_CHUNK_SIZE,
+) -> Path:
+    """
+    Write buffered acquisition data to a file.
+
+    Args:
+        format: Export format
+        filepath: Destination path
+        session: Session the data belongs to
+        segments: Chronological (data, timestamps) segments, as returned by
+            CircularBuffer.snapshot()
+        chunk_size: Maximum samples per channel written at once
+
+    Returns:
+        Path of the written file (may differ from filepath when the format
+        dictates a suffix or falls back to another format)
+    """
+    if format == ExportFormat.CSV:
+        _write_csv(filepath, session, segments, chunk_size)
+    elif format == ExportFormat.NUMPY:
+        filepath = _npz_path(filepath)
+        _write_numpy(filepath, session, segments, chunk_size)
+    elif format == ExportFormat.JSON:
+        _write_json(filepath, session, segments, chunk_size)
+    elif format == ExportFormat.HDF5:
+        filepath = _write_hdf5(filepath, session, segments, chunk_size)
+    elif format == ExportFormat.PARQUET:
+        filepath = _write_parquet(filepath, session, segments, chunk_size)
+
+    return filepath
+
+
+def format_timestamps(timestamps: np.ndarray) -> np.ndarray:
+    """
+    Format Unix timestamps as local-time ISO 8601 strings.
+
+    Vectorized equivalent of ``datetime.fromtimestamp(t).isoformat()`` that
+    always includes microseconds.
+    """
+    timestamps = np.asarray(timestamps, dtype=np.float64)
+    if timestamps.size == 0:
+        return np.array([], dtype=str)
+
+    first = datetime.fromtimestamp(timestamps[0]).astimezone().utcoffset()
+    last = datetime.fromtimestamp(timestamps[-1]).astimezone().utcoffset()
+
+    if first != last:
+        # Chunk straddles a UTC offset change; format each sample
+        return np.array(
+            [
+                datetime.fromtimestamp(t).isoformat(timespec="microseconds")
+                for t in timestamps
+            ]
+        )
+
+    micros = np.round(timestamps * 1e6).astype(np.int64)
+    micros += int(first.total_seconds() * 1e6)
+    return np.datetime_as_string(micros.astype("datetime64[us]"), unit="us")
+
+
+def _iter_chunks(segments: Iterable[Segment], chunk_size: int) -> Iterator[Segment]:
+    """Split segments into chunks of at most chunk_size samples."""
+    for data, timestamps in segments:
+        for start in range(0, len(timestamps), chunk_size):
+            end = start + chunk_size
+            yield data[:, start:end], timestamps[start:end]
+
+
+def _npz_path(filepath: Path) -> Path:
+    """Apply np.savez's naming rule of appending .npz when missing."""
+    if filepath.name.endswith(".npz"):
+        return filepath
+    return filepath.with_name(filepath.name + ".npz")
+
+
+def _write_csv(
+    filepath: Path, session: AcquisitionSession, segments: List[Segment], chunk_size
+):
+    """Export to CSV format."""
+    with open(filepath, "w", newline="") as f:
+        writer = csv.writer(f)
+
+        # Header
+        writer.writerow(["timestamp"] + session.config.channels)
+
+        # Data, formatted one chunk at a time
+        for data, timestamps in _iter_chunks(segments, chunk_size):
+            columns = [format_timestamps(timestamps)] + [row.astype(str) for row in data]
+            f.write("\r\n".join(map(",".join, zip(*columns))))
+            f.write("\r\n")
+
+
+def _write_json_array(f: IO[str], chunks: Iterable[list]):
+    """Write JSON array items chunk by chunk (without the brackets)."""
+    first = True
+    for items in chunks:
+        if not items:
+            continue
+        if not first:
+            f.write(",")
+        f.write(json.dumps(items, separators=(",", ":"))[1:-1])
+        first = False
+
+
+def _write_json(
+    filepath: Path, session: AcquisitionSession, segments: List[Segment], chunk_size
+):
+    """Export to compact JSON format."""
+    header = {
+        "acquisition_id": session.acquisition_id,
+        "equipment_id": session.equipment_id,
+        "config": session.config.dict(),
+        "stats": session.stats.dict(),
+    }
+
+    with open(filepath, "w") as f:
+        # Header object without its closing brace, then the data member
+        f.write(json.dumps(header, default=str, separators=(",", ":"))[:-1])
+        f.write(',"data":{"timestamps":[')
+        _write_json_array(
+            f,
+            (
+                format_timestamps(timestamps).tolist()
+                for _, timestamps in _iter_chunks(segments, chunk_size)
+            ),
+        )
+        f.write('],"channels":{')
+
+        for i, channel in enumerate(session.config.channels):
+            if i:
+                f.write(",")
+            f.write(json.dumps(channel) + ":[")
+            _write_json_array(
+                f, (data[i].tolist() for data, _ in _iter_chunks(segments, chunk_size))
+            )
+            f.write("]")
+
+        f.write("}}}")
+
+
+def _write_npy_member(
+    archive: zipfile.ZipFile, name: str, shape: tuple, pieces: Iterable[np.ndarray]
+):
+    """Stream a float64 array into an .npz archive member in C order."""
+    header = {
+        "descr": np.lib.format.dtype_to_descr(np.dtype(np.float64)),
+        "fortran_order": False,
+        "shape": shape,
+    }
+
+    with archive.open(f"{name}.npy", "w", force_zip64=True) as f:
+        np.lib.format.write_array_header_1_0(f, header)
+        for piece in pieces:
+            f.write(np.ascontiguousarray(piece, dtype=np.float64).tobytes())
+
+
+def _write_numpy(
+    filepath: Path, session: AcquisitionSession, segments: List[Segment], chunk_size
+):
+    """Export to NumPy .npz format, compatible with np.load."""
+    channels = session.config.channels
+    total = sum(len(timestamps) for _, timestamps in segments)
+
+    with zipfile.ZipFile(filepath, "w", zipfile.ZIP_STORED, allowZip64=True) as archive:
+        # (channels, samples) in C order is each channel's samples in turn
+        _write_npy_member(
+            archive,
+            "data",
+            (len(channels), total),
+            (
+                data[i]
+                for i in range(len(channels))
+                for data, _ in _iter_chunks(segments, chunk_size)
+            ),
+        )
+        _write_npy_member(
+            archive,
+            "timestamps",
+            (total,),
+            (timestamps for _, timestamps in _iter_chunks(segments, chunk_size)),
+        )
+
+        with archive.open("channels.npy", "w", force_zip64=True) as f:
+            np.lib.format.write_array(f, np.array(channels))
+        with archive.open("metadata.npy", "w", force_zip64=True) as f:
+            np.lib.format.write_array(f, np.array(session.config.metadata))
+
+
+def _write_hdf5(
+    filepath: Path, session: AcquisitionSession, segments: List[Segment], chunk_size
+) -> Path:
+    """Export to HDF5 format using chunked, resizable datasets."""
+    try:
+        import h5py
+    except ImportError:
+        logger.warning("h5py not installed, falling back to NumPy format")
+        filepath = filepath.with_suffix(".npz")
+        _write_numpy(filepath, session, segments, chunk_size)
+        return filepath
+
+    with h5py.File(filepath, "w") as f:
+        # Create groups
+        config_group = f.create_group("config")
+        stats_group = f.create_group("stats")
+        data_group = f.create_group("data")
+
+        # Store config
+        config_group.attrs["acquisition_id"] = session.acquisition_id
+        config_group.attrs["equipment_id"] = session.equipment_id
+        config_group.attrs["mode"] = session.config.mode.value
+        config_group.attrs["sample_rate"] = session.config.sample_rate
+
+        # Store stats
+        stats_group.attrs["total_samples"] = session.stats.total_samples
+        stats_group.attrs["duration_seconds"] = session.stats.duration_seconds or 0
+
+        # Store data, growing each dataset one chunk at a time
+        names = ["timestamps"] + list(session.config.channels)
+        datasets = [
+            data_group.create_dataset(
+                name,
+                shape=(0,),
+                maxshape=(None,),
+                chunks=(chunk_size,),
+                dtype=np.float64,
+            )
+            for name in names
+        ]
+
+        written = 0
+        for data, timestamps in _iter_chunks(segments, chunk_size):
+            end = written + len(timestamps)
+            for dataset, values in zip(datasets, [timestamps, *data]):
+                dataset.resize((end,))
+                dataset[written:end] = values
+            written = end
+
+    return filepath
+
+
+def _write_parquet(
+    filepath: Path, session: AcquisitionSession, segments: List[Segment], chunk_size
+) -> Path:
+    """
+    Export to Parquet format with one column per channel.
+
+    Each chunk becomes a row group. Session details are stored as JSON under
+    the "lablink" key of the schema metadata.
+    """
+    check_format_available(ExportFormat.PARQUET)
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    channels = session.config.channels
+    metadata = {
+        "acquisition_id": session.acquisition_id,
+        "equipment_id": session.equipment_id,
+        "config": session.config.dict(),
+        "stats": session.stats.dict(),
+    }
+    schema = pa.schema(
+        [pa.field("timestamp", pa.timestamp("us", tz="UTC"))]
+        + [pa.field(channel, pa.float64()) for channel in channels],
+        metadata={"lablink": json.dumps(metadata, default=str)},
+    )
+
+    with pq.ParquetWriter(filepath, schema, compression=PARQUET_COMPRESSION) as writer:
+        for data, timestamps in _iter_chunks(segments, chunk_size):
+            micros = np.round(timestamps * 1e6).astype(np.int64)
+            columns = [pa.array(micros, type=pa.int64()).cast(schema.field(0).type)]
+            columns += [pa.array(row, type=pa.float64()) for row in data]
+            writer.write_batch(pa.record_batch(columns, schema=schema))
+
+    return filepath
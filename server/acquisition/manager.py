@@ -1,18 +1,21 @@
 """Data acquisition manager for coordinating data collection."""
 
 import asyncio
-import csv
-import json
 import logging
+import tempfile
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 
+from .export import check_format_available, export_segments
 from .models import (AcquisitionConfig, AcquisitionMode, AcquisitionSession,
                      AcquisitionState, CircularBuffer, DataPoint, ExportFormat,
                      TriggerEdge, TriggerType)
+from .statistics import LiveAnalytics
+from .tiered_buffer import TieredBuffer
+from .timing import DeadlineScheduler
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +27,7 @@ class AcquisitionManager:
         self._sessions: Dict[str, AcquisitionSession] = {}
         self._buffers: Dict[str, CircularBuffer] = {}
         self._tasks: Dict[str, asyncio.Task] = {}
+        self._analytics: Dict[str, LiveAnalytics] = {}
         self._export_dir: Optional[Path] = None
 
     def set_export_directory(self, directory: str):
@@ -55,14 +59,27 @@ class AcquisitionManager:
             state=AcquisitionState.IDLE,
         )
 
-        # Create circular buffer
-        buffer = CircularBuffer(
-            size=config.buffer_size, num_channels=len(config.channels)
-        )
+        # Create buffer, spilling to disk for long-running sessions
+        if config.spill_to_disk:
+            spill_dir = (
+                Path(config.spill_directory)
+                if config.spill_directory
+                else Path(tempfile.gettempdir()) / "lablink_acquisition"
+            )
+            buffer = TieredBuffer(
+                size=config.buffer_size,
+                num_channels=len(config.channels),
+                spill_path=str(spill_dir / f"{acquisition_id}.spill"),
+            )
+        else:
+            buffer = CircularBuffer(
+                size=config.buffer_size, num_channels=len(config.channels)
+            )
 
         # Store session and buffer
         self._sessions[acquisition_id] = session
         self._buffers[acquisition_id] = buffer
+        self._analytics[acquisition_id] = LiveAnalytics(buffer)
 
         logger.info(
             f"Created acquisition session {acquisition_id} for {config.equipment_id}"
@@ -187,6 +204,7 @@ class AcquisitionManager:
         session = self._sessions[acquisition_id]
         config = session.config
         buffer = self._buffers[acquisition_id]
+        scheduler: Optional[DeadlineScheduler] = None
 
         try:
             # Wait for trigger if needed
@@ -195,8 +213,18 @@ class AcquisitionManager:
 
             session.state = AcquisitionState.ACQUIRING
 
-            # Calculate sleep time based on sample rate
-            sleep_time = 1.0 / config.sample_rate
+            # Use driver block reads when requested; each deadline then
+            # covers a whole block of samples
+            block_size = config.block_size if hasattr(equipment, "read_block") else None
+
+            # Schedule samples on an absolute time grid so instrument latency
+            # doesn't accumulate into the sample period
+            scheduler = DeadlineScheduler(
+                (block_size or 1) / config.sample_rate, config.timing_policy
+            )
+
+            # Bounds concurrent per-channel reads when no batch read exists
+            read_semaphore = asyncio.Semaphore(config.max_concurrent_reads)
 
             samples_acquired = 0
 
@@ -208,29 +236,56 @@ class AcquisitionManager:
                 # Skip if paused
                 if session.state == AcquisitionState.PAUSED:
                     await asyncio.sleep(0.1)
+                    scheduler.reset()
                     continue
 
-                # Acquire data
-                timestamp = datetime.now().timestamp()
-                values = []
+                # Wait for the next sample deadline
+                await scheduler.wait()
+
+                if block_size:
+                    block = await self._read_block(
+                        equipment, config.channels, block_size, config.sample_rate
+                    )
 
-                for channel in config.channels:
-                    try:
-                        # Get measurement from equipment
-                        value = await self._get_channel_value(equipment, channel)
-                        values.append(value)
-                    except Exception as e:
-                        logger.error(f"Error reading channel {channel}: {e}")
-                        values.append(np.nan)
+                    if block is None:
+                        # Driver doesn't support block reads after all
+                        logger.info(
+                            f"Block reads unsupported for {config.equipment_id}, "
+                            f"falling back to point-by-point acquisition"
+                        )
+                        block_size = None
+                        scheduler = DeadlineScheduler(
+                            1.0 / config.sample_rate, config.timing_policy
+                        )
+                        continue
+
+                    data, timestamps = block
+
+                    # Don't overshoot a single-shot sample count
+                    if config.mode == AcquisitionMode.SINGLE_SHOT and config.num_samples:
+                        remaining = config.num_samples - samples_acquired
+                        data = data[:, :remaining]
+                        timestamps = timestamps[:remaining]
+
+                    buffer.add_many(data, timestamps)
+                    samples_acquired += len(timestamps)
+                else:
+                    # Acquire data
+                    timestamp = datetime.now().timestamp()
+                    values = await self._read_channels(
+                        equipment, config.channels, read_semaphore
+                    )
 
-                # Add to buffer
-                buffer.add(values, timestamp)
+                    # Add to buffer
+                    buffer.add(values, timestamp)
+                    samples_acquired += 1
 
                 # Update stats
-                samples_acquired += 1
                 session.stats.total_samples = samples_acquired
                 for i, channel in enumerate(config.channels):
                     session.stats.samples_per_channel[channel] = samples_acquired
+                self._update_summary_stats(session, buffer)
+                session.stats.buffer_overruns = buffer.overruns
 
                 # Check if we've reached the target number of samples
                 if config.mode == AcquisitionMode.SINGLE_SHOT:
@@ -247,8 +302,9 @@ class AcquisitionManager:
                         )
                         break
 
-                # Sleep until next sample
-                await asyncio.sleep(sleep_time)
+                # Schedule next sample and publish timing stats
+                scheduler.advance()
+                self._update_timing_stats(session, scheduler)
 
         except asyncio.CancelledError:
             logger.info(f"Acquisition {acquisition_id} cancelled")
@@ -272,16 +328,34 @@ class AcquisitionManager:
                         session.stats.total_samples / session.stats.duration_seconds
                     )
 
-            # Calculate min/max/mean
-            if buffer.count > 0:
-                data, _ = buffer.get_all()
-                for i, channel in enumerate(config.channels):
-                    channel_data = data[i, :]
-                    session.stats.min_values[channel] = float(np.nanmin(channel_data))
-                    session.stats.max_values[channel] = float(np.nanmax(channel_data))
-                    session.stats.mean_values[channel] = float(np.nanmean(channel_data))
+            self._update_summary_stats(session, buffer)
 
             session.stats.buffer_overruns = buffer.overruns
+            session.stats.spilled_samples = getattr(buffer, "spilled", 0)
+
+            if scheduler is not None:
+                self._update_timing_stats(session, scheduler)
+
+    def _update_summary_stats(
+        self, session: AcquisitionSession, buffer: CircularBuffer
+    ):
+        """Copy per-channel running min/max/mean/std into the session."""
+        running = buffer.running
+        std = running.std
+
+        for i, channel in enumerate(session.config.channels):
+            if running.count[i] == 0:
+                continue
+            session.stats.min_values[channel] = float(running.min[i])
+            session.stats.max_values[channel] = float(running.max[i])
+            session.stats.mean_values[channel] = float(running.mean[i])
+            session.stats.std_values[channel] = float(std[i])
+
+    def _update_timing_stats(self, session: AcquisitionSession, scheduler):
+        """Copy sample timing statistics from the scheduler into the session."""
+        session.stats.missed_deadlines = scheduler.missed_deadlines
+        session.stats.mean_jitter_ms = scheduler.mean_lateness * 1000.0
+        session.stats.max_jitter_ms = scheduler.max_lateness * 1000.0
 
     async def _wait_for_trigger(self, acquisition_id: str, equipment):
         """Wait for trigger condition."""
@@ -339,6 +413,71 @@ class AcquisitionManager:
 
                 await asyncio.sleep(0.1)  # Check every 100ms
 
+    async def _read_channels(
+        self, equipment, channels: List[str], semaphore: asyncio.Semaphore
+    ) -> List[float]:
+        """Read one sample from every channel, using the cheapest path available.
+
+        Drivers that implement ``read_channels`` are read in a single batched
+        transaction. Otherwise channels are read individually, concurrently
+        (bounded by ``semaphore``) if the driver allows it, else one by one.
+        Channels that fail to read are recorded as NaN.
+        """
+        if hasattr(equipment, "read_channels"):
+            try:
+                values = await equipment.read_channels(channels)
+                if values is not None:
+                    return [float(value) for value in values]
+            except Exception as e:
+                logger.error(f"Error reading channels {channels}: {e}")
+                return [np.nan] * len(channels)
+
+        if len(channels) > 1 and getattr(
+            equipment, "supports_concurrent_reads", False
+        ):
+
+            async def read_bounded(channel: str) -> float:
+                async with semaphore:
+                    return await self._read_channel_or_nan(equipment, channel)
+
+            return list(await asyncio.gather(*(read_bounded(c) for c in channels)))
+
+        return [
+            await self._read_channel_or_nan(equipment, channel) for channel in channels
+        ]
+
+    async def _read_block(
+        self, equipment, channels: List[str], n: int, sample_rate: float
+    ) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Read a block of samples from the driver.
+
+        Returns:
+            (data, timestamps) tuple, an empty block if the read failed, or
+            None if the driver doesn't support block reads
+        """
+        try:
+            block = await equipment.read_block(channels, n, sample_rate)
+        except Exception as e:
+            logger.warning(f"Block read failed: {e}")
+            return np.empty((len(channels), 0)), np.empty(0)
+
+        if block is None:
+            return None
+
+        data, timestamps = block
+        return np.asarray(data, dtype=np.float64), np.asarray(
+            timestamps, dtype=np.float64
+        )
+
+    async def _read_channel_or_nan(self, equipment, channel: str) -> float:
+        """Read a single channel, returning NaN on failure."""
+        try:
+            return await self._get_channel_value(equipment, channel)
+        except Exception as e:
+            logger.error(f"Error reading channel {channel}: {e}")
+            return np.nan
+
     async def _get_channel_value(self, equipment, channel: str) -> float:
         """Get current value from equipment channel."""
         # This is a simplified version - equipment drivers should implement proper channel reading
@@ -388,6 +527,36 @@ class AcquisitionManager:
         buffer = self._buffers[acquisition_id]
         return buffer.get_latest(num_samples)
 
+    def get_buffer_sequence(self, acquisition_id: str) -> int:
+        """Get the sequence number of the next sample to be acquired."""
+        if acquisition_id not in self._buffers:
+            raise ValueError(f"Acquisition {acquisition_id} not found")
+
+        return self._buffers[acquisition_id].sequence
+
+    def get_buffer_data_since(
+        self, acquisition_id: str, sequence: int, limit: Optional[int] = None
+    ) -> tuple:
+        """
+        Get buffer samples written since a sequence number.
+
+        Args:
+            acquisition_id: Acquisition session ID
+            sequence: Sequence number of the first sample wanted
+            limit: Most samples to read (None = all the buffer returns)
+
+        Returns:
+            (data, timestamps, next_sequence, gap) tuple, where gap is the
+            number of requested samples already overwritten
+        """
+        if acquisition_id not in self._buffers:
+            raise ValueError(f"Acquisition {acquisition_id} not found")
+
+        buffer = self._buffers[acquisition_id]
+        gap = max(0, buffer.oldest_sequence - sequence)
+        data, timestamps, next_sequence = buffer.get_since(sequence, limit)
+        return data, timestamps, next_sequence, gap
+
     async def export_data(
         self,
         acquisition_id: str,
@@ -411,13 +580,15 @@ class AcquisitionManager:
         if acquisition_id not in self._buffers:
             raise ValueError(f"No data available for {acquisition_id}")
 
+        check_format_available(format)
+
         session = self._sessions[acquisition_id]
         buffer = self._buffers[acquisition_id]
 
-        # Get all data
-        data, timestamps = buffer.get_all()
+        # Freeze the data so acquisition can continue during the export
+        segments = buffer.snapshot()
 
-        if data.size == 0:
+        if not segments:
             raise ValueError("No data to export")
 
         # Determine export path
@@ -430,125 +601,21 @@ class AcquisitionManager:
         else:
             raise ValueError("No export directory configured and no filepath provided")
 
-        # Export based on format
-        if format == ExportFormat.CSV:
-            await self._export_csv(export_path, session, data, timestamps)
-
-        elif format == ExportFormat.NUMPY:
-            await self._export_numpy(export_path, session, data, timestamps)
-
-        elif format == ExportFormat.JSON:
-            await self._export_json(export_path, session, data, timestamps)
-
-        elif format == ExportFormat.HDF5:
-            await self._export_hdf5(export_path, session, data, timestamps)
+        # Write chunk by chunk in a worker thread to keep the event loop free
+        loop = asyncio.get_running_loop()
+        export_path = await loop.run_in_executor(
+            None,
+            export_segments,
+            format,
+            export_path,
+            session.copy(deep=True),
+            segments,
+        )
 
         logger.info(f"Exported data to {export_path}")
 
         return str(export_path)
 
-    async def _export_csv(
-        self,
-        filepath: Path,
-        session: AcquisitionSession,
-        data: np.ndarray,
-        timestamps: np.ndarray,
-    ):
-        """Export to CSV format."""
-        with open(filepath, "w", newline="") as f:
-            writer = csv.writer(f)
-
-            # Header
-            header = ["timestamp"] + session.config.channels
-            writer.writerow(header)
-
-            # Data
-            for i in range(len(timestamps)):
-                row = [datetime.fromtimestamp(timestamps[i]).isoformat()]
-                row.extend(data[:, i].tolist())
-                writer.writerow(row)
-
-    async def _export_numpy(
-        self,
-        filepath: Path,
-        session: AcquisitionSession,
-        data: np.ndarray,
-        timestamps: np.ndarray,
-    ):
-        """Export to NumPy binary format."""
-        np.savez(
-            filepath,
-            data=data,
-            timestamps=timestamps,
-            channels=session.config.channels,
-            metadata=session.config.metadata,
-        )
-
-    async def _export_json(
-        self,
-        filepath: Path,
-        session: AcquisitionSession,
-        data: np.ndarray,
-        timestamps: np.ndarray,
-    ):
-        """Export to JSON format."""
-        export_data = {
-            "acquisition_id": session.acquisition_id,
-            "equipment_id": session.equipment_id,
-            "config": session.config.dict(),
-            "stats": session.stats.dict(),
-            "data": {
-                "timestamps": [
-                    datetime.fromtimestamp(t).isoformat() for t in timestamps
-                ],
-                "channels": {
-                    channel: data[i, :].tolist()
-                    for i, channel in enumerate(session.config.channels)
-                },
-            },
-        }
-
-        with open(filepath, "w") as f:
-            json.dump(export_data, f, indent=2, default=str)
-
-    async def _export_hdf5(
-        self,
-        filepath: Path,
-        session: AcquisitionSession,
-        data: np.ndarray,
-        timestamps: np.ndarray,
-    ):
-        """Export to HDF5 format."""
-        try:
-            import h5py
-        except ImportError:
-            logger.warning("h5py not installed, falling back to NumPy format")
-            await self._export_numpy(
-                filepath.with_suffix(".npz"), session, data, timestamps
-            )
-            return
-
-        with h5py.File(filepath, "w") as f:
-            # Create groups
-            config_group = f.create_group("config")
-            stats_group = f.create_group("stats")
-            data_group = f.create_group("data")
-
-            # Store config
-            config_group.attrs["acquisition_id"] = session.acquisition_id
-            config_group.attrs["equipment_id"] = session.equipment_id
-            config_group.attrs["mode"] = session.config.mode
-            config_group.attrs["sample_rate"] = session.config.sample_rate
-
-            # Store stats
-            stats_group.attrs["total_samples"] = session.stats.total_samples
-            stats_group.attrs["duration_seconds"] = session.stats.duration_seconds or 0
-
-            # Store data
-            data_group.create_dataset("timestamps", data=timestamps)
-            for i, channel in enumerate(session.config.channels):
-                data_group.create_dataset(channel, data=data[i, :])
-
     async def delete_session(self, acquisition_id: str) -> bool:
         """Delete an acquisition session."""
         if acquisition_id not in self._sessions:
@@ -560,36 +627,29 @@ class AcquisitionManager:
 
         # Remove session and buffer
         del self._sessions[acquisition_id]
+        self._analytics.pop(acquisition_id, None)
         if acquisition_id in self._buffers:
-            del self._buffers[acquisition_id]
+            self._buffers.pop(acquisition_id).close()
 
         logger.info(f"Deleted acquisition session {acquisition_id}")
 
         return True
 
-    def compute_rolling_stats(
-        self, acquisition_id: str, channel: str, num_samples: Optional[int] = None
-    ):
+    def _channel_analytics(
+        self, acquisition_id: str, channel: str, num_samples: Optional[int]
+    ) -> Optional[Tuple[LiveAnalytics, int, int]]:
         """
-        Compute rolling statistics for a channel.
-
-        Args:
-            acquisition_id: Acquisition session ID
-            channel: Channel name
-            num_samples: Number of samples to analyze (None = all available)
+        Resolve the analytics engine, channel index and window for a request.
 
         Returns:
-            RollingStats object or None if session not found
+            (analytics, channel_index, num_samples) tuple or None if the
+            session or channel doesn't exist. A num_samples of None selects
+            the in-memory buffer size.
         """
-        from .statistics import stats_engine
-
         session = self.get_session(acquisition_id)
-        if session is None:
+        if session is None or acquisition_id not in self._analytics:
             return None
 
-        # Get channel data
-        data, _ = self.get_buffer_data(acquisition_id, num_samples)
-
         # Find channel index
         try:
             channel_idx = session.config.channels.index(channel)
@@ -597,9 +657,32 @@ class AcquisitionManager:
             logger.error(f"Channel {channel} not found in acquisition {acquisition_id}")
             return None
 
-        channel_data = data[channel_idx, :]
+        analytics = self._analytics[acquisition_id]
+        return analytics, channel_idx, num_samples or analytics.buffer.size
+
+    def compute_rolling_stats(
+        self, acquisition_id: str, channel: str, num_samples: Optional[int] = None
+    ):
+        """
+        Compute rolling statistics for a channel.
+
+        The sliding window is maintained incrementally, so only samples
+        acquired since the previous call are processed.
+
+        Args:
+            acquisition_id: Acquisition session ID
+            channel: Channel name
+            num_samples: Window size in samples (None = buffer size)
+
+        Returns:
+            RollingStats object or None if session not found
+        """
+        resolved = self._channel_analytics(acquisition_id, channel, num_samples)
+        if resolved is None:
+            return None
 
-        return stats_engine.compute_rolling_stats(channel_data)
+        analytics, channel_idx, num_samples = resolved
+        return analytics.rolling_stats(channel_idx, num_samples)
 
     def compute_fft(
         self,
@@ -611,36 +694,29 @@ class AcquisitionManager:
         """
         Compute FFT analysis for a channel.
 
+        Results are cached until the next sample is acquired.
+
         Args:
             acquisition_id: Acquisition session ID
             channel: Channel name
-            num_samples: Number of samples to analyze (None = all available)
+            num_samples: Number of samples to analyze (None = buffer size)
             window: Window function ('hann', 'hamming', 'blackman')
 
         Returns:
             FrequencyAnalysis object or None if session not found
         """
-        from .statistics import stats_engine
-
-        session = self.get_session(acquisition_id)
-        if session is None:
+        resolved = self._channel_analytics(acquisition_id, channel, num_samples)
+        if resolved is None:
             return None
 
-        # Get channel data
-        data, _ = self.get_buffer_data(acquisition_id, num_samples)
-
-        # Find channel index
-        try:
-            channel_idx = session.config.channels.index(channel)
-        except ValueError:
-            logger.error(f"Channel {channel} not found in acquisition {acquisition_id}")
-            return None
+        analytics, channel_idx, num_samples = resolved
+        sample_rate = self._sessions[acquisition_id].config.sample_rate
 
-        channel_data = data[channel_idx, :]
+        def compute():
+            channel_data, _ = analytics.latest(channel_idx, num_samples)
+            return analytics.engine.compute_fft(channel_data, sample_rate, window)
 
-        return stats_engine.compute_fft(
-            channel_data, session.config.sample_rate, window
-        )
+        return analytics.cached(("fft", channel_idx, num_samples, window), compute)
 
     def detect_trend(
         self, acquisition_id: str, channel: str, num_samples: Optional[int] = None
@@ -648,33 +724,27 @@ class AcquisitionManager:
         """
         Detect trend in channel data.
 
+        Results are cached until the next sample is acquired.
+
         Args:
             acquisition_id: Acquisition session ID
             channel: Channel name
-            num_samples: Number of samples to analyze (None = all available)
+            num_samples: Number of samples to analyze (None = buffer size)
 
         Returns:
             TrendAnalysis object or None if session not found
         """
-        from .statistics import stats_engine
-
-        session = self.get_session(acquisition_id)
-        if session is None:
+        resolved = self._channel_analytics(acquisition_id, channel, num_samples)
+        if resolved is None:
             return None
 
-        # Get channel data with timestamps
-        data, timestamps = self.get_buffer_data(acquisition_id, num_samples)
-
-        # Find channel index
-        try:
-            channel_idx = session.config.channels.index(channel)
-        except ValueError:
-            logger.error(f"Channel {channel} not found in acquisition {acquisition_id}")
-            return None
+        analytics, channel_idx, num_samples = resolved
 
-        channel_data = data[channel_idx, :]
+        def compute():
+            channel_data, timestamps = analytics.latest(channel_idx, num_samples)
+            return analytics.engine.detect_trend(channel_data, timestamps)
 
-        return stats_engine.detect_trend(channel_data, timestamps)
+        return analytics.cached(("trend", channel_idx, num_samples), compute)
 
     def assess_data_quality(
         self,
@@ -727,10 +797,12 @@ class AcquisitionManager:
         """
         Detect peaks in channel data.
 
+        Results are cached until the next sample is acquired.
+
         Args:
             acquisition_id: Acquisition session ID
             channel: Channel name
-            num_samples: Number of samples to analyze (None = all available)
+            num_samples: Number of samples to analyze (None = buffer size)
             prominence: Required prominence of peaks
             distance: Minimum distance between peaks
             height: Minimum height of peaks
@@ -738,25 +810,21 @@ class AcquisitionManager:
         Returns:
             PeakInfo object or None if session not found
         """
-        from .statistics import stats_engine
-
-        session = self.get_session(acquisition_id)
-        if session is None:
+        resolved = self._channel_analytics(acquisition_id, channel, num_samples)
+        if resolved is None:
             return None
 
-        # Get channel data
-        data, _ = self.get_buffer_data(acquisition_id, num_samples)
-
-        # Find channel index
-        try:
-            channel_idx = session.config.channels.index(channel)
-        except ValueError:
-            logger.error(f"Channel {channel} not found in acquisition {acquisition_id}")
-            return None
+        analytics, channel_idx, num_samples = resolved
 
-        channel_data = data[channel_idx, :]
+        def compute():
+            channel_data, _ = analytics.latest(channel_idx, num_samples)
+            return analytics.engine.detect_peaks(
+                channel_data, prominence, distance, height
+            )
 
-        return stats_engine.detect_peaks(channel_data, prominence, distance, height)
+        return analytics.cached(
+            ("peaks", channel_idx, num_samples, prominence, distance, height), compute
+        )
 
     def detect_threshold_crossings(
         self,
@@ -2,7 +2,7 @@
 
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from uuid import uuid4
 
 import numpy as np
@@ -46,6 +46,13 @@ class TriggerEdge(str, Enum):
     EITHER = "either"
 
 
+class TimingPolicy(str, Enum):
+    """How the acquisition loop recovers when it falls behind schedule."""
+
+    CATCH_UP = "catch_up"  # Take late samples back-to-back until on schedule
+    SKIP = "skip"  # Drop missed sample slots and re-join the time grid
+
+
 class ExportFormat(str, Enum):
     """Data export formats."""
 
@@ -53,6 +60,7 @@ class ExportFormat(str, Enum):
     HDF5 = "hdf5"
     NUMPY = "npy"
     JSON = "json"
+    PARQUET = "parquet"
 
 
 class TriggerConfig(BaseModel):
@@ -79,17 +87,35 @@ class AcquisitionConfig(BaseModel):
     sample_rate: float = Field(default=1.0, gt=0, description="Samples per second")
     num_samples: Optional[int] = Field(None, ge=1, description="For single-shot mode")
     duration_seconds: Optional[float] = Field(None, gt=0, description="Max duration")
+    timing_policy: TimingPolicy = Field(
+        default=TimingPolicy.SKIP, description="Behaviour when sampling falls behind"
+    )
 
     # Channels
     channels: List[str] = Field(
         default_factory=lambda: ["CH1"], description="Channels to acquire"
     )
+    max_concurrent_reads: int = Field(
+        default=4, ge=1, description="Max in-flight channel reads per sample"
+    )
+    block_size: Optional[int] = Field(
+        None,
+        ge=1,
+        description="Samples per channel per driver block read (None = point-by-point)",
+    )
 
     # Trigger settings
     trigger_config: TriggerConfig = Field(default_factory=TriggerConfig)
 
     # Buffer settings
     buffer_size: int = Field(default=10000, ge=100, description="Circular buffer size")
+    spill_to_disk: bool = Field(
+        default=False,
+        description="Spill full buffer chunks to disk instead of overwriting them",
+    )
+    spill_directory: Optional[str] = Field(
+        None, description="Directory for spill files (None = temp directory)"
+    )
 
     # Export settings
     auto_export: bool = Field(default=False, description="Auto-export when done")
@@ -123,9 +149,14 @@ class AcquisitionStats(BaseModel):
     duration_seconds: Optional[float] = None
     actual_sample_rate: Optional[float] = None
     buffer_overruns: int = 0
+    spilled_samples: int = 0
+    missed_deadlines: int = 0
+    mean_jitter_ms: Optional[float] = None
+    max_jitter_ms: Optional[float] = None
     min_values: Dict[str, float] = Field(default_factory=dict)
     max_values: Dict[str, float] = Field(default_factory=dict)
     mean_values: Dict[str, float] = Field(default_factory=dict)
+    std_values: Dict[str, float] = Field(default_factory=dict)
 
     class Config:
         json_encoders = {datetime: lambda v: v.isoformat()}
@@ -148,6 +179,76 @@ class AcquisitionSession(BaseModel):
         json_encoders = {datetime: lambda v: v.isoformat()}
 
 
+class RunningStatistics:
+    """
+    Per-channel running count/min/max/mean/variance.
+
+    Updated incrementally as samples arrive (Welford's algorithm, merged per
+    block), so reading the statistics costs O(channels) regardless of how
+    much data has been acquired. NaN samples are ignored.
+    """
+
+    def __init__(self, num_channels: int):
+        """
+        Initialize running statistics.
+
+        Args:
+            num_channels: Number of data channels
+        """
+        self.num_channels = num_channels
+        self.reset()
+
+    def reset(self):
+        """Discard all accumulated statistics."""
+        self.count = np.zeros(self.num_channels, dtype=np.int64)
+        self.mean = np.zeros(self.num_channels)
+        self.m2 = np.zeros(self.num_channels)
+        self.min = np.full(self.num_channels, np.inf)
+        self.max = np.full(self.num_channels, -np.inf)
+
+    def update(self, block: np.ndarray):
+        """
+        Add a block of samples.
+
+        Args:
+            block: Array shaped (num_channels, n)
+        """
+        valid = ~np.isnan(block)
+        block_count = valid.sum(axis=1)
+        if not block_count.any():
+            return
+
+        values = np.where(valid, block, 0.0)
+        has_data = block_count > 0
+        block_mean = values.sum(axis=1) / np.maximum(block_count, 1)
+        deviations = np.where(valid, block - block_mean[:, None], 0.0)
+        block_m2 = np.square(deviations).sum(axis=1)
+
+        # Merge the block into the running totals (Chan et al.)
+        total = self.count + block_count
+        delta = block_mean - self.mean
+        weight = np.where(has_data, block_count / np.maximum(total, 1), 0.0)
+        self.mean = self.mean + delta * weight
+        self.m2 = self.m2 + np.where(
+            has_data, block_m2 + np.square(delta) * self.count * weight, 0.0
+        )
+        self.count = total
+
+        self.min = np.minimum(self.min, np.where(valid, block, np.inf).min(axis=1))
+        self.max = np.maximum(self.max, np.where(valid, block, -np.inf).max(axis=1))
+
+    @property
+    def variance(self) -> np.ndarray:
+        """Population variance per channel (NaN for channels without data)."""
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(self.count > 0, self.m2 / self.count, np.nan)
+
+    @property
+    def std(self) -> np.ndarray:
+        """Population standard deviation per channel."""
+        return np.sqrt(self.variance)
+
+
 class CircularBuffer:
     """Circular buffer for efficient data storage."""
 
@@ -167,6 +268,7 @@ class CircularBuffer:
         self.count = 0
         self.overruns = 0
         self.start_time = datetime.now()
+        self.running = RunningStatistics(num_channels)
 
     def add(self, values: List[float], timestamp: Optional[float] = None):
         """
@@ -191,6 +293,105 @@ class CircularBuffer:
 
         self.write_index += 1
         self.count = min(self.count + 1, self.size)
+        self.running.update(self.data[:, idx : idx + 1])
+
+    def add_many(self, data: np.ndarray, timestamps: np.ndarray):
+        """
+        Add a block of samples to the buffer.
+
+        Args:
+            data: Array shaped (num_channels, n)
+            timestamps: Array of n Unix timestamps
+        """
+        data = np.asarray(data, dtype=np.float64)
+        timestamps = np.asarray(timestamps, dtype=np.float64)
+
+        if data.ndim != 2 or data.shape[0] != self.num_channels:
+            raise ValueError(
+                f"Expected block shaped ({self.num_channels}, n), got {data.shape}"
+            )
+        if timestamps.shape != (data.shape[1],):
+            raise ValueError(
+                f"Expected {data.shape[1]} timestamps, got {timestamps.shape[0]}"
+            )
+
+        n = data.shape[1]
+        if n == 0:
+            return
+
+        self.running.update(data)
+
+        # Samples that overwrite unread data count as overruns
+        self.overruns += max(0, self.count + n - self.size)
+
+        # Only the newest `size` samples of an oversized block survive
+        if n > self.size:
+            self.write_index += n - self.size
+            data = data[:, -self.size :]
+            timestamps = timestamps[-self.size :]
+            n = self.size
+
+        # Write in at most two contiguous slices around the wrap point
+        idx = self.write_index % self.size
+        first = min(n, self.size - idx)
+        self.data[:, idx : idx + first] = data[:, :first]
+        self.timestamps[idx : idx + first] = timestamps[:first]
+        if first < n:
+            self.data[:, : n - first] = data[:, first:]
+            self.timestamps[: n - first] = timestamps[first:]
+
+        self.write_index += n
+        self.count = min(self.count + n, self.size)
+
+    @property
+    def sequence(self) -> int:
+        """Sequence number of the next sample to be written."""
+        return self.write_index
+
+    @property
+    def oldest_sequence(self) -> int:
+        """Sequence number of the oldest sample still in the buffer."""
+        return self.write_index - self.count
+
+    def get_views(
+        self, n: Optional[int] = None
+    ) -> List[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Get the latest N samples as views into the buffer, without copying.
+
+        The views alias buffer storage and are overwritten by later adds, so
+        consume them before yielding to the acquisition loop.
+
+        Args:
+            n: Number of samples (None = all available)
+
+        Returns:
+            Up to two (data, timestamps) segments in chronological order
+        """
+        n = self.count if n is None else max(0, min(n, self.count))
+        return self._range_views(self.write_index - n, self.write_index)
+
+    def _range_views(
+        self, start: int, stop: int
+    ) -> List[Tuple[np.ndarray, np.ndarray]]:
+        """Views of the retained samples with sequence numbers in [start, stop)."""
+        if stop <= start:
+            return []
+
+        start_idx = start % self.size
+        end_idx = start_idx + (stop - start)
+
+        if end_idx <= self.size:
+            return [
+                (self.data[:, start_idx:end_idx], self.timestamps[start_idx:end_idx])
+            ]
+
+        # Window wraps around the end of storage
+        end_idx -= self.size
+        return [
+            (self.data[:, start_idx:], self.timestamps[start_idx:]),
+            (self.data[:, :end_idx], self.timestamps[:end_idx]),
+        ]
 
     def get_latest(self, n: Optional[int] = None) -> tuple:
         """
@@ -202,37 +403,99 @@ class CircularBuffer:
         Returns:
             (data, timestamps) tuple
         """
-        if n is None:
-            n = self.count
-        else:
-            n = min(n, self.count)
+        views = self.get_views(n)
 
-        if n == 0:
+        if not views:
             return np.array([]), np.array([])
 
-        # Get indices of latest n samples
-        if self.count < self.size:
-            # Buffer not full yet
-            indices = np.arange(max(0, self.write_index - n), self.write_index)
-        else:
-            # Buffer has wrapped around
-            end_idx = self.write_index % self.size
-            start_idx = (end_idx - n) % self.size
-
-            if start_idx < end_idx:
-                indices = np.arange(start_idx, end_idx)
-            else:
-                # Wrapped around
-                indices = np.concatenate(
-                    [np.arange(start_idx, self.size), np.arange(0, end_idx)]
-                )
-
-        return self.data[:, indices], self.timestamps[indices]
+        if len(views) == 1:
+            data, timestamps = views[0]
+            return data.copy(), timestamps.copy()
+
+        return (
+            np.concatenate([data for data, _ in views], axis=1),
+            np.concatenate([timestamps for _, timestamps in views]),
+        )
+
+    def get_since(
+        self, sequence: int, limit: Optional[int] = None
+    ) -> Tuple[np.ndarray, np.ndarray, int]:
+        """
+        Get samples written since a sequence number.
+
+        Readers pass back the returned sequence on their next call so each
+        call only touches new samples. If the reader fell behind by more
+        than the buffer size, reading resumes at the oldest retained sample;
+        compare against oldest_sequence beforehand to detect the gap.
+
+        Args:
+            sequence: Sequence number of the first sample wanted
+            limit: Most samples to read (None = all new samples); the oldest
+                come first and the rest are left for the next call
+
+        Returns:
+            (data, timestamps, next_sequence) tuple
+        """
+        start = max(sequence, self.oldest_sequence)
+        stop = self.write_index
+        if limit is not None:
+            stop = min(stop, start + limit)
+        views = self._range_views(start, stop)
+
+        if not views:
+            return np.empty((self.num_channels, 0)), np.empty(0), self.write_index
+
+        if len(views) == 1:
+            data, timestamps = views[0]
+            return data.copy(), timestamps.copy(), stop
+
+        return (
+            np.concatenate([data for data, _ in views], axis=1),
+            np.concatenate([timestamps for _, timestamps in views]),
+            stop,
+        )
 
     def get_all(self) -> tuple:
         """Get all available data."""
         return self.get_latest(self.count)
 
+    def iter_chunks(
+        self, chunk_size: int = 65536
+    ) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Iterate over all available data in chronological chunks.
+
+        Chunks are views into buffer storage, so large buffers can be
+        processed without materializing them in memory at once.
+
+        Args:
+            chunk_size: Maximum samples per chunk
+
+        Yields:
+            (data, timestamps) tuples
+        """
+        for data, timestamps in self.get_views():
+            for start in range(0, len(timestamps), chunk_size):
+                end = start + chunk_size
+                yield data[:, start:end], timestamps[start:end]
+
+    def snapshot(self) -> List[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Get all available data as segments that later adds won't modify.
+
+        Used to hand a consistent copy of the data to a worker thread while
+        acquisition continues.
+
+        Returns:
+            Chronological (data, timestamps) segments
+        """
+        if self.count == 0:
+            return []
+        return [self.get_latest()]
+
+    def close(self):
+        """Release resources held by the buffer."""
+
     def clear(self):
         """Clear the buffer."""
         self.data.fill(0)
@@ -241,9 +504,16 @@ class CircularBuffer:
         self.count = 0
         self.overruns = 0
         self.start_time = datetime.now()
+        self.running.reset()
 
     def get_stats(self) -> Dict[str, Any]:
-        """Get buffer statistics."""
+        """
+        Get buffer statistics.
+
+        Min/max/mean/std come from the running statistics, so they cover
+        every sample added since the last clear (including overwritten ones)
+        and cost nothing to compute.
+        """
         if self.count == 0:
             return {
                 "size": self.size,
@@ -252,15 +522,15 @@ class CircularBuffer:
                 "utilization": 0.0,
             }
 
-        data, _ = self.get_all()
+        has_data = self.running.count > 0
 
         return {
             "size": self.size,
             "count": self.count,
             "overruns": self.overruns,
             "utilization": self.count / self.size,
-            "min": data.min(axis=1).tolist(),
-            "max": data.max(axis=1).tolist(),
-            "mean": data.mean(axis=1).tolist(),
-            "std": data.std(axis=1).tolist(),
+            "min": np.where(has_data, self.running.min, np.nan).tolist(),
+            "max": np.where(has_data, self.running.max, np.nan).tolist(),
+            "mean": np.where(has_data, self.running.mean, np.nan).tolist(),
+            "std": self.running.std.tolist(),
         }
@@ -1,9 +1,12 @@
 """Advanced statistical analysis for acquisition data."""
 
-from collections import deque
+import bisect
+import math
+from collections import OrderedDict, deque
 from dataclasses import dataclass
 from enum import Enum
-from typing import Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
 
 import numpy as np
 from scipy import fft, signal
@@ -149,21 +152,18 @@ class StatisticsEngine:
             )
 
         # Apply window function
-        if window == "hann":
-            windowed_data = data * np.hanning(len(data))
-        elif window == "hamming":
-            windowed_data = data * np.hamming(len(data))
-        elif window == "blackman":
-            windowed_data = data * np.blackman(len(data))
+        window_function = _window_function(window, len(data))
+        if window_function is not None:
+            windowed_data = data * window_function
         else:
             windowed_data = data
 
-        # Compute FFT
-        fft_result = fft.fft(windowed_data)
-        n = len(fft_result)
+        # Compute FFT (real input, so only the positive half is needed)
+        n = len(windowed_data)
+        fft_result = fft.rfft(windowed_data)
 
         # Only use positive frequencies
-        frequencies = fft.fftfreq(n, 1.0 / sample_rate)[: n // 2]
+        frequencies = fft.rfftfreq(n, 1.0 / sample_rate)[: n // 2]
         magnitudes = np.abs(fft_result)[: n // 2] * (2.0 / n)
         phases = np.angle(fft_result)[: n // 2]
 
@@ -461,5 +461,259 @@ class StatisticsEngine:
         return float(snr)
 
 
+@lru_cache(maxsize=32)
+def _window_function(window: str, n: int) -> Optional[np.ndarray]:
+    """Get a (cached, read-only) FFT window of length n."""
+    if window == "hann":
+        values = np.hanning(n)
+    elif window == "hamming":
+        values = np.hamming(n)
+    elif window == "blackman":
+        values = np.blackman(n)
+    else:
+        return None
+
+    values.setflags(write=False)
+    return values
+
+
+class SlidingWindowStats:
+    """
+    Incrementally maintained statistics over the last N values of a channel.
+
+    Mean, std and RMS come from running sums, min and max from monotonic
+    deques, and the median from a sorted copy of the window kept up to date
+    with bisect. Each new value therefore costs one O(N) list insertion and
+    deletion (a memmove, fast for typical window sizes) instead of a pass
+    over the whole window. NaN values (failed reads) take up their position
+    in the window but are left out of the statistics, so the window always
+    spans the last N samples acquired.
+    """
+
+    def __init__(self, window_size: int):
+        """
+        Initialize sliding window statistics.
+
+        Args:
+            window_size: Number of most recent values to cover
+        """
+        if window_size < 1:
+            raise ValueError("Window size must be at least 1")
+
+        self.window_size = window_size
+        self.reset()
+
+    def reset(self):
+        """Discard all values."""
+        self._values: deque = deque()  # Every position, NaN included
+        self._sorted: List[float] = []  # Non-NaN values only
+        self._min: deque = deque()  # (index, value), values increasing
+        self._max: deque = deque()  # (index, value), values decreasing
+        self._shift = 0.0
+        self._sum = 0.0  # sum of (value - shift)
+        self._sum_sq = 0.0  # sum of (value - shift)^2
+        self._pushed = 0
+        self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._sorted)
+
+    def extend(self, values: np.ndarray):
+        """
+        Add new values, evicting the oldest once the window is full.
+
+        Args:
+            values: 1D array of new values in chronological order
+        """
+        values = np.asarray(values, dtype=np.float64)
+
+        if len(values) >= self.window_size:
+            # Everything currently in the window would be evicted anyway
+            self.reset()
+            values = values[-self.window_size :]
+
+        for value in values.tolist():
+            self._push(value)
+
+    def _push(self, value: float):
+        """Add one value to the window."""
+        if len(self._values) == self.window_size:
+            self._evict()
+
+        index = self._pushed
+        self._pushed += 1
+        self._values.append(value)
+        if math.isnan(value):
+            return
+
+        if not self._sorted:
+            # Shift sums to the first value to limit cancellation error
+            self._shift = value
+            self._sum = self._sum_sq = 0.0
+        bisect.insort(self._sorted, value)
+
+        shifted = value - self._shift
+        self._sum += shifted
+        self._sum_sq += shifted * shifted
+
+        while self._min and self._min[-1][1] >= value:
+            self._min.pop()
+        self._min.append((index, value))
+
+        while self._max and self._max[-1][1] <= value:
+            self._max.pop()
+        self._max.append((index, value))
+
+    def _evict(self):
+        """Remove the oldest value from the window."""
+        value = self._values.popleft()
+        if math.isnan(value):
+            return
+
+        del self._sorted[bisect.bisect_left(self._sorted, value)]
+
+        shifted = value - self._shift
+        self._sum -= shifted
+        self._sum_sq -= shifted * shifted
+
+        oldest_index = self._pushed - len(self._values) - 1
+        if self._min[0][0] == oldest_index:
+            self._min.popleft()
+        if self._max[0][0] == oldest_index:
+            self._max.popleft()
+
+        # Recompute the running sums once per window to stop drift
+        self._evictions += 1
+        if self._evictions >= self.window_size and self._sorted:
+            self._evictions = 0
+            values = np.fromiter(self._values, dtype=np.float64)
+            values = values[~np.isnan(values)]
+            self._shift = values[0]
+            shifted_values = values - self._shift
+            self._sum = float(shifted_values.sum())
+            self._sum_sq = float(np.dot(shifted_values, shifted_values))
+
+    def stats(self) -> RollingStats:
+        """Get statistics for the current window."""
+        n = len(self._sorted)
+        if n == 0:
+            return stats_engine.compute_rolling_stats(np.array([]))
+
+        shifted_mean = self._sum / n
+        mean = self._shift + shifted_mean
+        variance = max(self._sum_sq / n - shifted_mean * shifted_mean, 0.0)
+        mean_square = variance + mean * mean
+
+        middle = n // 2
+        if n % 2:
+            median = self._sorted[middle]
+        else:
+            median = (self._sorted[middle - 1] + self._sorted[middle]) / 2.0
+
+        minimum = self._min[0][1]
+        maximum = self._max[0][1]
+
+        return RollingStats(
+            mean=float(mean),
+            std=float(np.sqrt(variance)),
+            min=float(minimum),
+            max=float(maximum),
+            median=float(median),
+            rms=float(np.sqrt(mean_square)),
+            peak_to_peak=float(maximum - minimum),
+            num_samples=n,
+        )
+
+
+class LiveAnalytics:
+    """
+    Incremental analytics for one acquisition session.
+
+    Rolling statistics are kept up to date by feeding each sliding window only
+    the samples acquired since it was last read. Other analyses (FFT, trend,
+    peaks) are cached against the buffer's sequence number and recomputed only
+    once new samples have arrived, so repeated polling is nearly free.
+    """
+
+    # Maximum number of sliding windows / cached results kept per session
+    max_entries = 32
+
+    def __init__(self, buffer, engine: Optional[StatisticsEngine] = None):
+        """
+        Initialize live analytics.
+
+        Args:
+            buffer: Session buffer (CircularBuffer or compatible)
+            engine: Statistics engine used for non-incremental analyses
+        """
+        self.buffer = buffer
+        self.engine = engine or stats_engine
+        self._windows: OrderedDict = OrderedDict()
+        self._results: OrderedDict = OrderedDict()
+
+    def rolling_stats(self, channel_index: int, window_size: int) -> RollingStats:
+        """
+        Get statistics over the latest window_size samples of a channel.
+
+        Args:
+            channel_index: Index of the channel in the buffer
+            window_size: Number of most recent samples to cover
+        """
+        key = (channel_index, window_size)
+        entry = self._windows.get(key)
+
+        if entry is None:
+            window = SlidingWindowStats(window_size)
+            cursor = self.buffer.sequence - window_size
+        else:
+            window, cursor = entry
+            self._windows.move_to_end(key)
+
+        # Disk-backed buffers hand out a lagging cursor's backlog in chunks
+        while cursor != self.buffer.sequence:
+            data, _, cursor = self.buffer.get_since(cursor)
+            if data.size:
+                window.extend(data[channel_index])
+
+        self._store(self._windows, key, (window, cursor))
+        return self.cached(("rolling", key), window.stats)
+
+    def cached(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """
+        Get a result computed from buffer contents, recomputing it only if
+        samples have been added since it was last computed.
+
+        Args:
+            key: Identifies the analysis and its parameters
+            compute: Produces the result from the current buffer contents
+        """
+        sequence = self.buffer.sequence
+        entry = self._results.get(key)
+
+        if entry is not None and entry[0] == sequence:
+            self._results.move_to_end(key)
+            return entry[1]
+
+        result = compute()
+        self._store(self._results, key, (sequence, result))
+        return result
+
+    def latest(
+        self, channel_index: int, num_samples: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Get the latest samples of one channel and their timestamps."""
+        data, timestamps = self.buffer.get_latest(num_samples)
+        if data.size == 0:
+            return np.array([]), np.array([])
+        return data[channel_index], timestamps
+
+    def _store(self, entries: OrderedDict, key: Hashable, value: Any):
+        """Insert into a bounded LRU mapping."""
+        entries[key] = value
+        entries.move_to_end(key)
+        while len(entries) > self.max_entries:
+            entries.popitem(last=False)
+
+
 # Global statistics engine instance
 stats_engine = StatisticsEngine()
@@ -7,6 +7,8 @@ from datetime import datetime
 from enum import Enum
 from typing import Dict, List, Optional, Set
 
+import numpy as np
+
 from .models import AcquisitionConfig, AcquisitionState
 
 logger = logging.getLogger(__name__)
@@ -24,6 +26,14 @@ class SyncState(str, Enum):
     ERROR = "error"
 
 
+class ResampleMethod(str, Enum):
+    """Interpolation used to bring devices onto a common time grid."""
+
+    NEAREST = "nearest"
+    LINEAR = "linear"
+    ZERO_ORDER_HOLD = "zoh"
+
+
 @dataclass
 class SyncConfig:
     """Configuration for synchronized acquisition."""
@@ -34,6 +44,8 @@ class SyncConfig:
     sync_tolerance_ms: float = 10.0  # Maximum allowed time difference
     wait_for_all: bool = True  # Wait for all devices before starting
     auto_align_timestamps: bool = True  # Align timestamps to master
+    resample_method: ResampleMethod = ResampleMethod.LINEAR
+    resample_period_ms: Optional[float] = None  # None = slowest device's period
 
 
 @dataclass
@@ -52,6 +64,134 @@ class SyncStatus:
     sync_errors: List[str] = field(default_factory=list)
 
 
+@dataclass
+class SkewStats:
+    """Sample timing of one device relative to the master device."""
+
+    equipment_id: str
+    start_offset_ms: float  # First sample relative to master's first sample
+    mean_ms: float  # Mean offset of nearest sample to each master sample
+    std_ms: float
+    max_abs_ms: float
+    within_tolerance: bool
+
+
+@dataclass
+class AlignedData:
+    """Data from all devices of a group resampled onto one time grid."""
+
+    timestamps: np.ndarray  # Common grid, shape (n,)
+    data: np.ndarray  # Shape (total channels, n), rows ordered as channels
+    channels: List[str]  # "equipment_id:channel" label per row
+    method: ResampleMethod
+    period_ms: float
+    skew: Dict[str, SkewStats] = field(default_factory=dict)
+
+
+def _nearest_index(timestamps: np.ndarray, points: np.ndarray) -> np.ndarray:
+    """Index of the sample closest to each point (timestamps sorted, len >= 2)."""
+    right = np.clip(np.searchsorted(timestamps, points), 1, len(timestamps) - 1)
+    left = right - 1
+    closer_right = timestamps[right] - points < points - timestamps[left]
+    return np.where(closer_right, right, left)
+
+
+def resample(
+    timestamps: np.ndarray,
+    data: np.ndarray,
+    grid: np.ndarray,
+    method: ResampleMethod = ResampleMethod.LINEAR,
+) -> np.ndarray:
+    """
+    Resample multi-channel data onto new sample times.
+
+    All channels are interpolated at once. Grid points outside the span of
+    the original timestamps are NaN; nothing is extrapolated.
+
+    Args:
+        timestamps: Sorted sample times, shape (n,)
+        data: Samples, shape (num_channels, n)
+        grid: Times to resample at, shape (m,)
+        method: Interpolation method
+
+    Returns:
+        Array shaped (num_channels, m)
+    """
+    timestamps = np.asarray(timestamps, dtype=np.float64)
+    data = np.atleast_2d(np.asarray(data, dtype=np.float64))
+    grid = np.asarray(grid, dtype=np.float64)
+
+    result = np.full((data.shape[0], len(grid)), np.nan)
+    if len(timestamps) == 0 or len(grid) == 0:
+        return result
+
+    inside = (grid >= timestamps[0]) & (grid <= timestamps[-1])
+    points = grid[inside]
+
+    if len(timestamps) == 1:
+        result[:, inside] = data[:, :1]
+    elif method == ResampleMethod.ZERO_ORDER_HOLD:
+        index = np.searchsorted(timestamps, points, side="right") - 1
+        result[:, inside] = data[:, index]
+    elif method == ResampleMethod.NEAREST:
+        result[:, inside] = data[:, _nearest_index(timestamps, points)]
+    else:
+        right = np.clip(np.searchsorted(timestamps, points), 1, len(timestamps) - 1)
+        left = right - 1
+        span = timestamps[right] - timestamps[left]
+        weight = np.divide(
+            points - timestamps[left],
+            span,
+            out=np.zeros_like(points),
+            where=span > 0,
+        )
+        result[:, inside] = data[:, left] * (1 - weight) + data[:, right] * weight
+
+    return result
+
+
+def compute_skew(
+    equipment_id: str,
+    timestamps: np.ndarray,
+    reference: np.ndarray,
+    tolerance_ms: float,
+) -> SkewStats:
+    """
+    Measure how a device's sample times deviate from a reference device.
+
+    Each reference sample within the device's time span is paired with the
+    device's nearest sample, and the offsets are summarized.
+
+    Args:
+        equipment_id: Device being measured
+        timestamps: Sorted sample times of the device
+        reference: Sorted sample times of the reference (master) device
+        tolerance_ms: Allowed absolute offset
+
+    Returns:
+        SkewStats for the device
+    """
+    start_offset = (timestamps[0] - reference[0]) * 1000.0
+
+    points = reference[(reference >= timestamps[0]) & (reference <= timestamps[-1])]
+    if len(points) == 0:
+        offsets = np.array([start_offset])
+    elif len(timestamps) == 1:
+        offsets = (timestamps[0] - points) * 1000.0
+    else:
+        offsets = (timestamps[_nearest_index(timestamps, points)] - points) * 1000.0
+
+    max_abs = float(np.max(np.abs(offsets)))
+    return SkewStats(
+        equipment_id=equipment_id,
+        start_offset_ms=float(start_offset),
+        mean_ms=float(np.mean(offsets)),
+        std_ms=float(np.std(offsets)),
+        max_abs_ms=max_abs,
+        within_tolerance=max_abs <= tolerance_ms,
+    )
+
+
 class SynchronizationGroup:
     """Manages synchronized acquisition across multiple instruments."""
 
@@ -284,6 +424,113 @@ class SynchronizationGroup:
 
         return synchronized_data
 
+    async def get_aligned_data(
+        self,
+        acquisition_manager,
+        num_samples: Optional[int] = None,
+        method: Optional[ResampleMethod] = None,
+        period_ms: Optional[float] = None,
+    ) -> AlignedData:
+        """
+        Get data from all acquisitions resampled onto a common time grid.
+
+        The grid covers the time span shared by all devices that have data.
+        Devices without data contribute rows of NaN.
+
+        Args:
+            acquisition_manager: AcquisitionManager instance
+            num_samples: Number of samples to retrieve from each
+            method: Interpolation method (default from config)
+            period_ms: Grid period (default from config, else the sample
+                period of the slowest device)
+
+        Returns:
+            AlignedData with one row per device channel
+        """
+        method = ResampleMethod(method or self.config.resample_method)
+        if period_ms is None:
+            period_ms = self.config.resample_period_ms
+
+        series = []
+        for equipment_id, acquisition_id in self.acquisition_ids.items():
+            data, timestamps = acquisition_manager.get_buffer_data(
+                acquisition_id, num_samples
+            )
+            timestamps = np.asarray(timestamps, dtype=np.float64)
+
+            session = acquisition_manager.get_session(acquisition_id)
+            if session is not None:
+                channels = list(session.config.channels)
+            else:
+                channels = [f"ch{i}" for i in range(np.atleast_2d(data).shape[0])]
+
+            if len(timestamps) == 0:
+                data = np.empty((len(channels), 0))
+            series.append((equipment_id, channels, np.atleast_2d(data), timestamps))
+
+        populated = [item for item in series if len(item[3])]
+
+        # Common grid over the span every device covers
+        if populated:
+            start = max(timestamps[0] for *_, timestamps in populated)
+            end = min(timestamps[-1] for *_, timestamps in populated)
+        else:
+            start, end = 0.0, -1.0
+
+        if period_ms is None:
+            periods = [
+                np.median(np.diff(timestamps))
+                for *_, timestamps in populated
+                if len(timestamps) > 1
+            ]
+            period_ms = float(max(periods)) * 1000.0 if periods else 0.0
+
+        if end < start:
+            grid = np.array([])
+        elif period_ms > 0:
+            n = int(np.floor((end - start) / (period_ms / 1000.0) + 1e-9)) + 1
+            grid = start + np.arange(n) * (period_ms / 1000.0)
+        else:
+            grid = np.array([start])
+
+        rows = [
+            resample(timestamps, data, grid, method)
+            for _, _, data, timestamps in series
+        ]
+        labels = [
+            f"{equipment_id}:{channel}"
+            for equipment_id, channels, _, _ in series
+            for channel in channels
+        ]
+
+        # Skew of each device relative to the master
+        skew = {}
+        reference = next(
+            (
+                timestamps
+                for equipment_id, _, _, timestamps in populated
+                if equipment_id == self.config.master_equipment_id
+            ),
+            populated[0][3] if populated else None,
+        )
+        for equipment_id, _, _, timestamps in populated:
+            skew[equipment_id] = compute_skew(
+                equipment_id, timestamps, reference, self.config.sync_tolerance_ms
+            )
+
+        # Report times relative to sync start, as get_synchronized_data does
+        if self.config.auto_align_timestamps and self.start_time is not None:
+            grid = grid - self.start_time.timestamp()
+
+        return AlignedData(
+            timestamps=grid,
+            data=np.vstack(rows) if rows else np.empty((0, len(grid))),
+            channels=labels,
+            method=method,
+            period_ms=period_ms,
+            skew=skew,
+        )
+
 
 class SynchronizationManager:
     """Manages synchronization groups for multi-instrument acquisition."""
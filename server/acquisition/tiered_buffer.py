@@ -0,0 +1,329 @@
+"""Disk-spilling acquisition buffer for long-running sessions."""
+
+import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .models import CircularBuffer
+
+logger = logging.getLogger(__name__)
+
+
+class TieredBuffer(CircularBuffer):
+    """
+    Acquisition buffer with a hot tail in RAM and a cold tier on disk.
+
+    Samples are written into an in-memory chunk of ``size`` samples. When the
+    chunk fills it is appended to a spill file and the chunk is reused, so
+    memory use stays bounded while no sample is ever overwritten. The spill
+    file holds one float64 record per sample (timestamp followed by one value
+    per channel) and is read back through a read-only memory map.
+
+    Chunks are written by a background thread, so adds on the acquisition
+    loop never wait for the disk. Until its write completes a spilled chunk
+    is read from memory.
+    """
+
+    def __init__(self, size: int, num_channels: int, spill_path: str):
+        """
+        Initialize tiered buffer.
+
+        Args:
+            size: Number of samples per channel kept in RAM
+            num_channels: Number of data channels
+            spill_path: File that full chunks are appended to
+        """
+        super().__init__(size, num_channels)
+        self.spill_path = Path(spill_path)
+        self.spill_path.parent.mkdir(parents=True, exist_ok=True)
+        self.spilled = 0  # Samples moved out of the hot chunk
+        self.hot_count = 0
+        self._spill_file = open(self.spill_path, "wb")
+        self._mmap: Optional[np.memmap] = None
+        self._flushed = 0  # Spilled samples known to be on disk
+        self._pending: deque = deque()  # (records, future) being written
+        self._spill_failed = False
+        self._writer = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="tiered-buffer-spill"
+        )
+
+    @property
+    def spill_bytes(self) -> int:
+        """Size of the on-disk tier in bytes."""
+        return self.spilled * (self.num_channels + 1) * 8
+
+    def add(self, values: List[float], timestamp: Optional[float] = None):
+        """
+        Add a sample to the buffer.
+
+        Args:
+            values: List of values (one per channel)
+            timestamp: Unix timestamp (or use current time)
+        """
+        if len(values) != self.num_channels:
+            raise ValueError(f"Expected {self.num_channels} values, got {len(values)}")
+
+        self.data[:, self.hot_count] = values
+        self.timestamps[self.hot_count] = (
+            timestamp if timestamp else datetime.now().timestamp()
+        )
+        self.running.update(self.data[:, self.hot_count : self.hot_count + 1])
+        self.hot_count += 1
+        self._advance(1)
+
+    def add_many(self, data: np.ndarray, timestamps: np.ndarray):
+        """
+        Add a block of samples to the buffer.
+
+        Args:
+            data: Array shaped (num_channels, n)
+            timestamps: Array of n Unix timestamps
+        """
+        data = np.asarray(data, dtype=np.float64)
+        timestamps = np.asarray(timestamps, dtype=np.float64)
+
+        if data.ndim != 2 or data.shape[0] != self.num_channels:
+            raise ValueError(
+                f"Expected block shaped ({self.num_channels}, n), got {data.shape}"
+            )
+        if timestamps.shape != (data.shape[1],):
+            raise ValueError(
+                f"Expected {data.shape[1]} timestamps, got {timestamps.shape[0]}"
+            )
+
+        self.running.update(data)
+
+        written = 0
+        while written < data.shape[1]:
+            n = min(data.shape[1] - written, self.size - self.hot_count)
+            end = self.hot_count + n
+            self.data[:, self.hot_count : end] = data[:, written : written + n]
+            self.timestamps[self.hot_count : end] = timestamps[written : written + n]
+            self.hot_count = end
+            written += n
+            self._advance(n)
+
+    def _advance(self, n: int):
+        """Account for n new samples and spill the hot chunk if it is full."""
+        self.write_index += n
+        self.count = self.write_index
+
+        if self.hot_count == self.size:
+            self._spill()
+
+    def _spill(self):
+        """Hand the hot chunk to the spill writer and empty it."""
+        records = np.empty((self.hot_count, self.num_channels + 1), dtype=np.float64)
+        records[:, 0] = self.timestamps[: self.hot_count]
+        records[:, 1:] = self.data[:, : self.hot_count].T
+
+        future = self._writer.submit(self._write_records, self._spill_file, records)
+        self._pending.append((records, future))
+
+        self.spilled += self.hot_count
+        self.hot_count = 0
+
+    @staticmethod
+    def _write_records(spill_file, records: np.ndarray):
+        """Append records to the spill file (runs on the writer thread)."""
+        spill_file.write(records)
+        spill_file.flush()
+
+    def _reap_spills(self):
+        """Move chunks whose write has completed from memory to the disk tier."""
+        while self._pending and self._pending[0][1].done():
+            records, future = self._pending[0]
+            error = future.exception()
+            if error is not None:
+                if not self._spill_failed:
+                    self._spill_failed = True
+                    logger.error(
+                        f"Could not write to spill file {self.spill_path}: {error}; "
+                        "keeping further samples in memory"
+                    )
+                return
+            self._pending.popleft()
+            self._flushed += len(records)
+
+    def flush(self):
+        """Wait until every spilled chunk has been written to disk."""
+        for _, future in list(self._pending):
+            try:
+                future.result()
+            except Exception:
+                pass  # Reported by _reap_spills()
+        self._reap_spills()
+
+    def _disk_records(self) -> np.ndarray:
+        """Memory map of all written records, shaped (written, channels + 1)."""
+        if self._mmap is None or self._mmap.shape[0] != self._flushed:
+            self._mmap = np.memmap(
+                self.spill_path,
+                dtype=np.float64,
+                mode="r",
+                shape=(self._flushed, self.num_channels + 1),
+            )
+        return self._mmap
+
+    def _range_views(
+        self, start: int, stop: int
+    ) -> List[Tuple[np.ndarray, np.ndarray]]:
+        """Views of the samples with sequence numbers in [start, stop)."""
+        if stop <= start:
+            return []
+
+        self._reap_spills()
+        views = []
+
+        if start < self._flushed:
+            records = self._disk_records()[start : min(stop, self._flushed)]
+            views.append((records[:, 1:].T, records[:, 0]))
+
+        # Chunks still being written are read from memory
+        offset = self._flushed
+        for records, _ in self._pending:
+            end = offset + len(records)
+            if start < end and stop > offset:
+                records = records[max(start, offset) - offset : min(stop, end) - offset]
+                views.append((records[:, 1:].T, records[:, 0]))
+            offset = end
+
+        if stop > self.spilled:
+            lo = max(start, self.spilled) - self.spilled
+            hi = stop - self.spilled
+            views.append((self.data[:, lo:hi], self.timestamps[lo:hi]))
+
+        return views
+
+    def get_views(
+        self, n: Optional[int] = None
+    ) -> List[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Get the latest N samples as views across both tiers, without copying.
+
+        Args:
+            n: Number of samples (None = all available)
+
+        Returns:
+            (data, timestamps) segments in chronological order: the on-disk
+            part, chunks still being written, then the in-memory part
+        """
+        n = self.count if n is None else max(0, min(n, self.count))
+        return self._range_views(self.write_index - n, self.write_index)
+
+    def get_latest(self, n: Optional[int] = None) -> tuple:
+        """
+        Get latest N samples.
+
+        Without n, the copy is capped at the size of the in-memory tier so
+        that it (and get_all()) cannot pull the whole spill file into RAM.
+        Use iter_chunks() or snapshot() to walk the full history.
+
+        Args:
+            n: Number of samples (None = as many as the in-memory tier holds)
+
+        Returns:
+            (data, timestamps) tuple
+        """
+        return super().get_latest(self.size if n is None else n)
+
+    def get_all(self) -> tuple:
+        """Get the latest ``size`` samples; see get_latest()."""
+        return self.get_latest()
+
+    def get_since(
+        self, sequence: int, limit: Optional[int] = None
+    ) -> Tuple[np.ndarray, np.ndarray, int]:
+        """
+        Get up to ``limit`` samples written since a sequence number.
+
+        A reader far behind gets the oldest pending chunk first and catches
+        up over several calls by passing back the returned sequence. Only
+        that chunk is read from the spill file.
+
+        Args:
+            sequence: Sequence number of the first sample wanted
+            limit: Most samples to read (None = the in-memory tier size)
+
+        Returns:
+            (data, timestamps, next_sequence) tuple
+        """
+        return super().get_since(sequence, self.size if limit is None else limit)
+
+    def snapshot(self) -> List[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Get all available data as segments that later adds won't modify.
+
+        The on-disk tier and chunks being written are never modified, so
+        only the hot tail is copied.
+
+        Returns:
+            Chronological (data, timestamps) segments
+        """
+        views = self.get_views()
+        if views and self.hot_count:
+            data, timestamps = views[-1]
+            views[-1] = (data.copy(), timestamps.copy())
+        return views
+
+    def clear(self):
+        """
+        Clear the buffer, discarding the on-disk tier.
+
+        The spill file is replaced rather than truncated: a snapshot still
+        being exported keeps its memory map of the old, unlinked file.
+        """
+        super().clear()
+        self.flush()
+        self._mmap = None
+        self._spill_file.close()
+        if not self._remove_spill_file():
+            # Still mapped on a platform that cannot unlink open files
+            self.spill_path = self.spill_path.with_name(
+                f"{self.spill_path.stem}-{self.start_time:%Y%m%d%H%M%S%f}"
+                f"{self.spill_path.suffix}"
+            )
+        self._spill_file = open(self.spill_path, "wb")
+        self.spilled = 0
+        self.hot_count = 0
+        self._flushed = 0
+        self._pending.clear()
+        self._spill_failed = False
+
+    def close(self):
+        """Close and delete the spill file."""
+        self.flush()
+        self._writer.shutdown()
+        self._mmap = None
+        if not self._spill_file.closed:
+            self._spill_file.close()
+
+        self._remove_spill_file()
+
+    def _remove_spill_file(self) -> bool:
+        """Delete the spill file, returning False if it could not be removed."""
+        try:
+            self.spill_path.unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Could not remove spill file {self.spill_path}: {e}")
+            return False
+        return True
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get buffer statistics, including the size of the on-disk tier."""
+        stats = super().get_stats()
+        stats.update(
+            {
+                "utilization": self.hot_count / self.size,
+                "spilled": self.spilled,
+                "spill_bytes": self.spill_bytes,
+            }
+        )
+        return stats
@@ -0,0 +1,107 @@
+"""Deadline-based sample scheduling for acquisition loops."""
+
+import asyncio
+import time
+from typing import Callable
+
+from .models import TimingPolicy
+
+
+class DeadlineScheduler:
+    """Schedules samples on an absolute, drift-free time grid.
+
+    Deadlines are computed from a monotonic start time rather than by
+    sleeping a fixed period after each sample, so instrument round-trip
+    time is absorbed instead of accumulating into the sample period.
+    """
+
+    def __init__(
+        self,
+        period: float,
+        policy: TimingPolicy = TimingPolicy.SKIP,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize scheduler.
+
+        Args:
+            period: Sample period in seconds
+            policy: What to do when the loop falls behind schedule
+            clock: Monotonic clock function (injectable for testing)
+        """
+        if period <= 0:
+            raise ValueError("Sample period must be positive")
+
+        self.period = period
+        self.policy = policy
+        self._clock = clock
+        self._next_deadline = clock()
+
+        # Timing statistics
+        self.samples = 0
+        self.missed_deadlines = 0
+        self.total_lateness = 0.0
+        self.max_lateness = 0.0
+
+    def reset(self):
+        """Restart the time grid at the current time (e.g. after a pause)."""
+        self._next_deadline = self._clock()
+
+    @property
+    def next_deadline(self) -> float:
+        """Monotonic time of the next scheduled sample."""
+        return self._next_deadline
+
+    async def wait(self) -> float:
+        """
+        Sleep until the next deadline.
+
+        Returns:
+            Lateness in seconds (how far past the deadline we woke up)
+        """
+        delay = self._next_deadline - self._clock()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        lateness = max(0.0, self._clock() - self._next_deadline)
+        self.samples += 1
+        self.total_lateness += lateness
+        if lateness > self.max_lateness:
+            self.max_lateness = lateness
+
+        # A sample served a full period late has missed its slot
+        if self.policy == TimingPolicy.CATCH_UP and lateness >= self.period:
+            self.missed_deadlines += 1
+
+        return lateness
+
+    def advance(self) -> int:
+        """
+        Move to the next deadline after a sample has been taken.
+
+        With ``TimingPolicy.CATCH_UP`` the next deadline is always exactly one
+        period later, so a slow sample is followed by back-to-back reads until
+        the schedule is met again. With ``TimingPolicy.SKIP`` deadlines more
+        than one period in the past are dropped and the loop re-joins the grid.
+
+        Returns:
+            Number of deadlines skipped by this step
+        """
+        self._next_deadline += self.period
+
+        if self.policy != TimingPolicy.SKIP:
+            return 0
+
+        behind = self._clock() - self._next_deadline
+        if behind < self.period:
+            return 0
+
+        skipped = int(behind // self.period)
+        self._next_deadline += skipped * self.period
+        self.missed_deadlines += skipped
+        return skipped
+
+    @property
+    def mean_lateness(self) -> float:
+        """Average lateness in seconds across all samples."""
+        return self.total_lateness / self.samples if self.samples else 0.0
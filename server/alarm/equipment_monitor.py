@@ -26,16 +26,18 @@ class EquipmentAlarmIntegrator:
     relevant alarms, triggering notifications when conditions are met.
     """
 
-    def __init__(self, equipment_manager, alarm_manager):
+    def __init__(self, equipment_manager, alarm_manager, reading_service=None):
         """
         Initialize the integrator.
 
         Args:
             equipment_manager: Equipment manager instance
             alarm_manager: Alarm manager instance
+            reading_service: Shared reading service (None = global instance)
         """
         self.equipment_manager = equipment_manager
         self.alarm_manager = alarm_manager
+        self._reading_service = reading_service
         self._monitoring_tasks: Dict[str, asyncio.Task] = {}
         self._last_check: Dict[str, datetime] = {}
         self._check_interval = 1.0  # Check every 1 second
@@ -100,10 +102,8 @@ class EquipmentAlarmIntegrator:
         try:
             while self._running:
                 try:
-                    # Get equipment status
-                    status = await self.equipment_manager.get_device_status(
-                        equipment_id
-                    )
+                    # Get equipment status, sharing polls with other monitors
+                    status = await self._read_status(equipment_id)
 
                     if status:
                         # Check alarms for this equipment
@@ -119,6 +119,32 @@ class EquipmentAlarmIntegrator:
         except asyncio.CancelledError:
             logger.debug(f"Monitoring cancelled for equipment {equipment_id}")
 
+    async def _read_status(
+        self, equipment_id: str, max_age: Optional[float] = None
+    ) -> Optional[EquipmentStatus]:
+        """
+        Get equipment status through the shared reading service.
+
+        Args:
+            equipment_id: Equipment identifier
+            max_age: Oldest status (seconds) to accept (None = check interval)
+
+        Returns:
+            Equipment status, or None if the equipment is not connected
+        """
+        if self.equipment_manager.get_equipment(equipment_id) is None:
+            return None
+
+        if self._reading_service is None:
+            from equipment.readings import reading_service
+            self._reading_service = reading_service
+
+        return await self._reading_service.read(
+            equipment_id,
+            "get_status",
+            max_age=self._check_interval if max_age is None else max_age,
+        )
+
     async def _check_equipment_alarms(self, equipment_id: str, status: EquipmentStatus):
         """
         Check all alarms relevant to this equipment.
@@ -235,7 +261,7 @@ class EquipmentAlarmIntegrator:
             equipment_id: Equipment identifier
         """
         try:
-            status = await self.equipment_manager.get_device_status(equipment_id)
+            status = await self._read_status(equipment_id, max_age=0.0)
             if status:
                 await self._check_equipment_alarms(equipment_id, status)
                 logger.debug(f"Manual alarm check completed for {equipment_id}")
@@ -6,6 +6,8 @@ from collections import defaultdict
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, TYPE_CHECKING, Any
 
+from server.config.settings import settings
+
 from .models import (AlarmAcknowledgment, AlarmCondition, AlarmConfig,
                      AlarmEvent, AlarmSeverity, AlarmState, AlarmStatistics)
 
@@ -335,8 +337,21 @@ class AlarmManager:
             AlarmType.RATE_OF_CHANGE,
         ]:
             task = asyncio.create_task(self._monitoring_loop(alarm_id))
+            task.add_done_callback(
+                lambda done: self._monitoring_done(alarm_id, done)
+            )
             self._monitoring_tasks[alarm_id] = task
 
+    def _monitoring_done(self, alarm_id: str, task: asyncio.Task):
+        """Forget a finished monitoring task and log how it failed."""
+        if self._monitoring_tasks.get(alarm_id) is task:
+            del self._monitoring_tasks[alarm_id]
+
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(
+                f"Monitoring task for alarm {alarm_id} failed: {task.exception()}"
+            )
+
     async def _stop_monitoring(self, alarm_id: str):
         """Stop monitoring an alarm (internal)."""
         if alarm_id in self._monitoring_tasks:
@@ -361,7 +376,7 @@ class AlarmManager:
                         try:
                             # Try to get the parameter value
                             value = await self._get_parameter_value(
-                                equipment, config.parameter
+                                config.equipment_id, config.parameter
                             )
 
                             if value is not None:
@@ -380,21 +395,34 @@ class AlarmManager:
         except Exception as e:
             logger.error(f"Error in monitoring loop for alarm {alarm_id}: {e}")
 
-    async def _get_parameter_value(self, equipment, parameter: str) -> Optional[float]:
-        """Get parameter value from equipment."""
+    async def _get_parameter_value(
+        self, equipment_id: str, parameter: str
+    ) -> Optional[float]:
+        """Get parameter value from equipment.
+
+        Reads go through the shared reading service, so alarms on the same
+        equipment and parameter share one poll per monitoring interval.
+        """
+        from equipment.readings import reading_service
+
+        async def read(command: str):
+            return await reading_service.read(
+                equipment_id, command, max_age=settings.alarm_reading_max_age_sec
+            )
+
         # Try common parameter names
         try:
             if parameter in ["voltage", "v", "volt"]:
-                result = await equipment.execute_command("get_voltage", {})
+                result = await read("get_voltage")
                 return float(result.voltage) if hasattr(result, "voltage") else None
             elif parameter in ["current", "i", "amp"]:
-                result = await equipment.execute_command("get_current", {})
+                result = await read("get_current")
                 return float(result.current) if hasattr(result, "current") else None
             elif parameter in ["power", "p", "watt"]:
-                result = await equipment.execute_command("get_power", {})
+                result = await read("get_power")
                 return float(result.power) if hasattr(result, "power") else None
             elif parameter in ["temperature", "temp", "t"]:
-                result = await equipment.execute_command("get_temperature", {})
+                result = await read("get_temperature")
                 return (
                     float(result.temperature)
                     if hasattr(result, "temperature")
@@ -402,7 +430,7 @@ class AlarmManager:
                 )
             else:
                 # Try generic get command
-                result = await equipment.execute_command(f"get_{parameter}", {})
+                result = await read(f"get_{parameter}")
                 if hasattr(result, parameter):
                     return float(getattr(result, parameter))
         except Exception:
@@ -204,6 +204,25 @@ class BatchProcessor:
                     for key in rows[0].keys():
                         data[key] = [float(row[key]) for row in rows]
                 return data
+        elif file_path.suffix == ".parquet":
+            try:
+                import pyarrow as pa
+                import pyarrow.compute as pc
+                import pyarrow.parquet as pq
+            except ImportError:
+                raise ValueError("Parquet support requires pyarrow")
+
+            table = pq.read_table(file_path)
+            data = {}
+            for name, column in zip(table.column_names, table.columns):
+                if pa.types.is_timestamp(column.type):
+                    # Timestamps become Unix seconds, like other numeric columns
+                    ticks_per_second = {"s": 1, "ms": 1e3, "us": 1e6, "ns": 1e9}
+                    column = pc.divide(
+                        column.cast(pa.int64()), ticks_per_second[column.type.unit]
+                    )
+                data[name] = column.to_pylist()
+            return data
         else:
             raise ValueError(f"Unsupported file format: {file_path.suffix}")
 
@@ -229,6 +248,14 @@ class BatchProcessor:
                     for i in range(num_rows):
                         row = {key: data[key][i] for key in data.keys()}
                         writer.writerow(row)
+        elif file_path.suffix == ".parquet":
+            try:
+                import pyarrow as pa
+                import pyarrow.parquet as pq
+            except ImportError:
+                raise ValueError("Parquet support requires pyarrow")
+
+            pq.write_table(pa.table(data), file_path)
         else:
             raise ValueError(f"Unsupported file format: {file_path.suffix}")
 
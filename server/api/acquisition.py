@@ -1,13 +1,16 @@
 """REST API endpoints for data acquisition."""
 
 import logging
+from dataclasses import asdict
 from typing import List, Optional
 
+import numpy as np
 from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel, Field
 
 from server.acquisition import (AcquisitionConfig, AcquisitionMode,
-                                ExportFormat, TriggerConfig, TriggerType,
+                                ExportFormat, ExportFormatUnavailable,
+                                TimingPolicy, TriggerConfig, TriggerType,
                                 acquisition_manager)
 from server.equipment.manager import equipment_manager
 
@@ -31,8 +34,12 @@ class CreateSessionRequest(BaseModel):
     sample_rate: float = Field(default=1.0, gt=0)
     num_samples: Optional[int] = Field(None, ge=1)
     duration_seconds: Optional[float] = Field(None, gt=0)
+    timing_policy: TimingPolicy = TimingPolicy.SKIP
     channels: List[str] = Field(default=["CH1"])
+    max_concurrent_reads: int = Field(default=4, ge=1)
+    block_size: Optional[int] = Field(default=None, ge=1)
     buffer_size: int = Field(default=10000, ge=100)
+    spill_to_disk: bool = False
     auto_export: bool = False
     export_format: ExportFormat = ExportFormat.CSV
 
@@ -74,8 +81,12 @@ async def create_session(request: CreateSessionRequest):
             sample_rate=request.sample_rate,
             num_samples=request.num_samples,
             duration_seconds=request.duration_seconds,
+            timing_policy=request.timing_policy,
             channels=request.channels,
+            max_concurrent_reads=request.max_concurrent_reads,
+            block_size=request.block_size,
             buffer_size=request.buffer_size,
+            spill_to_disk=request.spill_to_disk,
             auto_export=request.auto_export,
             export_format=request.export_format,
         )
@@ -238,12 +249,24 @@ async def get_acquisition_data(
     num_samples: Optional[int] = Query(
         None, description="Number of samples to retrieve"
     ),
+    since: Optional[int] = Query(
+        None,
+        ge=0,
+        description="Only return samples from this sequence number onward",
+    ),
 ):
     """Get data from acquisition buffer."""
     try:
-        data, timestamps = acquisition_manager.get_buffer_data(
-            acquisition_id, num_samples
-        )
+        gap = 0
+        if since is not None:
+            data, timestamps, next_sequence, gap = (
+                acquisition_manager.get_buffer_data_since(acquisition_id, since)
+            )
+        else:
+            data, timestamps = acquisition_manager.get_buffer_data(
+                acquisition_id, num_samples
+            )
+            next_sequence = acquisition_manager.get_buffer_sequence(acquisition_id)
 
         session = acquisition_manager.get_session(acquisition_id)
         if not session:
@@ -267,6 +290,8 @@ async def get_acquisition_data(
                 },
             },
             "count": len(timestamps),
+            "next_sequence": next_sequence,
+            "missed_samples": gap,
         }
 
     except ValueError as e:
@@ -325,6 +350,8 @@ async def export_data(request: ExportDataRequest):
             "format": request.format,
         }
 
+    except ExportFormatUnavailable as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
@@ -371,7 +398,7 @@ async def get_rolling_stats(
     Args:
         acquisition_id: Acquisition session ID
         channel: Channel name
-        num_samples: Number of samples to analyze (None = all)
+        num_samples: Number of samples to analyze (None = buffer size)
 
     Returns:
         Rolling statistics (mean, std, min, max, etc.)
@@ -425,7 +452,7 @@ async def get_fft_analysis(
     Args:
         acquisition_id: Acquisition session ID
         channel: Channel name
-        num_samples: Number of samples to analyze (None = all)
+        num_samples: Number of samples to analyze (None = buffer size)
         window: Window function (hann, hamming, blackman)
 
     Returns:
@@ -474,7 +501,7 @@ async def detect_trend(
     Args:
         acquisition_id: Acquisition session ID
         channel: Channel name
-        num_samples: Number of samples to analyze (None = all)
+        num_samples: Number of samples to analyze (None = buffer size)
 
     Returns:
         Trend analysis (rising, falling, stable, noisy)
@@ -576,7 +603,7 @@ async def detect_peaks(
     Args:
         acquisition_id: Acquisition session ID
         channel: Channel name
-        num_samples: Number of samples to analyze (None = all)
+        num_samples: Number of samples to analyze (None = buffer size)
         prominence: Required prominence of peaks
         distance: Minimum distance between peaks
         height: Minimum height of peaks
@@ -686,6 +713,8 @@ class CreateSyncGroupRequest(BaseModel):
     sync_tolerance_ms: float = 10.0
     wait_for_all: bool = True
     auto_align_timestamps: bool = True
+    resample_method: str = "linear"
+    resample_period_ms: Optional[float] = Field(None, gt=0)
 
 
 class AddToSyncGroupRequest(BaseModel):
@@ -707,7 +736,8 @@ async def create_sync_group(request: CreateSyncGroupRequest):
         Sync group status
     """
     try:
-        from acquisition.synchronization import SyncConfig, sync_manager
+        from acquisition.synchronization import (ResampleMethod, SyncConfig,
+                                                 sync_manager)
 
         config = SyncConfig(
             group_id=request.group_id,
@@ -716,6 +746,8 @@ async def create_sync_group(request: CreateSyncGroupRequest):
             sync_tolerance_ms=request.sync_tolerance_ms,
             wait_for_all=request.wait_for_all,
             auto_align_timestamps=request.auto_align_timestamps,
+            resample_method=ResampleMethod(request.resample_method),
+            resample_period_ms=request.resample_period_ms,
         )
 
         group = await sync_manager.create_sync_group(config)
@@ -976,6 +1008,69 @@ async def get_sync_group_data(group_id: str, num_samples: Optional[int] = None):
         raise HTTPException(status_code=500, detail=f"Failed to get data: {str(e)}")
 
 
+def _nan_to_none(values) -> list:
+    """Convert an array to a JSON-safe list with NaN as null."""
+    values = np.asarray(values, dtype=np.float64)
+    result = values.astype(object)
+    result[np.isnan(values)] = None
+    return result.tolist()
+
+
+@router.get("/sync/group/{group_id}/aligned", summary="Get time-aligned data")
+async def get_sync_group_aligned_data(
+    group_id: str,
+    num_samples: Optional[int] = None,
+    method: Optional[str] = Query(
+        None, description="Resampling method: nearest, linear or zoh"
+    ),
+    period_ms: Optional[float] = Query(None, gt=0, description="Grid period"),
+):
+    """
+    Get data from all acquisitions in a group resampled onto one time grid.
+
+    Returns a single matrix with one row per device channel, the common
+    timestamps, and the sample-time skew of each device relative to the
+    master.
+    """
+    try:
+        from acquisition.synchronization import ResampleMethod, sync_manager
+
+        group = await sync_manager.get_sync_group(group_id)
+        if group is None:
+            raise HTTPException(
+                status_code=404, detail=f"Sync group {group_id} not found"
+            )
+
+        aligned = await group.get_aligned_data(
+            acquisition_manager,
+            num_samples,
+            method=ResampleMethod(method) if method else None,
+            period_ms=period_ms,
+        )
+
+        return {
+            "success": True,
+            "group_id": group_id,
+            "method": aligned.method,
+            "period_ms": aligned.period_ms,
+            "channels": aligned.channels,
+            "timestamps": aligned.timestamps.tolist(),
+            "data": _nan_to_none(aligned.data),
+            "skew": {
+                equipment_id: asdict(stats)
+                for equipment_id, stats in aligned.skew.items()
+            },
+        }
+
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error getting aligned sync group data: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to get data: {str(e)}")
+
+
 @router.get("/sync/groups", summary="List all sync groups")
 async def list_sync_groups():
     """List all synchronization groups."""
@@ -55,6 +55,13 @@ class ConnectDeviceRequest(BaseModel):
     model: str
 
 
+class BulkConnectRequest(BaseModel):
+    """Request to connect to several devices at once."""
+
+    devices: List[ConnectDeviceRequest]
+    max_concurrent: Optional[int] = None
+
+
 class DiscoverDevicesResponse(BaseModel):
     """Response for device discovery."""
 
@@ -89,6 +96,20 @@ async def connect_device(request: ConnectDeviceRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/connect/bulk", response_model=dict)
+async def connect_devices(request: BulkConnectRequest):
+    """Connect to several devices concurrently, reporting each result."""
+    results = await equipment_manager.connect_devices(
+        [(d.resource_string, d.equipment_type, d.model) for d in request.devices],
+        max_concurrent=request.max_concurrent,
+    )
+    return {
+        "results": results,
+        "connected": sum(1 for r in results if r["success"]),
+        "failed": sum(1 for r in results if not r["success"]),
+    }
+
+
 @router.post("/disconnect/{equipment_id}")
 async def disconnect_device(equipment_id: str, session_id: Optional[str] = None):
     """Disconnect a device."""
@@ -1,8 +1,12 @@
 """API endpoints for advanced waveform capture and analysis."""
 
+import asyncio
+import base64
+import json
 from typing import List, Optional
 
 from fastapi import APIRouter, Body, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 from waveform.analyzer import WaveformAnalyzer
 from waveform.manager import WaveformManager
@@ -95,6 +99,17 @@ class ContinuousAcquisitionRequest(BaseModel):
     rate_hz: float = Field(10.0, description="Acquisition rate in Hz")
 
 
+class DeepCaptureRequest(BaseModel):
+    """Deep-memory waveform download request."""
+
+    equipment_id: str = Field(..., description="Equipment ID")
+    channel: int = Field(1, description="Channel number")
+    points: Optional[int] = Field(
+        None, description="Points to read from the start of memory (None = all)"
+    )
+    word: bool = Field(False, description="Read 16-bit WORD instead of BYTE data")
+
+
 class AcquisitionResponse(BaseModel):
     """Continuous acquisition response."""
 
@@ -127,6 +142,60 @@ async def capture_waveform(request: CaptureRequest):
         raise HTTPException(status_code=400, detail=str(e))
 
 
+@router.post("/deep")
+async def download_deep_waveform(request: DeepCaptureRequest):
+    """Download a scope's deep acquisition memory, streaming progress.
+
+    The response is newline-delimited JSON: a "progress" event per chunk
+    read, then either a "complete" event carrying sample_rate, x_origin,
+    points and the voltages as base64 little-endian float32, or an "error"
+    event.
+    """
+    if not waveform_manager:
+        raise HTTPException(status_code=500, detail="Waveform manager not initialized")
+
+    equipment = waveform_manager.equipment_manager.get_equipment(request.equipment_id)
+    if not equipment:
+        raise HTTPException(
+            status_code=404, detail=f"Equipment not found: {request.equipment_id}"
+        )
+    if not hasattr(equipment, "get_waveform_deep"):
+        raise HTTPException(
+            status_code=400, detail="Equipment does not support deep memory download"
+        )
+
+    events: asyncio.Queue = asyncio.Queue()
+
+    def on_progress(points_read: int, total: int):
+        events.put_nowait(
+            {"type": "progress", "points_read": points_read, "total": total}
+        )
+
+    async def download():
+        try:
+            voltages, info = await equipment.get_waveform_deep(
+                request.channel, request.points, request.word, on_progress
+            )
+            data = base64.b64encode(voltages.astype("<f4").tobytes()).decode("ascii")
+            events.put_nowait({"type": "complete", **info, "data": data})
+        except Exception as e:
+            events.put_nowait({"type": "error", "error": str(e)})
+
+    async def stream():
+        task = asyncio.create_task(download())
+        try:
+            while True:
+                event = await events.get()
+                yield json.dumps(event) + "\n"
+                if event["type"] != "progress":
+                    break
+        finally:
+            # Client went away: stop the download, which restores the scope
+            task.cancel()
+
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
+
+
 @router.get("/cached/{equipment_id}/{channel}", response_model=ExtendedWaveformData)
 async def get_cached_waveform(equipment_id: str, channel: int):
     """Get cached waveform for equipment/channel."""
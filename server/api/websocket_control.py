@@ -19,6 +19,7 @@ class CompressionTypeAPI(str, Enum):
     NONE = "none"
     GZIP = "gzip"
     ZLIB = "zlib"
+    DEFLATE = "deflate"
 
 
 class MessagePriorityAPI(str, Enum):
@@ -268,6 +269,7 @@ async def send_test_message(request: SendTestMessageRequest):
         CompressionTypeAPI.NONE: CompressionType.NONE,
         CompressionTypeAPI.GZIP: CompressionType.GZIP,
         CompressionTypeAPI.ZLIB: CompressionType.ZLIB,
+        CompressionTypeAPI.DEFLATE: CompressionType.DEFLATE,
     }
 
     priority = priority_map[request.priority]
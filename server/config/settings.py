@@ -61,6 +61,40 @@ class Settings(BaseSettings):
     command_timeout_ms: int = Field(
         default=5000, ge=100, description="Command execution timeout (ms)"
     )
+    max_concurrent_connects: int = Field(
+        default=8,
+        ge=1,
+        le=64,
+        description="Maximum devices connected or reconnected at once",
+    )
+    enable_adaptive_timeouts: bool = Field(
+        default=True,
+        description="Derive I/O timeouts from each device's observed latency",
+    )
+    adaptive_timeout_multiplier: float = Field(
+        default=4.0, ge=1.0, description="I/O timeout as a multiple of p99 latency"
+    )
+    adaptive_timeout_floor_ms: int = Field(
+        default=250, ge=10, description="Shortest adaptive I/O timeout (ms)"
+    )
+    adaptive_timeout_ceiling_ms: int = Field(
+        default=10000, ge=100, description="Longest adaptive I/O timeout (ms)"
+    )
+    circuit_breaker_threshold: int = Field(
+        default=3,
+        ge=1,
+        description="Consecutive timeouts before a device's I/O fails fast",
+    )
+    circuit_breaker_reset_sec: float = Field(
+        default=5.0,
+        ge=0.1,
+        description="Seconds a tripped device fails fast before a probe command",
+    )
+    alarm_reading_max_age_sec: float = Field(
+        default=1.0,
+        ge=0.0,
+        description="Oldest shared reading (seconds) an alarm check accepts",
+    )
 
     # ==================== Error Handling & Recovery ====================
     enable_auto_reconnect: bool = Field(
@@ -92,6 +126,9 @@ class Settings(BaseSettings):
     retry_delay_ms: int = Field(
         default=500, ge=100, description="Delay between command retries (ms)"
     )
+    retry_max_delay_ms: int = Field(
+        default=5000, ge=100, description="Longest delay between command retries (ms)"
+    )
 
     # ==================== Logging Configuration ====================
     log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] = Field(
@@ -9,6 +9,7 @@ from typing import Any, Dict, List, Optional
 
 import psutil
 
+from .metrics import CommandMetrics
 from .models import (CommunicationDiagnostics, ConnectionDiagnostics,
                      DiagnosticCategory, DiagnosticReport, DiagnosticResult,
                      DiagnosticStatus, DiagnosticTest, EquipmentHealth,
@@ -41,17 +42,8 @@ class DiagnosticsManager:
             }
         )
 
-        self._communication_stats: Dict[str, Dict] = defaultdict(
-            lambda: {
-                "total_commands": 0,
-                "successful": 0,
-                "failed": 0,
-                "timeouts": 0,
-                "retries": 0,
-                "response_times": [],
-                "bytes_sent": 0,
-                "bytes_received": 0,
-            }
+        self._communication_stats: Dict[str, CommandMetrics] = defaultdict(
+            CommandMetrics
         )
 
         self._server_start_time = datetime.now()
@@ -217,54 +209,59 @@ class DiagnosticsManager:
 
     async def _check_communication(self, equipment_id: str) -> CommunicationDiagnostics:
         """Check communication quality and statistics."""
+        from equipment.manager import equipment_manager
+
         stats = self._communication_stats[equipment_id]
 
         # Calculate statistics
-        total = stats["total_commands"]
-        successful = stats["successful"]
-        failed = stats["failed"]
+        total = stats.total_commands
+        successful = stats.successful
+        failed = stats.failed
 
-        response_times = stats["response_times"][-100:]  # Last 100
-        avg_response = (
-            sum(response_times) / len(response_times) if response_times else 0
-        )
-        min_response = min(response_times) if response_times else 0
-        max_response = max(response_times) if response_times else 0
+        response_times = stats.recent_latencies(100)  # Last 100
+        avg_response = float(response_times.mean()) if len(response_times) else 0
+        min_response = float(response_times.min()) if len(response_times) else 0
+        max_response = float(response_times.max()) if len(response_times) else 0
 
         # Calculate data transfer rate (simplified)
         data_rate = 0.0
-        if stats["bytes_sent"] + stats["bytes_received"] > 0:
+        if stats.bytes_sent + stats.bytes_received > 0:
             # Assume over last hour or uptime
             time_window = 3600  # seconds
-            total_bytes = stats["bytes_sent"] + stats["bytes_received"]
+            total_bytes = stats.bytes_sent + stats.bytes_received
             data_rate = (total_bytes * 8) / time_window  # bits per second
 
         # Get recent errors
-        error_history = []
-        for err in stats.get("error_list", [])[-10:]:
-            error_history.append(err)
+        error_history = stats.recent_errors(10)
 
         # Calculate error rate
         error_rate = None
         if total > 0:
             error_rate = (failed / total) * 100
 
+        # I/O worker queue statistics of the connected driver
+        equipment = equipment_manager.get_equipment(equipment_id)
+        io_queue = equipment.get_io_stats() if equipment else {}
+
         return CommunicationDiagnostics(
             equipment_id=equipment_id,
             total_commands=total,
             successful_commands=successful,
             failed_commands=failed,
-            timeout_count=stats["timeouts"],
-            retry_count=stats["retries"],
+            timeout_count=stats.timeouts,
+            retry_count=stats.retries,
             average_response_time_ms=avg_response,
             min_response_time_ms=min_response,
             max_response_time_ms=max_response,
-            bytes_sent=stats["bytes_sent"],
-            bytes_received=stats["bytes_received"],
+            p50_response_time_ms=stats.percentile(50),
+            p99_response_time_ms=stats.percentile(99),
+            bytes_sent=stats.bytes_sent,
+            bytes_received=stats.bytes_received,
             data_transfer_rate_bps=data_rate,
-            last_error=stats.get("last_error"),
+            last_error=stats.last_error,
             error_history=error_history,
             error_rate=error_rate,
+            io_queue=io_queue if isinstance(io_queue, dict) else {},
         )
 
     async def _run_performance_benchmark(
@@ -872,29 +869,20 @@ class DiagnosticsManager:
         bytes_sent: int = 0,
         bytes_received: int = 0,
         error: Optional[str] = None,
+        timed_out: bool = False,
     ):
         """Record command execution statistics."""
-        stats = self._communication_stats[equipment_id]
-        stats["total_commands"] += 1
-
-        if success:
-            stats["successful"] += 1
-        else:
-            stats["failed"] += 1
-            if error:
-                if "error_list" not in stats:
-                    stats["error_list"] = []
-                stats["error_list"].append(
-                    {"timestamp": datetime.now(), "error": error}
-                )
-                stats["last_error"] = error
+        self._communication_stats[equipment_id].record(
+            response_time_ms, success, bytes_sent, bytes_received, error, timed_out
+        )
 
-        stats["response_times"].append(response_time_ms)
-        if len(stats["response_times"]) > 1000:
-            stats["response_times"] = stats["response_times"][-1000:]
+    def get_command_metrics(self, equipment_id: str) -> CommandMetrics:
+        """Get the command metrics recorder of a piece of equipment.
 
-        stats["bytes_sent"] += bytes_sent
-        stats["bytes_received"] += bytes_received
+        Equipment drivers keep this object and record into it directly, so
+        the I/O path does not look up the manager on every command.
+        """
+        return self._communication_stats[equipment_id]
 
     def get_health_cache(self, equipment_id: str) -> Optional[EquipmentHealth]:
         """Get cached health status."""
@@ -0,0 +1,194 @@
+"""Fixed-memory command metrics for equipment I/O.
+
+Recording a command is on the I/O hot path, so it must not allocate or
+copy: CommandMetrics writes each latency into a preallocated NumPy ring
+buffer, keeps plain integer counters and bounds the error history. The
+ring is folded into a log-linear (HDR-style) latency histogram in one
+vectorized step whenever it fills up or statistics are read. Recording
+happens on the event loop thread only, so no locking is needed.
+"""
+
+import math
+import time
+from collections import deque
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+# Ring buffer size for recent latencies, and errors kept per equipment
+LATENCY_RING_SIZE = 1000
+ERROR_HISTORY_SIZE = 100
+
+
+class LatencyHistogram:
+    """Log-linear latency histogram with bounded relative error.
+
+    Values (in microseconds) are bucketed by power of two, and each power of
+    two is split into ``sub_buckets`` linear buckets, so every recorded
+    value is known to within 1/sub_buckets of itself however wide the range.
+    """
+
+    def __init__(self, sub_buckets: int = 32, max_exponent: int = 40):
+        """
+        Initialize histogram.
+
+        Args:
+            sub_buckets: Linear buckets per power of two (precision)
+            max_exponent: Largest power of two tracked, in microseconds
+                (40 is about 12 days)
+        """
+        self.sub_buckets = sub_buckets
+        self._counts = np.zeros((max_exponent + 1) * sub_buckets, dtype=np.int64)
+        self.count = 0
+
+    def record_many(self, values_ms: np.ndarray):
+        """Add latencies in milliseconds."""
+        if len(values_ms) == 0:
+            return
+        mantissa, exponent = np.frexp(values_ms * 1000.0)  # 0.5 <= mantissa < 1
+        index = exponent * self.sub_buckets + (
+            (mantissa - 0.5) * (2 * self.sub_buckets)
+        ).astype(np.int64)
+        index[exponent < 1] = 0
+        np.clip(index, 0, len(self._counts) - 1, out=index)
+        self._counts += np.bincount(index, minlength=len(self._counts))
+        self.count += len(values_ms)
+
+    def _bucket_value_ms(self, index: int) -> float:
+        """Upper edge of a bucket in milliseconds."""
+        exponent, sub = divmod(index, self.sub_buckets)
+        return math.ldexp(0.5 + (sub + 1) / (2 * self.sub_buckets), exponent) / 1000.0
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Get a latency percentile (0-100) in milliseconds, or None if empty."""
+        if self.count == 0:
+            return None
+        rank = max(1, math.ceil(q / 100 * self.count))
+        index = int(np.searchsorted(np.cumsum(self._counts), rank))
+        return self._bucket_value_ms(index)
+
+    def reset(self):
+        """Forget all recorded values."""
+        self._counts[:] = 0
+        self.count = 0
+
+
+class CommandMetrics:
+    """Command counters, recent latencies and latency histogram for one device."""
+
+    def __init__(
+        self,
+        ring_size: int = LATENCY_RING_SIZE,
+        error_history: int = ERROR_HISTORY_SIZE,
+    ):
+        """
+        Initialize metrics.
+
+        Args:
+            ring_size: Most recent latencies kept
+            error_history: Most recent errors kept
+        """
+        self._latencies = np.zeros(ring_size, dtype=np.float64)
+        # Scalar stores through a memoryview skip NumPy's per-item overhead
+        self._latency_view = memoryview(self._latencies)
+        self._ring_size = ring_size
+        self._histogram = LatencyHistogram()
+        self._folded = 0  # Commands whose latency is in the histogram
+        self.errors: deque = deque(maxlen=error_history)
+
+        self.total_commands = 0
+        self.successful = 0
+        self.failed = 0
+        self.timeouts = 0
+        self.retries = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.last_error: Optional[str] = None
+
+    def record(
+        self,
+        response_time_ms: float,
+        success: bool = True,
+        bytes_sent: int = 0,
+        bytes_received: int = 0,
+        error: Optional[str] = None,
+        timed_out: bool = False,
+    ):
+        """
+        Record one command.
+
+        Args:
+            response_time_ms: Time from submitting the command to its result
+            success: Whether the command succeeded
+            bytes_sent: Bytes written
+            bytes_received: Bytes read
+            error: Error message of a failed command
+            timed_out: Whether the command failed by timing out
+        """
+        slot = self.total_commands % self._ring_size
+        self._latency_view[slot] = response_time_ms
+        self.total_commands += 1
+        if slot == self._ring_size - 1:
+            self._fold()  # The next record overwrites the oldest latency
+        self.bytes_sent += bytes_sent
+        self.bytes_received += bytes_received
+
+        if success:
+            self.successful += 1
+        else:
+            self.failed += 1
+            self.timeouts += timed_out
+            if error:
+                self.errors.append((time.time(), error))
+                self.last_error = error
+
+    def recent_latencies(self, n: Optional[int] = None) -> np.ndarray:
+        """
+        Get the most recent latencies, oldest first.
+
+        Args:
+            n: Number of latencies (None = all kept)
+
+        Returns:
+            Copy of up to n latencies in milliseconds
+        """
+        kept = min(self.total_commands, self._ring_size)
+        n = kept if n is None else min(n, kept)
+        end = self.total_commands % self._ring_size
+        indices = np.arange(end - n, end) % self._ring_size
+        return self._latencies[indices]
+
+    def _fold(self):
+        """Move latencies not yet in the histogram into it."""
+        self._histogram.record_many(
+            self.recent_latencies(self.total_commands - self._folded)
+        )
+        self._folded = self.total_commands
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Get a latency percentile (0-100) in milliseconds, or None if empty."""
+        self._fold()
+        return self._histogram.percentile(q)
+
+    def recent_errors(self, n: int) -> List[Dict[str, Any]]:
+        """Get the most recent errors as {"timestamp", "error"} dicts."""
+        return [
+            {"timestamp": datetime.fromtimestamp(timestamp), "error": error}
+            for timestamp, error in list(self.errors)[-n:]
+        ]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get counters and latency percentiles."""
+        return {
+            "total_commands": self.total_commands,
+            "successful": self.successful,
+            "failed": self.failed,
+            "timeouts": self.timeouts,
+            "bytes_sent": self.bytes_sent,
+            "bytes_received": self.bytes_received,
+            "p50_ms": self.percentile(50),
+            "p90_ms": self.percentile(90),
+            "p99_ms": self.percentile(99),
+            "p999_ms": self.percentile(99.9),
+        }
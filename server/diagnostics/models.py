@@ -132,6 +132,8 @@ class CommunicationDiagnostics(BaseModel):
     average_response_time_ms: float = 0.0
     min_response_time_ms: float = 0.0
     max_response_time_ms: float = 0.0
+    p50_response_time_ms: Optional[float] = None
+    p99_response_time_ms: Optional[float] = None
 
     # Data transfer
     bytes_sent: int = 0
@@ -143,6 +145,9 @@ class CommunicationDiagnostics(BaseModel):
     error_history: List[Dict[str, Any]] = Field(default_factory=list)
     error_rate: Optional[float] = None  # Percentage of failed commands
 
+    # I/O worker queue (depth, wait and service times)
+    io_queue: Dict[str, Any] = Field(default_factory=dict)
+
 
 class PerformanceBenchmark(BaseModel):
     """Performance benchmark results."""
@@ -6,12 +6,14 @@ from .manager import equipment_manager
 from .mock.mock_electronic_load import MockElectronicLoad
 from .mock.mock_oscilloscope import MockOscilloscope
 from .mock.mock_power_supply import MockPowerSupply
+from .readings import reading_service
 from .rigol_electronic_load import RigolDL3021A
 from .rigol_scope import RigolDS1102D, RigolDS1104, RigolMSO2072A
 
 __all__ = [
     "BaseEquipment",
     "equipment_manager",
+    "reading_service",
     "RigolMSO2072A",
     "RigolDS1104",
     "RigolDS1102D",
@@ -3,18 +3,162 @@
 import asyncio
 import hashlib
 import logging
+import time
 from abc import ABC, abstractmethod
-from typing import Any, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
 from pyvisa import ResourceManager
+from pyvisa.constants import StatusCode
+from pyvisa.errors import InvalidSession, VisaIOError
 from pyvisa.resources import MessageBasedResource
 
 from shared.models.equipment import (ConnectionType, EquipmentInfo,
                                      EquipmentStatus, EquipmentType)
 
+from .error_handler import is_timeout_error
+from .io_worker import InstrumentIOWorker
+from .timeouts import AdaptiveTimeout, CircuitBreaker
+
 logger = logging.getLogger(__name__)
 
 
+# Commands that reset or recall instrument settings wholesale
+SETTINGS_RESET_COMMANDS = ("*RST", "*RCL", "SYST:PRES", "AUT")
+
+
+def scpi_header(command: str) -> str:
+    """Normalize the header of one SCPI command to its short form.
+
+    Long and short spellings of a mnemonic map to the same key, using the
+    IEEE 488.2 rule: the first four letters, or three if the fourth is a
+    vowel; numeric suffixes are kept.
+
+    Args:
+        command: SCPI command (e.g. ":WAVeform:SOURce CHAN2")
+
+    Returns:
+        Upper-case short-form header without leading colon (e.g. "WAV:SOUR")
+    """
+    header = command.strip().split(" ", 1)[0].lstrip(":").upper()
+
+    mnemonics = []
+    for mnemonic in header.split(":"):
+        stem = mnemonic.rstrip("0123456789")
+        suffix = mnemonic[len(stem) :]
+        if len(stem) > 4:
+            stem = stem[:3] if stem[3] in "AEIOU" else stem[:4]
+        mnemonics.append(stem + suffix)
+
+    return ":".join(mnemonics)
+
+
+def parse_setting(command: str) -> Optional[Tuple[str, str]]:
+    """Split a setting write into (header, value).
+
+    Args:
+        command: SCPI command (e.g. ":WAV:FORM BYTE")
+
+    Returns:
+        Normalized header and value (e.g. ("WAV:FORM", "BYTE")), or None for
+        queries, common commands, compound commands and commands without an
+        argument
+    """
+    command = command.strip()
+    if command.endswith("?") or command.startswith("*") or ";" in command:
+        return None
+    _, _, value = command.partition(" ")
+    if not value.strip():
+        return None
+    return scpi_header(command), value.strip()
+
+
+def is_resource_manager_alive(resource_manager) -> bool:
+    """Check that a resource manager's VISA session is open.
+
+    Only inspects the session handle, so unlike list_resources() it never
+    scans the bus.
+    """
+    if resource_manager is None:
+        return False
+
+    try:
+        _ = resource_manager.session
+        return True
+    except Exception:
+        return False
+
+
+def is_resource_manager_error(error: Exception) -> bool:
+    """Check whether an error means the resource manager itself is unusable.
+
+    Missing devices, timeouts and bad resource strings are not manager
+    errors; only an invalid manager session or object is.
+    """
+    if isinstance(error, InvalidSession):
+        return True
+    # VI_ERROR_INV_SESSION shares its status code with VI_ERROR_INV_OBJECT
+    return (
+        isinstance(error, VisaIOError)
+        and error.error_code == StatusCode.error_invalid_object
+    )
+
+
+def is_resource_manager_usable(resource_manager, failed: bool = False) -> bool:
+    """Check whether a resource manager can keep being used.
+
+    The session handle is checked every time. After a manager-level error
+    (failed), list_resources() decides, so a manager is only rebuilt when
+    its session is closed or a bus scan fails.
+    """
+    if not is_resource_manager_alive(resource_manager):
+        return False
+    if not failed:
+        return True
+
+    try:
+        resource_manager.list_resources()
+        return True
+    except Exception:
+        return False
+
+
+def release_resource_manager(resource_manager):
+    """Close a replaced resource manager unless instruments still use it.
+
+    pyvisa's ResourceManager.close() also closes every resource it opened,
+    so a manager with live instruments is left for them to finish with.
+    """
+    try:
+        opened = resource_manager.list_opened_resources()
+    except Exception:
+        return
+
+    if opened:
+        logger.warning(
+            f"Keeping replaced resource manager open for {len(opened)} instruments"
+        )
+        return
+
+    try:
+        resource_manager.close()
+    except Exception:
+        pass
+
+
+def _payload_size(response: Any) -> int:
+    """Approximate bytes received for a call's result."""
+    if response is None:
+        return 0
+    if isinstance(response, (str, bytes)):
+        return len(response)
+    if isinstance(response, np.ndarray):
+        return response.nbytes
+    if isinstance(response, list):
+        return sum(_payload_size(r) for r in response)
+    return 0
+
+
 def generate_equipment_id(resource_string: str, prefix: str) -> str:
     """Generate a deterministic equipment ID from the resource string.
 
@@ -35,6 +179,27 @@ def generate_equipment_id(resource_string: str, prefix: str) -> str:
 class BaseEquipment(ABC):
     """Base class for all lab equipment."""
 
+    # Whether independent channel reads may be issued concurrently. VISA
+    # sessions are not safe for interleaved query traffic, so drivers opt in.
+    supports_concurrent_reads = False
+
+    # Whether the instrument accepts several SCPI commands joined with ';' in
+    # one message and answers all of its queries in one ';'-separated reply.
+    supports_compound_commands = False
+
+    # I/O timeout (ms) used to connect, and until the device's latency is known
+    default_timeout_ms = 10000
+
+    # Fixed timeouts (ms) for commands far slower than the device's usual
+    # I/O, keyed by header prefix. These are not adapted and their latency
+    # does not feed the adaptive timeout.
+    command_timeouts_ms: Dict[str, int] = {
+        "AUT": 30000,  # Autoscale
+        "*RST": 15000,
+        "*TST?": 60000,
+        "*CAL?": 120000,
+    }
+
     def __init__(self, resource_manager: ResourceManager, resource_string: str):
         """Initialize equipment."""
         self.resource_manager = resource_manager
@@ -44,6 +209,18 @@ class BaseEquipment(ABC):
         self.cached_info: Optional[EquipmentInfo] = None
         self._lock = asyncio.Lock()
         self._is_connecting = False  # Flag to prevent recursion during connection
+        self._resource_manager_failed = False  # Set when opening a resource fails
+        self._io_worker: Optional[InstrumentIOWorker] = None
+        self._settings_cache: Dict[str, str] = {}  # Last value written per setting
+        self._timeouts = AdaptiveTimeout.from_settings(self.default_timeout_ms)
+        self._circuit = CircuitBreaker.from_settings(resource_string)
+        self._command_timeouts_ms = {
+            self._header(prefix): ms
+            for prefix, ms in self.command_timeouts_ms.items()
+        }
+        self._applied_timeout_ms: Optional[int] = None  # Last timeout on the session
+        self._metrics = None  # Diagnostics CommandMetrics for _metrics_id
+        self._metrics_id: Optional[str] = None
 
     def _is_instrument_valid(self) -> bool:
         """Check if the instrument session is still valid."""
@@ -58,31 +235,43 @@ class BaseEquipment(ABC):
             return False
 
     def _is_resource_manager_valid(self) -> bool:
-        """Check if the resource manager is still valid."""
-        if not self.resource_manager:
-            return False
+        """Check if the resource manager is still valid.
+
+        Cheap enough for every connect: only checks the session handle,
+        unless an open failed with a manager-level error, in which case
+        list_resources() decides.
+        """
+        valid = is_resource_manager_usable(
+            self.resource_manager, self._resource_manager_failed
+        )
+        if valid:
+            self._resource_manager_failed = False
+        return valid
 
+    def _open_resource(self) -> MessageBasedResource:
+        """Open this equipment's resource, flagging manager-level failures."""
         try:
-            # Try to list resources to check if manager is still valid
-            _ = self.resource_manager.list_resources()
-            return True
-        except Exception:
-            return False
+            instrument = self.resource_manager.open_resource(self.resource_string)
+            self._applied_timeout_ms = None
+            return instrument
+        except Exception as e:
+            # Make the next connect attempt check the manager with a bus scan
+            if is_resource_manager_error(e):
+                self._resource_manager_failed = True
+            raise
 
     def _refresh_resource_manager(self):
         """Refresh the resource manager if it's invalid."""
         if not self._is_resource_manager_valid():
             logger.warning(f"Resource manager invalid, creating new one for {self.resource_string}")
             try:
-                # Close the old one if possible
+                # Close the old one if no other instrument still uses it
                 if self.resource_manager:
-                    try:
-                        self.resource_manager.close()
-                    except Exception:
-                        pass
+                    release_resource_manager(self.resource_manager)
                 # Create a new resource manager
                 from pyvisa import ResourceManager
                 self.resource_manager = ResourceManager("@py")
+                self._resource_manager_failed = False
                 logger.info("Created new resource manager")
             except Exception as e:
                 logger.error(f"Failed to create new resource manager: {e}")
@@ -116,9 +305,8 @@ class BaseEquipment(ABC):
             try:
                 # Set flag to prevent recursion during connection
                 self._is_connecting = True
-
-                # Ensure resource manager is valid before opening resource
-                self._refresh_resource_manager()
+                self.invalidate_settings()
+                self._circuit.reset()
 
                 # Close old instrument if it exists
                 if self.instrument is not None:
@@ -128,13 +316,13 @@ class BaseEquipment(ABC):
                         pass  # Ignore errors when closing invalid sessions
                     self.instrument = None
 
-                # Open the resource
-                self.instrument = self.resource_manager.open_resource(
-                    self.resource_string
-                )
+                # Ensure resource manager is valid before opening resource
+                await self._run_io(self._refresh_resource_manager)
 
-                # Set timeout (10 seconds)
-                self.instrument.timeout = 10000
+                # Open the resource on the I/O worker; a network open can
+                # block for seconds
+                self.instrument = await self._run_io(self._open_resource)
+                self._apply_timeout(self.default_timeout_ms)
 
                 # Verify connection with IDN query
                 idn = await self._query("*IDN?")
@@ -166,6 +354,243 @@ class BaseEquipment(ABC):
                     self.instrument = None
                     self.connected = False
 
+            self.invalidate_settings()
+
+            if self._io_worker is not None:
+                self._io_worker.close()
+                self._io_worker = None
+
+    def _get_io_worker(self) -> InstrumentIOWorker:
+        """Get this instrument's I/O worker, starting a new one if needed."""
+        if self._io_worker is None or self._io_worker.closed:
+            self._io_worker = InstrumentIOWorker(self.resource_string)
+        return self._io_worker
+
+    async def _run_io(self, func, *args, **kwargs) -> Any:
+        """Run a blocking instrument call on this instrument's I/O worker."""
+        return await self._get_io_worker().run(func, *args, **kwargs)
+
+    def get_io_stats(self) -> dict:
+        """Get I/O queue depth, wait time and service time statistics."""
+        return self._io_worker.get_stats() if self._io_worker else {}
+
+    def get_timeout_stats(self) -> Dict[str, Any]:
+        """Get the adaptive timeout, latency percentiles and circuit state."""
+        return {**self._timeouts.get_stats(), "circuit": self._circuit.get_stats()}
+
+    @staticmethod
+    def _header(command: str) -> str:
+        """Normalized header of a command (e.g. ":aut" -> "AUT")."""
+        return command.strip().split(" ", 1)[0].lstrip(":").upper()
+
+    def set_command_timeout(self, command: str, timeout_ms: Optional[int]):
+        """
+        Give commands starting with a header a fixed timeout.
+
+        Args:
+            command: Header prefix (e.g. ":AUT" or "*TST?")
+            timeout_ms: Timeout in milliseconds, or None to adapt it again
+        """
+        if timeout_ms is None:
+            self._command_timeouts_ms.pop(self._header(command), None)
+        else:
+            self._command_timeouts_ms[self._header(command)] = timeout_ms
+
+    def io_timeout_ms(self, commands: List[str]) -> Tuple[int, bool]:
+        """
+        Pick the I/O timeout for a call sending commands.
+
+        Args:
+            commands: Commands sent by the call
+
+        Returns:
+            (timeout in ms, whether it is the adaptive timeout)
+        """
+        overrides = [
+            ms
+            for command in commands
+            for prefix, ms in self._command_timeouts_ms.items()
+            if self._header(command).startswith(prefix)
+        ]
+        if overrides:
+            return max(overrides), False
+        if self._is_connecting:
+            return self.default_timeout_ms, False
+        return self._timeouts.timeout_ms, True
+
+    def _apply_timeout(self, timeout_ms: int):
+        """Set the session timeout unless it already has that value."""
+        if self._applied_timeout_ms != timeout_ms:
+            self.instrument.timeout = timeout_ms
+            self._applied_timeout_ms = timeout_ms
+
+    def _call_with_timeout(
+        self, timeout_ms: int, func, args, kwargs
+    ) -> Tuple[Any, float]:
+        """Run func under a session timeout (runs on the I/O worker).
+
+        Returns:
+            (result, service time in ms)
+        """
+        self._apply_timeout(timeout_ms)
+        start = time.perf_counter()
+        result = func(*args, **kwargs)
+        return result, (time.perf_counter() - start) * 1000
+
+    async def _run_timed(
+        self,
+        commands: List[str],
+        func,
+        *args,
+        round_trips: int = 1,
+        timeout_ms: Optional[int] = None,
+        pass_timeout: bool = False,
+        **kwargs,
+    ) -> Any:
+        """
+        Run instrument I/O under the adaptive timeout and circuit breaker.
+
+        Fails fast while the circuit is open, so a hung device does not hold
+        its I/O worker for a full timeout per queued call.
+
+        Args:
+            commands: Commands the call sends (selects per-command timeouts)
+            func: Blocking call to run on the I/O worker
+            *args: Positional arguments for func
+            round_trips: Request/response exchanges in the call; its latency
+                is recorded per exchange
+            timeout_ms: Fixed timeout for this call (None = pick one)
+            pass_timeout: Also give func the chosen timeout as its timeout_ms
+                keyword (for I/O that enforces its own deadline)
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            Result of func
+        """
+        self._circuit.before_call()
+
+        adaptive = False
+        if timeout_ms is None:
+            timeout_ms, adaptive = self.io_timeout_ms(commands)
+        if pass_timeout:
+            kwargs["timeout_ms"] = timeout_ms
+
+        start = time.perf_counter()
+        try:
+            result, latency_ms = await self._run_io(
+                self._call_with_timeout, timeout_ms, func, args, kwargs
+            )
+        except Exception as e:
+            timed_out = is_timeout_error(e)
+            self._record_command(commands, start, None, e, timed_out)
+            if timed_out:
+                self._circuit.record_timeout()
+                if self._circuit.state == CircuitBreaker.OPEN:
+                    logger.warning(
+                        f"{self.resource_string} timed out "
+                        f"{self._circuit.consecutive_timeouts} times in a row; "
+                        f"failing fast for {self._circuit.reset_sec}s"
+                    )
+            else:
+                self._circuit.record_error()
+            raise
+
+        self._record_command(commands, start, result)
+        self._circuit.record_success()
+        if adaptive:
+            self._timeouts.record(latency_ms / max(round_trips, 1))
+        return result
+
+    def _get_command_metrics(self):
+        """Get this equipment's diagnostics recorder, looked up once per ID."""
+        if self.cached_info is None:
+            return None  # Not identified yet (e.g. the connect *IDN? query)
+
+        if self._metrics_id != self.cached_info.id:
+            from diagnostics import diagnostics_manager
+
+            self._metrics = diagnostics_manager.get_command_metrics(
+                self.cached_info.id
+            )
+            self._metrics_id = self.cached_info.id
+        return self._metrics
+
+    def _record_command(
+        self,
+        commands: List[str],
+        start: float,
+        response: Any,
+        error: Optional[Exception] = None,
+        timed_out: bool = False,
+    ):
+        """Record a finished call in the diagnostics command metrics."""
+        try:
+            metrics = self._get_command_metrics()
+        except Exception:
+            return  # Diagnostics unavailable; never fail I/O because of it
+        if metrics is None:
+            return
+
+        metrics.record(
+            (time.perf_counter() - start) * 1000,
+            error is None,
+            sum(len(c) for c in commands),
+            _payload_size(response),
+            None if error is None else str(error),
+            timed_out,
+        )
+
+    def invalidate_settings(self, command: Optional[str] = None):
+        """
+        Forget cached setting values.
+
+        Args:
+            command: Command about to be sent outside the cache; only the
+                setting it touches is forgotten, unless it resets the
+                instrument. None forgets every setting.
+        """
+        if command is None:
+            self._settings_cache.clear()
+            return
+
+        for i, part in enumerate(command.split(";")):
+            part = part.strip()
+            header = scpi_header(part)
+            # A relative header in a compound command depends on the path
+            # left by the previous one, so its key is unknown
+            relative = i > 0 and not part.startswith((":", "*"))
+            if relative or header.startswith(SETTINGS_RESET_COMMANDS):
+                self._settings_cache.clear()
+                return
+            self._settings_cache.pop(header, None)
+
+    def _is_setting_cached(self, command: str) -> bool:
+        """Check whether a setting write would leave the instrument unchanged."""
+        setting = parse_setting(command)
+        return setting is not None and self._settings_cache.get(setting[0]) == setting[1]
+
+    def _cache_setting(self, command: str):
+        """Record the value written by a successful setting write."""
+        setting = parse_setting(command)
+        if setting is not None:
+            self._settings_cache[setting[0]] = setting[1]
+
+    async def _write_setting(self, command: str) -> bool:
+        """
+        Write a setting unless the instrument already has that value.
+
+        Args:
+            command: Setting command (e.g. ":WAV:FORM BYTE")
+
+        Returns:
+            True if the command was sent, False if it was skipped
+        """
+        if self._is_setting_cached(command):
+            return False
+        await self._write(command)
+        self._cache_setting(command)
+        return True
+
     async def _write(self, command: str):
         """Write a command to the instrument."""
         # Ensure we have a valid connection, reconnect if needed
@@ -174,35 +599,14 @@ class BaseEquipment(ABC):
         if not self.instrument:
             raise RuntimeError("Equipment not connected")
 
-        import time
-        start_time = time.time()
-        success = False
-        error_msg = None
+        # The instrument state may no longer match what was cached
+        self.invalidate_settings(command)
 
         try:
-            loop = asyncio.get_running_loop()
-            await loop.run_in_executor(None, self.instrument.write, command)
-            success = True
+            await self._run_timed([command], self.instrument.write, command)
         except Exception as e:
-            error_msg = str(e)
             logger.error(f"Error writing command '{command}': {e}")
             raise
-        finally:
-            # Record command statistics for diagnostics
-            response_time_ms = (time.time() - start_time) * 1000
-            try:
-                from diagnostics import diagnostics_manager
-                if hasattr(self, 'cached_info') and self.cached_info:
-                    diagnostics_manager.record_command(
-                        equipment_id=self.cached_info.id,
-                        success=success,
-                        response_time_ms=response_time_ms,
-                        bytes_sent=len(command.encode()),
-                        error=error_msg,
-                    )
-            except Exception:
-                # Don't let diagnostics recording interfere with operations
-                pass
 
     async def _query(self, command: str) -> str:
         """Query the instrument and return response."""
@@ -212,53 +616,145 @@ class BaseEquipment(ABC):
         if not self.instrument:
             raise RuntimeError("Equipment not connected")
 
-        import time
-        start_time = time.time()
-        success = False
-        error_msg = None
-        response = ""
-
         try:
-            loop = asyncio.get_running_loop()
-            response = await loop.run_in_executor(None, self.instrument.query, command)
-            success = True
+            response = await self._run_timed(
+                [command], self.instrument.query, command
+            )
             return response.strip()
         except Exception as e:
-            error_msg = str(e)
             logger.error(f"Error querying '{command}': {e}")
             raise
-        finally:
-            # Record command statistics for diagnostics
-            response_time_ms = (time.time() - start_time) * 1000
-            try:
-                from diagnostics import diagnostics_manager
-                if hasattr(self, 'cached_info') and self.cached_info:
-                    diagnostics_manager.record_command(
-                        equipment_id=self.cached_info.id,
-                        success=success,
-                        response_time_ms=response_time_ms,
-                        bytes_sent=len(command.encode()),
-                        bytes_received=len(response.encode()) if response else 0,
-                        error=error_msg,
-                    )
-            except Exception:
-                # Don't let diagnostics recording interfere with operations
-                pass
+
+    async def batch(
+        self, commands: List[str], cache_settings: bool = False
+    ) -> List[Optional[str]]:
+        """
+        Execute several commands with as few round-trips as possible.
+
+        Instruments that support compound commands receive all commands as one
+        ';'-joined message and the reply is split back into one response per
+        query. Other instruments run the commands back-to-back in a single call
+        on the I/O worker, so writes are pipelined without returning to the
+        event loop between commands.
+
+        Args:
+            commands: SCPI commands; those ending in '?' are queries
+            cache_settings: Skip setting writes whose value the instrument
+                already has, and remember the values written
+
+        Returns:
+            One entry per command: the stripped response for queries, None
+            for writes
+        """
+        if not commands:
+            return []
+
+        # Ensure we have a valid connection, reconnect if needed
+        await self._ensure_connected()
+
+        if not self.instrument:
+            raise RuntimeError("Equipment not connected")
+
+        skipped = [cache_settings and self._is_setting_cached(c) for c in commands]
+        sent = [c for c, skip in zip(commands, skipped) if not skip]
+        for command in sent:
+            if not command.rstrip().endswith("?"):
+                self.invalidate_settings(command)
+
+        if not sent:
+            return [None] * len(commands)
+
+        # The batch is recorded as one command for diagnostics
+        try:
+            if self.supports_compound_commands:
+                responses = await self._run_timed(sent, self._batch_compound, sent)
+            else:
+                responses = await self._run_timed(
+                    sent, self._batch_sequential, sent, round_trips=len(sent)
+                )
+        except Exception as e:
+            logger.error(f"Error executing batch {commands}: {e}")
+            raise
+
+        if cache_settings:
+            for command in sent:
+                self._cache_setting(command)
+
+        # Skipped writes answer None like any other write
+        replies = iter(responses)
+        return [None if skip else next(replies) for skip in skipped]
+
+    def _batch_compound(self, commands: List[str]) -> List[Optional[str]]:
+        """Send commands as one compound message (runs on the I/O worker)."""
+        # Root every header so each command is parsed from the top of the
+        # SCPI tree rather than relative to the previous one
+        message = ";".join(
+            c if c.startswith((":", "*")) else f":{c}" for c in commands
+        )
+        is_query = [c.rstrip().endswith("?") for c in commands]
+
+        if not any(is_query):
+            self.instrument.write(message)
+            return [None] * len(commands)
+
+        replies = self.instrument.query(message).strip().split(";")
+        if len(replies) != sum(is_query):
+            raise ValueError(
+                f"Expected {sum(is_query)} responses to compound command, "
+                f"got {len(replies)}: {';'.join(replies)!r}"
+            )
+
+        replies_iter = iter(replies)
+        return [next(replies_iter).strip() if q else None for q in is_query]
+
+    def _batch_sequential(self, commands: List[str]) -> List[Optional[str]]:
+        """Run commands back-to-back (runs on the I/O worker)."""
+        responses: List[Optional[str]] = []
+        for command in commands:
+            if command.rstrip().endswith("?"):
+                responses.append(self.instrument.query(command).strip())
+            else:
+                self.instrument.write(command)
+                responses.append(None)
+        return responses
 
     async def _query_binary(self, command: str) -> bytes:
         """Query the instrument and return binary response."""
+        response = await self._query_binary_array(command)
+        return np.asarray(response, dtype=np.uint8).tobytes()
+
+    async def _query_binary_array(
+        self, command: str, datatype: str = "B", is_big_endian: bool = False
+    ) -> np.ndarray:
+        """Query an IEEE binary block and decode it with np.frombuffer.
+
+        Args:
+            command: Query returning a definite-length binary block
+            datatype: struct format of one element ('B' = byte, 'H' = word)
+            is_big_endian: Byte order of multi-byte elements
+
+        Returns:
+            Read-only array view over the received block
+        """
         # Ensure we have a valid connection, reconnect if needed
         await self._ensure_connected()
 
         if not self.instrument:
             raise RuntimeError("Equipment not connected")
 
+        # Block transfers scale with the data size, not with command latency
+        timeout_ms = max(self.default_timeout_ms, self._timeouts.ceiling_ms)
+
         try:
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None, self.instrument.query_binary_values, command, datatype="B"
+            return await self._run_timed(
+                [command],
+                self.instrument.query_binary_values,
+                command,
+                timeout_ms=timeout_ms,
+                datatype=datatype,
+                is_big_endian=is_big_endian,
+                container=np.ndarray,
             )
-            return bytes(response)
         except Exception as e:
             logger.error(f"Error querying binary '{command}': {e}")
             raise
@@ -278,6 +774,54 @@ class BaseEquipment(ABC):
         """Execute a command on the equipment."""
         pass
 
+    # ==================== Optional Acquisition Methods ====================
+
+    async def read_channels(self, channels: List[str]) -> Optional[List[float]]:
+        """
+        Read one value from each of several channels in a single transaction.
+
+        Drivers whose instruments can return all channels from one command
+        should override this so acquisition costs one round-trip per sample
+        instead of one per channel.
+
+        Args:
+            channels: Channel identifiers (e.g. ['CH1', 'CH2'])
+
+        Returns:
+            Values in the same order as ``channels``, or None if not supported
+        """
+        return None
+
+    async def read_block(
+        self, channels: List[str], n: int, sample_rate: Optional[float] = None
+    ) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Read a block of samples from the instrument's own acquisition memory.
+
+        Instruments with internal buffers (scope memory, load data loggers)
+        can return many samples per round-trip, allowing acquisition rates
+        far beyond what point-by-point polling achieves.
+
+        Args:
+            channels: Channel identifiers to read
+            n: Number of samples per channel
+            sample_rate: Requested sample rate in Hz (None = instrument default)
+
+        Returns:
+            (data, timestamps) with data shaped (len(channels), n) and
+            timestamps shaped (n,) as Unix times, or None if not supported
+        """
+        return None
+
+    def _parse_channel(self, channel: str) -> int:
+        """Parse channel number from string (handle 'CH1' or '1' format)."""
+        channel_num = int(channel.upper().replace("CH", ""))
+
+        if channel_num < 1 or channel_num > getattr(self, "num_channels", 1):
+            raise ValueError(f"Invalid channel: {channel}")
+
+        return channel_num
+
     # ==================== Optional Diagnostic Methods (v0.12.0) ====================
     # Subclasses can override these methods to provide equipment-specific diagnostics
 
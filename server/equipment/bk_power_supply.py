@@ -1,9 +1,8 @@
 """BK Precision power supply drivers."""
 
-import asyncio
 import logging
 import uuid
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
 
 from server.config.settings import settings
 from shared.models.data import PowerSupplyData
@@ -11,6 +10,7 @@ from shared.models.equipment import (EquipmentInfo, EquipmentStatus,
                                      EquipmentType)
 
 from .base import BaseEquipment
+from .framing import FramedReader
 from .safety import (SafetyLimits, SafetyValidator, emergency_stop_manager,
                      get_default_limits)
 
@@ -20,6 +20,8 @@ logger = logging.getLogger(__name__)
 class BKPowerSupplyBase(BaseEquipment):
     """Base class for BK Precision power supplies."""
 
+    default_timeout_ms = 2000  # BK responds quickly
+
     def __init__(self, resource_manager, resource_string: str):
         """Initialize BK power supply."""
         super().__init__(resource_manager, resource_string)
@@ -33,6 +35,8 @@ class BKPowerSupplyBase(BaseEquipment):
         self.safety_validator = None
         self._current_voltage = 0.0  # Track current voltage for slew rate limiting
         self._current_current = 0.0  # Track current current for slew rate limiting
+        self._reader: Optional[FramedReader] = None  # Serial transaction thread
+        self._selected_channel: Optional[int] = None  # Last INST:NSEL sent
 
     def _parse_bk_response(self, response: str) -> str:
         """Parse BK Precision response and remove OK suffix."""
@@ -48,55 +52,108 @@ class BKPowerSupplyBase(BaseEquipment):
         BK responses are formatted as: DATA\rOK\r
         We need to read the full response, not just until the first \r
 
-        Uses locking to ensure serial commands execute one at a time,
-        preventing collisions when multiple requests happen simultaneously.
+        The whole transaction runs as one call on the instrument's I/O worker
+        thread, reading everything the port has available at once and
+        scanning for the OK\r terminator. Uses locking to ensure serial
+        commands execute one at a time, preventing collisions when multiple
+        requests happen simultaneously.
         """
         await self._ensure_connected()
 
         # Lock to prevent concurrent serial port access
         async with self._lock:
-            loop = asyncio.get_event_loop()
+            reader = self._get_reader()
 
-            # Flush input buffer to clear any junk from previous failed reads
+            logger.debug(f"Sending BK command: {command}")
             try:
-                if hasattr(self.instrument, 'flush') and hasattr(self.instrument.flush, '__call__'):
-                    await loop.run_in_executor(None, self.instrument.flush, 1)  # Flush input (VI_READ_BUF)
-            except Exception:
-                pass  # Ignore flush errors
+                frames = await self._run_timed(
+                    [command],
+                    self._framed_transact,
+                    reader,
+                    [command],
+                    pass_timeout=True,
+                )
+                full_response = frames[0]
+            except Exception as e:
+                logger.error(f"Error reading response to {command}: {e}")
+                raise
 
-            # Send command (write_termination = '\r' is already set)
-            logger.debug(f"Sending BK command: {command}")
-            await loop.run_in_executor(None, self.instrument.write, command)
+            # Decode and parse
+            response_str = full_response.decode('ascii', errors='ignore')
+            logger.debug(f"Received BK response ({len(full_response)} bytes): {repr(response_str)}")
+            return self._parse_bk_response(response_str)
 
-            # Read full response - keep reading until we get OK\r or timeout
-            # Use read_bytes to get raw data instead of relying on read_termination
-            full_response = b''
-            start_time = loop.time()
-            timeout = self.instrument.timeout / 1000.0  # Convert ms to seconds
+    async def batch(
+        self, commands: List[str], cache_settings: bool = False
+    ) -> List[Optional[str]]:
+        """Run several BK commands as back-to-back framed transactions.
 
-            while True:
-                try:
-                    # Read one byte at a time until we get the full response
-                    chunk = await loop.run_in_executor(None, self.instrument.read_bytes, 1)
-                    full_response += chunk
+        The BK serial protocol has no compound commands, so every command
+        still gets its own DATA\rOK\r frame, but the whole sequence runs as
+        one call on the I/O worker under a single lock acquisition. Every
+        command is acknowledged, so all of them are sent and cache_settings
+        is ignored.
+        """
+        if not commands:
+            return []
 
-                    # Check if we've received the complete response (ends with OK\r)
-                    if full_response.endswith(b'OK\r'):
-                        break
+        await self._ensure_connected()
 
-                    # Timeout check
-                    if loop.time() - start_time > timeout:
-                        raise TimeoutError(f"Timeout waiting for OK terminator. Got: {full_response}")
+        async with self._lock:
+            reader = self._get_reader()
+
+            logger.debug(f"Sending BK batch: {commands}")
+            try:
+                frames = await self._run_timed(
+                    commands,
+                    self._framed_transact,
+                    reader,
+                    commands,
+                    round_trips=len(commands),
+                    pass_timeout=True,
+                )
+            except Exception as e:
+                logger.error(f"Error reading responses to {commands}: {e}")
+                raise
+
+            return [
+                self._parse_bk_response(frame.decode('ascii', errors='ignore'))
+                for frame in frames
+            ]
+
+    @staticmethod
+    def _framed_transact(
+        reader: FramedReader, commands: List[str], timeout_ms: int
+    ) -> List[bytes]:
+        """Run framed transactions with a per-frame timeout (on the I/O worker)."""
+        return reader.transact_many_blocking(commands, timeout_ms / 1000.0)
+
+    def _get_reader(self) -> FramedReader:
+        """Get the framed reader for the current instrument session."""
+        worker = self._get_io_worker()
+        if (
+            self._reader is None
+            or self._reader.instrument is not self.instrument
+            or self._reader.worker is not worker
+        ):
+            self._close_reader()
+            self._reader = FramedReader(
+                self.instrument, terminator=b'OK\r', worker=worker
+            )
+        return self._reader
 
-                except Exception as e:
-                    if full_response:
-                        logger.error(f"Error reading response after {len(full_response)} bytes: {e}")
-                    raise
+    def _close_reader(self):
+        """Stop the framed reader thread, if any."""
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
 
-            # Decode and parse
-            response_str = full_response.decode('ascii', errors='ignore')
-            logger.debug(f"Received BK response ({len(full_response)} bytes): {repr(response_str)}")
-            return self._parse_bk_response(response_str)
+    def get_io_stats(self) -> Dict[str, Any]:
+        """Get I/O worker statistics and serial transaction latency metrics."""
+        stats = super().get_io_stats()
+        if self._reader:
+            stats["framing"] = self._reader.get_stats()
+        return stats
 
     async def connect(self):
         """Connect to the BK power supply with serial port configuration.
@@ -105,10 +162,11 @@ class BKPowerSupplyBase(BaseEquipment):
         not here, to avoid deadlock when calling _bk_query() during connect.
         """
         try:
-            # Refresh resource manager if needed
-            self._refresh_resource_manager()
+            self.invalidate_settings()
+            self._circuit.reset()
 
             # Close old instrument if it exists
+            self._close_reader()
             if self.instrument is not None:
                 try:
                     self.instrument.close()
@@ -116,10 +174,11 @@ class BKPowerSupplyBase(BaseEquipment):
                     pass  # Ignore errors when closing invalid sessions
                 self.instrument = None
 
-            # Open the resource
-            self.instrument = self.resource_manager.open_resource(
-                self.resource_string
-            )
+            # Refresh resource manager if needed
+            await self._run_io(self._refresh_resource_manager)
+
+            # Open the resource on the I/O worker
+            self.instrument = await self._run_io(self._open_resource)
 
             # Configure serial port settings for BK Precision devices
             # Baud rate: 9600, Data bits: 8, Parity: None, Stop bits: 1
@@ -134,8 +193,7 @@ class BKPowerSupplyBase(BaseEquipment):
                 self.instrument.write_termination = '\r'
                 logger.info(f"Configured serial port: 9600 8N1 with CR termination")
 
-            # Set timeout (2 seconds - BK responds quickly)
-            self.instrument.timeout = 2000
+            self._apply_timeout(self.default_timeout_ms)
 
             # Verify connection with GMAX command (BK Precision proprietary)
             # GMAX returns max voltage and current: VVVCCC format
@@ -155,6 +213,11 @@ class BKPowerSupplyBase(BaseEquipment):
             self.connected = False
             raise
 
+    async def disconnect(self):
+        """Disconnect from the power supply and stop its I/O thread."""
+        await super().disconnect()
+        self._close_reader()
+
     def _initialize_safety(self, equipment_id: str):
         """Initialize safety validator with appropriate limits."""
         if not settings.enable_safety_limits:
@@ -320,7 +383,11 @@ class BKPowerSupplyBase(BaseEquipment):
     async def get_readings(self, channel: int = 1) -> PowerSupplyData:
         """Get current voltage and current readings using BK Precision protocol."""
         # GETD returns: VVVVIIIIIM (voltage*100, current*1000, mode)
-        getd_response = await self._bk_query("GETD")
+        # GOUT returns 0 (ON) or 1 (OFF) - inverted like SOUT
+        # GETS returns VVVCCC (voltage*10, current*10)
+        getd_response, gout_response, gets_response = await self.batch(
+            ["GETD", "GOUT", "GETS"]
+        )
 
         if len(getd_response) < 9:
             raise ValueError(f"Invalid GETD response: {getd_response}")
@@ -329,13 +396,8 @@ class BKPowerSupplyBase(BaseEquipment):
         current = int(getd_response[4:8]) / 1000.0  # IIII / 1000
         mode = int(getd_response[8])  # 0=CV, 1=CC
 
-        # Get output state: GOUT returns 0 (ON) or 1 (OFF) - inverted like SOUT
-        gout_response = await self._bk_query("GOUT")
         output_enabled = gout_response.strip() == "0"
 
-        # Get setpoints: GETS returns VVVCCC (voltage*10, current*10)
-        gets_response = await self._bk_query("GETS")
-
         if len(gets_response) < 6:
             raise ValueError(f"Invalid GETS response: {gets_response}")
 
@@ -358,6 +420,75 @@ class BKPowerSupplyBase(BaseEquipment):
             in_cc_mode=in_cc_mode,
         )
 
+    async def read_channels(self, channels: List[str]) -> List[float]:
+        """Read output voltage of several channels in one worker call.
+
+        Each channel costs one GETD, all sent as a single call on the I/O
+        worker. Multi-output supplies select each channel with a plain
+        INST:NSEL write (it has no reply frame) and then re-select the
+        channel that was active before the read.
+
+        Args:
+            channels: Channel identifiers (e.g., ['CH1', 'CH2'])
+
+        Returns:
+            One voltage reading per requested channel
+        """
+        channel_nums = [self._parse_channel(channel) for channel in channels]
+        unique = list(dict.fromkeys(channel_nums))
+
+        if self.num_channels > 1:
+            await self._ensure_connected()
+            async with self._lock:
+                frames = await self._run_timed(
+                    ["GETD"] * len(unique),
+                    self._read_selected,
+                    self._get_reader(),
+                    unique,
+                    round_trips=len(unique),
+                    pass_timeout=True,
+                )
+            responses = [
+                self._parse_bk_response(frame.decode('ascii', errors='ignore'))
+                for frame in frames
+            ]
+        else:
+            responses = await self.batch(["GETD"] * len(unique))
+
+        voltages = []
+        for response in responses:
+            if len(response) < 9:
+                raise ValueError(f"Invalid GETD response: {response}")
+            voltages.append(int(response[:4]) / 100.0)  # VVVV / 100
+
+        values = dict(zip(unique, voltages))
+        return [values[channel_num] for channel_num in channel_nums]
+
+    def _read_selected(
+        self, reader: FramedReader, channel_nums: List[int], timeout_ms: int
+    ) -> List[bytes]:
+        """Select and GETD each channel, then restore the selection (I/O worker)."""
+        frames = []
+        try:
+            for channel_num in channel_nums:
+                self.instrument.write(f"INST:NSEL {channel_num}")
+                frames.extend(
+                    reader.transact_many_blocking(["GETD"], timeout_ms / 1000.0)
+                )
+        finally:
+            if self._selected_channel is not None:
+                self.instrument.write(f"INST:NSEL {self._selected_channel}")
+            else:
+                # Nothing known to restore; the last channel read stays selected
+                self._selected_channel = channel_nums[-1]
+        return frames
+
+    async def _select_channel(self, channel: int):
+        """Make a channel the target of the following commands."""
+        # Recorded first, so a read queued behind this write restores it
+        self._selected_channel = channel
+        await self._write(f"INST:NSEL {channel}")
+
     async def get_setpoints(self, channel: int = 1) -> Dict[str, float]:
         """Get voltage and current setpoints using BK Precision protocol."""
         # GETS returns: VVVCCC (voltage*10, current*10)
@@ -411,7 +542,7 @@ class BK9130B(BKPowerSupplyBase):
                 f"Voltage must be between 0 and {max_v}V for channel {channel}"
             )
 
-        await self._write(f"INST:NSEL {channel}")
+        await self._select_channel(channel)
         await self._write(f"VOLT {voltage}")
 
     async def set_current(self, current: float, channel: int = 1):
@@ -422,7 +553,7 @@ class BK9130B(BKPowerSupplyBase):
         if current < 0 or current > self.max_current:
             raise ValueError(f"Current must be between 0 and {self.max_current}A")
 
-        await self._write(f"INST:NSEL {channel}")
+        await self._select_channel(channel)
         await self._write(f"CURR {current}")
 
     async def set_output(self, enabled: bool, channel: int = 1):
@@ -430,7 +561,7 @@ class BK9130B(BKPowerSupplyBase):
         if channel < 1 or channel > self.num_channels:
             raise ValueError(f"Invalid channel: {channel}")
 
-        await self._write(f"INST:NSEL {channel}")
+        await self._select_channel(channel)
         await self._write(f"OUTP {'ON' if enabled else 'OFF'}")
 
     async def get_readings(self, channel: int = 1) -> PowerSupplyData:
@@ -439,7 +570,7 @@ class BK9130B(BKPowerSupplyBase):
             raise ValueError(f"Invalid channel: {channel}")
 
         # Select channel
-        await self._write(f"INST:NSEL {channel}")
+        await self._select_channel(channel)
 
         # Get readings using base class method
         return await super().get_readings(channel)
@@ -452,6 +583,9 @@ class BK9205B(BaseEquipment):
     BK models (1685B, 1902B) which use proprietary serial protocol.
     """
 
+    supports_compound_commands = True
+    default_timeout_ms = 5000
+
     def __init__(self, resource_manager, resource_string: str):
         """Initialize BK 9205B."""
         super().__init__(resource_manager, resource_string)
@@ -470,8 +604,8 @@ class BK9205B(BaseEquipment):
     async def connect(self):
         """Connect to the BK 9205B power supply."""
         try:
-            # Refresh resource manager if needed
-            self._refresh_resource_manager()
+            self.invalidate_settings()
+            self._circuit.reset()
 
             # Close old instrument if it exists
             if self.instrument is not None:
@@ -481,13 +615,14 @@ class BK9205B(BaseEquipment):
                     pass
                 self.instrument = None
 
-            # Open the resource
-            self.instrument = self.resource_manager.open_resource(
-                self.resource_string
-            )
+            # Refresh resource manager if needed
+            await self._run_io(self._refresh_resource_manager)
+
+            # Open the resource on the I/O worker
+            self.instrument = await self._run_io(self._open_resource)
 
             # Set timeout and termination for USB/SCPI communication
-            self.instrument.timeout = 5000  # 5 seconds
+            self._apply_timeout(self.default_timeout_ms)
             self.instrument.write_termination = '\n'
             self.instrument.read_termination = '\n'
 
@@ -663,17 +798,14 @@ class BK9205B(BaseEquipment):
 
     async def get_readings(self, channel: int = 1) -> PowerSupplyData:
         """Get current voltage and current readings using SCPI."""
-        # Query actual measurements
-        voltage = float(await self._query("MEAS:VOLT?"))
-        current = float(await self._query("MEAS:CURR?"))
-
-        # Query setpoints
-        voltage_set = float(await self._query("VOLT?"))
-        current_set = float(await self._query("CURR?"))
-
-        # Query output state
-        output_response = await self._query("OUTP?")
-        output_enabled = output_response.strip() in ["1", "ON"]
+        # Query actual measurements, setpoints and output state in one batch
+        responses = await self.batch(
+            ["MEAS:VOLT?", "MEAS:CURR?", "VOLT?", "CURR?", "OUTP?"]
+        )
+        voltage, current, voltage_set, current_set = (
+            float(r) for r in responses[:4]
+        )
+        output_enabled = responses[4].strip() in ["1", "ON"]
 
         # Determine CV/CC mode based on actual vs setpoint
         # If actual voltage is close to setpoint, we're in CV mode
@@ -696,10 +828,26 @@ class BK9205B(BaseEquipment):
             in_cc_mode=in_cc_mode,
         )
 
+    async def read_channels(self, channels: List[str]) -> List[float]:
+        """Read output voltage with one MEAS:VOLT? query.
+
+        Args:
+            channels: Channel identifiers (e.g., ['CH1'])
+
+        Returns:
+            One voltage reading per requested channel
+        """
+        for channel in channels:
+            self._parse_channel(channel)
+
+        (voltage,) = await self.batch(["MEAS:VOLT?"])
+        return [float(voltage)] * len(channels)
+
     async def get_setpoints(self, channel: int = 1) -> Dict[str, float]:
         """Get voltage and current setpoints using SCPI."""
-        voltage_set = float(await self._query("VOLT?"))
-        current_set = float(await self._query("CURR?"))
+        voltage_set, current_set = (
+            float(r) for r in await self.batch(["VOLT?", "CURR?"])
+        )
 
         return {
             "voltage": voltage_set,
@@ -1,10 +1,15 @@
 """Error handling and recovery system for equipment connections."""
 
 import asyncio
+import builtins
 import logging
+import random
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Dict, Optional
+
+from pyvisa.constants import StatusCode
+from pyvisa.errors import VisaIOError
 
 from server.config.settings import settings
 
@@ -100,14 +105,58 @@ class TimeoutError(EquipmentError):
         self.timeout_ms = timeout_ms
 
 
+class CircuitOpenError(EquipmentError):
+    """Equipment I/O rejected because the device keeps timing out."""
+
+    def __init__(self, resource_string: str, retry_in_sec: float):
+        super().__init__(
+            message=(
+                f"{resource_string} is not responding; "
+                f"I/O suspended for {retry_in_sec:.1f}s"
+            ),
+            severity=ErrorSeverity.HIGH,
+            recoverable=True,
+            troubleshooting_hint=(
+                "Check: 1) Equipment is powered on and not busy, "
+                "2) Cable or network link is intact, "
+                "3) Equipment is not stuck waiting on a previous command"
+            ),
+        )
+        self.resource_string = resource_string
+        self.retry_in_sec = retry_in_sec
+
+
+def is_timeout_error(error: Exception) -> bool:
+    """Check whether an I/O error means the device did not answer in time."""
+    if isinstance(error, (builtins.TimeoutError, TimeoutError)):
+        return True
+    return (
+        isinstance(error, VisaIOError)
+        and error.error_code == StatusCode.error_timeout
+    )
+
+
 class RetryHandler:
-    """Handles command retry logic with exponential backoff."""
+    """Handles command retry logic with jittered exponential backoff."""
 
     def __init__(self):
         self.max_retries = settings.max_command_retries
         self.retry_delay_ms = settings.retry_delay_ms
+        self.max_delay_ms = settings.retry_max_delay_ms
         self.enabled = settings.enable_command_retry
 
+    def _retry_delay_ms(self, attempt: int, error: Exception) -> float:
+        """Backoff before the next attempt.
+
+        Full jitter keeps clients that failed together from retrying in
+        lockstep. A device that timed out already cost a full timeout, so
+        the wait before retrying it is not made longer still.
+        """
+        delay_ms = min(self.retry_delay_ms * (2**attempt), self.max_delay_ms)
+        if is_timeout_error(error):
+            delay_ms = min(delay_ms, self.retry_delay_ms)
+        return random.uniform(delay_ms / 2, delay_ms)
+
     async def execute_with_retry(
         self, func: Callable, *args, operation_name: str = "operation", **kwargs
     ) -> Any:
@@ -137,13 +186,17 @@ class RetryHandler:
                     logger.info(f"{operation_name} succeeded on retry {attempt}")
                 return result
 
+            except CircuitOpenError:
+                # The device is known to be unresponsive; fail fast
+                raise
+
             except Exception as e:
                 last_error = e
                 if attempt < self.max_retries:
-                    delay_ms = self.retry_delay_ms * (2**attempt)  # Exponential backoff
+                    delay_ms = self._retry_delay_ms(attempt, e)
                     logger.warning(
                         f"{operation_name} failed (attempt {attempt + 1}/{self.max_retries + 1}). "
-                        f"Retrying in {delay_ms}ms... Error: {str(e)}"
+                        f"Retrying in {delay_ms:.0f}ms... Error: {str(e)}"
                     )
                     await asyncio.sleep(delay_ms / 1000.0)
                 else:
@@ -209,6 +262,36 @@ class ReconnectionHandler:
         )
         return False
 
+    async def reconnect_all(
+        self,
+        connect_funcs: Dict[str, Callable],
+        max_concurrent: Optional[int] = None,
+    ) -> Dict[str, bool]:
+        """
+        Reconnect several pieces of equipment concurrently.
+
+        Args:
+            connect_funcs: Async connect function per equipment ID
+            max_concurrent: Most reconnects in flight at once
+                (None = settings.max_concurrent_connects)
+
+        Returns:
+            Dict[str, bool]: Reconnection success per equipment ID
+        """
+        semaphore = asyncio.Semaphore(
+            max_concurrent or settings.max_concurrent_connects
+        )
+
+        async def reconnect_one(equipment_id: str, connect_func: Callable) -> bool:
+            async with semaphore:
+                return await self.attempt_reconnect(connect_func, equipment_id)
+
+        equipment_ids = list(connect_funcs)
+        results = await asyncio.gather(
+            *(reconnect_one(eid, connect_funcs[eid]) for eid in equipment_ids)
+        )
+        return dict(zip(equipment_ids, results))
+
 
 class HealthMonitor:
     """Monitors equipment health and triggers recovery actions."""
@@ -252,26 +335,48 @@ class HealthMonitor:
                 logger.error(f"Error in health monitoring loop: {e}")
 
     async def _check_all_equipment(self, equipment_manager):
-        """Check health of all connected equipment."""
-        for equipment_id, equipment in equipment_manager.equipment.items():
-            try:
-                # Perform health check (get status)
-                status = await equipment.get_status()
+        """Check health of all connected equipment.
 
-                if not status.connected:
-                    logger.warning(
-                        f"Health check failed for {equipment_id} - disconnected"
-                    )
-                    # Trigger reconnection
-                    reconnect_handler = ReconnectionHandler()
-                    await reconnect_handler.attempt_reconnect(
-                        equipment.connect, equipment_id
+        Devices are checked concurrently and all disconnected devices are
+        reconnected together, bounded by settings.max_concurrent_connects.
+        """
+        from .readings import reading_service
+
+        semaphore = asyncio.Semaphore(settings.max_concurrent_connects)
+        disconnected: Dict[str, Callable] = {}
+        stale = []
+
+        async def check(equipment_id: str, equipment):
+            async with semaphore:
+                try:
+                    # Perform health check (get status), reusing a status
+                    # polled by other monitors within the check interval
+                    status = await reading_service.read(
+                        equipment_id, "get_status", max_age=self.check_interval_sec
                     )
-                else:
-                    self.equipment_health[equipment_id] = datetime.now()
 
-            except Exception as e:
-                logger.error(f"Health check error for {equipment_id}: {e}")
+                    if not status.connected:
+                        logger.warning(
+                            f"Health check failed for {equipment_id} - disconnected"
+                        )
+                        disconnected[equipment_id] = equipment.connect
+                        stale.append(equipment)
+                    else:
+                        self.equipment_health[equipment_id] = datetime.now()
+
+                except Exception as e:
+                    logger.error(f"Health check error for {equipment_id}: {e}")
+
+        await asyncio.gather(
+            *(check(eid, eq) for eid, eq in list(equipment_manager.equipment.items()))
+        )
+
+        # Trigger reconnection
+        if disconnected:
+            # Check the shared manager once before the reconnects fan out
+            await equipment_manager.check_resource_manager(stale)
+            reconnect_handler = ReconnectionHandler()
+            await reconnect_handler.reconnect_all(disconnected)
 
 
 # Global instances
@@ -0,0 +1,179 @@
+"""Framed request/response I/O for serial instruments.
+
+Some instruments (e.g. the BK Precision 1900B series) answer every command
+with a reply that ends in a fixed terminator rather than a single
+termination character. FramedReader performs a whole transaction - write,
+then read until the terminator - as one call on the instrument's I/O
+worker thread, pulling all bytes the port has available per read instead
+of one byte at a time.
+"""
+
+import logging
+import time
+from typing import Any, Dict, List, Optional
+
+from .io_worker import InstrumentIOWorker
+
+logger = logging.getLogger(__name__)
+
+
+class FramedReader:
+    """Terminator-framed transactions on a VISA resource."""
+
+    def __init__(
+        self,
+        instrument,
+        terminator: bytes = b"OK\r",
+        worker: Optional[InstrumentIOWorker] = None,
+        name: str = "",
+    ):
+        """
+        Initialize framed reader.
+
+        Args:
+            instrument: Open pyvisa resource
+            terminator: Byte sequence that ends each response frame
+            worker: I/O worker of the instrument (None = start a private one)
+            name: Label for a private I/O thread (usually the resource string)
+        """
+        self.instrument = instrument
+        self.terminator = terminator
+        self._buffer = bytearray()
+        self._owns_worker = worker is None
+        self.worker = worker or InstrumentIOWorker(name)
+
+        # Latency metrics
+        self.transactions = 0
+        self.errors = 0
+        self.timeouts = 0
+        self.reads = 0
+        self.bytes_received = 0
+        self.total_latency_ms = 0.0
+        self.max_latency_ms = 0.0
+        self.last_latency_ms: Optional[float] = None
+
+    async def transact(self, command: str, timeout: float) -> bytes:
+        """
+        Send a command and read its response frame.
+
+        Args:
+            command: Command to write (the resource adds write termination)
+            timeout: Seconds to wait for the terminator
+
+        Returns:
+            Response frame including the terminator
+        """
+        return await self.worker.run(self._transact, command, timeout)
+
+    async def transact_many(self, commands: List[str], timeout: float) -> List[bytes]:
+        """
+        Run several transactions back-to-back in one call on the I/O thread.
+
+        Args:
+            commands: Commands to write, in order
+            timeout: Seconds to wait for each terminator
+
+        Returns:
+            One response frame per command
+        """
+        return await self.worker.run(self.transact_many_blocking, commands, timeout)
+
+    def transact_many_blocking(
+        self, commands: List[str], timeout: float
+    ) -> List[bytes]:
+        """
+        Blocking form of transact_many for callers already on the I/O thread.
+
+        Args:
+            commands: Commands to write, in order
+            timeout: Seconds to wait for each terminator
+
+        Returns:
+            One response frame per command
+        """
+        return [self._transact(command, timeout) for command in commands]
+
+    def _transact(self, command: str, timeout: float) -> bytes:
+        """Blocking transaction, run on the I/O thread."""
+        start = time.perf_counter()
+        try:
+            self._flush()
+            self.instrument.write(command)
+            frame = self._read_frame(start + timeout)
+        except TimeoutError:
+            self.timeouts += 1
+            self.errors += 1
+            raise
+        except Exception:
+            self.errors += 1
+            raise
+
+        latency_ms = (time.perf_counter() - start) * 1000
+        self.transactions += 1
+        self.total_latency_ms += latency_ms
+        self.max_latency_ms = max(self.max_latency_ms, latency_ms)
+        self.last_latency_ms = latency_ms
+        return frame
+
+    def _flush(self):
+        """Discard stale input, both buffered here and in the VISA driver."""
+        self._buffer.clear()
+        try:
+            flush = getattr(self.instrument, "flush", None)
+            if callable(flush):
+                flush(1)  # VI_READ_BUF
+        except Exception:
+            pass  # Ignore flush errors
+
+    def _read_frame(self, deadline: float) -> bytes:
+        """Read until the terminator is in the buffer and split off one frame."""
+        scanned = 0
+        while True:
+            end = self._buffer.find(self.terminator, scanned)
+            if end >= 0:
+                end += len(self.terminator)
+                frame = bytes(self._buffer[:end])
+                del self._buffer[:end]
+                return frame
+
+            # Only rescan the tail that could hold a split terminator
+            scanned = max(0, len(self._buffer) - len(self.terminator) + 1)
+
+            if time.perf_counter() > deadline:
+                raise TimeoutError(
+                    f"Timeout waiting for {self.terminator!r} terminator. "
+                    f"Got: {bytes(self._buffer)!r}"
+                )
+
+            chunk = self._read_available()
+            self.reads += 1
+            self.bytes_received += len(chunk)
+            self._buffer += chunk
+
+    def _read_available(self) -> bytes:
+        """Read everything waiting on the port, blocking for at least one byte."""
+        try:
+            available = int(self.instrument.bytes_in_buffer)
+        except Exception:
+            available = 0  # Not a serial resource, or attribute unsupported
+        return self.instrument.read_bytes(max(1, available))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get transaction latency metrics."""
+        return {
+            "transactions": self.transactions,
+            "errors": self.errors,
+            "timeouts": self.timeouts,
+            "reads": self.reads,
+            "bytes_received": self.bytes_received,
+            "avg_latency_ms": (
+                self.total_latency_ms / self.transactions if self.transactions else 0.0
+            ),
+            "max_latency_ms": self.max_latency_ms,
+            "last_latency_ms": self.last_latency_ms,
+        }
+
+    def close(self):
+        """Stop the I/O thread if this reader started it."""
+        if self._owns_worker:
+            self.worker.close()
@@ -0,0 +1,123 @@
+"""Per-instrument I/O worker threads.
+
+Each connected instrument owns one worker thread that executes its blocking
+VISA calls in submission order. Instrument I/O therefore never competes with
+discovery scans, exports or other users of the event loop's default
+executor, and calls to a single instrument are serialized by construction.
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict
+
+
+class InstrumentIOWorker:
+    """Single-threaded command queue for one instrument."""
+
+    def __init__(self, name: str = ""):
+        """
+        Initialize I/O worker.
+
+        The thread is started on the first submitted call.
+
+        Args:
+            name: Label for the worker thread (usually the resource string)
+        """
+        self.name = name
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix=f"instrument-io-{name}"
+        )
+        self._stats_lock = threading.Lock()
+        self.closed = False
+
+        # Queue metrics
+        self.queue_depth = 0  # Calls submitted but not yet started
+        self.max_queue_depth = 0
+        self.in_flight = 0  # Calls submitted but not yet finished
+        self.commands = 0
+        self.errors = 0
+        self.total_wait_ms = 0.0
+        self.max_wait_ms = 0.0
+        self.total_service_ms = 0.0
+        self.max_service_ms = 0.0
+
+    async def run(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        Run a blocking call on the worker thread.
+
+        Args:
+            func: Callable to run
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            Result of func
+        """
+        if self.closed:
+            raise RuntimeError(f"I/O worker {self.name} is closed")
+
+        with self._stats_lock:
+            self.queue_depth += 1
+            self.in_flight += 1
+            self.max_queue_depth = max(self.max_queue_depth, self.queue_depth)
+
+        future = self._executor.submit(
+            self._call, time.perf_counter(), func, args, kwargs
+        )
+        try:
+            return await asyncio.wrap_future(future)
+        finally:
+            with self._stats_lock:
+                self.in_flight -= 1
+                if future.cancelled():
+                    # Cancelled before it started, so _call never dequeued it
+                    self.queue_depth -= 1
+
+    def _call(self, submitted: float, func: Callable, args, kwargs) -> Any:
+        """Run func on the worker thread, recording wait and service time."""
+        started = time.perf_counter()
+        with self._stats_lock:
+            self.queue_depth -= 1
+
+        failed = False
+        try:
+            return func(*args, **kwargs)
+        except Exception:
+            failed = True
+            raise
+        finally:
+            finished = time.perf_counter()
+            wait_ms = (started - submitted) * 1000
+            service_ms = (finished - started) * 1000
+            with self._stats_lock:
+                self.commands += 1
+                self.errors += failed
+                self.total_wait_ms += wait_ms
+                self.max_wait_ms = max(self.max_wait_ms, wait_ms)
+                self.total_service_ms += service_ms
+                self.max_service_ms = max(self.max_service_ms, service_ms)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get queue depth, wait time and service time statistics."""
+        with self._stats_lock:
+            commands = self.commands
+            return {
+                "queue_depth": self.queue_depth,
+                "max_queue_depth": self.max_queue_depth,
+                "in_flight": self.in_flight,
+                "commands": commands,
+                "errors": self.errors,
+                "avg_wait_ms": self.total_wait_ms / commands if commands else 0.0,
+                "max_wait_ms": self.max_wait_ms,
+                "avg_service_ms": (
+                    self.total_service_ms / commands if commands else 0.0
+                ),
+                "max_service_ms": self.max_service_ms,
+            }
+
+    def close(self):
+        """Stop accepting calls and let the thread exit once idle."""
+        self.closed = True
+        self._executor.shutdown(wait=False)
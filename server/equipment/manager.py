@@ -2,14 +2,18 @@
 
 import asyncio
 import logging
-from typing import Dict, List, Optional
+from collections import Counter
+from contextlib import asynccontextmanager
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from pyvisa import ResourceManager
 
+from server.config.settings import settings
 from shared.models.equipment import (EquipmentInfo, EquipmentStatus,
                                      EquipmentType)
 
-from .base import BaseEquipment
+from .base import (BaseEquipment, is_resource_manager_usable,
+                   release_resource_manager)
 from .bk_power_supply import BK1685B, BK1902B, BK9130B, BK9205B, BK9206B
 from .mock.mock_electronic_load import MockElectronicLoad
 from .mock.mock_oscilloscope import MockOscilloscope
@@ -27,7 +31,10 @@ class EquipmentManager:
         """Initialize equipment manager."""
         self.equipment: Dict[str, BaseEquipment] = {}
         self.resource_manager: Optional[ResourceManager] = None
-        self._lock = asyncio.Lock()
+        self._resource_manager_failed = False  # Set when a device fails to open
+        self._lock = asyncio.Lock()  # Guards the registry and resource manager
+        self._resource_locks: Dict[str, asyncio.Lock] = {}
+        self._resource_lock_users: Counter = Counter()
 
     async def initialize(self):
         """Initialize the equipment manager."""
@@ -105,46 +112,39 @@ class EquipmentManager:
     async def connect_device(
         self, resource_string: str, equipment_type: EquipmentType, model: str
     ) -> str:
-        """Connect to a device and add it to the manager."""
-        async with self._lock:
+        """Connect to a device and add it to the manager.
+
+        The manager lock only guards the resource manager and the registry,
+        so different devices connect concurrently. Connects to the same
+        resource are serialized.
+        """
+        async with self._resource_lock(resource_string):
             try:
-                # Ensure resource manager is initialized (lazy initialization)
-                # Always create a new one if None or invalid
-                if not self.resource_manager:
-                    logger.warning("Resource manager not initialized, initializing now...")
-                    self.resource_manager = ResourceManager("@py")
-                    logger.info("Resource manager initialized (lazy)")
-                else:
-                    # Try to use existing resource manager, recreate if closed
-                    try:
-                        # Test if resource manager is valid by attempting to list resources
-                        _ = self.resource_manager.list_resources()
-                    except Exception:
-                        logger.warning("Resource manager invalid, recreating...")
-                        try:
-                            self.resource_manager.close()
-                        except Exception:
-                            pass
-                        self.resource_manager = ResourceManager("@py")
-                        logger.info("Resource manager recreated")
-
-                # Create appropriate equipment instance based on model
-                equipment = self._create_equipment_instance(
-                    resource_string, equipment_type, model
-                )
+                async with self._lock:
+                    # Ensure resource manager is initialized (lazy initialization)
+                    await asyncio.to_thread(self._ensure_resource_manager)
+
+                    # Create appropriate equipment instance based on model
+                    equipment = self._create_equipment_instance(
+                        resource_string, equipment_type, model
+                    )
 
                 if equipment is None:
                     raise ValueError(f"Unsupported equipment model: {model}")
 
                 # Connect to the device
-                await equipment.connect()
+                try:
+                    await equipment.connect()
+                finally:
+                    self._sync_resource_manager(equipment)
 
                 # Get equipment info
                 info = await equipment.get_info()
                 equipment_id = info.id
 
                 # Store equipment
-                self.equipment[equipment_id] = equipment
+                async with self._lock:
+                    self.equipment[equipment_id] = equipment
 
                 # Record connection event for diagnostics
                 from diagnostics import diagnostics_manager
@@ -159,6 +159,135 @@ class EquipmentManager:
                 logger.error(f"Failed to connect to device at {resource_string}: {e}")
                 raise
 
+    async def connect_devices(
+        self,
+        devices: List[Tuple[str, EquipmentType, str]],
+        max_concurrent: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Connect several devices concurrently.
+
+        Args:
+            devices: (resource_string, equipment_type, model) per device
+            max_concurrent: Most connects in flight at once
+                (None = settings.max_concurrent_connects)
+
+        Returns:
+            One result per device, in input order, with resource_string,
+            equipment_id (None on failure), success and error
+        """
+        # Check the shared manager once, so the connects below never race
+        # to close and recreate it
+        await self.check_resource_manager()
+
+        semaphore = asyncio.Semaphore(
+            max_concurrent or settings.max_concurrent_connects
+        )
+
+        async def connect_one(resource_string, equipment_type, model):
+            async with semaphore:
+                try:
+                    equipment_id = await self.connect_device(
+                        resource_string, equipment_type, model
+                    )
+                    return {
+                        "resource_string": resource_string,
+                        "equipment_id": equipment_id,
+                        "success": True,
+                        "error": None,
+                    }
+                except Exception as e:
+                    return {
+                        "resource_string": resource_string,
+                        "equipment_id": None,
+                        "success": False,
+                        "error": str(e),
+                    }
+
+        results = await asyncio.gather(
+            *(connect_one(*device) for device in devices)
+        )
+
+        connected = sum(1 for r in results if r["success"])
+        logger.info(f"Bulk connect: {connected}/{len(results)} devices connected")
+        return list(results)
+
+    @asynccontextmanager
+    async def _resource_lock(self, resource_string: str):
+        """Serialize connects to one resource.
+
+        The lock is dropped once nobody waits on it and the resource is not
+        connected, so the table does not grow with every resource tried.
+        """
+        lock = self._resource_locks.setdefault(resource_string, asyncio.Lock())
+        self._resource_lock_users[resource_string] += 1
+        try:
+            async with lock:
+                yield
+        finally:
+            self._resource_lock_users[resource_string] -= 1
+            self._drop_resource_lock(resource_string)
+
+    def _drop_resource_lock(self, resource_string: str):
+        """Forget the connect lock of an unused, disconnected resource."""
+        if self._resource_lock_users[resource_string] > 0:
+            return
+        if any(eq.resource_string == resource_string for eq in self.equipment.values()):
+            return
+        self._resource_locks.pop(resource_string, None)
+        del self._resource_lock_users[resource_string]
+
+    async def check_resource_manager(self, equipment: Iterable[BaseEquipment] = ()):
+        """Validate the shared resource manager before concurrent connects.
+
+        Runs the check once under the manager lock and hands the result to
+        the given equipment, so their connects find a valid manager instead
+        of each closing and recreating it.
+
+        Args:
+            equipment: Equipment about to (re)connect
+        """
+        async with self._lock:
+            await asyncio.to_thread(self._ensure_resource_manager)
+            for eq in equipment:
+                if eq.resource_manager is None:
+                    continue  # Mock equipment
+                eq.resource_manager = self.resource_manager
+                eq._resource_manager_failed = False
+
+    def _ensure_resource_manager(self):
+        """Create the resource manager if missing, closed or known bad.
+
+        Liveness comes from the session handle, so the connect path only
+        scans the bus after equipment reported a manager-level error.
+        """
+        if not self.resource_manager:
+            logger.warning("Resource manager not initialized, initializing now...")
+            self.resource_manager = ResourceManager("@py")
+            self._resource_manager_failed = False
+            logger.info("Resource manager initialized (lazy)")
+        elif not is_resource_manager_usable(
+            self.resource_manager, self._resource_manager_failed
+        ):
+            logger.warning("Resource manager invalid, recreating...")
+            release_resource_manager(self.resource_manager)
+            self.resource_manager = ResourceManager("@py")
+            self._resource_manager_failed = False
+            logger.info("Resource manager recreated")
+        else:
+            self._resource_manager_failed = False
+
+    def _sync_resource_manager(self, equipment: BaseEquipment):
+        """Pick up resource manager changes made by an equipment's connect."""
+        if equipment.resource_manager is None:
+            return  # Mock equipment
+
+        if equipment._resource_manager_failed:
+            self._resource_manager_failed = True
+        elif equipment.resource_manager is not self.resource_manager:
+            # The equipment replaced a bad manager; share its fresh handle
+            self.resource_manager = equipment.resource_manager
+            self._resource_manager_failed = False
+
     def _create_equipment_instance(
         self, resource_string: str, equipment_type: EquipmentType, model: str
     ) -> Optional[BaseEquipment]:
@@ -221,8 +350,6 @@ class EquipmentManager:
                 equipment = self.equipment[equipment_id]
 
                 # Safe state on disconnect - disable outputs
-                from config.settings import settings
-
                 if settings.safe_state_on_disconnect:
                     try:
                         logger.info(
@@ -246,6 +373,10 @@ class EquipmentManager:
 
                 await equipment.disconnect()
                 del self.equipment[equipment_id]
+                self._drop_resource_lock(equipment.resource_string)
+
+                from .readings import reading_service
+                reading_service.invalidate(equipment_id)
 
                 # Record disconnection event for diagnostics
                 from diagnostics import diagnostics_manager
@@ -4,7 +4,7 @@ import asyncio
 import logging
 import uuid
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 import numpy as np
 
@@ -18,6 +18,8 @@ logger = logging.getLogger(__name__)
 class MockElectronicLoad:
     """Mock electronic load that simulates realistic behavior."""
 
+    supports_concurrent_reads = True
+
     def __init__(self, resource_manager=None, resource_string: str = "MOCK::LOAD::0"):
         """Initialize mock electronic load."""
         self.resource_string = resource_string
@@ -304,6 +306,30 @@ class MockElectronicLoad:
         readings = await self.get_readings()
         return {"value": readings.current}
 
+    async def read_channels(self, channels: List[str]) -> List[float]:
+        """Read several quantities from a single load measurement.
+
+        Args:
+            channels: Quantities to read ('VOLT', 'CURR' or 'POW'); any other
+                identifier returns the current, matching get_measurement()
+
+        Returns:
+            One value per requested channel, all from the same reading
+        """
+        readings = await self.get_readings()
+
+        values = []
+        for channel in channels:
+            name = channel.upper()
+            if name.startswith("VOLT"):
+                values.append(readings.voltage)
+            elif name.startswith("POW"):
+                values.append(readings.power)
+            else:
+                values.append(readings.current)
+
+        return values
+
     async def get_readings(self) -> ElectronicLoadData:
         """Get current readings from the load."""
         # Simulate measurement delay
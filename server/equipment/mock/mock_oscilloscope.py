@@ -4,7 +4,7 @@ import asyncio
 import logging
 import uuid
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 
@@ -18,6 +18,8 @@ logger = logging.getLogger(__name__)
 class MockOscilloscope:
     """Mock oscilloscope that generates realistic waveforms."""
 
+    supports_concurrent_reads = True
+
     def __init__(self, resource_manager=None, resource_string: str = "MOCK::SCOPE::0"):
         """Initialize mock oscilloscope."""
         self.resource_string = resource_string
@@ -289,21 +291,68 @@ class MockOscilloscope:
         Returns:
             Dict with 'value' key containing the instantaneous voltage reading
         """
-        # Parse channel number from string (handle 'CH1' or '1' format)
+        channel_num = self._parse_channel(channel)
+        return {"value": self._sample_channel(channel_num, datetime.now().timestamp())}
+
+    async def read_channels(self, channels: List[str]) -> List[float]:
+        """Read the instantaneous value of several channels at once.
+
+        Args:
+            channels: Channel identifiers (e.g., ['CH1', 'CH2'])
+
+        Returns:
+            One value per requested channel, sampled at the same instant
+        """
+        channel_nums = [self._parse_channel(channel) for channel in channels]
+        t = datetime.now().timestamp()
+        return [self._sample_channel(channel_num, t) for channel_num in channel_nums]
+
+    def _parse_channel(self, channel: str) -> int:
+        """Parse channel number from string (handle 'CH1' or '1' format)."""
         channel_num = int(channel.replace("CH", "").replace("ch", ""))
 
         if channel_num < 1 or channel_num > self.num_channels:
             raise ValueError(f"Invalid channel: {channel}")
 
-        # Generate a single sample point for this channel
+        return channel_num
+
+    async def read_block(
+        self, channels: List[str], n: int, sample_rate: Optional[float] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Read the most recent n samples of several channels from memory.
+
+        Args:
+            channels: Channel identifiers (e.g., ['CH1', 'CH2'])
+            n: Number of samples per channel
+            sample_rate: Sample rate in Hz (None = scope sample rate)
+
+        Returns:
+            (data, timestamps) with data shaped (len(channels), n)
+        """
+        channel_nums = [self._parse_channel(channel) for channel in channels]
+        rate = sample_rate or self.sample_rate
+
+        # Block ends at the moment of the read, as with a rolling scope memory
+        now = datetime.now().timestamp()
+        timestamps = now - np.arange(n - 1, -1, -1, dtype=np.float64) / rate
+
+        data = np.empty((len(channel_nums), n), dtype=np.float64)
+        for row, channel_num in enumerate(channel_nums):
+            data[row] = self._sample_channel_block(channel_num, timestamps)
+
+        return data, timestamps
+
+    def _sample_channel(self, channel_num: int, t: float) -> float:
+        """Generate a single sample point for a channel at time t."""
+        return float(self._sample_channel_block(channel_num, np.array([t]))[0])
+
+    def _sample_channel_block(self, channel_num: int, t: np.ndarray) -> np.ndarray:
+        """Generate samples for a channel at each time in t."""
         waveform_type = self.waveform_type.get(channel_num, "sine")
         freq = self.frequency.get(channel_num, 1000.0)
         amp = self.amplitude.get(channel_num, 1.0)
         offset = self.channel_offset.get(channel_num, 0.0)
 
-        # Get current time-dependent value
-        t = datetime.now().timestamp()
-
         if waveform_type == "sine":
             value = amp * np.sin(2 * np.pi * freq * t)
         elif waveform_type == "square":
@@ -311,15 +360,13 @@ class MockOscilloscope:
         elif waveform_type == "triangle":
             value = amp * (2 * np.abs(2 * (freq * t - np.floor(freq * t + 0.5))) - 1)
         elif waveform_type == "noise":
-            value = np.random.normal(0, amp)
+            value = np.random.normal(0, amp, t.shape)
         else:
-            value = 0.0
+            value = np.zeros_like(t)
 
         # Add noise and offset
-        noise = np.random.normal(0, self.noise_level)
-        value = float(value + noise + offset)
-
-        return {"value": value}
+        noise = np.random.normal(0, self.noise_level, t.shape)
+        return value + noise + offset
 
     async def get_measurements(self, channel: int = 1) -> Dict[str, float]:
         """Get automated measurements for a channel."""
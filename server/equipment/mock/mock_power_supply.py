@@ -4,7 +4,7 @@ import asyncio
 import logging
 import uuid
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 import numpy as np
 
@@ -18,6 +18,8 @@ logger = logging.getLogger(__name__)
 class MockPowerSupply:
     """Mock power supply that simulates realistic behavior."""
 
+    supports_concurrent_reads = True
+
     def __init__(self, resource_manager=None, resource_string: str = "MOCK::PSU::0"):
         """Initialize mock power supply."""
         self.resource_string = resource_string
@@ -176,6 +178,30 @@ class MockPowerSupply:
         readings = await self.get_readings(channel_num)
         return {"value": readings.voltage_actual}
 
+    async def read_channels(self, channels: List[str]) -> List[float]:
+        """Read output voltage of several channels in one transaction.
+
+        Args:
+            channels: Channel identifiers (e.g., ['CH1', 'CH2'])
+
+        Returns:
+            One voltage reading per requested channel
+        """
+        channel_nums = [
+            int(channel.replace("CH", "").replace("ch", "")) for channel in channels
+        ]
+        for channel, channel_num in zip(channels, channel_nums):
+            if channel_num < 1 or channel_num > self.num_channels:
+                raise ValueError(f"Invalid channel: {channel}")
+
+        # Simulate a single measurement delay for the whole batch
+        await asyncio.sleep(0.01)
+
+        return [
+            self._compute_readings(channel_num).voltage_actual
+            for channel_num in channel_nums
+        ]
+
     async def get_readings(self, channel: int = 1) -> PowerSupplyData:
         """Get current voltage and current readings."""
         if channel < 1 or channel > self.num_channels:
@@ -184,6 +210,10 @@ class MockPowerSupply:
         # Simulate measurement delay
         await asyncio.sleep(0.01)
 
+        return self._compute_readings(channel)
+
+    def _compute_readings(self, channel: int) -> PowerSupplyData:
+        """Simulate the output state of a channel."""
         # Get setpoints
         voltage_set = self.voltage_set[channel]
         current_set = self.current_set[channel]
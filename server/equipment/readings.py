@@ -0,0 +1,275 @@
+"""Shared, coalesced equipment readings.
+
+Streams, alarm loops, the alarm integrator and the health monitor all poll
+the same instruments. ReadingService lets them share one poll per reading:
+concurrent requests for the same reading wait on a single in-flight call
+(single-flight), recent values are served from cache under a max-age, and
+subscribers to a reading are fed by one poller running at the fastest rate
+any of them asked for.
+"""
+
+import asyncio
+import logging
+import time
+from collections import defaultdict
+from typing import Any, Dict, Optional, Set, Tuple
+
+from .manager import equipment_manager
+
+logger = logging.getLogger(__name__)
+
+# (equipment_id, command, sorted parameter items)
+ReadingKey = Tuple[str, str, Tuple]
+
+# Command and parameters polled for each WebSocket stream type
+STREAM_COMMANDS: Dict[str, Tuple[str, Dict[str, Any]]] = {
+    "readings": ("get_readings", {}),
+    "waveform": ("get_waveform", {"channel": 1}),
+    "measurements": ("get_measurements", {"channel": 1}),
+}
+
+
+class ReadingSubscription:
+    """One consumer of a polled reading."""
+
+    def __init__(self, service: "ReadingService", key: ReadingKey, interval: float):
+        """
+        Initialize subscription.
+
+        Args:
+            service: Service that polls the reading
+            key: Reading key
+            interval: Seconds between readings this consumer wants
+        """
+        self.key = key
+        self.interval = interval
+        self._service = service
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=1)
+
+    def _deliver(self, item: Any):
+        """Hand over a reading, replacing one the consumer has not taken yet."""
+        if self._queue.full():
+            self._queue.get_nowait()
+        self._queue.put_nowait(item)
+
+    async def get(self) -> Any:
+        """
+        Wait for the next reading.
+
+        Returns:
+            Reading value
+
+        Raises:
+            Exception: The error raised by the poll, if it failed
+        """
+        item = await self._queue.get()
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+    def close(self):
+        """Stop receiving readings."""
+        self._service._unsubscribe(self)
+
+
+class ReadingService:
+    """Per-equipment reading cache with single-flight polls and fan-out."""
+
+    def __init__(self, equipment_manager):
+        """
+        Initialize reading service.
+
+        Args:
+            equipment_manager: Manager used to look up equipment by ID
+        """
+        self.equipment_manager = equipment_manager
+        self._cache: Dict[ReadingKey, Tuple[Any, float]] = {}  # value, monotonic time
+        self._in_flight: Dict[ReadingKey, asyncio.Task] = {}
+        self._subscribers: Dict[ReadingKey, Set[ReadingSubscription]] = defaultdict(set)
+        self._pollers: Dict[ReadingKey, asyncio.Task] = {}
+        self._wake: Dict[ReadingKey, asyncio.Event] = {}
+
+        # Metrics
+        self.requests = 0
+        self.cache_hits = 0
+        self.coalesced = 0
+        self.polls = 0
+
+    @staticmethod
+    def _key(
+        equipment_id: str, command: str, parameters: Optional[Dict[str, Any]]
+    ) -> ReadingKey:
+        return (equipment_id, command, tuple(sorted((parameters or {}).items())))
+
+    async def read(
+        self,
+        equipment_id: str,
+        command: str = "get_readings",
+        parameters: Optional[Dict[str, Any]] = None,
+        max_age: float = 0.0,
+    ) -> Any:
+        """
+        Get a reading, reusing a recent or in-flight one when possible.
+
+        Args:
+            equipment_id: Equipment identifier
+            command: execute_command() name, or "get_status"
+            parameters: Command parameters
+            max_age: Oldest cached value (seconds) the caller accepts
+
+        Returns:
+            Reading value
+        """
+        key = self._key(equipment_id, command, parameters)
+        self.requests += 1
+
+        cached = self._cache.get(key)
+        if cached is not None and time.monotonic() - cached[1] <= max_age:
+            self.cache_hits += 1
+            return cached[0]
+
+        return await self._fetch(key)
+
+    async def _fetch(self, key: ReadingKey) -> Any:
+        """Poll the instrument, joining a poll already in flight for key."""
+        task = self._in_flight.get(key)
+        if task is not None:
+            self.coalesced += 1
+        else:
+            task = asyncio.ensure_future(self._poll(key))
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+
+        # Shield so one cancelled waiter does not cancel the shared poll
+        return await asyncio.shield(task)
+
+    async def _poll(self, key: ReadingKey) -> Any:
+        """Read the value from the instrument and cache it."""
+        equipment_id, command, parameters = key
+        equipment = self.equipment_manager.get_equipment(equipment_id)
+        if equipment is None:
+            raise LookupError(f"Equipment not found: {equipment_id}")
+
+        self.polls += 1
+        if command == "get_status":
+            value = await equipment.get_status()
+        else:
+            value = await equipment.execute_command(command, dict(parameters))
+
+        self._cache[key] = (value, time.monotonic())
+        return value
+
+    def subscribe(
+        self,
+        equipment_id: str,
+        command: str = "get_readings",
+        parameters: Optional[Dict[str, Any]] = None,
+        interval: float = 1.0,
+    ) -> ReadingSubscription:
+        """
+        Receive a reading periodically.
+
+        All subscribers to the same reading share one poller, which runs at
+        the shortest interval among them.
+
+        Args:
+            equipment_id: Equipment identifier
+            command: execute_command() name, or "get_status"
+            parameters: Command parameters
+            interval: Seconds between readings
+
+        Returns:
+            Subscription; close() it when done
+        """
+        key = self._key(equipment_id, command, parameters)
+        subscription = ReadingSubscription(self, key, interval)
+        self._subscribers[key].add(subscription)
+
+        if key in self._pollers:
+            # Let the poller pick up a possibly shorter interval
+            self._wake[key].set()
+        else:
+            self._wake[key] = asyncio.Event()
+            poller = asyncio.create_task(self._poll_loop(key))
+            poller.add_done_callback(lambda task: self._poller_done(key, task))
+            self._pollers[key] = poller
+
+        return subscription
+
+    def _unsubscribe(self, subscription: ReadingSubscription):
+        """Remove a subscriber, stopping the poller after the last one."""
+        key = subscription.key
+        subscribers = self._subscribers.get(key)
+        if not subscribers:
+            return
+
+        subscribers.discard(subscription)
+        if not subscribers:
+            del self._subscribers[key]
+            self._wake.pop(key, None)
+            poller = self._pollers.pop(key, None)
+            if poller is not None:
+                poller.cancel()
+
+    def _poller_done(self, key: ReadingKey, task: asyncio.Task):
+        """Forget a finished poller; report a crash to its subscribers."""
+        if self._pollers.get(key) is task:
+            del self._pollers[key]
+
+        if task.cancelled() or task.exception() is None:
+            return
+
+        error = task.exception()
+        logger.error(f"Reading poller for {key[0]} {key[1]} failed: {error}")
+        # Subscribers get the error; a later subscribe() starts a new poller
+        for subscription in list(self._subscribers.get(key, ())):
+            subscription._deliver(error)
+
+    async def _poll_loop(self, key: ReadingKey):
+        """Poll one reading for its subscribers."""
+        wake = self._wake[key]
+        last_poll: Optional[float] = None
+
+        while self._subscribers.get(key):
+            interval = min(s.interval for s in self._subscribers[key])
+
+            if last_poll is not None:
+                delay = last_poll + interval - time.monotonic()
+                if delay > 0:
+                    wake.clear()
+                    try:
+                        await asyncio.wait_for(wake.wait(), delay)
+                        continue  # Subscribers changed; recompute the interval
+                    except asyncio.TimeoutError:
+                        pass
+
+            last_poll = time.monotonic()
+            try:
+                item = await self._fetch(key)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                item = e
+
+            for subscription in list(self._subscribers.get(key, ())):
+                subscription._deliver(item)
+
+    def invalidate(self, equipment_id: str):
+        """Drop cached readings of a piece of equipment."""
+        for key in [k for k in self._cache if k[0] == equipment_id]:
+            del self._cache[key]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get request, cache and poll counters."""
+        return {
+            "requests": self.requests,
+            "cache_hits": self.cache_hits,
+            "coalesced": self.coalesced,
+            "polls": self.polls,
+            "pollers": len(self._pollers),
+            "subscribers": sum(len(s) for s in self._subscribers.values()),
+        }
+
+
+# Global reading service instance
+reading_service = ReadingService(equipment_manager)
@@ -2,7 +2,7 @@
 
 import logging
 import uuid
-from typing import Any
+from typing import Any, List
 
 from shared.models.data import ElectronicLoadData
 from shared.models.equipment import (EquipmentInfo, EquipmentStatus,
@@ -16,6 +16,8 @@ logger = logging.getLogger(__name__)
 class RigolDL3021A(BaseEquipment):
     """Driver for Rigol DL3021A DC Electronic Load."""
 
+    supports_compound_commands = True
+
     def __init__(self, resource_manager, resource_string: str):
         """Initialize Rigol DL3021A."""
         super().__init__(resource_manager, resource_string)
@@ -137,22 +139,35 @@ class RigolDL3021A(BaseEquipment):
 
     async def get_readings(self) -> ElectronicLoadData:
         """Get current readings from the load."""
-        # Get mode
-        mode = await self._query(":SOUR:FUNC?")
+        # Get mode, all setpoints, measured values and input state in one batch
+        (
+            mode, curr_set, volt_set, res_set, pow_set,
+            voltage_str, current_str, power_str, input_state,
+        ) = await self.batch([
+            ":SOUR:FUNC?",
+            ":SOUR:CURR:LEV:IMM?",
+            ":SOUR:VOLT:LEV:IMM?",
+            ":SOUR:RES:LEV:IMM?",
+            ":SOUR:POW:LEV:IMM?",
+            ":MEAS:VOLT?",
+            ":MEAS:CURR?",
+            ":MEAS:POW?",
+            ":SOUR:INP:STAT?",
+        ])
         mode = mode.strip().upper()
 
-        # Get setpoint based on mode
+        # Pick the setpoint for the active mode
         if mode == "CURR" or mode == "CC":
-            setpoint_str = await self._query(":SOUR:CURR:LEV:IMM?")
+            setpoint_str = curr_set
             mode = "CC"
         elif mode == "VOLT" or mode == "CV":
-            setpoint_str = await self._query(":SOUR:VOLT:LEV:IMM?")
+            setpoint_str = volt_set
             mode = "CV"
         elif mode == "RES" or mode == "CR":
-            setpoint_str = await self._query(":SOUR:RES:LEV:IMM?")
+            setpoint_str = res_set
             mode = "CR"
         elif mode == "POW" or mode == "CP":
-            setpoint_str = await self._query(":SOUR:POW:LEV:IMM?")
+            setpoint_str = pow_set
             mode = "CP"
         else:
             setpoint_str = "0"
@@ -160,17 +175,10 @@ class RigolDL3021A(BaseEquipment):
 
         setpoint = float(setpoint_str)
 
-        # Get measured values
-        voltage_str = await self._query(":MEAS:VOLT?")
-        current_str = await self._query(":MEAS:CURR?")
-        power_str = await self._query(":MEAS:POW?")
-
         voltage = float(voltage_str)
         current = float(current_str)
         power = float(power_str)
 
-        # Get input state
-        input_state = await self._query(":SOUR:INP:STAT?")
         load_enabled = input_state.strip() == "1" or input_state.strip().upper() == "ON"
 
         return ElectronicLoadData(
@@ -182,3 +190,27 @@ class RigolDL3021A(BaseEquipment):
             power=power,
             load_enabled=load_enabled,
         )
+
+    async def read_channels(self, channels: List[str]) -> List[float]:
+        """Read several quantities with one compound :MEAS query.
+
+        Args:
+            channels: Quantities to read ('VOLT', 'CURR' or 'POW'); any other
+                identifier returns the current, matching the mock load
+
+        Returns:
+            One value per requested channel
+        """
+        queries = []
+        for channel in channels:
+            name = channel.upper()
+            if name.startswith("VOLT"):
+                queries.append(":MEAS:VOLT?")
+            elif name.startswith("POW"):
+                queries.append(":MEAS:POW?")
+            else:
+                queries.append(":MEAS:CURR?")
+
+        unique = list(dict.fromkeys(queries))
+        values = dict(zip(unique, (float(r) for r in await self.batch(unique))))
+        return [values[query] for query in queries]
@@ -2,7 +2,7 @@
 
 import logging
 import uuid
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import numpy as np
 
@@ -14,10 +14,135 @@ from .base import BaseEquipment
 
 logger = logging.getLogger(__name__)
 
+# Most points one :WAV:DATA? may return in RAW mode, per waveform format
+RAW_CHUNK_POINTS = {"BYTE": 250000, "WORD": 125000}
+
+
+async def read_raw_memory(
+    scope: BaseEquipment,
+    channel: int,
+    points: Optional[int] = None,
+    word: bool = False,
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+) -> Tuple[np.ndarray, Dict[str, float]]:
+    """
+    Download a channel's acquisition memory in RAW mode, chunk by chunk.
+
+    Acquisition is stopped first, as RAW reads require. Each chunk is
+    selected with :WAV:STAR/:WAV:STOP and decoded with np.frombuffer
+    straight into one preallocated array. The run state, waveform mode and
+    :WAV:STAR/:WAV:STOP range are restored afterwards, even if the download
+    fails, since NORM-mode reads use the same range.
+
+    Args:
+        scope: Connected Rigol scope driver
+        channel: Analog channel number
+        points: Points to read from the start of memory (None = all)
+        word: Use WORD format (2 bytes/point) instead of BYTE
+        progress_callback: Called with (points_read, total_points) after
+            each chunk
+
+    Returns:
+        (voltages, info) with voltages as float32 and info holding
+        sample_rate, x_origin and points
+    """
+    fmt = "WORD" if word else "BYTE"
+
+    trigger_status, wave_mode, wave_start, wave_stop = await scope.batch(
+        [":TRIG:STAT?", ":WAV:MODE?", ":WAV:STAR?", ":WAV:STOP?"]
+    )
+    try:
+        codes, preamble = await _download_raw(
+            scope, channel, points, fmt, progress_callback
+        )
+    finally:
+        # Restore the range while still in RAW mode, where any memory point
+        # is valid. STAR 1 first keeps the range non-empty whatever the last
+        # chunk was.
+        restore = [
+            ":WAV:STAR 1",
+            f":WAV:STOP {int(wave_stop)}",
+            f":WAV:STAR {int(wave_start)}",
+            f":WAV:MODE {wave_mode.strip().upper()}",
+        ]
+        if trigger_status.strip().upper() != "STOP":
+            restore.append(":RUN")
+        try:
+            await scope.batch(restore, cache_settings=True)
+        finally:
+            # The mode change may clamp the range, so don't trust the cache
+            scope.invalidate_settings(":WAV:STAR")
+            scope.invalidate_settings(":WAV:STOP")
+
+    total = len(codes)
+    x_increment, x_origin, y_increment, y_origin, y_reference = preamble
+    voltages = (codes.astype(np.float32) - (y_origin + y_reference)) * y_increment
+    info = {
+        "sample_rate": 1.0 / x_increment if x_increment > 0 else 1e9,
+        "x_origin": x_origin,
+        "points": total,
+    }
+    return voltages, info
+
+
+async def _download_raw(
+    scope: BaseEquipment,
+    channel: int,
+    points: Optional[int],
+    fmt: str,
+    progress_callback: Optional[Callable[[int, int], None]],
+) -> Tuple[np.ndarray, Tuple[float, float, float, float, float]]:
+    """Stop acquisition and read RAW memory codes; see read_raw_memory()."""
+    await scope._write(":STOP")
+    await scope.batch([
+        f":WAV:SOUR CHAN{channel}",
+        ":WAV:MODE RAW",
+        f":WAV:FORM {fmt}",
+    ], cache_settings=True)
+
+    preamble_parts = (await scope._query(":WAV:PRE?")).split(",")
+    if len(preamble_parts) < 10:
+        raise ValueError("Invalid preamble format")
+    total = int(preamble_parts[2])
+    x_increment = float(preamble_parts[4])
+    x_origin = float(preamble_parts[5])
+    y_increment = float(preamble_parts[7])
+    y_origin = float(preamble_parts[8])
+    y_reference = float(preamble_parts[9])
+
+    if points is not None:
+        total = min(points, total)
+
+    word = fmt == "WORD"
+    datatype = "H" if word else "B"
+    codes = np.empty(total, dtype=np.uint16 if word else np.uint8)
+    chunk_points = RAW_CHUNK_POINTS[fmt]
+
+    start = 0
+    while start < total:
+        stop = min(start + chunk_points, total)
+        # Move STOP before STAR so the range never becomes empty
+        await scope.batch(
+            [f":WAV:STOP {stop}", f":WAV:STAR {start + 1}"], cache_settings=True
+        )
+        chunk = await scope._query_binary_array(":WAV:DATA?", datatype=datatype)
+        count = min(len(chunk), stop - start)
+        if count == 0:
+            raise ValueError(f"Empty waveform chunk at point {start + 1}")
+        codes[start:start + count] = chunk[:count]
+        start += count
+
+        if progress_callback:
+            progress_callback(start, total)
+
+    return codes, (x_increment, x_origin, y_increment, y_origin, y_reference)
+
 
 class RigolMSO2072A(BaseEquipment):
     """Driver for Rigol MSO2072A oscilloscope."""
 
+    supports_compound_commands = True
+
     def __init__(self, resource_manager, resource_string: str):
         """Initialize Rigol scope."""
         super().__init__(resource_manager, resource_string)
@@ -105,17 +230,17 @@ class RigolMSO2072A(BaseEquipment):
         if channel < 1 or channel > self.num_channels:
             raise ValueError(f"Invalid channel: {channel}")
 
-        # Set waveform source
-        await self._write(f":WAV:SOUR CHAN{channel}")
-
-        # Set waveform mode to normal
-        await self._write(":WAV:MODE NORM")
-
-        # Set format to BYTE
-        await self._write(":WAV:FORM BYTE")
-
-        # Get preamble (contains scaling info)
-        preamble = await self._query(":WAV:PRE?")
+        # Select source, normal mode and BYTE format, then read the preamble
+        # (scaling info) and timebase/vertical settings in one batch
+        _, _, _, preamble, time_scale, volt_scale, volt_offset = await self.batch([
+            f":WAV:SOUR CHAN{channel}",
+            ":WAV:MODE NORM",
+            ":WAV:FORM BYTE",
+            ":WAV:PRE?",
+            ":TIM:MAIN:SCAL?",
+            f":CHAN{channel}:SCAL?",
+            f":CHAN{channel}:OFFS?",
+        ], cache_settings=True)
         preamble_parts = preamble.split(",")
 
         # Parse preamble
@@ -130,10 +255,10 @@ class RigolMSO2072A(BaseEquipment):
         else:
             raise ValueError("Invalid preamble format")
 
-        # Get timebase and vertical settings
-        time_scale = float(await self._query(":TIM:MAIN:SCAL?"))
-        volt_scale = float(await self._query(f":CHAN{channel}:SCAL?"))
-        volt_offset = float(await self._query(f":CHAN{channel}:OFFS?"))
+        # Parse timebase and vertical settings
+        time_scale = float(time_scale)
+        volt_scale = float(volt_scale)
+        volt_offset = float(volt_offset)
 
         # Get sample rate
         sample_rate = 1.0 / x_increment if x_increment > 0 else 1e9
@@ -162,15 +287,33 @@ class RigolMSO2072A(BaseEquipment):
         if channel < 1 or channel > self.num_channels:
             raise ValueError(f"Invalid channel: {channel}")
 
-        # Set waveform source
-        await self._write(f":WAV:SOUR CHAN{channel}")
-        await self._write(":WAV:MODE NORM")
-        await self._write(":WAV:FORM BYTE")
+        # Set waveform source, mode and format
+        await self.batch([
+            f":WAV:SOUR CHAN{channel}",
+            ":WAV:MODE NORM",
+            ":WAV:FORM BYTE",
+        ], cache_settings=True)
 
         # Get data
         raw_data = await self._query_binary(":WAV:DATA?")
         return raw_data
 
+    async def get_waveform_deep(
+        self,
+        channel: int = 1,
+        points: Optional[int] = None,
+        word: bool = False,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+    ) -> Tuple[np.ndarray, Dict[str, float]]:
+        """Download deep acquisition memory in RAW mode.
+
+        See read_raw_memory() for arguments and return value.
+        """
+        if channel < 1 or channel > self.num_channels:
+            raise ValueError(f"Invalid channel: {channel}")
+
+        return await read_raw_memory(self, channel, points, word, progress_callback)
+
     async def set_timebase(self, scale: float, offset: float = 0.0):
         """Set timebase settings."""
         await self._write(f":TIM:MAIN:SCAL {scale}")
@@ -217,27 +360,47 @@ class RigolMSO2072A(BaseEquipment):
         measurements = {}
 
         try:
-            # Set measurement source
-            await self._write(f":MEAS:SOUR CHAN{channel}")
-
-            # Get common measurements
-            measurements["vpp"] = float(await self._query(":MEAS:VPP?"))
-            measurements["vmax"] = float(await self._query(":MEAS:VMAX?"))
-            measurements["vmin"] = float(await self._query(":MEAS:VMIN?"))
-            measurements["vavg"] = float(await self._query(":MEAS:VAV?"))
-            measurements["vrms"] = float(await self._query(":MEAS:VRMS?"))
-            measurements["freq"] = float(await self._query(":MEAS:FREQ?"))
-            measurements["period"] = float(await self._query(":MEAS:PER?"))
+            # Set measurement source and get common measurements in one batch
+            names = ["vpp", "vmax", "vmin", "vavg", "vrms", "freq", "period"]
+            responses = await self.batch([
+                f":MEAS:SOUR CHAN{channel}",
+                ":MEAS:VPP?",
+                ":MEAS:VMAX?",
+                ":MEAS:VMIN?",
+                ":MEAS:VAV?",
+                ":MEAS:VRMS?",
+                ":MEAS:FREQ?",
+                ":MEAS:PER?",
+            ], cache_settings=True)
+            for name, value in zip(names, responses[1:]):
+                measurements[name] = float(value)
 
         except Exception as e:
             logger.error(f"Error getting measurements: {e}")
 
         return measurements
 
+    async def read_channels(self, channels: List[str]) -> List[float]:
+        """Read the average voltage of several channels in one batch.
+
+        Args:
+            channels: Channel identifiers (e.g., ['CH1', 'CH2'])
+
+        Returns:
+            One :MEAS:VAV reading per requested channel
+        """
+        commands = []
+        for channel in channels:
+            commands += [f":MEAS:SOUR CHAN{self._parse_channel(channel)}", ":MEAS:VAV?"]
+
+        return [float(r) for r in (await self.batch(commands))[1::2]]
+
 
 class RigolDS1104(BaseEquipment):
     """Driver for Rigol DS1104 digital oscilloscope."""
 
+    supports_compound_commands = True
+
     def __init__(self, resource_manager, resource_string: str):
         """Initialize Rigol DS1104 scope."""
         super().__init__(resource_manager, resource_string)
@@ -324,17 +487,17 @@ class RigolDS1104(BaseEquipment):
         if channel < 1 or channel > self.num_channels:
             raise ValueError(f"Invalid channel: {channel}")
 
-        # Set waveform source
-        await self._write(f":WAV:SOUR CHAN{channel}")
-
-        # Set waveform mode to normal
-        await self._write(":WAV:MODE NORM")
-
-        # Set format to BYTE
-        await self._write(":WAV:FORM BYTE")
-
-        # Get preamble (contains scaling info)
-        preamble = await self._query(":WAV:PRE?")
+        # Select source, normal mode and BYTE format, then read the preamble
+        # (scaling info) and timebase/vertical settings in one batch
+        _, _, _, preamble, time_scale, volt_scale, volt_offset = await self.batch([
+            f":WAV:SOUR CHAN{channel}",
+            ":WAV:MODE NORM",
+            ":WAV:FORM BYTE",
+            ":WAV:PRE?",
+            ":TIM:MAIN:SCAL?",
+            f":CHAN{channel}:SCAL?",
+            f":CHAN{channel}:OFFS?",
+        ], cache_settings=True)
         preamble_parts = preamble.split(",")
 
         # Parse preamble
@@ -348,10 +511,10 @@ class RigolDS1104(BaseEquipment):
         else:
             raise ValueError("Invalid preamble format")
 
-        # Get timebase and vertical settings
-        time_scale = float(await self._query(":TIM:MAIN:SCAL?"))
-        volt_scale = float(await self._query(f":CHAN{channel}:SCAL?"))
-        volt_offset = float(await self._query(f":CHAN{channel}:OFFS?"))
+        # Parse timebase and vertical settings
+        time_scale = float(time_scale)
+        volt_scale = float(volt_scale)
+        volt_offset = float(volt_offset)
 
         # Get sample rate
         sample_rate = 1.0 / x_increment if x_increment > 0 else 1e9
@@ -377,15 +540,33 @@ class RigolDS1104(BaseEquipment):
         if channel < 1 or channel > self.num_channels:
             raise ValueError(f"Invalid channel: {channel}")
 
-        # Set waveform source
-        await self._write(f":WAV:SOUR CHAN{channel}")
-        await self._write(":WAV:MODE NORM")
-        await self._write(":WAV:FORM BYTE")
+        # Set waveform source, mode and format
+        await self.batch([
+            f":WAV:SOUR CHAN{channel}",
+            ":WAV:MODE NORM",
+            ":WAV:FORM BYTE",
+        ], cache_settings=True)
 
         # Get data
         raw_data = await self._query_binary(":WAV:DATA?")
         return raw_data
 
+    async def get_waveform_deep(
+        self,
+        channel: int = 1,
+        points: Optional[int] = None,
+        word: bool = False,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+    ) -> Tuple[np.ndarray, Dict[str, float]]:
+        """Download deep acquisition memory in RAW mode.
+
+        See read_raw_memory() for arguments and return value.
+        """
+        if channel < 1 or channel > self.num_channels:
+            raise ValueError(f"Invalid channel: {channel}")
+
+        return await read_raw_memory(self, channel, points, word, progress_callback)
+
     async def set_timebase(self, scale: float, offset: float = 0.0):
         """Set timebase settings."""
         await self._write(f":TIM:MAIN:SCAL {scale}")
@@ -432,23 +613,41 @@ class RigolDS1104(BaseEquipment):
         measurements = {}
 
         try:
-            # Set measurement source
-            await self._write(f":MEAS:SOUR CHAN{channel}")
-
-            # Get common measurements
-            measurements["vpp"] = float(await self._query(":MEAS:VPP?"))
-            measurements["vmax"] = float(await self._query(":MEAS:VMAX?"))
-            measurements["vmin"] = float(await self._query(":MEAS:VMIN?"))
-            measurements["vavg"] = float(await self._query(":MEAS:VAV?"))
-            measurements["vrms"] = float(await self._query(":MEAS:VRMS?"))
-            measurements["freq"] = float(await self._query(":MEAS:FREQ?"))
-            measurements["period"] = float(await self._query(":MEAS:PER?"))
+            # Set measurement source and get common measurements in one batch
+            names = ["vpp", "vmax", "vmin", "vavg", "vrms", "freq", "period"]
+            responses = await self.batch([
+                f":MEAS:SOUR CHAN{channel}",
+                ":MEAS:VPP?",
+                ":MEAS:VMAX?",
+                ":MEAS:VMIN?",
+                ":MEAS:VAV?",
+                ":MEAS:VRMS?",
+                ":MEAS:FREQ?",
+                ":MEAS:PER?",
+            ], cache_settings=True)
+            for name, value in zip(names, responses[1:]):
+                measurements[name] = float(value)
 
         except Exception as e:
             logger.error(f"Error getting measurements: {e}")
 
         return measurements
 
+    async def read_channels(self, channels: List[str]) -> List[float]:
+        """Read the average voltage of several channels in one batch.
+
+        Args:
+            channels: Channel identifiers (e.g., ['CH1', 'CH2'])
+
+        Returns:
+            One :MEAS:VAV reading per requested channel
+        """
+        commands = []
+        for channel in channels:
+            commands += [f":MEAS:SOUR CHAN{self._parse_channel(channel)}", ":MEAS:VAV?"]
+
+        return [float(r) for r in (await self.batch(commands))[1::2]]
+
 
 class RigolDS1102D(BaseEquipment):
     """Driver for Rigol DS1102D digital oscilloscope.
@@ -554,13 +753,17 @@ class RigolDS1102D(BaseEquipment):
         if channel < 1 or channel > self.num_channels:
             raise ValueError(f"Invalid channel: {channel}")
 
-        # Set waveform source
-        await self._write(f":WAV:SOUR CHAN{channel}")
-        await self._write(":WAV:MODE NORM")
-        await self._write(":WAV:FORM BYTE")
-
-        # Get preamble (contains scaling info)
-        preamble = await self._query(":WAV:PRE?")
+        # Select source, normal mode and BYTE format, then read the preamble
+        # (scaling info) and timebase/vertical settings in one batch
+        _, _, _, preamble, time_scale, volt_scale, volt_offset = await self.batch([
+            f":WAV:SOUR CHAN{channel}",
+            ":WAV:MODE NORM",
+            ":WAV:FORM BYTE",
+            ":WAV:PRE?",
+            ":TIM:SCAL?",
+            f":CHAN{channel}:SCAL?",
+            f":CHAN{channel}:OFFS?",
+        ], cache_settings=True)
         preamble_parts = preamble.split(",")
 
         # Parse preamble - DS1102D uses similar format to other Rigol scopes
@@ -573,10 +776,10 @@ class RigolDS1102D(BaseEquipment):
         else:
             raise ValueError("Invalid preamble format")
 
-        # Get timebase and vertical settings
-        time_scale = float(await self._query(":TIM:SCAL?"))
-        volt_scale = float(await self._query(f":CHAN{channel}:SCAL?"))
-        volt_offset = float(await self._query(f":CHAN{channel}:OFFS?"))
+        # Parse timebase and vertical settings
+        time_scale = float(time_scale)
+        volt_scale = float(volt_scale)
+        volt_offset = float(volt_offset)
 
         # Get sample rate
         sample_rate = 1.0 / x_increment if x_increment > 0 else 1e9
@@ -600,9 +803,11 @@ class RigolDS1102D(BaseEquipment):
         if channel < 1 or channel > self.num_channels:
             raise ValueError(f"Invalid channel: {channel}")
 
-        await self._write(f":WAV:SOUR CHAN{channel}")
-        await self._write(":WAV:MODE NORM")
-        await self._write(":WAV:FORM BYTE")
+        await self.batch([
+            f":WAV:SOUR CHAN{channel}",
+            ":WAV:MODE NORM",
+            ":WAV:FORM BYTE",
+        ], cache_settings=True)
 
         return await self._query_binary(":WAV:DATA?")
 
@@ -760,6 +965,21 @@ class RigolDS1102D(BaseEquipment):
 
         return measurements
 
+    async def read_channels(self, channels: List[str]) -> List[float]:
+        """Read the average voltage of several channels in one batch.
+
+        Args:
+            channels: Channel identifiers (e.g., ['CH1', 'CH2'])
+
+        Returns:
+            One :MEAS:VAV reading per requested channel
+        """
+        commands = []
+        for channel in channels:
+            commands += [f":MEAS:SOUR CHAN{self._parse_channel(channel)}", ":MEAS:VAV?"]
+
+        return [float(r) for r in (await self.batch(commands))[1::2]]
+
     async def force_trigger(self):
         """Force a trigger event immediately."""
         await self._write(":TFOR")
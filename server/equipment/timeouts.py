@@ -0,0 +1,204 @@
+"""Adaptive I/O timeouts and circuit breaking for instruments.
+
+A fixed VISA timeout has to cover the slowest instrument and command, so a
+hung device holds its I/O worker for the full timeout on every queued call.
+AdaptiveTimeout instead derives each device's timeout from the latencies it
+has actually shown (p99 x multiplier, clamped to a floor and a ceiling), and
+CircuitBreaker stops sending I/O to a device after repeated timeouts so
+callers fail fast until a probe command shows it answering again.
+"""
+
+import math
+import time
+from collections import deque
+from typing import Any, Dict, Optional
+
+from server.config.settings import settings
+
+from .error_handler import CircuitOpenError
+
+# Latency samples kept per device, and samples needed before adapting
+LATENCY_WINDOW = 200
+MIN_LATENCY_SAMPLES = 20
+
+
+class AdaptiveTimeout:
+    """I/O timeout derived from a device's recent latency distribution."""
+
+    def __init__(
+        self,
+        default_ms: int,
+        multiplier: float = 4.0,
+        floor_ms: int = 250,
+        ceiling_ms: int = 10000,
+        enabled: bool = True,
+        window: int = LATENCY_WINDOW,
+        min_samples: int = MIN_LATENCY_SAMPLES,
+    ):
+        """
+        Initialize adaptive timeout.
+
+        Args:
+            default_ms: Timeout until enough latencies are known, or when
+                adaptation is disabled
+            multiplier: Timeout as a multiple of the p99 latency
+            floor_ms: Shortest timeout
+            ceiling_ms: Longest timeout
+            enabled: Whether to adapt at all
+            window: Number of most recent latencies considered
+            min_samples: Latencies needed before adapting
+        """
+        self.default_ms = default_ms
+        self.multiplier = multiplier
+        self.floor_ms = floor_ms
+        self.ceiling_ms = max(ceiling_ms, floor_ms)
+        self.enabled = enabled
+        self.min_samples = min_samples
+        self._samples: deque = deque(maxlen=window)
+        self._timeout_ms: Optional[int] = None  # Cached until the next sample
+
+    @classmethod
+    def from_settings(cls, default_ms: int) -> "AdaptiveTimeout":
+        """Create an adaptive timeout configured from settings."""
+        return cls(
+            default_ms,
+            multiplier=settings.adaptive_timeout_multiplier,
+            floor_ms=settings.adaptive_timeout_floor_ms,
+            ceiling_ms=settings.adaptive_timeout_ceiling_ms,
+            enabled=settings.enable_adaptive_timeouts,
+        )
+
+    def record(self, latency_ms: float):
+        """Add the latency of a command that completed."""
+        self._samples.append(latency_ms)
+        self._timeout_ms = None
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Get a latency percentile (0-100), or None without samples."""
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, math.ceil(q / 100 * len(ordered)) - 1)]
+
+    @property
+    def timeout_ms(self) -> int:
+        """Current timeout in milliseconds."""
+        if not self.enabled or len(self._samples) < self.min_samples:
+            return self.default_ms
+
+        if self._timeout_ms is None:
+            adaptive = self.percentile(99) * self.multiplier
+            self._timeout_ms = int(min(max(adaptive, self.floor_ms), self.ceiling_ms))
+        return self._timeout_ms
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get the current timeout and latency percentiles."""
+        return {
+            "timeout_ms": self.timeout_ms,
+            "adaptive": self.enabled and len(self._samples) >= self.min_samples,
+            "samples": len(self._samples),
+            "p50_latency_ms": self.percentile(50),
+            "p99_latency_ms": self.percentile(99),
+        }
+
+
+class CircuitBreaker:
+    """Fail-fast gate for a device that keeps timing out.
+
+    closed: I/O flows normally. After ``threshold`` consecutive timeouts the
+    circuit opens and every call is rejected for ``reset_sec``. Then it is
+    half-open: one probe call goes through; success closes the circuit, a
+    timeout opens it again.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, name: str = "", threshold: int = 3, reset_sec: float = 5.0):
+        """
+        Initialize circuit breaker.
+
+        Args:
+            name: Device label for errors (usually the resource string)
+            threshold: Consecutive timeouts that open the circuit
+            reset_sec: Seconds the circuit stays open before a probe
+        """
+        self.name = name
+        self.threshold = threshold
+        self.reset_sec = reset_sec
+        self.state = self.CLOSED
+        self.consecutive_timeouts = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+
+        # Metrics
+        self.trips = 0
+        self.rejected = 0
+
+    @classmethod
+    def from_settings(cls, name: str = "") -> "CircuitBreaker":
+        """Create a circuit breaker configured from settings."""
+        return cls(
+            name,
+            threshold=settings.circuit_breaker_threshold,
+            reset_sec=settings.circuit_breaker_reset_sec,
+        )
+
+    def before_call(self):
+        """
+        Admit a call, or reject it while the device is known to be hung.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with a
+                probe already in flight
+        """
+        if self.state == self.CLOSED:
+            return
+
+        if self.state == self.OPEN:
+            remaining = self._opened_at + self.reset_sec - time.monotonic()
+            if remaining > 0:
+                self.rejected += 1
+                raise CircuitOpenError(self.name, remaining)
+            self.state = self.HALF_OPEN
+
+        if self._probe_in_flight:
+            self.rejected += 1
+            raise CircuitOpenError(self.name, self.reset_sec)
+        self._probe_in_flight = True
+
+    def record_success(self):
+        """Record a call the device answered."""
+        self._probe_in_flight = False
+        self.consecutive_timeouts = 0
+        self.state = self.CLOSED
+
+    def record_timeout(self):
+        """Record a call the device did not answer in time."""
+        self._probe_in_flight = False
+        self.consecutive_timeouts += 1
+        if self.state == self.HALF_OPEN or self.consecutive_timeouts >= self.threshold:
+            if self.state != self.OPEN:
+                self.trips += 1
+            self.state = self.OPEN
+            self._opened_at = time.monotonic()
+
+    def record_error(self):
+        """Record a call that failed for a reason other than a timeout."""
+        self._probe_in_flight = False
+
+    def reset(self):
+        """Close the circuit, e.g. after an explicit reconnect."""
+        self._probe_in_flight = False
+        self.consecutive_timeouts = 0
+        self.state = self.CLOSED
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get circuit state and counters."""
+        return {
+            "state": self.state,
+            "consecutive_timeouts": self.consecutive_timeouts,
+            "trips": self.trips,
+            "rejected": self.rejected,
+        }
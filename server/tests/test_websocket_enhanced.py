@@ -8,12 +8,14 @@ Tests cover:
 """
 
 import asyncio
+import base64
 import gzip
 import json
 import shutil
 # Import the modules we're testing
 import sys
 import tempfile
+import time
 from pathlib import Path
 from unittest.mock import AsyncMock, Mock, patch
 
@@ -21,13 +23,16 @@ import pytest
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from websocket.enhanced_features import (BackpressureConfig,
+from websocket.enhanced_features import (COMPRESSION_DICTIONARY,
+                                         BackpressureConfig,
                                          BackpressureHandler, CompressionType,
                                          MessageCompressor, MessagePriority,
                                          PriorityQueue, RateLimiter,
-                                         RecordingFormat, StreamRecorder,
+                                         RecordingFormat, StreamCompressor,
+                                         StreamDecompressor, StreamRecorder,
                                          StreamRecordingConfig)
 from websocket.enhanced_manager import EnhancedStreamManager
+from websocket.pubsub import EncodedMessage
 
 
 class TestStreamRecorder:
@@ -206,6 +211,72 @@ class TestMessageCompressor:
 
         assert ratio > 1.0  # Should have some compression
 
+    def test_deflate_decompression(self):
+        """Test a standalone DEFLATE message."""
+        original = "Hello World" * 100
+        compressed = MessageCompressor.compress(original, CompressionType.DEFLATE)
+        decompressed = MessageCompressor.decompress(
+            compressed, CompressionType.DEFLATE
+        )
+
+        assert decompressed == original
+
+
+def stream_message(i):
+    """Create a small power supply stream message."""
+    return json.dumps(
+        {
+            "type": "stream_data",
+            "equipment_id": "ps_1234",
+            "stream_type": "readings",
+            "data": {
+                "equipment_id": "ps_1234",
+                "timestamp": f"2026-01-01T00:00:{i:02d}.000000",
+                "voltage_set": 5.0,
+                "current_set": 1.0,
+                "voltage_actual": 5.0 + i / 1000,
+                "current_actual": 0.5,
+                "output_enabled": True,
+            },
+        },
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+class TestStreamCompressor:
+    """Test per-connection DEFLATE streams."""
+
+    def test_round_trip_in_order(self):
+        """Test every message decompresses on arrival."""
+        compressor = StreamCompressor()
+        decompressor = StreamDecompressor()
+
+        for i in range(20):
+            message = stream_message(i)
+            assert decompressor.decompress(compressor.compress(message)) == message
+
+    def test_small_messages_compress_better_than_one_shot(self):
+        """Test the shared window and dictionary beat per-message zlib."""
+        compressor = StreamCompressor()
+        messages = [stream_message(i) for i in range(20)]
+
+        streamed = sum(len(compressor.compress(m)) for m in messages)
+        one_shot = sum(
+            len(MessageCompressor.compress(m, CompressionType.ZLIB)) for m in messages
+        )
+
+        assert streamed * 5 < one_shot
+
+    def test_dictionary_helps_first_message(self):
+        """Test the preset dictionary shrinks the first message of a stream."""
+        message = stream_message(0)
+
+        with_dictionary = StreamCompressor().compress(message)
+        without = StreamCompressor(zdict=b"").compress(message)
+
+        assert len(with_dictionary) < len(without)
+        assert len(COMPRESSION_DICTIONARY) <= 32768  # Fits the window
+
 
 class TestPriorityQueue:
     """Test priority queue."""
@@ -276,6 +347,43 @@ class TestPriorityQueue:
         assert queue.size_by_priority(MessagePriority.HIGH) == 1
         assert queue.size_by_priority(MessagePriority.CRITICAL) == 0
 
+    def test_fifo_within_priority(self):
+        """Test messages of equal priority keep their order."""
+        queue = PriorityQueue(max_size=100)
+
+        for i in range(5):
+            queue.put({"msg": i}, MessagePriority.NORMAL)
+        queue.put({"msg": "low"}, MessagePriority.LOW)
+        queue.clear_low_priority()
+
+        assert [queue.get().data["msg"] for _ in range(5)] == [0, 1, 2, 3, 4]
+        assert queue.get() is None
+
+    @pytest.mark.asyncio
+    async def test_wait_wakes_on_put(self):
+        """Test a waiting consumer is woken by put instead of polling."""
+        queue = PriorityQueue(max_size=100)
+        waiter = asyncio.create_task(queue.wait())
+
+        await asyncio.sleep(0.01)
+        assert not waiter.done()
+
+        queue.put({"msg": "wake"}, MessagePriority.NORMAL)
+        await asyncio.wait_for(waiter, 1.0)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_passes_wakeup_on(self):
+        """Test a cancelled consumer does not swallow a wakeup."""
+        queue = PriorityQueue(max_size=100)
+        first = asyncio.create_task(queue.wait())
+        second = asyncio.create_task(queue.wait())
+        await asyncio.sleep(0)
+
+        queue.put({"msg": "wake"}, MessagePriority.NORMAL)
+        first.cancel()
+
+        await asyncio.wait_for(second, 1.0)
+
 
 class TestRateLimiter:
     """Test rate limiter."""
@@ -310,6 +418,18 @@ class TestRateLimiter:
         # 11th should fail
         assert not await limiter.acquire()
 
+    @pytest.mark.asyncio
+    async def test_wait_sleeps_until_next_token(self):
+        """Test waiting for a token takes about one refill interval."""
+        limiter = RateLimiter(max_rate=20, burst_size=1)
+        assert await limiter.acquire()
+
+        start = time.monotonic()
+        await limiter.wait()
+        elapsed = time.monotonic() - start
+
+        assert 0.04 <= elapsed < 0.2
+
 
 class TestBackpressureHandler:
     """Test backpressure handler."""
@@ -399,6 +519,42 @@ class TestBackpressureHandler:
         msg2 = await handler.get_next_message()
         assert msg2.data["msg"] == "first"
 
+    @pytest.mark.asyncio
+    async def test_empty_queue_keeps_tokens(self):
+        """Test polling an empty queue does not use up rate limit tokens."""
+        config = BackpressureConfig(enabled=True, burst_size=2)
+        handler = BackpressureHandler(config)
+
+        for _ in range(5):
+            assert await handler.get_next_message() is None
+
+        assert handler.rate_limiter.get_tokens() == 2
+        assert handler.get_stats()["rate_limit_hits"] == 0
+
+    @pytest.mark.asyncio
+    async def test_wait_next_message(self):
+        """Test waiting for messages at the configured rate."""
+        config = BackpressureConfig(
+            enabled=True, max_messages_per_second=50, burst_size=1
+        )
+        handler = BackpressureHandler(config)
+        receiver = asyncio.create_task(handler.wait_next_message())
+
+        await asyncio.sleep(0.01)
+        assert not receiver.done()
+
+        await handler.queue_message({"msg": "first"}, MessagePriority.NORMAL)
+        assert (await asyncio.wait_for(receiver, 1.0)).data["msg"] == "first"
+
+        # The bucket is empty: the next message waits about 20 ms for a token
+        await handler.queue_message({"msg": "second"}, MessagePriority.NORMAL)
+        start = time.monotonic()
+        message = await asyncio.wait_for(handler.wait_next_message(), 1.0)
+
+        assert message.data["msg"] == "second"
+        assert time.monotonic() - start >= 0.01
+        assert handler.get_stats()["rate_limit_hits"] == 1
+
 
 class TestEnhancedStreamManager:
     """Test enhanced stream manager."""
@@ -488,6 +644,81 @@ class TestEnhancedStreamManager:
         assert stats1["messages_queued"] > 0
         assert stats2["messages_queued"] > 0
 
+    @pytest.mark.asyncio
+    async def test_send_loop_sends_immediately(self, manager):
+        """Test queued messages are sent without a polling delay."""
+        mock_websocket = AsyncMock()
+        await manager.connect(mock_websocket, "test_client")
+        await asyncio.sleep(0)
+        mock_websocket.send_text.reset_mock()
+
+        await manager.send_to_client("test_client", {"type": "test"})
+        await asyncio.sleep(0)
+
+        mock_websocket.send_text.assert_awaited_once()
+        manager.disconnect("test_client")
+
+    @pytest.mark.asyncio
+    async def test_deflate_per_connection(self, manager):
+        """Test negotiated DEFLATE streams are separate per client."""
+        websockets = {"client1": AsyncMock(), "client2": AsyncMock()}
+        for client_id, websocket in websockets.items():
+            await manager.connect(websocket, client_id)
+        await asyncio.sleep(0)
+
+        capabilities = json.loads(
+            websockets["client1"].send_text.call_args.args[0]
+        )["features"]["compression"]
+        assert "deflate" in capabilities["types"]
+        dictionary = base64.b64decode(capabilities["deflate"]["dictionary"])
+
+        for client_id in websockets:
+            assert manager.set_compression(client_id, CompressionType.DEFLATE)
+        # client2 misses nothing by joining later: its context is its own
+        await manager.send_to_client("client1", {"type": "test", "n": 0})
+        for n in range(1, 3):
+            await manager.broadcast({"type": "test", "n": n})
+        await asyncio.sleep(0)
+
+        for client_id, websocket in websockets.items():
+            decompressor = StreamDecompressor(zdict=dictionary)
+            received = []
+            for call in websocket.send_bytes.call_args_list:
+                frame = call.args[0]
+                assert frame[:1] == b"d"
+                received.append(json.loads(decompressor.decompress(frame[1:]))["n"])
+            assert received == ([0, 1, 2] if client_id == "client1" else [1, 2])
+            manager.disconnect(client_id)
+
+        assert manager.compression_contexts == {}
+        assert manager.get_global_stats()["average_compression_ratio"] > 0
+
+    @pytest.mark.asyncio
+    async def test_failed_deflate_send_drops_context(self, manager):
+        """Test a context that ran ahead of the client is not reused."""
+        websocket = AsyncMock()
+        websocket.send_bytes.side_effect = RuntimeError("closed")
+        message = EncodedMessage({"type": "test"}, CompressionType.DEFLATE)
+
+        with pytest.raises(RuntimeError):
+            await manager._send_compressed("client1", websocket, message)
+
+        assert "client1" not in manager.compression_contexts
+
+    @pytest.mark.asyncio
+    async def test_set_unknown_compression_reports_error(self):
+        """Test an unknown compression type is answered with an error."""
+        import websocket_server_enhanced as server
+
+        with patch.object(server, "enhanced_stream_manager") as manager:
+            manager.send_to_client = AsyncMock()
+            await server.handle_set_compression("client1", {"compression": "lz4"})
+
+        manager.set_compression.assert_not_called()
+        reply = manager.send_to_client.call_args.args[1]
+        assert reply["type"] == "error"
+        assert "lz4" in reply["error"]
+
     def test_recording_integration(self, manager):
         """Test recording integration."""
         # Start recording
@@ -3,8 +3,12 @@
 from .enhanced_features import (BackpressureConfig, BackpressureHandler,
                                 CompressionType, MessageCompressor,
                                 MessagePriority, RecordingFormat,
+                                StreamCompressor, StreamDecompressor,
                                 StreamRecorder, StreamRecordingConfig)
 from .enhanced_manager import EnhancedStreamManager
+from .frames import (FrameFormat, decode_acquisition_frame,
+                     encode_acquisition_frame)
+from .pubsub import EncodedMessage, Subscriber, TopicHub
 
 __all__ = [
     "CompressionType",
@@ -14,6 +18,14 @@ __all__ = [
     "BackpressureConfig",
     "StreamRecorder",
     "MessageCompressor",
+    "StreamCompressor",
+    "StreamDecompressor",
     "BackpressureHandler",
     "EnhancedStreamManager",
+    "FrameFormat",
+    "encode_acquisition_frame",
+    "decode_acquisition_frame",
+    "EncodedMessage",
+    "Subscriber",
+    "TopicHub",
 ]
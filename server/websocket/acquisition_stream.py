@@ -0,0 +1,114 @@
+"""Per-client cursors for delta-only acquisition streaming.
+
+Each client's position in an acquisition stream is the sequence number of
+the next sample it needs. Every update carries only the samples written
+since that position, so bandwidth follows the acquisition's sample rate
+rather than the poll rate, and a stream whose acquisition has stopped goes
+quiet. Each update also carries ``sequence`` (first sample in the update)
+and ``next_sequence``, so a client that misses an update notices the jump
+and asks for a resync from the sequence it expected; the answer is marked
+``resync``. When the samples a client needs have already left the buffer,
+the update reports how many were lost in ``gap``. ``state`` and ``stats``
+are only included when they differ from what the client last received.
+"""
+
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+# Most samples sent in one update; a client far behind catches up over
+# several updates
+MAX_UPDATE_SAMPLES = 10000
+
+
+def acquisition_status(session) -> Dict[str, Any]:
+    """Get the state and statistics fields of an acquisition update."""
+    return {
+        "state": session.state,
+        "stats": session.stats.model_dump(mode="json"),
+    }
+
+
+class AcquisitionCursor:
+    """One client's position in an acquisition stream."""
+
+    def __init__(self, num_samples: int = 100):
+        """
+        Initialize cursor.
+
+        Args:
+            num_samples: Latest samples sent first when a client starts
+                without a known position
+        """
+        self.num_samples = num_samples
+        self.sequence: Optional[int] = None  # Next sample the client needs
+        self.status: Optional[Dict[str, Any]] = None  # Last status sent
+        self.resynced = False  # Next update answers a resync request
+
+    def resync(self, sequence: Optional[int] = None):
+        """
+        Restart the stream for the client.
+
+        Args:
+            sequence: Sequence number of the first sample the client needs
+                (None = the latest num_samples samples)
+        """
+        self.sequence = sequence
+        self.status = None
+        self.resynced = True
+
+    def copy_position(self, other: "AcquisitionCursor"):
+        """Take over another cursor's position after sharing its update."""
+        self.sequence = other.sequence
+        self.status = other.status
+        self.resynced = other.resynced
+
+    def next_update(
+        self, acquisition_manager, acquisition_id: str, status: Dict[str, Any]
+    ) -> Optional[Tuple[Dict[str, Any], np.ndarray, np.ndarray]]:
+        """
+        Read the samples the client has not received yet, and advance.
+
+        Args:
+            acquisition_manager: Acquisition manager owning the buffer
+            acquisition_id: Acquisition session ID
+            status: Current acquisition_status() of the session
+
+        Returns:
+            (message fields, data, timestamps) tuple, or None when there is
+            nothing new to send
+        """
+        if self.sequence is None:
+            self.sequence = max(
+                0,
+                acquisition_manager.get_buffer_sequence(acquisition_id)
+                - self.num_samples,
+            )
+
+        # Oldest samples first; the rest follow in the next update
+        data, timestamps, next_sequence, gap = (
+            acquisition_manager.get_buffer_data_since(
+                acquisition_id, self.sequence, MAX_UPDATE_SAMPLES
+            )
+        )
+        first_sequence = next_sequence - len(timestamps)
+
+        status_changed = status != self.status
+        if len(timestamps) == 0 and not gap and not status_changed:
+            return None
+
+        message = {
+            "sequence": first_sequence,
+            "next_sequence": next_sequence,
+        }
+        if gap:
+            message["gap"] = gap
+        if self.resynced:
+            message["resync"] = True
+            self.resynced = False
+        if status_changed:
+            message.update(status)
+            self.status = status
+
+        self.sequence = next_sequence
+        return message, data, timestamps
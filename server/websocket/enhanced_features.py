@@ -9,6 +9,8 @@ This module provides advanced WebSocket capabilities including:
 
 import asyncio
 import gzip
+import heapq
+import itertools
 import json
 import logging
 import time
@@ -18,7 +20,7 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple, Union
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +31,7 @@ class CompressionType(str, Enum):
     NONE = "none"
     GZIP = "gzip"
     ZLIB = "zlib"
+    DEFLATE = "deflate"  # Streaming, one context per connection
 
 
 class MessagePriority(int, Enum):
@@ -81,7 +84,7 @@ class PriorityMessage:
 
     priority: MessagePriority
     timestamp: float
-    data: Dict[str, Any]
+    data: Any  # Message to send (an EncodedMessage in the enhanced manager)
     compressed: bool = False
     compression_type: Optional[CompressionType] = None
 
@@ -290,31 +293,111 @@ class StreamRecorder:
         }
 
 
+# Preset dictionary for DEFLATE streams: fragments of the JSON messages the
+# server streams, so even the first message of a connection compresses well.
+# zlib favours matches near the end, so the most frequent fragments go last.
+# Changing it breaks clients holding the old one; it is advertised in the
+# capabilities message and versioned by COMPRESSION_DICTIONARY_ID.
+COMPRESSION_DICTIONARY_ID = 1
+COMPRESSION_DICTIONARY = (
+    '{"type":"capabilities","features":{"compression":{"enabled":true,'
+    '"type":"compression_set","compression":"deflate"}'
+    '{"type":"waveform","channel":1,"sample_rate":,"time_scale":,'
+    '"voltage_scale":,"voltage_offset":0.0,"num_samples":,"data_id":"'
+    '"measurements":{"frequency":,"vpp":,"vrms":},"units":{"V","Hz","A","W"}'
+    '"mode":"CC","setpoint":,"voltage":,"current":,"power":,"load_enabled":'
+    '"voltage_set":,"current_set":,"voltage_actual":,"current_actual":,'
+    '"output_enabled":true,"in_cv_mode":false,"in_cc_mode":false}'
+    '"stats":{"total_samples":,"samples_per_channel":{},"start_time":"'
+    '"end_time":null,"duration_seconds":,"actual_sample_rate":,'
+    '"buffer_overruns":0,"spilled_samples":0,"missed_deadlines":0,'
+    '"mean_jitter_ms":,"max_jitter_ms":,"min_values":{},"max_values":{}}'
+    '{"type":"acquisition_stream","acquisition_id":"acq_","sequence":,'
+    '"next_sequence":,"state":"acquiring","channels":["CH1","CH2"],'
+    '"data":{"timestamps":["T","],"values":{"CH1":[,"CH2":[],"count":}}'
+    '{"type":"stream_data","equipment_id":"","stream_type":"readings",'
+    '"data":{"equipment_id":"","timestamp":"2026-01-01T00:00:00.000000",'
+    '"channel":1,"value":0.0,'
+).encode("utf-8")
+
+# Ends every Z_SYNC_FLUSH; implied rather than sent
+_SYNC_FLUSH_MARKER = b"\x00\x00\xff\xff"
+
+
+class StreamCompressor:
+    """Streaming DEFLATE context for the messages sent on one connection.
+
+    The compression window persists across messages, so the keys and values
+    repeated by every small stream message compress to back-references
+    instead of being re-encoded from scratch with fresh headers. Each
+    message is flushed with Z_SYNC_FLUSH so it can be decompressed as soon
+    as it arrives, and the flush marker (00 00 ff ff) is left off as in
+    WebSocket permessage-deflate (RFC 7692). Messages must be decompressed
+    in the order they were compressed (see StreamDecompressor).
+    """
+
+    def __init__(self, level: int = 6, zdict: bytes = COMPRESSION_DICTIONARY):
+        """Initialize compressor.
+
+        Args:
+            level: zlib compression level
+            zdict: Preset dictionary shared with the peer
+        """
+        self._compressor = zlib.compressobj(
+            level, zlib.DEFLATED, -zlib.MAX_WBITS, zdict=zdict
+        )
+
+    def compress(self, data: bytes) -> bytes:
+        """Compress the next message of the stream."""
+        compressed = self._compressor.compress(data)
+        compressed += self._compressor.flush(zlib.Z_SYNC_FLUSH)
+        return compressed[: -len(_SYNC_FLUSH_MARKER)]
+
+
+class StreamDecompressor:
+    """Receiving end of a StreamCompressor."""
+
+    def __init__(self, zdict: bytes = COMPRESSION_DICTIONARY):
+        """Initialize decompressor.
+
+        Args:
+            zdict: Preset dictionary the peer compresses with
+        """
+        self._decompressor = zlib.decompressobj(-zlib.MAX_WBITS, zdict=zdict)
+
+    def decompress(self, data: bytes) -> bytes:
+        """Decompress the next message of the stream."""
+        return self._decompressor.decompress(data + _SYNC_FLUSH_MARKER)
+
+
 class MessageCompressor:
     """Handles message compression for WebSocket."""
 
     @staticmethod
     def compress(
-        data: str, compression_type: CompressionType = CompressionType.GZIP
+        data: Union[str, bytes],
+        compression_type: CompressionType = CompressionType.GZIP,
     ) -> bytes:
-        """Compress a string message.
+        """Compress a message.
+
+        DEFLATE messages compressed here stand alone; connections keep a
+        StreamCompressor instead.
 
         Args:
-            data: String data to compress
+            data: String (or UTF-8 encoded) data to compress
             compression_type: Type of compression to use
 
         Returns:
             Compressed bytes
         """
-        if compression_type == CompressionType.NONE:
-            return data.encode("utf-8")
-
-        data_bytes = data.encode("utf-8")
+        data_bytes = data.encode("utf-8") if isinstance(data, str) else data
 
         if compression_type == CompressionType.GZIP:
             return gzip.compress(data_bytes)
         elif compression_type == CompressionType.ZLIB:
             return zlib.compress(data_bytes)
+        elif compression_type == CompressionType.DEFLATE:
+            return StreamCompressor().compress(data_bytes)
 
         return data_bytes
 
@@ -338,6 +421,8 @@ class MessageCompressor:
             return gzip.decompress(data).decode("utf-8")
         elif compression_type == CompressionType.ZLIB:
             return zlib.decompress(data).decode("utf-8")
+        elif compression_type == CompressionType.DEFLATE:
+            return StreamDecompressor().decompress(data).decode("utf-8")
 
         return data.decode("utf-8")
 
@@ -362,23 +447,27 @@ class MessageCompressor:
 
 
 class PriorityQueue:
-    """Priority queue for WebSocket messages."""
+    """Awaitable priority queue for WebSocket messages.
+
+    Messages are kept in a heap ordered by priority, then arrival order.
+    Consumers waiting in wait() are woken by put(), so an idle consumer
+    costs nothing until a message arrives.
+    """
 
     def __init__(self, max_size: int = 1000):
         """Initialize priority queue."""
         self.max_size = max_size
-        # Separate queues for each priority level
-        self.queues: Dict[MessagePriority, deque] = {
-            MessagePriority.CRITICAL: deque(),
-            MessagePriority.HIGH: deque(),
-            MessagePriority.NORMAL: deque(),
-            MessagePriority.LOW: deque(),
+        # (-priority, arrival, message): highest priority first, FIFO within
+        self._heap: List[Tuple[int, int, PriorityMessage]] = []
+        self._arrivals = itertools.count()
+        self._sizes: Dict[MessagePriority, int] = {
+            priority: 0 for priority in MessagePriority
         }
-        self._size = 0
+        self._waiters: Deque[asyncio.Future] = deque()
 
     def put(
         self,
-        message: Dict[str, Any],
+        message: Any,
         priority: MessagePriority = MessagePriority.NORMAL,
     ) -> bool:
         """Add message to queue.
@@ -390,15 +479,16 @@ class PriorityQueue:
         Returns:
             True if added, False if queue is full
         """
-        if self._size >= self.max_size:
+        if self.is_full():
             return False
 
         priority_msg = PriorityMessage(
             priority=priority, timestamp=time.time(), data=message
         )
 
-        self.queues[priority].append(priority_msg)
-        self._size += 1
+        heapq.heappush(self._heap, (-priority, next(self._arrivals), priority_msg))
+        self._sizes[priority] += 1
+        self._wake_waiter()
         return True
 
     def get(self) -> Optional[PriorityMessage]:
@@ -407,26 +497,44 @@ class PriorityQueue:
         Returns:
             Message with highest priority, or None if empty
         """
-        # Check queues in priority order
-        for priority in [
-            MessagePriority.CRITICAL,
-            MessagePriority.HIGH,
-            MessagePriority.NORMAL,
-            MessagePriority.LOW,
-        ]:
-            if self.queues[priority]:
-                self._size -= 1
-                return self.queues[priority].popleft()
-
-        return None
+        if not self._heap:
+            return None
+
+        _, _, priority_msg = heapq.heappop(self._heap)
+        self._sizes[priority_msg.priority] -= 1
+        return priority_msg
+
+    async def wait(self):
+        """Wait until the queue holds at least one message."""
+        while not self._heap:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                # Pass a wakeup this consumer can no longer use on
+                if waiter.done() and not waiter.cancelled():
+                    self._wake_waiter()
+                raise
+            finally:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+
+    def _wake_waiter(self):
+        """Wake the first consumer waiting for a message."""
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                break
 
     def size(self) -> int:
         """Get total queue size."""
-        return self._size
+        return len(self._heap)
 
     def size_by_priority(self, priority: MessagePriority) -> int:
         """Get queue size for specific priority."""
-        return len(self.queues[priority])
+        return self._sizes[priority]
 
     def clear_low_priority(self) -> int:
         """Clear low priority messages.
@@ -434,20 +542,26 @@ class PriorityQueue:
         Returns:
             Number of messages cleared
         """
-        count = len(self.queues[MessagePriority.LOW])
-        self.queues[MessagePriority.LOW].clear()
-        self._size -= count
+        count = self._sizes[MessagePriority.LOW]
+        if count:
+            self._heap = [
+                entry
+                for entry in self._heap
+                if entry[2].priority != MessagePriority.LOW
+            ]
+            heapq.heapify(self._heap)
+            self._sizes[MessagePriority.LOW] = 0
         return count
 
     def is_full(self) -> bool:
         """Check if queue is full."""
-        return self._size >= self.max_size
+        return len(self._heap) >= self.max_size
 
     def clear(self):
         """Clear all messages from queue."""
-        for queue in self.queues.values():
-            queue.clear()
-        self._size = 0
+        self._heap.clear()
+        for priority in self._sizes:
+            self._sizes[priority] = 0
 
 
 class BackpressureHandler:
@@ -470,7 +584,7 @@ class BackpressureHandler:
 
     async def queue_message(
         self,
-        message: Dict[str, Any],
+        message: Any,
         priority: MessagePriority = MessagePriority.NORMAL,
     ) -> bool:
         """Queue a message for sending.
@@ -520,7 +634,7 @@ class BackpressureHandler:
         Returns:
             Next message to send, or None if no messages or rate limited
         """
-        if not self.config.enabled:
+        if not self.config.enabled or self.message_queue.size() == 0:
             return None
 
         # Check rate limit
@@ -536,6 +650,30 @@ class BackpressureHandler:
 
         return message
 
+    async def wait_next_message(self) -> PriorityMessage:
+        """Wait for the next message to send, respecting rate limits.
+
+        Sleeps until a message is queued, and when rate limited until the
+        next token is due, so a waiting sender uses no CPU. The message is
+        taken after the token, so one queued meanwhile with a higher
+        priority goes first.
+
+        Returns:
+            Next message to send
+        """
+        while True:
+            await self.message_queue.wait()
+
+            if self.config.rate_limit_enabled and not await self.rate_limiter.acquire():
+                self.stats["rate_limit_hits"] += 1
+                await self.rate_limiter.wait()
+
+            # Messages may have been dropped while waiting for the token
+            message = self.message_queue.get()
+            if message:
+                self.stats["messages_sent"] += 1
+                return message
+
     def get_stats(self) -> Dict[str, Any]:
         """Get backpressure handler statistics."""
         return {
@@ -575,7 +713,7 @@ class RateLimiter:
         self.max_rate = max_rate
         self.burst_size = burst_size
         self.tokens = burst_size
-        self.last_refill = time.time()
+        self.last_refill = time.monotonic()
         self._lock = asyncio.Lock()
 
     async def acquire(self) -> bool:
@@ -585,13 +723,7 @@ class RateLimiter:
             True if token acquired, False if rate limited
         """
         async with self._lock:
-            # Refill tokens based on time elapsed
-            now = time.time()
-            elapsed = now - self.last_refill
-            tokens_to_add = elapsed * self.max_rate
-
-            self.tokens = min(self.burst_size, self.tokens + tokens_to_add)
-            self.last_refill = now
+            self._refill()
 
             # Try to acquire token
             if self.tokens >= 1.0:
@@ -600,6 +732,19 @@ class RateLimiter:
 
             return False
 
+    async def wait(self):
+        """Wait until a token is available and acquire it."""
+        while not await self.acquire():
+            # Sleep until the missing fraction of a token has refilled
+            await asyncio.sleep((1.0 - self.tokens) / self.max_rate)
+
+    def _refill(self):
+        """Refill tokens based on time elapsed."""
+        now = time.monotonic()
+        elapsed = now - self.last_refill
+        self.tokens = min(self.burst_size, self.tokens + elapsed * self.max_rate)
+        self.last_refill = now
+
     def get_tokens(self) -> float:
         """Get current token count."""
         return self.tokens
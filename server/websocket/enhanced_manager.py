@@ -9,17 +9,20 @@ This module extends the basic StreamManager with:
 
 import asyncio
 import base64
-import json
 import logging
 from datetime import datetime
-from typing import Any, Dict, Optional, Set
+from typing import Any, Dict, Optional, Set, Union
 
 from fastapi import WebSocket
 
-from .enhanced_features import (BackpressureConfig, BackpressureHandler,
-                                CompressionType, MessageCompressor,
-                                MessagePriority, RecordingFormat,
+from .enhanced_features import (COMPRESSION_DICTIONARY,
+                                COMPRESSION_DICTIONARY_ID, BackpressureConfig,
+                                BackpressureHandler, CompressionType,
+                                MessageCompressor, MessagePriority,
+                                RecordingFormat, StreamCompressor,
                                 StreamRecorder, StreamRecordingConfig)
+from .frames import frame_to_json_message
+from .pubsub import EncodedMessage
 
 logger = logging.getLogger(__name__)
 
@@ -57,6 +60,9 @@ class EnhancedStreamManager:
         # Per-connection send tasks
         self.send_tasks: Dict[str, asyncio.Task] = {}
 
+        # Per-connection DEFLATE stream contexts
+        self.compression_contexts: Dict[str, StreamCompressor] = {}
+
         # Statistics
         self.stats = {
             "total_connections": 0,
@@ -128,6 +134,8 @@ class EnhancedStreamManager:
         if client_id in self.backpressure_handlers:
             del self.backpressure_handlers[client_id]
 
+        self.compression_contexts.pop(client_id, None)
+
         logger.info(
             f"WebSocket disconnected: {client_id}. "
             f"Total connections: {len(self.active_connections)}"
@@ -136,7 +144,7 @@ class EnhancedStreamManager:
     async def send_to_client(
         self,
         client_id: str,
-        message: Dict[str, Any],
+        message: Union[Dict[str, Any], bytes],
         priority: MessagePriority = MessagePriority.NORMAL,
         compression: Optional[CompressionType] = None,
     ) -> bool:
@@ -144,9 +152,11 @@ class EnhancedStreamManager:
 
         Args:
             client_id: Client identifier
-            message: Message to send
+            message: Message to send, or an encoded binary frame
+                (see websocket.frames), which is sent as is
             priority: Message priority
-            compression: Optional compression type
+            compression: Optional compression type (JSON messages only);
+                defaults to the one the client set
 
         Returns:
             True if queued/sent, False if failed
@@ -154,12 +164,24 @@ class EnhancedStreamManager:
         if client_id not in self.active_connections:
             return False
 
-        # Add compression metadata if specified
-        if compression and compression != CompressionType.NONE:
-            message["_compression"] = compression.value
+        if compression is None:
+            compression = self.get_compression(client_id)
 
-        # Queue message with backpressure handling
-        handler = self.backpressure_handlers[client_id]
+        # Compression only applies to JSON messages
+        if isinstance(message, (bytes, bytearray)):
+            compression = CompressionType.NONE
+
+        return await self._queue_message(
+            client_id, EncodedMessage(message, compression), priority
+        )
+
+    async def _queue_message(
+        self, client_id: str, message: EncodedMessage, priority: MessagePriority
+    ) -> bool:
+        """Queue an encoded message with backpressure handling."""
+        handler = self.backpressure_handlers.get(client_id)
+        if handler is None:
+            return False
         return await handler.queue_message(message, priority)
 
     async def broadcast(
@@ -171,17 +193,30 @@ class EnhancedStreamManager:
     ):
         """Broadcast a message to all connected clients.
 
+        The message is serialized once for all clients, and compressed once
+        per compression type except for DEFLATE, whose compression context
+        is per connection.
+
         Args:
             message: Message to broadcast
             priority: Message priority
-            compression: Optional compression type
+            compression: Optional compression type; defaults to each
+                client's own
             exclude_clients: Optional set of client IDs to exclude
         """
         exclude = exclude_clients or set()
+        encoded: Dict[CompressionType, EncodedMessage] = {}
 
         for client_id in list(self.active_connections.keys()):
             if client_id not in exclude:
-                await self.send_to_client(client_id, message, priority, compression)
+                client_compression = compression or self.get_compression(client_id)
+                if client_compression not in encoded:
+                    encoded[client_compression] = EncodedMessage(
+                        message, client_compression
+                    )
+                await self._queue_message(
+                    client_id, encoded[client_compression], priority
+                )
 
     async def _send_loop(self, client_id: str):
         """Background task to send queued messages to client.
@@ -194,45 +229,12 @@ class EnhancedStreamManager:
 
         try:
             while True:
-                # Get next message from queue
-                priority_msg = await handler.get_next_message()
-
-                if priority_msg is None:
-                    # No messages available or rate limited, wait a bit
-                    await asyncio.sleep(0.01)
-                    continue
-
-                message = priority_msg.data
-
-                # Check if message should be compressed
-                compression_type = CompressionType.NONE
-                if "_compression" in message:
-                    compression_type = CompressionType(message["_compression"])
-                    del message["_compression"]
-
-                # Send message
-                try:
-                    if compression_type != CompressionType.NONE:
-                        # Send compressed message
-                        await self._send_compressed(
-                            websocket, message, compression_type
-                        )
-                    else:
-                        # Send uncompressed JSON
-                        await websocket.send_json(message)
-
-                    self.stats["total_messages_sent"] += 1
-
-                    # Record to file if enabled
-                    if self.recording_config.enabled:
-                        for session_id in self.recorder.get_active_recordings():
-                            # Check if this client is part of recording
-                            # (simplified - in production, you'd filter by session)
-                            self.recorder.record_message(session_id, message)
-
-                except Exception as e:
-                    logger.error(f"Error sending message to {client_id}: {e}")
-                    self.disconnect(client_id)
+                # Wait for the next message and, if rate limited, a token
+                priority_msg = await handler.wait_next_message()
+
+                if not await self._send_encoded(
+                    client_id, websocket, priority_msg.data
+                ):
                     break
 
         except asyncio.CancelledError:
@@ -240,36 +242,87 @@ class EnhancedStreamManager:
         except Exception as e:
             logger.error(f"Error in send loop for {client_id}: {e}")
 
+    async def _send_encoded(
+        self, client_id: str, websocket: WebSocket, message: EncodedMessage
+    ) -> bool:
+        """Send an encoded message, compressed if requested.
+
+        Args:
+            client_id: Client identifier
+            websocket: WebSocket connection
+            message: Encoded message
+
+        Returns:
+            True if sent, False if the client was disconnected
+        """
+        try:
+            if message.compression != CompressionType.NONE:
+                # Send compressed message
+                await self._send_compressed(client_id, websocket, message)
+            else:
+                await message.send(websocket)
+                self.stats["total_bytes_sent"] += message.size
+        except Exception as e:
+            logger.error(f"Error sending message to {client_id}: {e}")
+            self.disconnect(client_id)
+            return False
+
+        self.stats["total_messages_sent"] += 1
+
+        # Record to file if enabled
+        if self.recording_config.enabled:
+            active_recordings = self.recorder.get_active_recordings()
+            if active_recordings:
+                # Recordings hold the JSON equivalent of binary frames
+                recorded = (
+                    message.payload
+                    if message.data is None
+                    else frame_to_json_message(message.data)
+                )
+                for session_id in active_recordings:
+                    # (simplified - in production, you'd filter by session)
+                    self.recorder.record_message(session_id, recorded)
+
+        return True
+
     async def _send_compressed(
-        self,
-        websocket: WebSocket,
-        message: Dict[str, Any],
-        compression_type: CompressionType,
+        self, client_id: str, websocket: WebSocket, message: EncodedMessage
     ):
         """Send a compressed message.
 
         Args:
+            client_id: Client identifier
             websocket: WebSocket connection
-            message: Message to send
-            compression_type: Type of compression to use
+            message: Encoded JSON message and its compression type
         """
-        # Convert to JSON string
-        json_str = json.dumps(message)
-        original_size = len(json_str.encode("utf-8"))
+        compression_type = message.compression
+        original_size = message.size
 
-        # Compress
-        compressed = self.compressor.compress(json_str, compression_type)
+        if compression_type == CompressionType.DEFLATE:
+            # Continues the connection's stream, so it cannot be shared
+            compressed = self._compression_context(client_id).compress(
+                message.utf8
+            )
+        else:
+            # Compressed once per message, however many clients receive it
+            compressed = message.compressed(compression_type)
         compressed_size = len(compressed)
 
         # Calculate compression ratio
-        ratio = self.compressor.calculate_compression_ratio(json_str, compressed)
+        ratio = original_size / compressed_size if compressed_size else 1.0
         self.stats["compression_ratio_sum"] += ratio
         self.stats["compression_count"] += 1
 
         # Send as binary with compression metadata
         # Format: 1 byte compression type + compressed data
         compression_byte = bytes([compression_type.value.encode("utf-8")[0]])
-        await websocket.send_bytes(compression_byte + compressed)
+        try:
+            await websocket.send_bytes(compression_byte + compressed)
+        except Exception:
+            # The DEFLATE context already holds a message the client never
+            # got, so nothing it compresses later could be decompressed
+            self.compression_contexts.pop(client_id, None)
+            raise
 
         self.stats["total_bytes_sent"] += compressed_size
 
@@ -278,6 +331,35 @@ class EnhancedStreamManager:
             f"(ratio: {ratio:.2f}x)"
         )
 
+    def _compression_context(self, client_id: str) -> StreamCompressor:
+        """Get a client's DEFLATE stream context, creating it on first use."""
+        context = self.compression_contexts.get(client_id)
+        if context is None:
+            context = StreamCompressor()
+            self.compression_contexts[client_id] = context
+        return context
+
+    def set_compression(self, client_id: str, compression: CompressionType) -> bool:
+        """Set the compression used for a client's messages by default.
+
+        Args:
+            client_id: Client identifier
+            compression: Compression type
+
+        Returns:
+            True if set, False if the client is not connected
+        """
+        if client_id not in self.connection_metadata:
+            return False
+
+        self.connection_metadata[client_id]["compression"] = compression.value
+        return True
+
+    def get_compression(self, client_id: str) -> CompressionType:
+        """Get the compression a client set, or NONE."""
+        metadata = self.connection_metadata.get(client_id, {})
+        return CompressionType(metadata.get("compression", CompressionType.NONE))
+
     async def _send_capabilities(self, client_id: str):
         """Send server capabilities to client.
 
@@ -290,6 +372,16 @@ class EnhancedStreamManager:
                 "compression": {
                     "enabled": True,
                     "types": [ct.value for ct in CompressionType],
+                    "default": self.get_compression(client_id).value,
+                    # Raw DEFLATE stream with a preset dictionary; messages
+                    # end in Z_SYNC_FLUSH without its 00 00 ff ff marker
+                    "deflate": {
+                        "window_bits": 15,
+                        "dictionary_id": COMPRESSION_DICTIONARY_ID,
+                        "dictionary": base64.b64encode(
+                            COMPRESSION_DICTIONARY
+                        ).decode("ascii"),
+                    },
                 },
                 "priorities": {
                     "enabled": True,
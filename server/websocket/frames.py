@@ -0,0 +1,257 @@
+"""Binary columnar frames for acquisition streaming.
+
+A JSON acquisition message spells out every timestamp as an ISO-8601 string
+and every sample as a decimal number. A binary frame instead carries a small
+header, the session metadata as compact JSON, and then raw little-endian
+arrays: one block of timestamp offsets from the first sample, followed by one
+contiguous block per channel. Clients decode the arrays with ``np.frombuffer``
+without parsing any numbers.
+
+Frame layout (little-endian)::
+
+    magic         4s   b"LLAF"
+    version       u8   FRAME_VERSION
+    time_dtype    u8   dtype code of the timestamp offsets
+    value_dtype   u8   dtype code of the channel values
+    reserved      u8
+    meta_len      u32  length of the UTF-8 JSON metadata
+    num_channels  u16
+    reserved      2x
+    num_samples   u32
+    t0            f64  Unix timestamp of the first sample
+    metadata      meta_len bytes, zero-padded to a multiple of 8
+    offsets       num_samples x time_dtype, seconds since t0
+    values        num_channels x num_samples x value_dtype, channel-major
+
+The magic never starts with a compression type byte, so frames can share a
+connection with compressed JSON messages.
+"""
+
+import json
+import struct
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, Sequence, Union
+
+import numpy as np
+
+FRAME_MAGIC = b"LLAF"
+FRAME_VERSION = 1
+
+_HEADER = struct.Struct("<4sBBBBIH2xId")
+
+# Wire dtype codes
+_DTYPE_CODES = {1: np.dtype("<f4"), 2: np.dtype("<f8")}
+_CODES_BY_NAME = {"float32": 1, "float64": 2}
+TIMESTAMP_DTYPES = tuple(_CODES_BY_NAME)
+
+
+class FrameFormat(str, Enum):
+    """Wire formats for acquisition stream data."""
+
+    JSON = "json"
+    BINARY = "binary"
+
+
+def _align(offset: int) -> int:
+    """Round an offset up to 8 bytes so arrays decode aligned."""
+    return (offset + 7) & ~7
+
+
+def is_acquisition_frame(frame: Union[bytes, bytearray, memoryview]) -> bool:
+    """Check whether a binary WebSocket message is an acquisition frame."""
+    return bytes(frame[:4]) == FRAME_MAGIC
+
+
+def acquisition_data_dict(
+    channels: Sequence[str], data: np.ndarray, timestamps: np.ndarray
+) -> Dict[str, Any]:
+    """
+    Build the ``data`` field of a JSON acquisition message.
+
+    Args:
+        channels: Channel names, one per row of data
+        data: Samples, shape (channels, samples)
+        timestamps: Unix timestamps, one per sample
+
+    Returns:
+        Dict with ISO-8601 timestamps, values per channel and sample count
+    """
+    return {
+        "timestamps": [datetime.fromtimestamp(t).isoformat() for t in timestamps],
+        "values": {channel: data[i, :].tolist() for i, channel in enumerate(channels)},
+        "count": len(timestamps),
+    }
+
+
+def encode_acquisition_frame(
+    meta: Dict[str, Any],
+    channels: Sequence[str],
+    data: np.ndarray,
+    timestamps: np.ndarray,
+    timestamp_dtype: str = "float64",
+) -> bytes:
+    """
+    Encode acquisition samples as a binary frame.
+
+    Args:
+        meta: JSON-serializable message fields (type, acquisition_id, state,
+            stats, ...); channel names are added
+        channels: Channel names, one per row of data
+        data: Samples, shape (channels, samples); float32 data is sent as
+            float32, anything else as float64
+        timestamps: Unix timestamps, one per sample
+        timestamp_dtype: "float64", or "float32" to halve the timestamp
+            block at about microsecond resolution over a one second frame
+
+    Returns:
+        Encoded frame
+    """
+    time_code = _CODES_BY_NAME[timestamp_dtype]
+    value_code = 1 if data.dtype == np.float32 else 2
+    num_samples = len(timestamps)
+    num_channels = len(channels)
+
+    meta_bytes = json.dumps(
+        {**meta, "channels": list(channels)}, separators=(",", ":")
+    ).encode("utf-8")
+    time_offset = _align(_HEADER.size + len(meta_bytes))
+    values_offset = time_offset + num_samples * _DTYPE_CODES[time_code].itemsize
+    values_size = num_channels * num_samples * _DTYPE_CODES[value_code].itemsize
+    size = values_offset + values_size
+
+    t0 = float(timestamps[0]) if num_samples else 0.0
+    frame = bytearray(size)
+    _HEADER.pack_into(
+        frame,
+        0,
+        FRAME_MAGIC,
+        FRAME_VERSION,
+        time_code,
+        value_code,
+        0,
+        len(meta_bytes),
+        num_channels,
+        num_samples,
+        t0,
+    )
+    frame[_HEADER.size : _HEADER.size + len(meta_bytes)] = meta_bytes
+
+    if num_samples:
+        # Write the arrays straight into the frame, converting on the way
+        offsets = np.frombuffer(
+            frame, _DTYPE_CODES[time_code], num_samples, time_offset
+        )
+        np.subtract(timestamps, t0, out=offsets, casting="unsafe")
+        values = np.frombuffer(
+            frame, _DTYPE_CODES[value_code], num_channels * num_samples, values_offset
+        ).reshape(num_channels, num_samples)
+        values[...] = data[:num_channels]
+
+    return bytes(frame)
+
+
+def decode_acquisition_frame(
+    frame: Union[bytes, bytearray, memoryview]
+) -> Dict[str, Any]:
+    """
+    Decode a binary frame into an acquisition message.
+
+    Args:
+        frame: Encoded frame
+
+    Returns:
+        The frame metadata with a ``data`` field holding float64 Unix
+        timestamps and a read-only array per channel (or None when the frame
+        has no samples)
+
+    Raises:
+        ValueError: If the frame is not an acquisition frame of a known version
+    """
+    (
+        magic,
+        version,
+        time_code,
+        value_code,
+        _,
+        meta_len,
+        num_channels,
+        num_samples,
+        t0,
+    ) = _HEADER.unpack_from(frame, 0)
+    if magic != FRAME_MAGIC or version != FRAME_VERSION:
+        raise ValueError(
+            f"Not an acquisition frame (magic {magic!r}, version {version})"
+        )
+
+    message = json.loads(bytes(frame[_HEADER.size : _HEADER.size + meta_len]))
+    if num_samples == 0:
+        message["data"] = None
+        return message
+
+    time_dtype = _DTYPE_CODES[time_code]
+    value_dtype = _DTYPE_CODES[value_code]
+    time_offset = _align(_HEADER.size + meta_len)
+    values_offset = time_offset + num_samples * time_dtype.itemsize
+
+    offsets = np.frombuffer(frame, time_dtype, num_samples, time_offset)
+    values = np.frombuffer(
+        frame, value_dtype, num_channels * num_samples, values_offset
+    ).reshape(num_channels, num_samples)
+
+    message["data"] = {
+        "timestamps": t0 + offsets.astype(np.float64),
+        "values": {
+            channel: values[i] for i, channel in enumerate(message["channels"])
+        },
+        "count": num_samples,
+    }
+    return message
+
+
+def encode_acquisition_update(
+    meta: Dict[str, Any],
+    channels: Sequence[str],
+    data: np.ndarray,
+    timestamps: np.ndarray,
+    frame_format: FrameFormat = FrameFormat.JSON,
+    timestamp_dtype: str = "float64",
+) -> Union[bytes, Dict[str, Any]]:
+    """
+    Encode an acquisition update in the requested wire format.
+
+    Returns:
+        An encoded binary frame, or a JSON message dict whose ``data`` is
+        None when there are no samples
+    """
+    if frame_format == FrameFormat.BINARY:
+        return encode_acquisition_frame(
+            meta, channels, data, timestamps, timestamp_dtype
+        )
+
+    return {
+        **meta,
+        "data": (
+            acquisition_data_dict(channels, data, timestamps)
+            if len(timestamps)
+            else None
+        ),
+    }
+
+
+def frame_to_json_message(
+    frame: Union[bytes, bytearray, memoryview]
+) -> Dict[str, Any]:
+    """Convert a binary frame to the equivalent JSON acquisition message."""
+    message = decode_acquisition_frame(frame)
+    data = message["data"]
+    if data is not None:
+        channels = message["channels"]
+        message["data"] = acquisition_data_dict(
+            channels,
+            np.stack([data["values"][channel] for channel in channels])
+            if channels
+            else np.empty((0, data["count"])),
+            data["timestamps"],
+        )
+    return message
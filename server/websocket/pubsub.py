@@ -0,0 +1,231 @@
+"""Topic-based fan-out of WebSocket messages.
+
+A message published to a topic is serialized once into an EncodedMessage
+and the same encoded payload is queued for every subscriber of the topic.
+Each subscriber owns a bounded send queue drained by its own task, so one
+slow client neither delays the others nor makes the publisher wait: when a
+client's queue is full its oldest message is dropped. Clients only receive
+topics they subscribed to.
+"""
+
+import asyncio
+import json
+import logging
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Set, Union
+
+from fastapi import WebSocket
+
+from .enhanced_features import CompressionType, MessageCompressor
+
+logger = logging.getLogger(__name__)
+
+
+def _json_default(value: Any) -> Any:
+    """Encode values json.dumps does not handle, as pydantic's JSON mode does."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+class EncodedMessage:
+    """A message serialized once, shared by every recipient."""
+
+    __slots__ = ("payload", "text", "data", "compression", "_utf8", "_compressed")
+
+    def __init__(
+        self,
+        payload: Union[Dict[str, Any], bytes],
+        compression: CompressionType = CompressionType.NONE,
+    ):
+        """
+        Encode message.
+
+        Args:
+            payload: JSON message, or an already encoded binary frame
+            compression: Compression the JSON text is sent with, if the
+                sender supports it
+        """
+        self.payload = payload
+        self.compression = compression
+        if isinstance(payload, (bytes, bytearray)):
+            self.text: Optional[str] = None
+            self.data: Optional[bytes] = bytes(payload)
+        else:
+            self.text = json.dumps(
+                payload, separators=(",", ":"), default=_json_default
+            )
+            self.data = None
+        self._utf8: Optional[bytes] = None
+        self._compressed: Dict[CompressionType, bytes] = {}
+
+    @property
+    def size(self) -> int:
+        """Encoded size in bytes (the JSON text is ASCII)."""
+        return len(self.data) if self.data is not None else len(self.text)
+
+    @property
+    def utf8(self) -> bytes:
+        """Get the JSON text as bytes, encoding once."""
+        if self._utf8 is None:
+            self._utf8 = self.text.encode("utf-8")
+        return self._utf8
+
+    def compressed(self, compression_type: CompressionType) -> bytes:
+        """Get the JSON text compressed, compressing once per type."""
+        compressed = self._compressed.get(compression_type)
+        if compressed is None:
+            compressed = MessageCompressor.compress(self.utf8, compression_type)
+            self._compressed[compression_type] = compressed
+        return compressed
+
+    async def send(self, websocket: WebSocket):
+        """Send the message as a text or binary WebSocket message."""
+        if self.data is not None:
+            await websocket.send_bytes(self.data)
+        else:
+            await websocket.send_text(self.text)
+
+
+class Subscriber:
+    """A WebSocket client with its own bounded send queue and sender task."""
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        max_queue_size: int = 1000,
+        on_error: Optional[Callable[["Subscriber"], None]] = None,
+    ):
+        """
+        Initialize subscriber.
+
+        Args:
+            websocket: Client connection
+            max_queue_size: Messages queued before the oldest is dropped
+            on_error: Called once if sending fails (e.g. the client left)
+        """
+        self.websocket = websocket
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue_size)
+        self._on_error = on_error
+        self._task: Optional[asyncio.Task] = None
+
+        # Statistics
+        self.messages_sent = 0
+        self.messages_dropped = 0
+
+    def start(self):
+        """Start the sender task."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._send_loop())
+
+    def close(self):
+        """Stop the sender task, discarding queued messages."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def enqueue(self, message: EncodedMessage):
+        """Queue a message without waiting, dropping the oldest if full."""
+        if self._queue.full():
+            self._queue.get_nowait()
+            self._queue.task_done()
+            self.messages_dropped += 1
+        self._queue.put_nowait(message)
+
+    @property
+    def queue_size(self) -> int:
+        """Messages waiting to be sent."""
+        return self._queue.qsize()
+
+    async def drain(self):
+        """Wait until every queued message has been sent."""
+        await self._queue.join()
+
+    async def _send_loop(self):
+        """Send queued messages in order."""
+        try:
+            while True:
+                message = await self._queue.get()
+                try:
+                    await message.send(self.websocket)
+                finally:
+                    self._queue.task_done()
+                self.messages_sent += 1
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logger.error(f"Error sending message: {e}")
+            self._task = None
+            if self._on_error:
+                self._on_error(self)
+
+
+class TopicHub:
+    """Subscriptions of subscribers to named topics."""
+
+    def __init__(self):
+        """Initialize hub."""
+        self._topics: Dict[str, Set[Subscriber]] = defaultdict(set)
+
+    def subscribe(self, topic: str, subscriber: Subscriber):
+        """Subscribe to a topic."""
+        self._topics[topic].add(subscriber)
+
+    def unsubscribe(self, topic: str, subscriber: Subscriber) -> int:
+        """
+        Unsubscribe from a topic.
+
+        Returns:
+            Number of subscribers left on the topic
+        """
+        subscribers = self._topics.get(topic)
+        if subscribers is None:
+            return 0
+        subscribers.discard(subscriber)
+        if not subscribers:
+            del self._topics[topic]
+            return 0
+        return len(subscribers)
+
+    def unsubscribe_all(self, subscriber: Subscriber) -> List[str]:
+        """
+        Unsubscribe from every topic.
+
+        Returns:
+            Topics left without subscribers
+        """
+        emptied = []
+        for topic in [t for t, subs in self._topics.items() if subscriber in subs]:
+            if self.unsubscribe(topic, subscriber) == 0:
+                emptied.append(topic)
+        return emptied
+
+    def subscribers(self, topic: str) -> Set[Subscriber]:
+        """Get a snapshot of a topic's subscribers."""
+        return set(self._topics.get(topic, ()))
+
+    def topics(self) -> List[str]:
+        """Get topics with at least one subscriber."""
+        return list(self._topics)
+
+    def publish(self, topic: str, payload: Union[Dict[str, Any], bytes]) -> int:
+        """
+        Queue a message for every subscriber of a topic.
+
+        The message is encoded once, and only if someone is subscribed.
+
+        Returns:
+            Number of subscribers the message was queued for
+        """
+        subscribers = self._topics.get(topic)
+        if not subscribers:
+            return 0
+        fan_out(EncodedMessage(payload), subscribers)
+        return len(subscribers)
+
+
+def fan_out(message: EncodedMessage, subscribers) -> None:
+    """Queue one encoded message for several subscribers."""
+    for subscriber in list(subscribers):
+        subscriber.enqueue(message)
@@ -3,34 +3,88 @@
 import asyncio
 import json
 import logging
-from datetime import datetime
-from typing import Set
+from collections import defaultdict
+from typing import Dict, Optional, Set, Tuple
 
+from server.config.settings import settings
 from equipment.manager import equipment_manager
+from equipment.readings import STREAM_COMMANDS, reading_service
 from fastapi import WebSocket, WebSocketDisconnect
+from websocket.acquisition_stream import AcquisitionCursor, acquisition_status
+from websocket.frames import (TIMESTAMP_DTYPES, FrameFormat,
+                              encode_acquisition_update)
+from websocket.pubsub import EncodedMessage, Subscriber, TopicHub, fan_out
 
 logger = logging.getLogger(__name__)
 
 
+def stream_topic(equipment_id: str, stream_type: str) -> str:
+    """Topic of an equipment data stream."""
+    return f"stream:{equipment_id}:{stream_type}"
+
+
+def acquisition_topic(acquisition_id: str) -> str:
+    """Topic of an acquisition data stream."""
+    return f"acquisition:{acquisition_id}"
+
+
 class StreamManager:
-    """Manages WebSocket connections and data streaming."""
+    """Manages WebSocket connections and data streaming.
+
+    Each stream is a topic with one producer task. Clients subscribe to the
+    topics they start, each stream message is encoded once, and every
+    client has its own bounded send queue (see websocket.pubsub).
+    """
 
     def __init__(self):
         """Initialize stream manager."""
         self.active_connections: Set[WebSocket] = set()
-        self.streaming_tasks: dict[str, asyncio.Task] = {}
+        self.streaming_tasks: dict[str, asyncio.Task] = {}  # topic -> producer
+        self.subscribers: Dict[WebSocket, Subscriber] = {}
+        self.topics = TopicHub()
+        self._stream_intervals: Dict[str, int] = {}
+        # acquisition_id -> each client's position and wire format
+        self.acquisition_cursors: Dict[
+            str, Dict[WebSocket, AcquisitionCursor]
+        ] = {}
+        self.acquisition_formats: Dict[
+            str, Dict[WebSocket, Tuple[FrameFormat, str]]
+        ] = {}
 
     async def connect(self, websocket: WebSocket):
         """Accept a WebSocket connection."""
         await websocket.accept()
         self.active_connections.add(websocket)
+        self._subscriber(websocket)
         logger.info(
             f"WebSocket connected. Total connections: {len(self.active_connections)}"
         )
 
+    def _subscriber(self, websocket: WebSocket) -> Subscriber:
+        """Get a client's subscriber, starting its send queue if needed."""
+        subscriber = self.subscribers.get(websocket)
+        if subscriber is None:
+            subscriber = Subscriber(
+                websocket,
+                settings.ws_message_queue_size,
+                on_error=lambda failed: self.disconnect(failed.websocket),
+            )
+            subscriber.start()
+            self.subscribers[websocket] = subscriber
+        return subscriber
+
     def disconnect(self, websocket: WebSocket):
         """Remove a WebSocket connection."""
         self.active_connections.discard(websocket)
+        subscriber = self.subscribers.pop(websocket, None)
+        if subscriber is not None:
+            subscriber.close()
+            for topic in self.topics.unsubscribe_all(subscriber):
+                self._stop_topic(topic)
+        for cursors in self.acquisition_cursors.values():
+            cursors.pop(websocket, None)
+        for formats in self.acquisition_formats.values():
+            formats.pop(websocket, None)
         logger.info(
             f"WebSocket disconnected. Total connections: {len(self.active_connections)}"
         )
@@ -44,59 +98,138 @@ class StreamManager:
                     task.cancel()
                     logger.debug(f"Cancelled streaming task: {task_key}")
             self.streaming_tasks.clear()
+            self._stream_intervals.clear()
 
     async def send_to_client(self, websocket: WebSocket, message: dict):
         """Send a message to a specific client."""
-        try:
-            await websocket.send_json(message)
-        except Exception as e:
-            logger.error(f"Error sending message: {e}")
-            self.disconnect(websocket)
+        self._subscriber(websocket).enqueue(EncodedMessage(message))
 
     async def broadcast(self, message: dict):
         """Broadcast a message to all connected clients."""
-        disconnected = set()
-        for connection in self.active_connections:
-            try:
-                await connection.send_json(message)
-            except Exception as e:
-                logger.error(f"Error broadcasting: {e}")
-                disconnected.add(connection)
+        fan_out(
+            EncodedMessage(message),
+            [self._subscriber(ws) for ws in list(self.active_connections)],
+        )
 
-        # Remove disconnected clients
-        for connection in disconnected:
-            self.disconnect(connection)
-
-    async def start_streaming(
-        self, equipment_id: str, stream_type: str, interval_ms: int = 100
-    ):
-        """Start streaming data from a device."""
-        task_key = f"{equipment_id}_{stream_type}"
+    def _start_topic(self, topic: str, interval_ms: int, producer) -> bool:
+        """Start a topic's producer task unless it already runs at this interval.
+
+        Returns:
+            True if a new producer was started
+        """
+        task = self.streaming_tasks.get(topic)
+        if (
+            task is not None
+            and not task.done()
+            and self._stream_intervals.get(topic) == interval_ms
+        ):
+            producer.close()
+            return False
 
         # Stop existing stream if any
-        if task_key in self.streaming_tasks:
-            self.streaming_tasks[task_key].cancel()
+        if task is not None:
+            task.cancel()
+
+        self.streaming_tasks[topic] = asyncio.create_task(producer)
+        self._stream_intervals[topic] = interval_ms
+        return True
+
+    def _stop_topic(self, topic: str):
+        """Stop a topic's producer task."""
+        task = self.streaming_tasks.pop(topic, None)
+        if task is not None:
+            task.cancel()
+        self._stream_intervals.pop(topic, None)
+
+    def _leave_topic(self, topic: str, websocket: Optional[WebSocket]) -> bool:
+        """Unsubscribe a client, or everyone without one.
+
+        Returns:
+            True if the topic has no subscribers left
+        """
+        if websocket is None:
+            for subscriber in self.topics.subscribers(topic):
+                self.topics.unsubscribe(topic, subscriber)
+            return True
+
+        subscriber = self.subscribers.get(websocket)
+        if subscriber is None:
+            return not self.topics.subscribers(topic)
+        return self.topics.unsubscribe(topic, subscriber) == 0
 
-        # Create new streaming task
-        task = asyncio.create_task(
-            self._stream_data(equipment_id, stream_type, interval_ms)
-        )
-        self.streaming_tasks[task_key] = task
-        logger.info(f"Started streaming {stream_type} from {equipment_id}")
-
-    async def stop_streaming(self, equipment_id: str, stream_type: str):
-        """Stop streaming data from a device."""
-        task_key = f"{equipment_id}_{stream_type}"
-
-        if task_key in self.streaming_tasks:
-            self.streaming_tasks[task_key].cancel()
-            del self.streaming_tasks[task_key]
+    async def start_streaming(
+        self,
+        equipment_id: str,
+        stream_type: str,
+        interval_ms: int = 100,
+        websocket: Optional[WebSocket] = None,
+    ):
+        """Start streaming data from a device.
+
+        Args:
+            equipment_id: Equipment ID
+            stream_type: Stream type (see STREAM_COMMANDS)
+            interval_ms: Update interval in milliseconds
+            websocket: Client subscribing to the stream
+        """
+        topic = stream_topic(equipment_id, stream_type)
+        if websocket is not None:
+            self.topics.subscribe(topic, self._subscriber(websocket))
+
+        if self._start_topic(
+            topic,
+            interval_ms,
+            self._stream_data(equipment_id, stream_type, interval_ms),
+        ):
+            logger.info(f"Started streaming {stream_type} from {equipment_id}")
+
+    async def stop_streaming(
+        self,
+        equipment_id: str,
+        stream_type: str,
+        websocket: Optional[WebSocket] = None,
+    ):
+        """Stop streaming data from a device.
+
+        Args:
+            equipment_id: Equipment ID
+            stream_type: Stream type
+            websocket: Client unsubscribing; the stream stops when it was
+                the last subscriber (None = stop for everyone)
+        """
+        topic = stream_topic(equipment_id, stream_type)
+
+        if self._leave_topic(topic, websocket) and topic in self.streaming_tasks:
+            self._stop_topic(topic)
             logger.info(f"Stopped streaming {stream_type} from {equipment_id}")
 
     async def _stream_data(self, equipment_id: str, stream_type: str, interval_ms: int):
         """Stream data from a device at regular intervals."""
         interval_sec = interval_ms / 1000.0
 
+        if stream_type not in STREAM_COMMANDS:
+            logger.error(f"Unknown stream type: {stream_type}")
+            return
+
+        # Share one poll of the device with other streams, alarms and monitors
+        command, parameters = STREAM_COMMANDS[stream_type]
+        subscription = reading_service.subscribe(
+            equipment_id, command, parameters, interval_sec
+        )
+
+        try:
+            await self._stream_subscription(
+                equipment_id, stream_type, interval_sec, subscription
+            )
+        finally:
+            subscription.close()
+
+    async def _stream_subscription(
+        self, equipment_id: str, stream_type: str, interval_sec: float, subscription
+    ):
+        """Publish readings from a reading subscription to the stream's topic."""
+        topic = stream_topic(equipment_id, stream_type)
+
         while True:
             try:
                 equipment = equipment_manager.get_equipment(equipment_id)
@@ -106,40 +239,25 @@ class StreamManager:
                     )
                     break
 
-                # Get data based on stream type
-                if stream_type == "readings":
-                    data = await equipment.execute_command("get_readings", {})
-                elif stream_type == "waveform":
-                    data = await equipment.execute_command(
-                        "get_waveform", {"channel": 1}
-                    )
-                elif stream_type == "measurements":
-                    data = await equipment.execute_command(
-                        "get_measurements", {"channel": 1}
-                    )
-                else:
-                    logger.error(f"Unknown stream type: {stream_type}")
-                    break
+                # Wait for the next shared reading
+                data = await subscription.get()
 
                 # Convert data to dict if it's a Pydantic model
-                if hasattr(data, "dict"):
-                    data_dict = data.dict()
+                if hasattr(data, "model_dump"):
+                    data_dict = data.model_dump(mode="json")
                 elif isinstance(data, dict):
                     data_dict = data
                 else:
                     data_dict = {"value": str(data)}
 
-                # Broadcast data
+                # Publish data to subscribers
                 message = {
                     "type": "stream_data",
                     "equipment_id": equipment_id,
                     "stream_type": stream_type,
                     "data": data_dict,
                 }
-                await self.broadcast(message)
-
-                # Wait for next interval
-                await asyncio.sleep(interval_sec)
+                self.topics.publish(topic, message)
 
             except asyncio.CancelledError:
                 logger.info(
@@ -150,13 +268,17 @@ class StreamManager:
                 logger.error(f"Error in streaming task: {e}")
                 await asyncio.sleep(interval_sec)
 
-    async def _stream_acquisition(
-        self, acquisition_id: str, interval_ms: int, num_samples: int = 100
-    ):
-        """Stream real-time acquisition data."""
+    async def _stream_acquisition(self, acquisition_id: str, interval_ms: int):
+        """Stream real-time acquisition data.
+
+        Each subscriber only receives samples it has not received yet (see
+        websocket.acquisition_stream). Subscribers at the same position
+        asking for the same format share one encoded update.
+        """
         from acquisition import acquisition_manager
 
         interval_sec = interval_ms / 1000.0
+        topic = acquisition_topic(acquisition_id)
 
         while True:
             try:
@@ -168,41 +290,54 @@ class StreamManager:
                     )
                     break
 
-                # Get latest data from buffer
-                data, timestamps = acquisition_manager.get_buffer_data(
-                    acquisition_id, num_samples
-                )
+                status = acquisition_status(session)
+                cursors = self.acquisition_cursors.setdefault(acquisition_id, {})
+                formats = self.acquisition_formats.setdefault(acquisition_id, {})
+
+                # Group subscribers whose next update is identical
+                groups = defaultdict(list)
+                for subscriber in self.topics.subscribers(topic):
+                    websocket = subscriber.websocket
+                    cursor = cursors.get(websocket)
+                    if cursor is None:
+                        cursor = cursors[websocket] = AcquisitionCursor()
+                    # Cursors without a position yet start num_samples back
+                    key = (
+                        cursor.sequence,
+                        cursor.num_samples if cursor.sequence is None else None,
+                        cursor.status == status,
+                        cursor.resynced,
+                        formats.get(websocket, (FrameFormat.JSON, "float64")),
+                    )
+                    groups[key].append((subscriber, cursor))
 
-                if len(timestamps) == 0:
-                    # No data yet, just send status
-                    message = {
-                        "type": "acquisition_stream",
-                        "acquisition_id": acquisition_id,
-                        "state": session.state,
-                        "stats": session.stats.dict(),
-                        "data": None,
-                    }
-                else:
-                    # Convert to JSON-serializable format
-                    message = {
-                        "type": "acquisition_stream",
-                        "acquisition_id": acquisition_id,
-                        "state": session.state,
-                        "stats": session.stats.dict(),
-                        "data": {
-                            "timestamps": [
-                                datetime.fromtimestamp(t).isoformat()
-                                for t in timestamps
-                            ],
-                            "values": {
-                                channel: data[i, :].tolist()
-                                for i, channel in enumerate(session.config.channels)
-                            },
-                            "count": len(timestamps),
+                for (*_, (frame_format, timestamp_dtype)), members in groups.items():
+                    _, lead = members[0]
+                    update = lead.next_update(
+                        acquisition_manager, acquisition_id, status
+                    )
+                    for _, cursor in members[1:]:
+                        cursor.copy_position(lead)
+                    if update is None:
+                        continue
+
+                    fields, data, timestamps = update
+                    payload = encode_acquisition_update(
+                        {
+                            "type": "acquisition_stream",
+                            "acquisition_id": acquisition_id,
+                            **fields,
                         },
-                    }
-
-                await self.broadcast(message)
+                        session.config.channels,
+                        data,
+                        timestamps,
+                        frame_format,
+                        timestamp_dtype,
+                    )
+                    fan_out(
+                        EncodedMessage(payload),
+                        [subscriber for subscriber, _ in members],
+                    )
 
                 # Wait for next interval
                 await asyncio.sleep(interval_sec)
@@ -216,37 +351,144 @@ class StreamManager:
                 logger.error(f"Error in acquisition streaming task: {e}")
                 await asyncio.sleep(interval_sec)
 
-    async def start_acquisition_stream(
-        self, acquisition_id: str, interval_ms: int = 100, num_samples: int = 100
+    def resync_acquisition_stream(
+        self,
+        websocket: WebSocket,
+        acquisition_id: str,
+        sequence: Optional[int] = None,
     ):
-        """Start streaming acquisition data."""
-        task_key = f"acquisition_{acquisition_id}"
-
-        # Stop existing stream if any
-        if task_key in self.streaming_tasks:
-            self.streaming_tasks[task_key].cancel()
+        """Restart a client's acquisition stream, e.g. after it missed an update.
+
+        Args:
+            websocket: Client connection
+            acquisition_id: Acquisition session ID
+            sequence: First sample the client needs (None = latest samples)
+        """
+        cursor = self.acquisition_cursors.get(acquisition_id, {}).get(websocket)
+        if cursor is not None:
+            cursor.resync(sequence)
+
+    def subscribe_acquisition(
+        self,
+        websocket: WebSocket,
+        acquisition_id: str,
+        num_samples: int = 100,
+        frame_format: FrameFormat = FrameFormat.JSON,
+        timestamp_dtype: str = "float64",
+    ):
+        """Subscribe a client to an acquisition stream.
 
-        # Create new streaming task
-        task = asyncio.create_task(
-            self._stream_acquisition(acquisition_id, interval_ms, num_samples)
+        A (re)subscribed client starts with the latest num_samples samples.
+        """
+        self.topics.subscribe(
+            acquisition_topic(acquisition_id), self._subscriber(websocket)
+        )
+        self.acquisition_cursors.setdefault(acquisition_id, {})[websocket] = (
+            AcquisitionCursor(num_samples)
         )
-        self.streaming_tasks[task_key] = task
-        logger.info(f"Started acquisition streaming for {acquisition_id}")
+        self.acquisition_formats.setdefault(acquisition_id, {})[websocket] = (
+            frame_format,
+            timestamp_dtype,
+        )
+
+    async def start_acquisition_stream(
+        self,
+        acquisition_id: str,
+        interval_ms: int = 100,
+        num_samples: int = 100,
+        frame_format: FrameFormat = FrameFormat.JSON,
+        timestamp_dtype: str = "float64",
+        websocket: Optional[WebSocket] = None,
+    ):
+        """Start streaming acquisition data.
+
+        Args:
+            acquisition_id: Acquisition session ID
+            interval_ms: Update interval in milliseconds
+            num_samples: Latest samples sent to the client first
+            frame_format: JSON messages, or binary frames (see websocket.frames)
+            timestamp_dtype: Timestamp offset type of binary frames
+                ("float64" or "float32")
+            websocket: Client subscribing to the stream
+        """
+        if websocket is not None:
+            self.subscribe_acquisition(
+                websocket, acquisition_id, num_samples, frame_format, timestamp_dtype
+            )
+
+        if self._start_topic(
+            acquisition_topic(acquisition_id),
+            interval_ms,
+            self._stream_acquisition(acquisition_id, interval_ms),
+        ):
+            logger.info(f"Started acquisition streaming for {acquisition_id}")
+
+    async def stop_acquisition_stream(
+        self, acquisition_id: str, websocket: Optional[WebSocket] = None
+    ):
+        """Stop streaming acquisition data.
 
-    async def stop_acquisition_stream(self, acquisition_id: str):
-        """Stop streaming acquisition data."""
-        task_key = f"acquisition_{acquisition_id}"
+        Args:
+            acquisition_id: Acquisition session ID
+            websocket: Client unsubscribing; the stream stops when it was
+                the last subscriber (None = stop for everyone)
+        """
+        topic = acquisition_topic(acquisition_id)
+        self.acquisition_cursors.get(acquisition_id, {}).pop(websocket, None)
+        self.acquisition_formats.get(acquisition_id, {}).pop(websocket, None)
 
-        if task_key in self.streaming_tasks:
-            self.streaming_tasks[task_key].cancel()
-            del self.streaming_tasks[task_key]
-            logger.info(f"Stopped acquisition streaming for {acquisition_id}")
+        if self._leave_topic(topic, websocket):
+            self.acquisition_cursors.pop(acquisition_id, None)
+            self.acquisition_formats.pop(acquisition_id, None)
+            if topic in self.streaming_tasks:
+                self._stop_topic(topic)
+                logger.info(f"Stopped acquisition streaming for {acquisition_id}")
 
 
 # Global stream manager
 stream_manager = StreamManager()
 
 
+async def _start_acquisition_stream(websocket: WebSocket, message: dict):
+    """Handle a start_acquisition_stream request."""
+    acquisition_id = message.get("acquisition_id")
+    timestamp_dtype = message.get("timestamp_dtype", "float64")
+    try:
+        frame_format = FrameFormat(str(message.get("format", "json")).lower())
+    except ValueError:
+        frame_format = None
+    if frame_format is None or timestamp_dtype not in TIMESTAMP_DTYPES:
+        await stream_manager.send_to_client(
+            websocket,
+            {"type": "error", "detail": "Invalid acquisition stream format"},
+        )
+        return
+
+    await stream_manager.start_acquisition_stream(
+        acquisition_id,
+        message.get("interval_ms", 100),
+        message.get("num_samples", 100),
+        frame_format,
+        timestamp_dtype,
+        websocket,
+    )
+    await stream_manager.send_to_client(
+        websocket,
+        {
+            "type": "acquisition_stream_started",
+            "acquisition_id": acquisition_id,
+            "format": frame_format.value,
+        },
+    )
+
+
+def _resync_acquisition_stream(websocket: WebSocket, message: dict):
+    """Handle a resync_acquisition_stream request."""
+    stream_manager.resync_acquisition_stream(
+        websocket, message.get("acquisition_id"), message.get("sequence")
+    )
+
+
 async def handle_websocket(websocket: WebSocket):
     """Handle WebSocket connection."""
     await stream_manager.connect(websocket)
@@ -272,7 +514,7 @@ async def handle_websocket(websocket: WebSocket):
                 stream_type = message.get("stream_type", "readings")
                 interval_ms = message.get("interval_ms", 100)
                 await stream_manager.start_streaming(
-                    equipment_id, stream_type, interval_ms
+                    equipment_id, stream_type, interval_ms, websocket
                 )
                 await stream_manager.send_to_client(
                     websocket,
@@ -286,7 +528,9 @@ async def handle_websocket(websocket: WebSocket):
             elif msg_type == "stop_stream":
                 equipment_id = message.get("equipment_id")
                 stream_type = message.get("stream_type", "readings")
-                await stream_manager.stop_streaming(equipment_id, stream_type)
+                await stream_manager.stop_streaming(
+                    equipment_id, stream_type, websocket
+                )
                 await stream_manager.send_to_client(
                     websocket,
                     {
@@ -297,23 +541,13 @@ async def handle_websocket(websocket: WebSocket):
                 )
 
             elif msg_type == "start_acquisition_stream":
-                acquisition_id = message.get("acquisition_id")
-                interval_ms = message.get("interval_ms", 100)
-                num_samples = message.get("num_samples", 100)
-                await stream_manager.start_acquisition_stream(
-                    acquisition_id, interval_ms, num_samples
-                )
-                await stream_manager.send_to_client(
-                    websocket,
-                    {
-                        "type": "acquisition_stream_started",
-                        "acquisition_id": acquisition_id,
-                    },
-                )
+                await _start_acquisition_stream(websocket, message)
 
             elif msg_type == "stop_acquisition_stream":
                 acquisition_id = message.get("acquisition_id")
-                await stream_manager.stop_acquisition_stream(acquisition_id)
+                await stream_manager.stop_acquisition_stream(
+                    acquisition_id, websocket
+                )
                 await stream_manager.send_to_client(
                     websocket,
                     {
@@ -322,6 +556,9 @@ async def handle_websocket(websocket: WebSocket):
                     },
                 )
 
+            elif msg_type == "resync_acquisition_stream":
+                _resync_acquisition_stream(websocket, message)
+
             elif msg_type == "ping":
                 await stream_manager.send_to_client(websocket, {"type": "pong"})
 
@@ -2,7 +2,7 @@
 
 This module provides an enhanced WebSocket server with:
 - Stream recording to files
-- Message compression (gzip/zlib)
+- Message compression (gzip/zlib, streaming deflate)
 - Priority-based message routing
 - Backpressure handling and flow control
 """
@@ -11,15 +11,19 @@ import asyncio
 import json
 import logging
 from datetime import datetime
-from typing import Optional
+from typing import Dict, Optional
 
 from config.settings import settings
 from equipment.manager import equipment_manager
+from equipment.readings import STREAM_COMMANDS, reading_service
 from fastapi import WebSocket, WebSocketDisconnect
 from websocket.enhanced_features import (BackpressureConfig, CompressionType,
                                          MessagePriority, RecordingFormat,
                                          StreamRecordingConfig)
 from websocket.enhanced_manager import EnhancedStreamManager
+from websocket.acquisition_stream import AcquisitionCursor, acquisition_status
+from websocket.frames import (TIMESTAMP_DTYPES, FrameFormat,
+                              encode_acquisition_update)
 
 logger = logging.getLogger(__name__)
 
@@ -59,6 +63,9 @@ def create_enhanced_stream_manager() -> EnhancedStreamManager:
 # Global enhanced stream manager
 enhanced_stream_manager = create_enhanced_stream_manager()
 
+# Acquisition stream task key -> the client's position in that stream
+acquisition_cursors: Dict[str, AcquisitionCursor] = {}
+
 
 async def handle_websocket_enhanced(
     websocket: WebSocket, client_id: Optional[str] = None
@@ -89,45 +96,13 @@ async def handle_websocket_enhanced(
             data = await websocket.receive_text()
             message = json.loads(data)
 
-            # Handle different message types
+            # Dispatch on message type
             msg_type = message.get("type")
-
-            if msg_type == "start_stream":
-                await handle_start_stream(client_id, message)
-
-            elif msg_type == "stop_stream":
-                await handle_stop_stream(client_id, message)
-
-            elif msg_type == "start_acquisition_stream":
-                await handle_start_acquisition_stream(client_id, message)
-
-            elif msg_type == "stop_acquisition_stream":
-                await handle_stop_acquisition_stream(client_id, message)
-
-            elif msg_type == "start_recording":
-                await handle_start_recording(client_id, message)
-
-            elif msg_type == "stop_recording":
-                await handle_stop_recording(client_id, message)
-
-            elif msg_type == "set_compression":
-                await handle_set_compression(client_id, message)
-
-            elif msg_type == "set_priority":
-                await handle_set_priority(client_id, message)
-
-            elif msg_type == "get_stats":
-                await handle_get_stats(client_id)
-
-            elif msg_type == "ping":
-                await enhanced_stream_manager.send_to_client(
-                    client_id,
-                    {"type": "pong", "timestamp": datetime.now().isoformat()},
-                    MessagePriority.HIGH,
-                )
-
-            else:
+            handler = MESSAGE_HANDLERS.get(msg_type)
+            if handler is None:
                 logger.warning(f"Unknown message type: {msg_type}")
+            else:
+                await handler(client_id, message)
 
     except WebSocketDisconnect:
         enhanced_stream_manager.disconnect(client_id)
@@ -142,7 +117,9 @@ async def handle_start_stream(client_id: str, message: dict):
     stream_type = message.get("stream_type", "readings")
     interval_ms = message.get("interval_ms", 100)
     priority = message.get("priority", "normal")
-    compression = message.get("compression", "none")
+    compression = message.get(
+        "compression", enhanced_stream_manager.get_compression(client_id).value
+    )
 
     # Convert priority and compression
     priority_enum = MessagePriority[priority.upper()]
@@ -203,13 +180,27 @@ async def handle_start_acquisition_stream(client_id: str, message: dict):
     interval_ms = message.get("interval_ms", 100)
     num_samples = message.get("num_samples", 100)
     priority = message.get("priority", "normal")
-    compression = message.get("compression", "none")
+    compression = message.get(
+        "compression", enhanced_stream_manager.get_compression(client_id).value
+    )
+
+    frame_format = FrameFormat(message.get("format", "json").lower())
+    timestamp_dtype = message.get("timestamp_dtype", "float64")
+    if timestamp_dtype not in TIMESTAMP_DTYPES:
+        raise ValueError(f"Unknown timestamp_dtype: {timestamp_dtype}")
 
     priority_enum = MessagePriority[priority.upper()]
     compression_enum = CompressionType(compression.lower())
 
     task_key = f"acquisition_{acquisition_id}_{client_id}"
 
+    # Stop existing stream if any
+    if task_key in enhanced_stream_manager.streaming_tasks:
+        enhanced_stream_manager.streaming_tasks[task_key].cancel()
+
+    cursor = AcquisitionCursor(num_samples)
+    acquisition_cursors[task_key] = cursor
+
     task = asyncio.create_task(
         stream_acquisition_data(
             client_id,
@@ -218,6 +209,9 @@ async def handle_start_acquisition_stream(client_id: str, message: dict):
             num_samples,
             priority_enum,
             compression_enum,
+            frame_format,
+            timestamp_dtype,
+            cursor,
         )
     )
 
@@ -228,6 +222,7 @@ async def handle_start_acquisition_stream(client_id: str, message: dict):
         {
             "type": "acquisition_stream_started",
             "acquisition_id": acquisition_id,
+            "format": frame_format.value,
         },
         MessagePriority.HIGH,
     )
@@ -242,6 +237,7 @@ async def handle_stop_acquisition_stream(client_id: str, message: dict):
     if task_key in enhanced_stream_manager.streaming_tasks:
         enhanced_stream_manager.streaming_tasks[task_key].cancel()
         del enhanced_stream_manager.streaming_tasks[task_key]
+        acquisition_cursors.pop(task_key, None)
 
         await enhanced_stream_manager.send_to_client(
             client_id,
@@ -253,6 +249,18 @@ async def handle_stop_acquisition_stream(client_id: str, message: dict):
         )
 
 
+async def handle_resync_acquisition_stream(client_id: str, message: dict):
+    """Handle a client's request to restart an acquisition stream.
+
+    The next update starts at ``sequence`` (or the latest samples without
+    one) and carries the acquisition state and statistics.
+    """
+    acquisition_id = message.get("acquisition_id")
+    cursor = acquisition_cursors.get(f"acquisition_{acquisition_id}_{client_id}")
+    if cursor is not None:
+        cursor.resync(message.get("sequence"))
+
+
 async def handle_start_recording(client_id: str, message: dict):
     """Handle start recording request."""
     session_id = message.get("session_id", f"recording_{client_id}")
@@ -310,19 +318,28 @@ async def handle_stop_recording(client_id: str, message: dict):
 
 async def handle_set_compression(client_id: str, message: dict):
     """Handle set compression request."""
-    compression = message.get("compression", "none")
+    requested = str(message.get("compression", "none")).lower()
+    try:
+        compression = CompressionType(requested)
+    except ValueError:
+        await enhanced_stream_manager.send_to_client(
+            client_id,
+            {
+                "type": "error",
+                "error": f"Unsupported compression type: {requested}",
+            },
+            MessagePriority.HIGH,
+        )
+        return
 
-    # Store compression preference in metadata
-    if client_id in enhanced_stream_manager.connection_metadata:
-        enhanced_stream_manager.connection_metadata[client_id][
-            "compression"
-        ] = compression
+    # Later messages to the client use it unless a stream asks otherwise
+    enhanced_stream_manager.set_compression(client_id, compression)
 
     await enhanced_stream_manager.send_to_client(
         client_id,
         {
             "type": "compression_set",
-            "compression": compression,
+            "compression": compression.value,
         },
         MessagePriority.HIGH,
     )
@@ -346,7 +363,7 @@ async def handle_set_priority(client_id: str, message: dict):
     )
 
 
-async def handle_get_stats(client_id: str):
+async def handle_get_stats(client_id: str, message: Optional[dict] = None):
     """Handle get stats request."""
     connection_stats = enhanced_stream_manager.get_backpressure_stats(client_id)
     global_stats = enhanced_stream_manager.get_global_stats()
@@ -362,6 +379,31 @@ async def handle_get_stats(client_id: str):
     )
 
 
+async def handle_ping(client_id: str, message: dict):
+    """Handle ping request."""
+    await enhanced_stream_manager.send_to_client(
+        client_id,
+        {"type": "pong", "timestamp": datetime.now().isoformat()},
+        MessagePriority.HIGH,
+    )
+
+
+# Client message type -> handler(client_id, message)
+MESSAGE_HANDLERS = {
+    "start_stream": handle_start_stream,
+    "stop_stream": handle_stop_stream,
+    "start_acquisition_stream": handle_start_acquisition_stream,
+    "stop_acquisition_stream": handle_stop_acquisition_stream,
+    "resync_acquisition_stream": handle_resync_acquisition_stream,
+    "start_recording": handle_start_recording,
+    "stop_recording": handle_stop_recording,
+    "set_compression": handle_set_compression,
+    "set_priority": handle_set_priority,
+    "get_stats": handle_get_stats,
+    "ping": handle_ping,
+}
+
+
 async def stream_equipment_data(
     client_id: str,
     equipment_id: str,
@@ -373,56 +415,60 @@ async def stream_equipment_data(
     """Stream equipment data to client."""
     interval_sec = interval_ms / 1000.0
 
-    while True:
-        try:
-            equipment = equipment_manager.get_equipment(equipment_id)
-            if equipment is None:
-                logger.warning(f"Equipment {equipment_id} not found, stopping stream")
-                break
+    if stream_type not in STREAM_COMMANDS:
+        logger.error(f"Unknown stream type: {stream_type}")
+        return
 
-            # Get data based on stream type
-            if stream_type == "readings":
-                data = await equipment.execute_command("get_readings", {})
-            elif stream_type == "waveform":
-                data = await equipment.execute_command("get_waveform", {"channel": 1})
-            elif stream_type == "measurements":
-                data = await equipment.execute_command(
-                    "get_measurements", {"channel": 1}
-                )
-            else:
-                logger.error(f"Unknown stream type: {stream_type}")
-                break
-
-            # Convert data to dict if it's a Pydantic model
-            if hasattr(data, "dict"):
-                data_dict = data.dict()
-            elif isinstance(data, dict):
-                data_dict = data
-            else:
-                data_dict = {"value": str(data)}
-
-            # Send data
-            message = {
-                "type": "stream_data",
-                "equipment_id": equipment_id,
-                "stream_type": stream_type,
-                "data": data_dict,
-                "timestamp": datetime.now().isoformat(),
-            }
+    # Share one poll of the device with other streams, alarms and monitors
+    command, parameters = STREAM_COMMANDS[stream_type]
+    subscription = reading_service.subscribe(
+        equipment_id, command, parameters, interval_sec
+    )
 
-            await enhanced_stream_manager.send_to_client(
-                client_id, message, priority, compression
-            )
+    try:
+        while True:
+            try:
+                equipment = equipment_manager.get_equipment(equipment_id)
+                if equipment is None:
+                    logger.warning(
+                        f"Equipment {equipment_id} not found, stopping stream"
+                    )
+                    break
+
+                # Wait for the next shared reading
+                data = await subscription.get()
+
+                # Convert data to dict if it's a Pydantic model
+                if hasattr(data, "dict"):
+                    data_dict = data.dict()
+                elif isinstance(data, dict):
+                    data_dict = data
+                else:
+                    data_dict = {"value": str(data)}
+
+                # Send data
+                message = {
+                    "type": "stream_data",
+                    "equipment_id": equipment_id,
+                    "stream_type": stream_type,
+                    "data": data_dict,
+                    "timestamp": datetime.now().isoformat(),
+                }
 
-            # Wait for next interval
-            await asyncio.sleep(interval_sec)
+                await enhanced_stream_manager.send_to_client(
+                    client_id, message, priority, compression
+                )
 
-        except asyncio.CancelledError:
-            logger.info(f"Streaming task cancelled for {equipment_id}/{stream_type}")
-            break
-        except Exception as e:
-            logger.error(f"Error in streaming task: {e}")
-            await asyncio.sleep(interval_sec)
+            except asyncio.CancelledError:
+                logger.info(
+                    f"Streaming task cancelled for {equipment_id}/{stream_type}"
+                )
+                break
+            except Exception as e:
+                logger.error(f"Error in streaming task: {e}")
+                await asyncio.sleep(interval_sec)
+    finally:
+        subscription.close()
 
 
 async def stream_acquisition_data(
@@ -432,11 +478,20 @@ async def stream_acquisition_data(
     num_samples: int,
     priority: MessagePriority,
     compression: CompressionType,
+    frame_format: FrameFormat = FrameFormat.JSON,
+    timestamp_dtype: str = "float64",
+    cursor: Optional[AcquisitionCursor] = None,
 ):
-    """Stream acquisition data to client."""
+    """Stream acquisition data to client.
+
+    Each update carries only the samples the client has not received yet
+    (see websocket.acquisition_stream). Binary frames are sent uncompressed;
+    their arrays barely compress.
+    """
     from acquisition import acquisition_manager
 
     interval_sec = interval_ms / 1000.0
+    cursor = cursor or AcquisitionCursor(num_samples)
 
     while True:
         try:
@@ -448,44 +503,28 @@ async def stream_acquisition_data(
                 )
                 break
 
-            # Get latest data from buffer
-            data, timestamps = acquisition_manager.get_buffer_data(
-                acquisition_id, num_samples
+            update = cursor.next_update(
+                acquisition_manager, acquisition_id, acquisition_status(session)
             )
 
-            if len(timestamps) == 0:
-                # No data yet, just send status
-                message = {
-                    "type": "acquisition_stream",
-                    "acquisition_id": acquisition_id,
-                    "state": session.state,
-                    "stats": session.stats.dict(),
-                    "data": None,
-                    "timestamp": datetime.now().isoformat(),
-                }
-            else:
-                # Convert to JSON-serializable format
-                message = {
-                    "type": "acquisition_stream",
-                    "acquisition_id": acquisition_id,
-                    "state": session.state,
-                    "stats": session.stats.dict(),
-                    "data": {
-                        "timestamps": [
-                            datetime.fromtimestamp(t).isoformat() for t in timestamps
-                        ],
-                        "values": {
-                            channel: data[i, :].tolist()
-                            for i, channel in enumerate(session.config.channels)
-                        },
-                        "count": len(timestamps),
+            if update is not None:
+                fields, data, timestamps = update
+                payload = encode_acquisition_update(
+                    {
+                        "type": "acquisition_stream",
+                        "acquisition_id": acquisition_id,
+                        **fields,
+                        "timestamp": datetime.now().isoformat(),
                     },
-                    "timestamp": datetime.now().isoformat(),
-                }
-
-            await enhanced_stream_manager.send_to_client(
-                client_id, message, priority, compression
-            )
+                    session.config.channels,
+                    data,
+                    timestamps,
+                    frame_format,
+                    timestamp_dtype,
+                )
+                await enhanced_stream_manager.send_to_client(
+                    client_id, payload, priority, compression
+                )
 
             # Wait for next interval
             await asyncio.sleep(interval_sec)
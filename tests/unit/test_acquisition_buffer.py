@@ -0,0 +1,182 @@
+"""Tests for the acquisition circular buffer."""
+
+import numpy as np
+import pytest
+
+from server.acquisition.models import CircularBuffer, RunningStatistics
+
+
+@pytest.mark.unit
+class TestCircularBufferBlocks:
+    """Test block writes into the acquisition CircularBuffer."""
+
+    def test_add_many_matches_add(self):
+        """Test that a block write stores the same data as per-sample adds."""
+        block = np.arange(14, dtype=np.float64).reshape(2, 7)
+        timestamps = np.arange(7, dtype=np.float64) + 1000.0
+
+        single = CircularBuffer(size=5, num_channels=2)
+        for i in range(7):
+            single.add(block[:, i].tolist(), timestamps[i])
+
+        batched = CircularBuffer(size=5, num_channels=2)
+        batched.add_many(block[:, :3], timestamps[:3])
+        batched.add_many(block[:, 3:], timestamps[3:])
+
+        data, ts = batched.get_all()
+        expected_data, expected_ts = single.get_all()
+        np.testing.assert_array_equal(data, expected_data)
+        np.testing.assert_array_equal(ts, expected_ts)
+        assert batched.overruns == single.overruns == 2
+
+    def test_add_many_larger_than_buffer(self):
+        """Test that an oversized block keeps only the newest samples."""
+        buffer = CircularBuffer(size=4, num_channels=1)
+        buffer.add_many(np.arange(10.0).reshape(1, 10), np.arange(10.0))
+
+        data, ts = buffer.get_all()
+        assert data[0].tolist() == [6.0, 7.0, 8.0, 9.0]
+        assert ts.tolist() == [6.0, 7.0, 8.0, 9.0]
+        assert buffer.count == 4
+        assert buffer.overruns == 6
+
+    def test_add_many_shape_mismatch(self):
+        """Test that blocks with the wrong shape are rejected."""
+        buffer = CircularBuffer(size=10, num_channels=2)
+
+        with pytest.raises(ValueError):
+            buffer.add_many(np.zeros((3, 4)), np.zeros(4))
+        with pytest.raises(ValueError):
+            buffer.add_many(np.zeros((2, 4)), np.zeros(3))
+
+
+@pytest.mark.unit
+class TestCircularBufferReads:
+    """Test view-based and cursor-based reads from the CircularBuffer."""
+
+    def _filled(self, count: int, size: int = 5) -> CircularBuffer:
+        buffer = CircularBuffer(size=size, num_channels=2)
+        for i in range(count):
+            buffer.add([float(i), float(-i)], 1000.0 + i)
+        return buffer
+
+    def test_single_view_without_wrap(self):
+        """Test that an unwrapped window is returned as one view."""
+        buffer = self._filled(3)
+
+        views = buffer.get_views()
+
+        assert len(views) == 1
+        data, timestamps = views[0]
+        assert np.shares_memory(data, buffer.data)
+        assert data[0].tolist() == [0.0, 1.0, 2.0]
+        assert timestamps.tolist() == [1000.0, 1001.0, 1002.0]
+
+    def test_two_views_when_wrapped(self):
+        """Test that a wrapped window is split into two views in order."""
+        buffer = self._filled(7)
+
+        views = buffer.get_views(4)
+
+        assert len(views) == 2
+        values = np.concatenate([data[0] for data, _ in views])
+        assert values.tolist() == [3.0, 4.0, 5.0, 6.0]
+
+    def test_single_view_at_exact_wrap(self):
+        """Test a full buffer whose write position is back at zero."""
+        buffer = self._filled(10)
+
+        views = buffer.get_views()
+
+        assert len(views) == 1
+        assert views[0][0][0].tolist() == [5.0, 6.0, 7.0, 8.0, 9.0]
+
+    def test_get_latest_returns_copy(self):
+        """Test that get_latest is unaffected by later writes."""
+        buffer = self._filled(3)
+        data, _ = buffer.get_latest()
+
+        buffer.add([99.0, 99.0])
+
+        assert data[0].tolist() == [0.0, 1.0, 2.0]
+
+    def test_get_since_returns_only_new_samples(self):
+        """Test that a reader cursor only sees samples it hasn't read."""
+        buffer = self._filled(3)
+        _, _, cursor = buffer.get_since(0)
+        assert cursor == 3
+
+        data, timestamps, cursor = buffer.get_since(cursor)
+        assert data.shape == (2, 0)
+        assert len(timestamps) == 0
+
+        buffer.add([3.0, -3.0], 1003.0)
+        data, timestamps, cursor = buffer.get_since(cursor)
+        assert data[0].tolist() == [3.0]
+        assert cursor == 4
+
+    def test_get_since_after_overwrite(self):
+        """Test that a lagging reader resumes at the oldest retained sample."""
+        buffer = self._filled(12)
+
+        assert buffer.oldest_sequence == 7
+        data, _, cursor = buffer.get_since(2)
+
+        assert data[0].tolist() == [7.0, 8.0, 9.0, 10.0, 11.0]
+        assert cursor == 12
+
+    def test_get_since_limit_reads_oldest_first(self):
+        """Test that a limited read returns the oldest pending chunk."""
+        buffer = self._filled(13)
+
+        data, _, cursor = buffer.get_since(8, limit=3)
+        assert data[0].tolist() == [8.0, 9.0, 10.0]
+        assert cursor == 11
+
+        data, _, cursor = buffer.get_since(cursor, limit=3)
+        assert data[0].tolist() == [11.0, 12.0]
+        assert cursor == 13
+
+
+@pytest.mark.unit
+class TestRunningStatistics:
+    """Test incremental per-channel statistics."""
+
+    def test_matches_batch_computation(self):
+        """Test that mixed single and block updates match numpy."""
+        values = np.random.default_rng(1).normal(5.0, 2.0, size=(2, 500))
+        stats = RunningStatistics(2)
+
+        stats.update(values[:, :1])
+        stats.update(values[:, 1:250])
+        stats.update(values[:, 250:])
+
+        np.testing.assert_allclose(stats.mean, values.mean(axis=1))
+        np.testing.assert_allclose(stats.std, values.std(axis=1))
+        np.testing.assert_array_equal(stats.min, values.min(axis=1))
+        np.testing.assert_array_equal(stats.max, values.max(axis=1))
+        assert stats.count.tolist() == [500, 500]
+
+    def test_ignores_nan(self):
+        """Test that NaN samples don't count or poison the statistics."""
+        stats = RunningStatistics(2)
+
+        stats.update(np.array([[1.0, np.nan, 3.0], [np.nan, np.nan, np.nan]]))
+
+        assert stats.count.tolist() == [2, 0]
+        assert stats.mean[0] == 2.0
+        assert np.isnan(stats.std[1])
+
+    def test_buffer_stats_cover_overwritten_samples(self):
+        """Test that buffer statistics include data that has wrapped out."""
+        buffer = CircularBuffer(size=4, num_channels=1)
+        for value in [100.0, 1.0, 2.0, 3.0, 4.0]:
+            buffer.add([value])
+
+        stats = buffer.get_stats()
+
+        assert stats["max"] == [100.0]
+        assert stats["mean"] == [pytest.approx(22.0)]
+
+        buffer.clear()
+        assert buffer.running.count.tolist() == [0]
@@ -0,0 +1,194 @@
+"""Tests for streaming acquisition data export."""
+
+import csv
+import json
+import sys
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from server.acquisition.export import (ExportFormatUnavailable, export_segments,
+                                       format_timestamps)
+from server.acquisition.manager import AcquisitionManager
+from server.acquisition.models import (AcquisitionConfig, AcquisitionSession,
+                                       CircularBuffer, ExportFormat)
+
+
+def _session(channels=("CH1", "CH2")) -> AcquisitionSession:
+    config = AcquisitionConfig(equipment_id="scope", channels=list(channels))
+    return AcquisitionSession(
+        acquisition_id=config.acquisition_id,
+        equipment_id=config.equipment_id,
+        config=config,
+    )
+
+
+def _segments():
+    """Two segments of 7 samples in total, as from a wrapped buffer."""
+    buffer = CircularBuffer(size=7, num_channels=2)
+    buffer.add_many(np.zeros((2, 3)), np.zeros(3))
+    data = np.vstack([np.arange(7.0) / 10, -np.arange(7.0)])
+    data[1, 4] = np.nan
+    buffer.add_many(data, 1700000000.25 + np.arange(7.0))
+    return buffer.get_views(), data, 1700000000.25 + np.arange(7.0)
+
+
+@pytest.mark.unit
+class TestExport:
+    """Test chunked export writers."""
+
+    def test_format_timestamps_matches_isoformat(self):
+        """Test that vectorized formatting matches datetime.isoformat."""
+        timestamps = np.array([1700000000.0, 1700000000.123456, 1234567890.5])
+
+        formatted = format_timestamps(timestamps)
+
+        assert formatted.tolist() == [
+            datetime.fromtimestamp(t).isoformat(timespec="microseconds")
+            for t in timestamps
+        ]
+
+    def test_csv_export(self, tmp_path):
+        """Test that CSV output is identical regardless of chunking."""
+        segments, data, timestamps = _segments()
+        path = export_segments(
+            ExportFormat.CSV, tmp_path / "out.csv", _session(), segments, chunk_size=2
+        )
+
+        with open(path, newline="") as f:
+            rows = list(csv.reader(f))
+
+        assert rows[0] == ["timestamp", "CH1", "CH2"]
+        assert len(rows) == 8
+        assert rows[1][0] == datetime.fromtimestamp(timestamps[0]).isoformat(
+            timespec="microseconds"
+        )
+        assert [float(r[1]) for r in rows[1:]] == data[0].tolist()
+        assert rows[5][2] == "nan"
+
+    def test_json_export_is_compact(self, tmp_path):
+        """Test that JSON output parses and is not pretty-printed."""
+        segments, data, _ = _segments()
+        session = _session()
+        path = export_segments(
+            ExportFormat.JSON, tmp_path / "out.json", session, segments, chunk_size=3
+        )
+
+        text = path.read_text()
+        exported = json.loads(text)
+
+        assert "\n" not in text
+        assert exported["acquisition_id"] == session.acquisition_id
+        assert len(exported["data"]["timestamps"]) == 7
+        assert exported["data"]["channels"]["CH1"] == data[0].tolist()
+        assert np.isnan(exported["data"]["channels"]["CH2"][4])
+
+    def test_numpy_export_loads(self, tmp_path):
+        """Test that the streamed archive is readable with np.load."""
+        segments, data, timestamps = _segments()
+        path = export_segments(
+            ExportFormat.NUMPY, tmp_path / "out.npy", _session(), segments, chunk_size=2
+        )
+
+        assert path.name == "out.npy.npz"
+        with np.load(path, allow_pickle=True) as archive:
+            np.testing.assert_array_equal(archive["data"], data)
+            np.testing.assert_array_equal(archive["timestamps"], timestamps)
+            assert archive["channels"].tolist() == ["CH1", "CH2"]
+
+    def test_hdf5_export(self, tmp_path):
+        """Test that HDF5 datasets are chunked and hold all samples."""
+        h5py = pytest.importorskip("h5py")
+        segments, data, timestamps = _segments()
+        path = export_segments(
+            ExportFormat.HDF5, tmp_path / "out.hdf5", _session(), segments, chunk_size=3
+        )
+
+        with h5py.File(path, "r") as f:
+            assert f["data/CH1"].chunks == (3,)
+            np.testing.assert_array_equal(f["data/CH1"][:], data[0])
+            np.testing.assert_array_equal(f["data/timestamps"][:], timestamps)
+
+    async def test_manager_export_from_worker(self, tmp_path):
+        """Test that export_data writes the buffer and returns the real path."""
+        manager = AcquisitionManager()
+        manager.set_export_directory(str(tmp_path))
+        session = await manager.create_session(None, _session().config)
+        manager._buffers[session.acquisition_id].add_many(
+            np.ones((2, 5)), np.arange(5.0) + 1700000000.0
+        )
+
+        path = await manager.export_data(session.acquisition_id, ExportFormat.NUMPY)
+
+        assert path.endswith(".npz")
+        with np.load(path) as archive:
+            assert archive["data"].shape == (2, 5)
+
+    async def test_export_empty_buffer(self, tmp_path):
+        """Test that exporting an empty session is rejected."""
+        manager = AcquisitionManager()
+        manager.set_export_directory(str(tmp_path))
+        session = await manager.create_session(None, _session().config)
+
+        with pytest.raises(ValueError):
+            await manager.export_data(session.acquisition_id, ExportFormat.CSV)
+
+
+@pytest.mark.unit
+class TestParquetExport:
+    """Test Parquet export and loading."""
+
+    def test_parquet_export(self, tmp_path):
+        """Test per-channel columns, row groups and session metadata."""
+        pq = pytest.importorskip("pyarrow.parquet")
+        segments, data, timestamps = _segments()
+        session = _session()
+
+        path = export_segments(
+            ExportFormat.PARQUET,
+            tmp_path / "out.parquet",
+            session,
+            segments,
+            chunk_size=3,
+        )
+
+        parquet_file = pq.ParquetFile(path)
+        table = parquet_file.read()
+        metadata = json.loads(table.schema.metadata[b"lablink"])
+
+        assert table.column_names == ["timestamp", "CH1", "CH2"]
+        assert parquet_file.num_row_groups == 3
+        assert table.column("CH1").to_pylist() == data[0].tolist()
+        assert table.column("timestamp")[0].value == int(timestamps[0] * 1e6)
+        assert metadata["acquisition_id"] == session.acquisition_id
+
+    def test_batch_loader_reads_parquet(self, tmp_path):
+        """Test that batch analysis loads Parquet exports as columns."""
+        pytest.importorskip("pyarrow")
+        from server.analysis.batch import BatchProcessor
+
+        segments, data, timestamps = _segments()
+        path = export_segments(
+            ExportFormat.PARQUET, tmp_path / "out.parquet", _session(), segments
+        )
+
+        loaded = BatchProcessor()._load_data(path)
+
+        assert loaded["timestamp"] == pytest.approx(timestamps.tolist())
+        assert loaded["CH1"] == data[0].tolist()
+
+    async def test_parquet_rejected_without_pyarrow(self, tmp_path, monkeypatch):
+        """Test that a missing pyarrow is an error, not a silent fallback."""
+        monkeypatch.setitem(sys.modules, "pyarrow", None)
+        manager = AcquisitionManager()
+        manager.set_export_directory(str(tmp_path))
+        session = await manager.create_session(None, _session().config)
+        manager._buffers[session.acquisition_id].add_many(
+            np.ones((2, 5)), np.arange(5.0) + 1700000000.0
+        )
+
+        with pytest.raises(ExportFormatUnavailable):
+            await manager.export_data(session.acquisition_id, ExportFormat.PARQUET)
+
+        assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,200 @@
+"""Tests for the acquisition manager's sampling paths."""
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from server.acquisition.manager import AcquisitionManager
+from server.acquisition.models import AcquisitionConfig, AcquisitionState
+
+
+class SlowChannelEquipment:
+    """Fake instrument whose single-channel reads take a fixed time."""
+
+    def __init__(self, delay: float = 0.05, concurrent: bool = True):
+        self.delay = delay
+        self.supports_concurrent_reads = concurrent
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def get_measurement(self, channel: str):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            if channel == "BAD":
+                raise RuntimeError("read failed")
+            return {"value": float(channel.replace("CH", ""))}
+        finally:
+            self.in_flight -= 1
+
+
+class BatchEquipment(SlowChannelEquipment):
+    """Fake instrument that can return all channels from one command."""
+
+    def __init__(self):
+        super().__init__()
+        self.batch_calls = 0
+
+    async def read_channels(self, channels):
+        self.batch_calls += 1
+        return [float(channel.replace("CH", "")) * 10 for channel in channels]
+
+
+@pytest.mark.unit
+class TestChannelReads:
+    """Test how the manager reads a sample across channels."""
+
+    async def test_batched_read_used_when_available(self):
+        """Test that one batched call replaces per-channel reads."""
+        manager = AcquisitionManager()
+        equipment = BatchEquipment()
+
+        values = await manager._read_channels(
+            equipment, ["CH1", "CH2", "CH3"], asyncio.Semaphore(4)
+        )
+
+        assert values == [10.0, 20.0, 30.0]
+        assert equipment.batch_calls == 1
+        assert equipment.max_in_flight == 0
+
+    async def test_concurrent_reads_are_bounded(self):
+        """Test that per-channel reads run concurrently up to the limit."""
+        manager = AcquisitionManager()
+        equipment = SlowChannelEquipment()
+        channels = [f"CH{i}" for i in range(1, 7)]
+
+        values = await manager._read_channels(
+            equipment, channels, asyncio.Semaphore(3)
+        )
+
+        assert values == [1.0, 2.0, 3.0, 4.0, 5.0, 6.0]
+        assert equipment.max_in_flight == 3
+
+    async def test_sequential_reads_without_opt_in(self):
+        """Test that drivers without concurrency support are read one at a time."""
+        manager = AcquisitionManager()
+        equipment = SlowChannelEquipment(delay=0.0, concurrent=False)
+
+        values = await manager._read_channels(
+            equipment, ["CH1", "CH2"], asyncio.Semaphore(4)
+        )
+
+        assert values == [1.0, 2.0]
+        assert equipment.max_in_flight == 1
+
+    async def test_failed_channel_is_nan(self):
+        """Test that one failing channel doesn't lose the others."""
+        manager = AcquisitionManager()
+        equipment = SlowChannelEquipment(delay=0.0)
+
+        values = await manager._read_channels(
+            equipment, ["CH1", "BAD"], asyncio.Semaphore(4)
+        )
+
+        assert values[0] == 1.0
+        assert np.isnan(values[1])
+
+    async def test_acquisition_loop_with_batched_reads(self):
+        """Test a short single-shot session using the batched path."""
+        manager = AcquisitionManager()
+        equipment = BatchEquipment()
+        config = AcquisitionConfig(
+            equipment_id="fake",
+            mode="single_shot",
+            num_samples=5,
+            sample_rate=200.0,
+            channels=["CH1", "CH2"],
+        )
+
+        session = await manager.create_session(equipment, config)
+        await manager.start_acquisition(session.acquisition_id, equipment)
+        await asyncio.wait_for(manager._tasks[session.acquisition_id], timeout=2.0)
+
+        data, _ = manager.get_buffer_data(session.acquisition_id)
+        assert session.state == AcquisitionState.ACQUIRING
+        assert session.stats.total_samples == 5
+        assert equipment.batch_calls == 5
+        assert data[1].tolist() == [20.0] * 5
+
+
+@pytest.mark.unit
+class TestBlockAcquisition:
+    """Test acquisition through driver block reads."""
+
+    async def test_single_shot_with_block_reads(self):
+        """Test that block reads fill the buffer without overshooting."""
+        from server.equipment.mock.mock_oscilloscope import MockOscilloscope
+
+        manager = AcquisitionManager()
+        equipment = MockOscilloscope()
+        config = AcquisitionConfig(
+            equipment_id="scope",
+            mode="single_shot",
+            num_samples=250,
+            sample_rate=10000.0,
+            block_size=100,
+            channels=["CH1", "CH2"],
+        )
+
+        session = await manager.create_session(equipment, config)
+        await manager.start_acquisition(session.acquisition_id, equipment)
+        await asyncio.wait_for(manager._tasks[session.acquisition_id], timeout=2.0)
+
+        data, timestamps = manager.get_buffer_data(session.acquisition_id)
+        assert session.stats.total_samples == 250
+        assert data.shape == (2, 250)
+        assert np.all(np.diff(timestamps[:100]) > 0)
+
+    async def test_falls_back_without_block_support(self):
+        """Test that drivers without block reads use point-by-point reads."""
+        manager = AcquisitionManager()
+        equipment = BatchEquipment()
+        equipment.read_block = _unsupported_read_block
+        config = AcquisitionConfig(
+            equipment_id="fake",
+            mode="single_shot",
+            num_samples=3,
+            sample_rate=200.0,
+            block_size=50,
+            channels=["CH1"],
+        )
+
+        session = await manager.create_session(equipment, config)
+        await manager.start_acquisition(session.acquisition_id, equipment)
+        await asyncio.wait_for(manager._tasks[session.acquisition_id], timeout=2.0)
+
+        assert session.stats.total_samples == 3
+        assert equipment.batch_calls == 3
+
+
+async def _unsupported_read_block(channels, n, sample_rate=None):
+    return None
+
+
+@pytest.mark.unit
+class TestLiveStatistics:
+    """Test that session statistics are maintained during acquisition."""
+
+    async def test_stats_available_while_acquiring(self):
+        """Test that per-channel stats are published without stopping."""
+        manager = AcquisitionManager()
+        equipment = BatchEquipment()
+        config = AcquisitionConfig(
+            equipment_id="fake",
+            mode="continuous",
+            sample_rate=500.0,
+            channels=["CH1", "CH2"],
+        )
+
+        session = await manager.create_session(equipment, config)
+        await manager.start_acquisition(session.acquisition_id, equipment)
+        await asyncio.sleep(0.05)
+
+        try:
+            assert session.stats.mean_values == {"CH1": 10.0, "CH2": 20.0}
+            assert session.stats.std_values["CH1"] == 0.0
+            assert session.stats.max_values["CH2"] == 20.0
+        finally:
+            await manager.stop_acquisition(session.acquisition_id)
@@ -0,0 +1,184 @@
+"""Tests for incremental acquisition statistics."""
+
+import numpy as np
+import pytest
+
+from server.acquisition.models import CircularBuffer
+from server.acquisition.statistics import (
+    LiveAnalytics,
+    SlidingWindowStats,
+    StatisticsEngine,
+)
+
+
+@pytest.mark.unit
+class TestSlidingWindowStats:
+    """Test the SlidingWindowStats class."""
+
+    def test_invalid_window(self):
+        """Test that an empty window is rejected."""
+        with pytest.raises(ValueError):
+            SlidingWindowStats(0)
+
+    def test_matches_full_recompute(self):
+        """Test that incremental results match a recompute of the window."""
+        rng = np.random.default_rng(2)
+        values = 1000.0 + rng.normal(size=5000)
+        window = SlidingWindowStats(64)
+        engine = StatisticsEngine()
+
+        for start in range(0, len(values), 37):
+            window.extend(values[start : start + 37])
+            expected = engine.compute_rolling_stats(values[: start + 37][-64:])
+            actual = window.stats()
+
+            assert actual.num_samples == expected.num_samples
+            assert actual.mean == pytest.approx(expected.mean)
+            assert actual.std == pytest.approx(expected.std, rel=1e-6)
+            assert actual.rms == pytest.approx(expected.rms)
+            assert actual.min == expected.min
+            assert actual.max == expected.max
+            assert actual.median == expected.median
+
+    def test_large_block_replaces_window(self):
+        """Test that a block larger than the window keeps only its tail."""
+        window = SlidingWindowStats(3)
+        window.extend(np.array([100.0, -100.0]))
+
+        window.extend(np.arange(10.0))
+
+        stats = window.stats()
+        assert (stats.min, stats.max, stats.median) == (7.0, 9.0, 8.0)
+
+    def test_skips_nan(self):
+        """Test that failed reads don't enter the window."""
+        window = SlidingWindowStats(4)
+
+        window.extend(np.array([1.0, np.nan, 3.0]))
+
+        stats = window.stats()
+        assert stats.num_samples == 2
+        assert stats.mean == 2.0
+
+    def test_nan_keeps_its_position(self):
+        """Test that a failed read still counts towards the window length."""
+        window = SlidingWindowStats(3)
+
+        window.extend(np.array([1.0, np.nan]))
+        window.extend(np.array([3.0, 5.0]))
+
+        stats = window.stats()
+        assert stats.num_samples == 2
+        assert (stats.min, stats.max, stats.mean) == (3.0, 5.0, 4.0)
+
+        window.extend(np.array([np.nan, np.nan, np.nan]))
+        assert window.stats().num_samples == 0
+
+        window.extend(np.array([np.nan, 8.0]))
+        stats = window.stats()
+        assert (stats.num_samples, stats.mean, stats.median) == (1, 8.0, 8.0)
+
+    def test_window_of_one(self):
+        """Test the smallest window size."""
+        window = SlidingWindowStats(1)
+
+        window.extend(np.array([5.0]))
+        window.extend(np.array([7.0]))
+
+        assert window.stats().mean == 7.0
+        assert window.stats().std == 0.0
+
+
+@pytest.mark.unit
+class TestLiveAnalytics:
+    """Test the LiveAnalytics class."""
+
+    def test_rolling_stats_follow_new_samples(self):
+        """Test that rolling stats only consume newly acquired samples."""
+        buffer = CircularBuffer(size=100, num_channels=2)
+        analytics = LiveAnalytics(buffer)
+        buffer.add_many(np.vstack([np.arange(50.0), np.zeros(50)]), np.arange(50.0))
+
+        first = analytics.rolling_stats(0, 10)
+        assert first.mean == pytest.approx(44.5)
+
+        buffer.add_many(np.vstack([np.arange(50.0, 55.0), np.zeros(5)]), np.arange(5.0))
+        second = analytics.rolling_stats(0, 10)
+
+        assert second.mean == pytest.approx(49.5)
+        assert second.min == 45.0
+
+    def test_results_cached_until_next_sample(self):
+        """Test that repeated polls reuse the previous result."""
+        buffer = CircularBuffer(size=100, num_channels=1)
+        analytics = LiveAnalytics(buffer)
+        calls = []
+
+        def compute():
+            calls.append(buffer.sequence)
+            return len(calls)
+
+        buffer.add([1.0])
+        assert analytics.cached("key", compute) == 1
+        assert analytics.cached("key", compute) == 1
+
+        buffer.add([2.0])
+        assert analytics.cached("key", compute) == 2
+        assert calls == [1, 2]
+
+    def test_cache_is_bounded(self):
+        """Test that distinct parameter sets don't grow the cache forever."""
+        buffer = CircularBuffer(size=100, num_channels=1)
+        buffer.add([1.0])
+        analytics = LiveAnalytics(buffer)
+
+        for window in range(1, 100):
+            analytics.rolling_stats(0, window)
+
+        assert len(analytics._windows) <= analytics.max_entries
+        assert len(analytics._results) <= analytics.max_entries
+
+
+@pytest.mark.unit
+class TestFFT:
+    """Test FFT analysis."""
+
+    def test_matches_complex_fft(self):
+        """Test that the real-input FFT matches the full complex FFT."""
+        t = np.arange(256) / 1000.0
+        data = np.sin(2 * np.pi * 125.0 * t) + 0.1 * np.cos(2 * np.pi * 250.0 * t)
+
+        result = StatisticsEngine().compute_fft(data, 1000.0)
+
+        full = np.fft.fft(data * np.hanning(256))
+        np.testing.assert_allclose(result.magnitudes, np.abs(full)[:128] * (2.0 / 256))
+        np.testing.assert_allclose(result.frequencies, np.fft.fftfreq(256, 1e-3)[:128])
+        assert result.dominant_frequency == pytest.approx(125.0)
+
+
+@pytest.mark.unit
+class TestManagerAnalytics:
+    """Test the manager's live analytics entry points."""
+
+    async def test_stats_endpoints_use_live_analytics(self):
+        """Test rolling stats, FFT and unknown channels through the manager."""
+        from server.acquisition.manager import AcquisitionManager
+        from server.acquisition.models import AcquisitionConfig
+
+        manager = AcquisitionManager()
+        config = AcquisitionConfig(
+            equipment_id="fake", sample_rate=1000.0, channels=["CH1"], buffer_size=256
+        )
+        session = await manager.create_session(None, config)
+        t = np.arange(256) / 1000.0
+        manager._buffers[session.acquisition_id].add_many(
+            np.sin(2 * np.pi * 125.0 * t)[None, :], t
+        )
+
+        stats = manager.compute_rolling_stats(session.acquisition_id, "CH1", 100)
+        fft_result = manager.compute_fft(session.acquisition_id, "CH1")
+
+        assert stats.num_samples == 100
+        assert fft_result.dominant_frequency == pytest.approx(125.0)
+        assert manager.compute_fft(session.acquisition_id, "CH1") is fft_result
+        assert manager.detect_trend(session.acquisition_id, "CH9") is None
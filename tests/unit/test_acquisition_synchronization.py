@@ -15,11 +15,14 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from server.acquisition.synchronization import (
+    ResampleMethod,
     SyncConfig,
     SyncState,
     SyncStatus,
     SynchronizationGroup,
     SynchronizationManager,
+    compute_skew,
+    resample,
 )
 
 
@@ -504,6 +507,201 @@ class TestSynchronizationGroup:
         assert data["scope2"]["timestamps"][0] == 0.0
 
 
+# ============================================================================
+# Test Resampling and Alignment
+# ============================================================================
+
+
+class TestResample:
+    """Test resampling multi-channel data onto a time grid."""
+
+    def setup_method(self):
+        import numpy as np
+
+        self.timestamps = np.array([0.0, 1.0, 2.0])
+        self.data = np.array([[0.0, 10.0, 20.0], [5.0, 5.0, -5.0]])
+        self.grid = np.array([0.0, 0.4, 0.6, 1.5, 2.0])
+
+    def test_linear(self):
+        """Test linear interpolation on all channels."""
+        import numpy as np
+
+        result = resample(self.timestamps, self.data, self.grid, ResampleMethod.LINEAR)
+
+        np.testing.assert_allclose(result[0], [0.0, 4.0, 6.0, 15.0, 20.0])
+        np.testing.assert_allclose(result[1], [5.0, 5.0, 5.0, 0.0, -5.0])
+
+    def test_nearest(self):
+        """Test nearest-sample resampling."""
+        import numpy as np
+
+        result = resample(self.timestamps, self.data, self.grid, ResampleMethod.NEAREST)
+
+        np.testing.assert_array_equal(result[0], [0.0, 0.0, 10.0, 10.0, 20.0])
+
+    def test_zero_order_hold(self):
+        """Test that zero-order hold keeps the previous sample."""
+        import numpy as np
+
+        result = resample(
+            self.timestamps, self.data, self.grid, ResampleMethod.ZERO_ORDER_HOLD
+        )
+
+        np.testing.assert_array_equal(result[0], [0.0, 0.0, 0.0, 10.0, 20.0])
+
+    def test_outside_span_is_nan(self):
+        """Test that grid points outside the data are not extrapolated."""
+        import numpy as np
+
+        grid = np.array([-1.0, 1.0, 3.0])
+        for method in ResampleMethod:
+            result = resample(self.timestamps, self.data, grid, method)
+
+            assert np.isnan(result[:, 0]).all()
+            assert np.isnan(result[:, 2]).all()
+            np.testing.assert_array_equal(result[:, 1], [10.0, 5.0])
+
+    def test_empty_input(self):
+        """Test resampling with no samples."""
+        import numpy as np
+
+        result = resample(np.array([]), np.empty((2, 0)), self.grid)
+
+        assert result.shape == (2, 5)
+        assert np.isnan(result).all()
+
+
+class TestComputeSkew:
+    """Test inter-device skew measurement."""
+
+    def test_constant_offset(self):
+        """Test a device sampling 2 ms after the reference."""
+        import numpy as np
+
+        reference = np.arange(10) * 0.1
+        skew = compute_skew("psu", reference + 0.002, reference, tolerance_ms=5.0)
+
+        assert skew.start_offset_ms == pytest.approx(2.0)
+        assert skew.mean_ms == pytest.approx(2.0)
+        assert skew.std_ms == pytest.approx(0.0, abs=1e-9)
+        assert skew.max_abs_ms == pytest.approx(2.0)
+        assert skew.within_tolerance is True
+
+    def test_outside_tolerance(self):
+        """Test that large offsets are flagged."""
+        import numpy as np
+
+        reference = np.arange(10) * 0.1
+        skew = compute_skew("psu", reference + 0.03, reference, tolerance_ms=10.0)
+
+        assert skew.within_tolerance is False
+
+
+class TestAlignedData:
+    """Test SynchronizationGroup.get_aligned_data."""
+
+    def _group(self, **kwargs):
+        config = SyncConfig(
+            group_id="group1",
+            equipment_ids=["psu", "scope"],
+            auto_align_timestamps=False,
+            **kwargs,
+        )
+        group = SynchronizationGroup(config)
+        group.acquisition_ids = {"psu": "acq1", "scope": "acq2"}
+        return group
+
+    def _manager(self, buffers, channels):
+        manager = MagicMock()
+        manager.get_buffer_data = MagicMock(
+            side_effect=lambda acquisition_id, n=None: buffers[acquisition_id]
+        )
+        manager.get_session = MagicMock(
+            side_effect=lambda acquisition_id: MagicMock(
+                config=MagicMock(channels=channels[acquisition_id])
+            )
+        )
+        return manager
+
+    @pytest.mark.asyncio
+    async def test_single_matrix_on_common_grid(self):
+        """Test that devices at different rates end up in one matrix."""
+        import numpy as np
+
+        psu_ts = 100.0 + np.arange(5) * 0.1
+        scope_ts = 100.0 + 0.005 + np.arange(41) * 0.01
+        manager = self._manager(
+            {
+                "acq1": (np.array([psu_ts - 100.0]), psu_ts),
+                "acq2": (
+                    np.vstack([scope_ts - 100.0, 2 * (scope_ts - 100.0)]),
+                    scope_ts,
+                ),
+            },
+            {"acq1": ["V"], "acq2": ["CH1", "CH2"]},
+        )
+
+        aligned = await self._group().get_aligned_data(manager)
+
+        assert aligned.channels == ["psu:V", "scope:CH1", "scope:CH2"]
+        # Default period follows the slowest device
+        assert aligned.period_ms == pytest.approx(100.0)
+        # Grid spans only the overlap of both devices
+        assert aligned.timestamps[0] == pytest.approx(100.005)
+        assert aligned.data.shape == (3, len(aligned.timestamps))
+        np.testing.assert_allclose(aligned.data[0], aligned.timestamps - 100.0)
+        np.testing.assert_allclose(aligned.data[2], 2 * (aligned.timestamps - 100.0))
+
+        assert aligned.skew["psu"].max_abs_ms == pytest.approx(0.0)
+        assert aligned.skew["scope"].start_offset_ms == pytest.approx(5.0)
+
+    @pytest.mark.asyncio
+    async def test_method_and_period_overrides(self):
+        """Test explicit resampling method and grid period."""
+        import numpy as np
+
+        ts = np.array([0.0, 1.0, 2.0])
+        manager = self._manager(
+            {
+                "acq1": (np.array([[0.0, 1.0, 2.0]]), ts),
+                "acq2": (np.array([[3.0, 4.0, 5.0]]), ts),
+            },
+            {"acq1": ["V"], "acq2": ["I"]},
+        )
+        group = self._group(resample_method=ResampleMethod.ZERO_ORDER_HOLD)
+
+        aligned = await group.get_aligned_data(manager, period_ms=500.0)
+
+        assert aligned.method == ResampleMethod.ZERO_ORDER_HOLD
+        np.testing.assert_allclose(aligned.timestamps, [0.0, 0.5, 1.0, 1.5, 2.0])
+        np.testing.assert_array_equal(aligned.data[0], [0.0, 0.0, 1.0, 1.0, 2.0])
+
+        aligned = await group.get_aligned_data(
+            manager, method=ResampleMethod.LINEAR, period_ms=500.0
+        )
+        np.testing.assert_allclose(aligned.data[1], [3.0, 3.5, 4.0, 4.5, 5.0])
+
+    @pytest.mark.asyncio
+    async def test_device_without_data(self):
+        """Test that a device with no samples yields NaN rows."""
+        import numpy as np
+
+        ts = np.array([0.0, 1.0])
+        manager = self._manager(
+            {
+                "acq1": (np.array([[1.0, 2.0]]), ts),
+                "acq2": (np.array([]), np.array([])),
+            },
+            {"acq1": ["V"], "acq2": ["I"]},
+        )
+
+        aligned = await self._group().get_aligned_data(manager)
+
+        assert aligned.data.shape == (2, 2)
+        assert np.isnan(aligned.data[1]).all()
+        assert "scope" not in aligned.skew
+
+
 # ============================================================================
 # Test SynchronizationManager
 # ============================================================================
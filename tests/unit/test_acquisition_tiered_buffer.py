@@ -0,0 +1,191 @@
+"""Tests for the disk-spilling acquisition buffer."""
+
+import asyncio
+import threading
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from server.acquisition.manager import AcquisitionManager
+from server.acquisition.models import AcquisitionConfig
+from server.acquisition.tiered_buffer import TieredBuffer
+
+
+@pytest.mark.unit
+class TestTieredBuffer:
+    """Test the TieredBuffer class."""
+
+    def test_spills_instead_of_overwriting(self, tmp_path):
+        """Test that no samples are lost once the hot tier is full."""
+        buffer = TieredBuffer(size=4, num_channels=2, spill_path=tmp_path / "a.spill")
+        for i in range(10):
+            buffer.add([float(i), float(-i)], 1000.0 + i)
+
+        segments = buffer.snapshot()
+        data = np.concatenate([d for d, _ in segments], axis=1)
+        timestamps = np.concatenate([t for _, t in segments])
+        buffer.flush()
+
+        assert buffer.spilled == 8
+        assert buffer.hot_count == 2
+        assert buffer.overruns == 0
+        assert data[0].tolist() == [float(i) for i in range(10)]
+        assert data[1].tolist() == [float(-i) for i in range(10)]
+        assert timestamps[-1] == 1009.0
+        assert (tmp_path / "a.spill").stat().st_size == buffer.spill_bytes
+
+    def test_block_writes_span_tiers(self, tmp_path):
+        """Test that a block larger than the hot tier is spilled in chunks."""
+        buffer = TieredBuffer(size=4, num_channels=1, spill_path=tmp_path / "b.spill")
+        buffer.add_many(np.arange(11.0).reshape(1, 11), np.arange(11.0))
+
+        buffer.flush()
+        data, _ = buffer.get_latest(5)
+
+        assert data[0].tolist() == [6.0, 7.0, 8.0, 9.0, 10.0]
+        assert len(buffer.get_views(5)) == 2
+        assert buffer.count == 11
+
+    def test_cursor_reads_across_tiers(self, tmp_path):
+        """Test that get_since reads spilled samples for a lagging reader."""
+        buffer = TieredBuffer(size=4, num_channels=1, spill_path=tmp_path / "c.spill")
+        buffer.add_many(np.arange(9.0).reshape(1, 9), np.arange(9.0))
+
+        data, _, cursor = buffer.get_since(2)
+
+        assert buffer.oldest_sequence == 0
+        assert data[0].tolist() == [2.0, 3.0, 4.0, 5.0]
+        assert cursor == 6
+
+        data, _, cursor = buffer.get_since(cursor)
+
+        assert data[0].tolist() == [6.0, 7.0, 8.0]
+        assert cursor == 9
+
+    def test_cursor_limit_reads_only_the_chunk(self, tmp_path):
+        """Test that a limited read touches only that chunk of the spill file."""
+        buffer = TieredBuffer(size=4, num_channels=1, spill_path=tmp_path / "l.spill")
+        buffer.add_many(np.arange(9.0).reshape(1, 9), np.arange(9.0))
+
+        with patch.object(
+            buffer, "_range_views", wraps=buffer._range_views
+        ) as range_views:
+            data, _, cursor = buffer.get_since(1, limit=2)
+
+        range_views.assert_called_once_with(1, 3)
+        assert data[0].tolist() == [1.0, 2.0]
+        assert cursor == 3
+
+    def test_spill_writes_run_off_the_caller(self, tmp_path):
+        """Test that adds don't wait for the disk and pending chunks stay readable."""
+        buffer = TieredBuffer(size=4, num_channels=1, spill_path=tmp_path / "w.spill")
+        release = threading.Event()
+        write = buffer._write_records
+
+        def slow_write(spill_file, records):
+            release.wait(timeout=5)
+            write(spill_file, records)
+
+        with patch.object(buffer, "_write_records", side_effect=slow_write):
+            buffer.add_many(np.arange(10.0).reshape(1, 10), np.arange(10.0))
+
+            assert (tmp_path / "w.spill").stat().st_size == 0
+            data, _, cursor = buffer.get_since(0, limit=10)
+            assert data[0].tolist() == [float(i) for i in range(10)]
+
+            release.set()
+            buffer.flush()
+
+        assert buffer.get_since(0, limit=10)[0][0].tolist() == data[0].tolist()
+        assert len(buffer.get_views()) == 2
+        buffer.close()
+
+    def test_reads_are_capped_at_memory_tier(self, tmp_path):
+        """Test that get_latest()/get_all() don't copy the whole spill file."""
+        buffer = TieredBuffer(size=4, num_channels=1, spill_path=tmp_path / "g.spill")
+        buffer.add_many(np.arange(10.0).reshape(1, 10), np.arange(10.0))
+
+        assert buffer.get_all()[0][0].tolist() == [6.0, 7.0, 8.0, 9.0]
+        assert buffer.get_latest()[1].tolist() == [6.0, 7.0, 8.0, 9.0]
+        assert buffer.get_latest(6)[0].shape == (1, 6)
+        assert sum(len(t) for _, t in buffer.iter_chunks()) == 10
+
+    def test_clear_keeps_exported_snapshot_readable(self, tmp_path):
+        """Test that clearing does not truncate a file a snapshot still maps."""
+        buffer = TieredBuffer(size=4, num_channels=1, spill_path=tmp_path / "h.spill")
+        buffer.add_many(np.arange(8.0).reshape(1, 8), np.arange(8.0))
+        segments = buffer.snapshot()
+
+        buffer.clear()
+        buffer.add_many(np.full((1, 8), -1.0), np.arange(8.0))
+
+        values = np.concatenate([data[0] for data, _ in segments])
+        assert values.tolist() == [float(i) for i in range(8)]
+        assert buffer.get_since(0)[0][0].tolist() == [-1.0] * 4
+
+    def test_stats_match_in_memory_reduction(self, tmp_path):
+        """Test that chunked statistics cover both tiers."""
+        buffer = TieredBuffer(size=8, num_channels=1, spill_path=tmp_path / "d.spill")
+        values = np.random.default_rng(0).normal(size=50)
+        buffer.add_many(values.reshape(1, -1), np.arange(50.0))
+
+        stats = buffer.get_stats()
+
+        assert stats["count"] == 50
+        assert stats["min"][0] == pytest.approx(values.min())
+        assert stats["max"][0] == pytest.approx(values.max())
+        assert stats["mean"][0] == pytest.approx(values.mean())
+        assert stats["std"][0] == pytest.approx(values.std())
+
+    def test_close_removes_spill_file(self, tmp_path):
+        """Test that closing the buffer deletes its spill file."""
+        path = tmp_path / "e.spill"
+        buffer = TieredBuffer(size=4, num_channels=1, spill_path=path)
+        buffer.add_many(np.zeros((1, 6)), np.arange(6.0))
+
+        buffer.close()
+
+        assert not path.exists()
+
+    async def test_session_spills_to_disk(self, tmp_path):
+        """Test a session whose data outgrows the in-memory buffer."""
+        from server.equipment.mock.mock_oscilloscope import MockOscilloscope
+
+        manager = AcquisitionManager()
+        config = AcquisitionConfig(
+            equipment_id="scope",
+            mode="single_shot",
+            num_samples=450,
+            sample_rate=100000.0,
+            block_size=150,
+            buffer_size=100,
+            spill_to_disk=True,
+            spill_directory=str(tmp_path),
+        )
+
+        session = await manager.create_session(MockOscilloscope(), config)
+        await manager.start_acquisition(session.acquisition_id, MockOscilloscope())
+        await asyncio.wait_for(manager._tasks[session.acquisition_id], timeout=2.0)
+
+        buffer = manager._buffers[session.acquisition_id]
+        data = np.concatenate([d for d, _ in buffer.iter_chunks()], axis=1)
+        assert data.shape == (1, 450)
+        assert manager.get_buffer_data(session.acquisition_id)[0].shape == (1, 100)
+        assert session.stats.buffer_overruns == 0
+        assert session.stats.spilled_samples == 400
+        assert session.stats.max_values["CH1"] == pytest.approx(np.nanmax(data))
+
+        await manager.delete_session(session.acquisition_id)
+        assert list(tmp_path.iterdir()) == []
+
+    def test_snapshot_is_stable(self, tmp_path):
+        """Test that a snapshot is unaffected by later writes to either tier."""
+        buffer = TieredBuffer(size=4, num_channels=1, spill_path=tmp_path / "f.spill")
+        buffer.add_many(np.arange(6.0).reshape(1, 6), np.arange(6.0))
+
+        segments = buffer.snapshot()
+        buffer.add_many(np.full((1, 6), -1.0), np.arange(6.0))
+
+        values = np.concatenate([data[0] for data, _ in segments])
+        assert values.tolist() == [0.0, 1.0, 2.0, 3.0, 4.0, 5.0]
@@ -0,0 +1,99 @@
+"""Tests for deadline-based acquisition sample scheduling."""
+
+import pytest
+
+from server.acquisition.models import TimingPolicy
+from server.acquisition.timing import DeadlineScheduler
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self, now: float = 100.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.mark.unit
+class TestDeadlineScheduler:
+    """Test the DeadlineScheduler class."""
+
+    def test_invalid_period(self):
+        """Test that a non-positive period is rejected."""
+        with pytest.raises(ValueError):
+            DeadlineScheduler(0.0)
+
+    async def test_first_deadline_is_immediate(self):
+        """Test that the first sample is not delayed."""
+        clock = FakeClock()
+        scheduler = DeadlineScheduler(0.1, clock=clock)
+
+        lateness = await scheduler.wait()
+
+        assert lateness == 0.0
+        assert scheduler.samples == 1
+
+    def test_deadlines_do_not_drift(self):
+        """Test that I/O latency does not accumulate into the period."""
+        clock = FakeClock(0.0)
+        scheduler = DeadlineScheduler(0.1, clock=clock)
+
+        for i in range(10):
+            # Each sample takes 40 ms of instrument time
+            clock.now += 0.04
+            scheduler.advance()
+            assert scheduler.next_deadline == pytest.approx(0.1 * (i + 1))
+            clock.now = scheduler.next_deadline
+
+        assert scheduler.missed_deadlines == 0
+
+    def test_skip_policy_drops_missed_slots(self):
+        """Test that SKIP re-joins the time grid after a stall."""
+        clock = FakeClock(0.0)
+        scheduler = DeadlineScheduler(0.1, TimingPolicy.SKIP, clock=clock)
+
+        # Sample stalls for 350 ms
+        clock.now = 0.35
+        skipped = scheduler.advance()
+
+        assert skipped == 2
+        assert scheduler.missed_deadlines == 2
+        assert scheduler.next_deadline == pytest.approx(0.3)
+
+    def test_skip_policy_tolerates_small_lateness(self):
+        """Test that being late by less than a period is not a miss."""
+        clock = FakeClock(0.0)
+        scheduler = DeadlineScheduler(0.1, TimingPolicy.SKIP, clock=clock)
+
+        clock.now = 0.15
+        assert scheduler.advance() == 0
+        assert scheduler.next_deadline == pytest.approx(0.1)
+
+    async def test_catch_up_policy_keeps_every_slot(self):
+        """Test that CATCH_UP never moves the grid forward."""
+        clock = FakeClock(0.0)
+        scheduler = DeadlineScheduler(0.1, TimingPolicy.CATCH_UP, clock=clock)
+
+        clock.now = 0.35
+        assert scheduler.advance() == 0
+        assert scheduler.next_deadline == pytest.approx(0.1)
+
+        # Next sample is served 250 ms late, which counts as a miss
+        lateness = await scheduler.wait()
+        assert lateness == pytest.approx(0.25)
+        assert scheduler.missed_deadlines == 1
+        assert scheduler.max_lateness == pytest.approx(0.25)
+
+    async def test_reset_restarts_grid(self):
+        """Test that reset schedules the next sample immediately."""
+        clock = FakeClock(0.0)
+        scheduler = DeadlineScheduler(1.0, clock=clock)
+        scheduler.advance()
+
+        clock.now = 0.5
+        scheduler.reset()
+
+        assert scheduler.next_deadline == 0.5
+        assert await scheduler.wait() == 0.0
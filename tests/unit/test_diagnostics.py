@@ -39,6 +39,7 @@ from server.diagnostics.models import (
 )
 
 from server.diagnostics.manager import DiagnosticsManager
+from server.diagnostics.metrics import CommandMetrics
 
 
 # ==================== Fixtures ====================
@@ -840,14 +841,13 @@ class TestStatisticsTracking:
             bytes_received=500,
         )
 
-        stats = diagnostics_manager._communication_stats["test_scope_001"]
-        assert stats["total_commands"] == 1
-        assert stats["successful"] == 1
-        assert stats["failed"] == 0
-        assert len(stats["response_times"]) == 1
-        assert stats["response_times"][0] == 50.5
-        assert stats["bytes_sent"] == 100
-        assert stats["bytes_received"] == 500
+        stats = diagnostics_manager.get_command_metrics("test_scope_001")
+        assert stats.total_commands == 1
+        assert stats.successful == 1
+        assert stats.failed == 0
+        assert list(stats.recent_latencies()) == [50.5]
+        assert stats.bytes_sent == 100
+        assert stats.bytes_received == 500
 
     def test_record_command_failure(self, diagnostics_manager):
         """Test recording failed command."""
@@ -856,14 +856,16 @@ class TestStatisticsTracking:
             success=False,
             response_time_ms=200.0,
             error="Timeout",
+            timed_out=True,
         )
 
-        stats = diagnostics_manager._communication_stats["test_scope_001"]
-        assert stats["total_commands"] == 1
-        assert stats["successful"] == 0
-        assert stats["failed"] == 1
-        assert stats["last_error"] == "Timeout"
-        assert len(stats["error_list"]) == 1
+        stats = diagnostics_manager.get_command_metrics("test_scope_001")
+        assert stats.total_commands == 1
+        assert stats.successful == 0
+        assert stats.failed == 1
+        assert stats.timeouts == 1
+        assert stats.last_error == "Timeout"
+        assert len(stats.recent_errors(10)) == 1
 
     def test_record_many_commands_response_time_limit(self, diagnostics_manager):
         """Test that response times are limited to 1000 entries."""
@@ -874,9 +876,12 @@ class TestStatisticsTracking:
                 response_time_ms=float(i),
             )
 
-        stats = diagnostics_manager._communication_stats["test_scope_001"]
-        assert stats["total_commands"] == 1500
-        assert len(stats["response_times"]) == 1000  # Capped at 1000
+        stats = diagnostics_manager.get_command_metrics("test_scope_001")
+        assert stats.total_commands == 1500
+        latencies = stats.recent_latencies()
+        assert len(latencies) == 1000  # Capped at 1000
+        assert latencies[0] == 500.0 and latencies[-1] == 1499.0
+        assert stats.percentile(50) == pytest.approx(750.0, rel=0.05)
 
     def test_get_health_cache(self, diagnostics_manager):
         """Test getting cached health status."""
@@ -938,6 +943,40 @@ class TestStatisticsTracking:
         assert len(history) == 10
 
 
+class TestCommandMetrics:
+    """Test the ring-buffer command metrics recorder."""
+
+    def test_percentiles_within_histogram_precision(self):
+        """Test that histogram percentiles track the exact ones closely."""
+        metrics = CommandMetrics(ring_size=64)
+        values = [float(v) for v in range(1, 1001)]  # Folded as the ring wraps
+        for value in values:
+            metrics.record(value)
+
+        assert metrics.percentile(50) == pytest.approx(500.0, rel=0.04)
+        assert metrics.percentile(99) == pytest.approx(990.0, rel=0.04)
+        assert metrics.get_stats()["p99_ms"] == metrics.percentile(99)
+
+    def test_recent_latencies_in_order(self):
+        """Test that recent latencies come back oldest first across a wrap."""
+        metrics = CommandMetrics(ring_size=4)
+        for value in range(6):
+            metrics.record(float(value))
+
+        assert list(metrics.recent_latencies()) == [2.0, 3.0, 4.0, 5.0]
+        assert list(metrics.recent_latencies(2)) == [4.0, 5.0]
+
+    def test_error_history_is_bounded(self):
+        """Test that only the most recent errors are kept."""
+        metrics = CommandMetrics(error_history=5)
+        for i in range(20):
+            metrics.record(1.0, success=False, error=f"error {i}")
+
+        errors = metrics.recent_errors(10)
+        assert [e["error"] for e in errors] == [f"error {i}" for i in range(15, 20)]
+        assert metrics.failed == 20
+
+
 # ==================== Enhanced Diagnostics Tests ====================
 
 
@@ -0,0 +1,209 @@
+"""Tests for batched SCPI command execution on BaseEquipment."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from server.diagnostics.metrics import CommandMetrics
+from server.equipment.base import BaseEquipment
+
+
+class Device(BaseEquipment):
+    """Minimal concrete equipment for exercising BaseEquipment I/O."""
+
+    async def get_info(self):
+        return None
+
+    async def get_status(self):
+        return None
+
+    async def execute_command(self, command, parameters):
+        return None
+
+
+def make_device(compound: bool, query=None):
+    """Create a connected device with a mock instrument."""
+    device = Device(MagicMock(), "TCPIP::192.168.1.10::INSTR")
+    device.supports_compound_commands = compound
+    device.instrument = MagicMock()
+    device.instrument.query = MagicMock(side_effect=query)
+    device.connected = True
+    device._ensure_connected = MagicMock(side_effect=lambda: asyncio.sleep(0))
+    return device
+
+
+@pytest.mark.unit
+class TestBatch:
+    """Test BaseEquipment.batch()."""
+
+    @pytest.mark.asyncio
+    async def test_compound_query_is_one_message(self):
+        """Test that commands are joined with ';' and replies demultiplexed."""
+        device = make_device(True, query=lambda message: "0.5;1.0E-3\n")
+
+        responses = await device.batch(
+            [":WAV:SOUR CHAN1", ":TIM:MAIN:SCAL?", "CHAN1:SCAL?"]
+        )
+
+        assert responses == [None, "0.5", "1.0E-3"]
+        device.instrument.query.assert_called_once_with(
+            ":WAV:SOUR CHAN1;:TIM:MAIN:SCAL?;:CHAN1:SCAL?"
+        )
+        device.instrument.write.assert_not_called()
+        assert device.get_io_stats()["commands"] == 1
+
+    @pytest.mark.asyncio
+    async def test_compound_writes_only(self):
+        """Test that a batch without queries is written, not queried."""
+        device = make_device(True)
+
+        responses = await device.batch([":WAV:MODE NORM", "*CLS"])
+
+        assert responses == [None, None]
+        device.instrument.write.assert_called_once_with(":WAV:MODE NORM;*CLS")
+        device.instrument.query.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_compound_reply_count_mismatch_raises(self):
+        """Test that a reply with the wrong number of fields is rejected."""
+        device = make_device(True, query=lambda message: "1.0\n")
+
+        with pytest.raises(ValueError):
+            await device.batch([":MEAS:VPP?", ":MEAS:VMAX?"])
+
+    @pytest.mark.asyncio
+    async def test_sequential_fallback(self):
+        """Test that other instruments get one call per command, in order."""
+        device = make_device(False, query=lambda command: f"{command}-reply\n")
+
+        responses = await device.batch(["VOLT 5", "VOLT?", "CURR?"])
+
+        assert responses == [None, "VOLT?-reply", "CURR?-reply"]
+        device.instrument.write.assert_called_once_with("VOLT 5")
+        assert [c.args[0] for c in device.instrument.query.call_args_list] == [
+            "VOLT?",
+            "CURR?",
+        ]
+        # Still a single hop to the I/O worker
+        assert device.get_io_stats()["commands"] == 1
+
+    @pytest.mark.asyncio
+    async def test_empty_batch(self):
+        """Test that an empty batch does no I/O."""
+        device = make_device(True)
+
+        assert await device.batch([]) == []
+        device.instrument.query.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_batch_recorded_as_one_command(self):
+        """Test that diagnostics see a batch as a single command."""
+        device = make_device(True, query=lambda message: "0.5;1.0\n")
+        device.cached_info = MagicMock(id="scope_1")
+        device._metrics_id = "scope_1"
+        device._metrics = CommandMetrics()
+
+        await device.batch([":MEAS:VPP?", ":MEAS:VMAX?"])
+
+        assert device._metrics.total_commands == 1
+        assert device._metrics.bytes_sent == len(":MEAS:VPP?:MEAS:VMAX?")
+        assert device._metrics.bytes_received == len("0.51.0")
+
+
+@pytest.mark.unit
+class TestSettingsCache:
+    """Test the write-through settings cache."""
+
+    @pytest.mark.asyncio
+    async def test_unchanged_settings_are_skipped(self):
+        """Test that a repeated setup batch only sends its queries."""
+        device = make_device(True, query=lambda message: "1.0\n")
+        commands = [":WAV:SOUR CHAN1", ":WAV:FORM BYTE", ":WAV:PRE?"]
+
+        await device.batch(commands, cache_settings=True)
+        responses = await device.batch(commands, cache_settings=True)
+
+        assert responses == [None, None, "1.0"]
+        assert device.instrument.query.call_args_list[-1].args[0] == ":WAV:PRE?"
+
+    @pytest.mark.asyncio
+    async def test_all_cached_batch_does_no_io(self):
+        """Test that a batch of cached settings never reaches the worker."""
+        device = make_device(True)
+        commands = [":WAV:SOUR CHAN1", ":WAV:MODE NORM"]
+
+        await device.batch(commands, cache_settings=True)
+        await device.batch(commands, cache_settings=True)
+
+        device.instrument.write.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_changed_value_is_sent(self):
+        """Test that a new value for a cached setting is written."""
+        device = make_device(False)
+
+        assert await device._write_setting(":WAV:SOUR CHAN1") is True
+        assert await device._write_setting(":wav:sour CHAN1") is False
+        assert await device._write_setting(":WAV:SOUR CHAN2") is True
+
+    @pytest.mark.asyncio
+    async def test_uncached_write_invalidates_setting(self):
+        """Test that a direct write forgets the setting it touches."""
+        device = make_device(False)
+        await device._write_setting(":WAV:SOUR CHAN1")
+        await device._write_setting(":WAV:FORM BYTE")
+
+        await device._write(":WAV:SOUR CHAN2")
+
+        assert await device._write_setting(":WAV:SOUR CHAN1") is True
+        assert await device._write_setting(":WAV:FORM BYTE") is False
+
+    @pytest.mark.asyncio
+    async def test_long_and_short_forms_share_a_key(self):
+        """Test that long-form headers hit and invalidate short-form entries."""
+        device = make_device(False)
+        await device._write_setting(":WAV:SOUR CHAN1")
+
+        assert await device._write_setting(":WAVeform:SOURce CHAN1") is False
+
+        await device._write(":WAVEFORM:SOURCE CHAN2")
+
+        assert await device._write_setting(":WAV:SOUR CHAN1") is True
+
+    @pytest.mark.asyncio
+    async def test_compound_write_invalidates_every_header(self):
+        """Test that each header of a ';'-joined write is forgotten."""
+        device = make_device(False)
+        await device._write_setting(":WAV:SOUR CHAN1")
+        await device._write_setting(":WAV:FORM BYTE")
+        await device._write_setting(":TIM:SCAL 0.001")
+
+        await device._write(":WAV:MODE RAW;:WAVeform:SOURce CHAN2")
+
+        assert await device._write_setting(":WAV:SOUR CHAN1") is True
+        assert await device._write_setting(":WAV:FORM BYTE") is False
+
+        await device._write(":TIM:SCAL 0.002;FORM ASC")
+
+        assert device._settings_cache == {}
+
+    @pytest.mark.asyncio
+    async def test_reset_invalidates_everything(self):
+        """Test that *RST clears the whole cache."""
+        device = make_device(False)
+        await device._write_setting(":WAV:FORM BYTE")
+
+        await device._write("*RST")
+
+        assert await device._write_setting(":WAV:FORM BYTE") is True
+
+    @pytest.mark.asyncio
+    async def test_disconnect_invalidates_everything(self):
+        """Test that the cache does not survive a disconnect."""
+        device = make_device(False)
+        await device._write_setting(":WAV:FORM BYTE")
+
+        await device.disconnect()
+
+        assert device._settings_cache == {}
@@ -0,0 +1,191 @@
+"""Tests for concurrent bulk connect and reconnect."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from server.equipment.base import BaseEquipment
+from server.equipment.error_handler import ReconnectionHandler
+from server.equipment.manager import EquipmentManager
+
+
+class SlowDevice:
+    """Equipment whose connect takes a while and tracks concurrency."""
+
+    in_flight = 0
+    max_in_flight = 0
+
+    def __init__(self, resource_string, fail=False):
+        self.resource_string = resource_string
+        self.resource_manager = None
+        self.fail = fail
+
+    async def connect(self):
+        SlowDevice.in_flight += 1
+        SlowDevice.max_in_flight = max(SlowDevice.max_in_flight, SlowDevice.in_flight)
+        try:
+            await asyncio.sleep(0.05)
+            if self.fail:
+                raise TimeoutError("No response to *IDN?")
+        finally:
+            SlowDevice.in_flight -= 1
+
+    async def disconnect(self):
+        pass
+
+    async def get_info(self):
+        return MagicMock(id=f"dev_{self.resource_string}")
+
+
+class BlockingOpenDevice(BaseEquipment):
+    """Equipment whose resource open blocks like a TCPIP open."""
+
+    def __init__(self, resource_manager, resource_string):
+        super().__init__(resource_manager, resource_string)
+        self.open_thread = None
+
+    def _open_resource(self):
+        self.open_thread = threading.current_thread()
+        time.sleep(0.2)
+        instrument = MagicMock()
+        instrument.query.return_value = "RIGOL,DS1104,1,1"
+        return instrument
+
+    async def get_info(self):
+        return MagicMock(id=f"dev_{self.resource_string}")
+
+    async def get_status(self):
+        return None
+
+    async def execute_command(self, command, parameters):
+        return None
+
+
+@pytest.fixture
+def manager():
+    SlowDevice.in_flight = 0
+    SlowDevice.max_in_flight = 0
+    manager = EquipmentManager()
+    manager.resource_manager = MagicMock()
+
+    def create(resource_string, equipment_type, model):
+        return SlowDevice(resource_string, fail=model == "BAD")
+
+    with patch.object(manager, "_create_equipment_instance", side_effect=create):
+        yield manager
+
+
+@pytest.mark.unit
+class TestBulkConnect:
+    """Test EquipmentManager.connect_devices()."""
+
+    @pytest.mark.asyncio
+    async def test_connects_concurrently_within_limit(self, manager):
+        """Test that devices connect in parallel, bounded by max_concurrent."""
+        devices = [(f"R{i}", MagicMock(), "OK") for i in range(6)]
+
+        results = await manager.connect_devices(devices, max_concurrent=3)
+
+        assert all(r["success"] for r in results)
+        assert SlowDevice.max_in_flight == 3
+        assert set(manager.equipment) == {f"dev_R{i}" for i in range(6)}
+
+    @pytest.mark.asyncio
+    async def test_reports_per_device_results(self, manager):
+        """Test that one failure does not affect the other devices."""
+        devices = [("R0", MagicMock(), "OK"), ("R1", MagicMock(), "BAD")]
+
+        results = await manager.connect_devices(devices)
+
+        assert [r["resource_string"] for r in results] == ["R0", "R1"]
+        assert results[0]["success"] and results[0]["equipment_id"] == "dev_R0"
+        assert not results[1]["success"]
+        assert results[1]["equipment_id"] is None
+        assert "IDN" in results[1]["error"]
+        assert list(manager.equipment) == ["dev_R0"]
+
+    @pytest.mark.asyncio
+    async def test_same_resource_is_serialized(self, manager):
+        """Test that two connects to one resource never overlap."""
+        await asyncio.gather(
+            manager.connect_device("R0", MagicMock(), "OK"),
+            manager.connect_device("R0", MagicMock(), "OK"),
+        )
+
+        assert SlowDevice.max_in_flight == 1
+
+    @pytest.mark.asyncio
+    async def test_resource_opens_overlap_off_the_event_loop(self, manager):
+        """Test that blocking opens run on I/O workers, not the event loop."""
+        rm = manager.resource_manager
+        devices = [BlockingOpenDevice(rm, f"R{i}") for i in range(3)]
+        manager._create_equipment_instance.side_effect = devices
+
+        start = time.monotonic()
+        results = await manager.connect_devices(
+            [(f"R{i}", MagicMock(), "X") for i in range(3)], max_concurrent=3
+        )
+        elapsed = time.monotonic() - start
+
+        assert all(r["success"] for r in results)
+        assert elapsed < 0.5
+        assert all(d.open_thread is not threading.main_thread() for d in devices)
+        for device in devices:
+            await device.disconnect()
+
+    @pytest.mark.asyncio
+    async def test_manager_checked_once_before_fan_out(self, manager):
+        """Test that equipment reconnects share one freshly checked manager."""
+        manager._resource_manager_failed = True
+        stale = [BlockingOpenDevice(MagicMock(), f"R{i}") for i in range(3)]
+        for device in stale:
+            device._resource_manager_failed = True
+
+        with patch(
+            "server.equipment.manager.is_resource_manager_usable",
+            side_effect=lambda rm, failed: not failed,
+        ), patch("server.equipment.manager.ResourceManager") as factory:
+            await manager.check_resource_manager(stale)
+
+        factory.assert_called_once()
+        for device in stale:
+            assert device.resource_manager is factory.return_value
+            assert device._is_resource_manager_valid()
+
+    @pytest.mark.asyncio
+    async def test_resource_lock_dropped_after_disconnect(self, manager):
+        """Test that connect locks do not outlive their resources."""
+        await manager.connect_device("R0", MagicMock(), "OK")
+        with pytest.raises(TimeoutError):
+            await manager.connect_device("R1", MagicMock(), "BAD")
+
+        assert list(manager._resource_locks) == ["R0"]
+
+        with patch("server.equipment.manager.settings") as settings:
+            settings.safe_state_on_disconnect = False
+            await manager.disconnect_device("dev_R0")
+
+        assert manager._resource_locks == {}
+
+
+@pytest.mark.unit
+class TestReconnectAll:
+    """Test ReconnectionHandler.reconnect_all()."""
+
+    @pytest.mark.asyncio
+    async def test_reconnects_concurrently(self):
+        """Test that reconnects run in parallel and report per device."""
+        handler = ReconnectionHandler()
+        handler.enabled = True
+        handler.max_attempts = 1
+        devices = {f"dev_{i}": SlowDevice(str(i), fail=i == 2) for i in range(4)}
+
+        results = await handler.reconnect_all(
+            {eid: d.connect for eid, d in devices.items()}, max_concurrent=4
+        )
+
+        assert results == {"dev_0": True, "dev_1": True, "dev_2": False, "dev_3": True}
+        assert SlowDevice.max_in_flight == 4
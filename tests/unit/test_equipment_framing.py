@@ -0,0 +1,143 @@
+"""Tests for terminator-framed serial transactions."""
+
+import threading
+
+import pytest
+
+from server.equipment.framing import FramedReader
+
+
+class FakeSerial:
+    """Serial resource that replies to each write with scripted chunks."""
+
+    def __init__(self, replies):
+        self.replies = dict(replies)
+        self.pending = []
+        self.written = []
+        self.flushes = 0
+        self.read_sizes = []
+        self.threads = set()
+
+    @property
+    def bytes_in_buffer(self):
+        return len(self.pending[0]) if self.pending else 0
+
+    def write(self, command):
+        self.threads.add(threading.get_ident())
+        self.written.append(command)
+        self.pending = list(self.replies[command])
+
+    def read_bytes(self, count):
+        self.threads.add(threading.get_ident())
+        self.read_sizes.append(count)
+        if not self.pending:
+            raise TimeoutError("VISA timeout")
+        chunk = self.pending[0][:count]
+        self.pending[0] = self.pending[0][count:]
+        if not self.pending[0]:
+            self.pending.pop(0)
+        return chunk
+
+    def flush(self, mask):
+        self.flushes += 1
+
+
+@pytest.mark.unit
+class TestFramedReader:
+    """Test FramedReader transactions."""
+
+    @pytest.mark.asyncio
+    async def test_reads_available_bytes_at_once(self):
+        """Test that a frame arriving in one burst takes a single read."""
+        port = FakeSerial({"GETD": [b"1200050000\rOK\r"]})
+        reader = FramedReader(port)
+
+        frame = await reader.transact("GETD", timeout=1.0)
+
+        assert frame == b"1200050000\rOK\r"
+        assert port.read_sizes == [len(frame)]
+        assert port.flushes == 1
+        reader.close()
+
+    @pytest.mark.asyncio
+    async def test_terminator_split_across_reads(self):
+        """Test a terminator that arrives across chunk boundaries."""
+        port = FakeSerial({"GOUT": [b"0\rO", b"K", b"\r"]})
+        reader = FramedReader(port)
+
+        frame = await reader.transact("GOUT", timeout=1.0)
+
+        assert frame == b"0\rOK\r"
+        assert reader.get_stats()["reads"] == 3
+        reader.close()
+
+    @pytest.mark.asyncio
+    async def test_trailing_bytes_discarded_by_next_transaction(self):
+        """Test that stale bytes do not leak into the next response."""
+        port = FakeSerial({"GETS": [b"120050\rOK\rjunk"], "GOUT": [b"1\rOK\r"]})
+        reader = FramedReader(port)
+
+        assert await reader.transact("GETS", timeout=1.0) == b"120050\rOK\r"
+        assert await reader.transact("GOUT", timeout=1.0) == b"1\rOK\r"
+        reader.close()
+
+    @pytest.mark.asyncio
+    async def test_runs_on_dedicated_thread(self):
+        """Test that all port I/O happens on one thread, not the caller's."""
+        port = FakeSerial({"GETD": [b"1\rOK\r"], "GOUT": [b"0\rOK\r"]})
+        reader = FramedReader(port, name="ASRL1")
+
+        await reader.transact("GETD", timeout=1.0)
+        await reader.transact("GOUT", timeout=1.0)
+
+        assert len(port.threads) == 1
+        assert threading.get_ident() not in port.threads
+        reader.close()
+
+    @pytest.mark.asyncio
+    async def test_missing_terminator_raises(self):
+        """Test that a reply without terminator fails and is counted."""
+        port = FakeSerial({"GMAX": [b"600050\r"]})
+        reader = FramedReader(port)
+
+        with pytest.raises(TimeoutError):
+            await reader.transact("GMAX", timeout=1.0)
+
+        stats = reader.get_stats()
+        assert stats["errors"] == 1
+        assert stats["transactions"] == 0
+        reader.close()
+
+    @pytest.mark.asyncio
+    async def test_latency_stats(self):
+        """Test that successful transactions record latency."""
+        port = FakeSerial({"GETD": [b"1\rOK\r"]})
+        reader = FramedReader(port)
+
+        for _ in range(3):
+            await reader.transact("GETD", timeout=1.0)
+
+        stats = reader.get_stats()
+        assert stats["transactions"] == 3
+        assert stats["bytes_received"] == 15
+        assert 0 <= stats["avg_latency_ms"] <= stats["max_latency_ms"]
+        assert stats["last_latency_ms"] is not None
+        reader.close()
+
+    @pytest.mark.asyncio
+    async def test_transact_many_in_one_worker_call(self):
+        """Test that a batch of transactions is a single worker call."""
+        port = FakeSerial({
+            "GETD": [b"1200050000\rOK\r"],
+            "GOUT": [b"0\rOK\r"],
+            "GETS": [b"120050\rOK\r"],
+        })
+        reader = FramedReader(port)
+
+        frames = await reader.transact_many(["GETD", "GOUT", "GETS"], timeout=1.0)
+
+        assert frames == [b"1200050000\rOK\r", b"0\rOK\r", b"120050\rOK\r"]
+        assert port.written == ["GETD", "GOUT", "GETS"]
+        assert reader.worker.get_stats()["commands"] == 1
+        assert reader.get_stats()["transactions"] == 3
+        reader.close()
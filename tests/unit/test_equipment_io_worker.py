@@ -0,0 +1,163 @@
+"""Tests for per-instrument I/O worker threads."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from server.equipment.io_worker import InstrumentIOWorker
+
+
+@pytest.mark.unit
+class TestInstrumentIOWorker:
+    """Test InstrumentIOWorker queueing and statistics."""
+
+    @pytest.mark.asyncio
+    async def test_runs_on_single_dedicated_thread(self):
+        """Test that every call runs on the same non-event-loop thread."""
+        worker = InstrumentIOWorker("TCPIP::1::INSTR")
+
+        threads = await asyncio.gather(
+            *(worker.run(threading.get_ident) for _ in range(5))
+        )
+
+        assert len(set(threads)) == 1
+        assert threads[0] != threading.get_ident()
+        worker.close()
+
+    @pytest.mark.asyncio
+    async def test_calls_are_serialized_in_order(self):
+        """Test that concurrent submissions execute one at a time, in order."""
+        worker = InstrumentIOWorker()
+        order = []
+        active = []
+
+        def command(i):
+            active.append(i)
+            assert len(active) == 1
+            time.sleep(0.005)
+            order.append(i)
+            active.remove(i)
+            return i
+
+        results = await asyncio.gather(*(worker.run(command, i) for i in range(5)))
+
+        assert results == [0, 1, 2, 3, 4]
+        assert order == [0, 1, 2, 3, 4]
+        worker.close()
+
+    @pytest.mark.asyncio
+    async def test_queue_statistics(self):
+        """Test queue depth, wait time and service time accounting."""
+        worker = InstrumentIOWorker()
+
+        await asyncio.gather(*(worker.run(time.sleep, 0.01) for _ in range(4)))
+
+        stats = worker.get_stats()
+        assert stats["commands"] == 4
+        assert stats["errors"] == 0
+        assert stats["queue_depth"] == 0
+        assert stats["in_flight"] == 0
+        assert stats["max_queue_depth"] >= 2
+        assert stats["avg_service_ms"] >= 10
+        # Later calls waited behind earlier ones
+        assert stats["max_wait_ms"] >= 20
+        worker.close()
+
+    @pytest.mark.asyncio
+    async def test_errors_propagate_and_are_counted(self):
+        """Test that exceptions reach the caller and are counted."""
+        worker = InstrumentIOWorker()
+
+        def fail():
+            raise TimeoutError("VISA timeout")
+
+        with pytest.raises(TimeoutError):
+            await worker.run(fail)
+
+        assert worker.get_stats()["errors"] == 1
+        worker.close()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_queued_call_leaves_queue(self):
+        """Test that cancelling a call that never started keeps depth accurate."""
+        worker = InstrumentIOWorker()
+        release = threading.Event()
+
+        busy = asyncio.ensure_future(worker.run(release.wait))
+        queued = asyncio.ensure_future(worker.run(time.time))
+        await asyncio.sleep(0.01)
+        assert worker.get_stats()["queue_depth"] == 1
+
+        queued.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await queued
+        release.set()
+        await busy
+
+        stats = worker.get_stats()
+        assert stats["queue_depth"] == 0
+        assert stats["in_flight"] == 0
+        assert stats["commands"] == 1
+        worker.close()
+
+    @pytest.mark.asyncio
+    async def test_closed_worker_rejects_calls(self):
+        """Test that a closed worker refuses new work."""
+        worker = InstrumentIOWorker()
+        worker.close()
+
+        with pytest.raises(RuntimeError):
+            await worker.run(time.time)
+
+
+@pytest.mark.unit
+class TestBaseEquipmentIO:
+    """Test that BaseEquipment routes VISA calls through its worker."""
+
+    def _equipment(self):
+        from server.equipment.base import BaseEquipment
+
+        class Device(BaseEquipment):
+            async def get_info(self):
+                return None
+
+            async def get_status(self):
+                return None
+
+            async def execute_command(self, command, parameters):
+                return None
+
+        device = Device(MagicMock(), "TCPIP::192.168.1.10::INSTR")
+        device.instrument = MagicMock()
+        device.instrument.query = MagicMock(
+            side_effect=lambda command: f"{threading.get_ident()}\n"
+        )
+        device.connected = True
+        device._ensure_connected = MagicMock(return_value=asyncio.sleep(0))
+        return device
+
+    @pytest.mark.asyncio
+    async def test_query_uses_instrument_worker(self):
+        """Test that queries run on the instrument's own thread."""
+        device = self._equipment()
+
+        thread_id = int(await device._query("*IDN?"))
+
+        assert thread_id != threading.get_ident()
+        assert device.get_io_stats()["commands"] == 1
+
+    @pytest.mark.asyncio
+    async def test_disconnect_stops_worker(self):
+        """Test that disconnecting closes the worker and a new one starts later."""
+        device = self._equipment()
+        await device._query("*IDN?")
+        worker = device._io_worker
+
+        await device.disconnect()
+
+        assert worker.closed
+        assert device.get_io_stats() == {}
+        assert device._get_io_worker() is not worker
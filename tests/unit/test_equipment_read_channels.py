@@ -0,0 +1,111 @@
+"""Tests for read_channels() on the real instrument drivers."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from server.equipment.bk_power_supply import BK9130B
+from server.equipment.rigol_electronic_load import RigolDL3021A
+from server.equipment.rigol_scope import RigolMSO2072A
+
+from .test_equipment_framing import FakeSerial
+
+
+class SelectingSerial(FakeSerial):
+    """Serial port of a multi-output supply: INST:NSEL is a write without reply."""
+
+    def __init__(self, readings):
+        super().__init__({})
+        self.readings = readings
+        self.selected = 1
+
+    def write(self, command):
+        if command.startswith("INST:NSEL"):
+            self.written.append(command)
+            self.selected = int(command.split()[1])
+        elif command == "GETD":
+            self.replies["GETD"] = [self.readings[self.selected]]
+            super().write(command)
+        else:
+            self.written.append(command)
+
+
+def connect(device, instrument):
+    """Attach a fake session to a driver as if connect() had run."""
+    device.instrument = instrument
+    device.connected = True
+    device._ensure_connected = MagicMock(side_effect=lambda: asyncio.sleep(0))
+    return device
+
+
+@pytest.mark.unit
+class TestReadChannels:
+    """Test read_channels() over fake sessions."""
+
+    @pytest.mark.asyncio
+    async def test_electronic_load_compound_query(self):
+        """Test that the load reads all quantities with one compound query."""
+        instrument = MagicMock()
+        instrument.query = MagicMock(return_value="12.5;1.2;15.0\n")
+        load = connect(RigolDL3021A(MagicMock(), "USB0::LOAD::INSTR"), instrument)
+
+        values = await load.read_channels(["VOLT", "CURR", "POW", "VOLT"])
+
+        assert values == [12.5, 1.2, 15.0, 12.5]
+        instrument.query.assert_called_once_with(
+            ":MEAS:VOLT?;:MEAS:CURR?;:MEAS:POW?"
+        )
+
+    @pytest.mark.asyncio
+    async def test_scope_compound_query(self):
+        """Test that the scope reads every channel in one message."""
+        instrument = MagicMock()
+        instrument.query = MagicMock(return_value="0.25;-1.5\n")
+        scope = connect(RigolMSO2072A(MagicMock(), "TCPIP::SCOPE::INSTR"), instrument)
+
+        values = await scope.read_channels(["CH1", "CH2"])
+
+        assert values == [0.25, -1.5]
+        instrument.query.assert_called_once_with(
+            ":MEAS:SOUR CHAN1;:MEAS:VAV?;:MEAS:SOUR CHAN2;:MEAS:VAV?"
+        )
+        with pytest.raises(ValueError):
+            await scope.read_channels(["CH3"])
+
+    @pytest.mark.asyncio
+    async def test_bk_supply_selects_each_channel(self):
+        """Test that a multi-output BK supply selects and reads each channel."""
+        port = SelectingSerial({1: b"1200050000\rOK\r", 3: b"0330010000\rOK\r"})
+        supply = connect(BK9130B(MagicMock(), "ASRL/dev/ttyUSB0::INSTR"), port)
+
+        values = await supply.read_channels(["CH1", "CH3", "CH1"])
+
+        assert values == [12.0, 3.3, 12.0]
+        assert port.written == ["INST:NSEL 1", "GETD", "INST:NSEL 3", "GETD"]
+        assert supply.get_io_stats()["commands"] == 1
+
+    @pytest.mark.asyncio
+    async def test_bk_supply_restores_selected_channel(self):
+        """Test that a read leaves the previously selected channel active."""
+        port = SelectingSerial({1: b"1200050000\rOK\r", 2: b"0500010000\rOK\r"})
+        supply = connect(BK9130B(MagicMock(), "ASRL/dev/ttyUSB0::INSTR"), port)
+        await supply.set_output(True, channel=2)
+
+        assert await supply.read_channels(["CH1"]) == [12.0]
+
+        assert port.selected == 2
+        assert port.written[-3:] == ["INST:NSEL 1", "GETD", "INST:NSEL 2"]
+
+    @pytest.mark.asyncio
+    async def test_bk_frames_use_the_chosen_timeout(self):
+        """Test that framed reads get the timeout picked for the call."""
+        port = FakeSerial({"GETD": [b"1200050000\rOK\r"]})
+        supply = connect(BK9130B(MagicMock(), "ASRL/dev/ttyUSB0::INSTR"), port)
+        supply.set_command_timeout("GETD", 2500)
+        reader = supply._get_reader()
+        reader.transact_many_blocking = MagicMock(return_value=[b"1\rOK\r"])
+
+        await supply._bk_query("GETD")
+
+        reader.transact_many_blocking.assert_called_once_with(["GETD"], 2.5)
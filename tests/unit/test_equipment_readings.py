@@ -0,0 +1,199 @@
+"""Tests for the shared equipment reading service."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from server.equipment.readings import ReadingService
+
+
+class FakeEquipment:
+    """Equipment that counts polls and answers after a short delay."""
+
+    def __init__(self, delay=0.01):
+        self.delay = delay
+        self.calls = []
+
+    async def execute_command(self, command, parameters):
+        self.calls.append((command, parameters))
+        await asyncio.sleep(self.delay)
+        return len(self.calls)
+
+    async def get_status(self):
+        self.calls.append(("get_status", {}))
+        return "status"
+
+
+class FakeManager:
+    def __init__(self, equipment):
+        self.equipment = equipment
+
+    def get_equipment(self, equipment_id):
+        return self.equipment.get(equipment_id)
+
+
+def make_service(**equipment):
+    return ReadingService(FakeManager(equipment))
+
+
+@pytest.mark.unit
+class TestReadingService:
+    """Test coalescing, caching and fan-out of readings."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_reads_are_single_flight(self):
+        """Test that concurrent identical reads share one poll."""
+        psu = FakeEquipment()
+        service = make_service(ps_1=psu)
+
+        values = await asyncio.gather(*(service.read("ps_1") for _ in range(5)))
+
+        assert values == [1] * 5
+        assert len(psu.calls) == 1
+        assert service.get_stats()["coalesced"] == 4
+
+    @pytest.mark.asyncio
+    async def test_max_age(self):
+        """Test that a fresh cached value is reused and a stale one is not."""
+        psu = FakeEquipment(delay=0)
+        service = make_service(ps_1=psu)
+
+        await service.read("ps_1")
+        assert await service.read("ps_1", max_age=10.0) == 1
+        assert await service.read("ps_1", max_age=0.0) == 2
+        assert service.get_stats()["cache_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_parameters_are_part_of_the_key(self):
+        """Test that different parameters are different readings."""
+        scope = FakeEquipment(delay=0)
+        service = make_service(scope_1=scope)
+
+        await asyncio.gather(
+            service.read("scope_1", "get_waveform", {"channel": 1}),
+            service.read("scope_1", "get_waveform", {"channel": 2}),
+        )
+
+        assert len(scope.calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_get_status(self):
+        """Test that get_status reads call the equipment's get_status()."""
+        psu = FakeEquipment()
+        service = make_service(ps_1=psu)
+
+        assert await service.read("ps_1", "get_status") == "status"
+
+    @pytest.mark.asyncio
+    async def test_missing_equipment(self):
+        """Test that reading unknown equipment raises LookupError."""
+        service = make_service()
+
+        with pytest.raises(LookupError):
+            await service.read("ps_missing")
+
+    @pytest.mark.asyncio
+    async def test_subscribers_share_one_poller(self):
+        """Test that subscribers are fed by one poller at the fastest rate."""
+        psu = FakeEquipment(delay=0)
+        service = make_service(ps_1=psu)
+
+        slow = service.subscribe("ps_1", interval=1.0)
+        fast = service.subscribe("ps_1", interval=0.02)
+
+        fast_values = [await fast.get() for _ in range(3)]
+        slow_value = await asyncio.wait_for(slow.get(), 0.5)
+
+        assert fast_values == sorted(fast_values)
+        assert slow_value >= fast_values[-1]
+        # One poll per reading, not one per subscriber
+        assert len(psu.calls) <= fast_values[-1] + 1
+        assert service.get_stats()["pollers"] == 1
+
+        slow.close()
+        fast.close()
+        assert service.get_stats()["pollers"] == 0
+        assert service.get_stats()["subscribers"] == 0
+
+    @pytest.mark.asyncio
+    async def test_poll_errors_reach_subscribers(self):
+        """Test that a failed poll is raised from the subscription."""
+        service = make_service()
+        subscription = service.subscribe("ps_missing", interval=0.01)
+
+        with pytest.raises(LookupError):
+            await subscription.get()
+        subscription.close()
+
+    @pytest.mark.asyncio
+    async def test_invalidate(self):
+        """Test that invalidation drops cached readings of one equipment."""
+        psu = FakeEquipment(delay=0)
+        service = make_service(ps_1=psu)
+
+        await service.read("ps_1")
+        service.invalidate("ps_1")
+
+        assert await service.read("ps_1", max_age=10.0) == 2
+
+    @pytest.mark.asyncio
+    async def test_crashed_poller_is_reported_and_forgotten(self, caplog):
+        """Test that a poller that dies is logged, cleared and reported."""
+        service = make_service(ps_1=FakeEquipment(delay=0))
+
+        async def crash(key):
+            raise RuntimeError("poller bug")
+
+        service._poll_loop = crash
+        subscription = service.subscribe("ps_1", interval=0.01)
+
+        with pytest.raises(RuntimeError):
+            await asyncio.wait_for(subscription.get(), 0.5)
+
+        assert service.get_stats()["pollers"] == 0
+        assert "poller bug" in caplog.text
+        subscription.close()
+
+
+@pytest.mark.unit
+class TestAlarmReadings:
+    """Test how the alarm manager uses the reading service."""
+
+    @pytest.mark.asyncio
+    async def test_alarm_reads_use_configured_max_age(self):
+        """Test that alarm reads accept cached values up to the setting."""
+        from server.alarm import manager as alarm_module
+
+        service = make_service(ps_1=FakeEquipment(delay=0))
+        service.read = AsyncMock(return_value=SimpleNamespace(voltage=5.0))
+
+        with patch("equipment.readings.reading_service", service), patch.object(
+            alarm_module.settings, "alarm_reading_max_age_sec", 2.5
+        ):
+            value = await alarm_module.AlarmManager()._get_parameter_value(
+                "ps_1", "voltage"
+            )
+
+        assert value == 5.0
+        service.read.assert_awaited_once_with("ps_1", "get_voltage", max_age=2.5)
+
+    @pytest.mark.asyncio
+    async def test_failed_monitoring_task_is_forgotten(self, caplog):
+        """Test that a crashed monitoring loop is logged and cleared."""
+        from server.alarm.manager import AlarmManager
+        from server.alarm.models import AlarmType
+
+        manager = AlarmManager()
+        manager._alarms["a1"] = SimpleNamespace(alarm_type=AlarmType.THRESHOLD)
+
+        async def crash(alarm_id):
+            raise RuntimeError("loop bug")
+
+        manager._monitoring_loop = crash
+        await manager._start_monitoring("a1")
+        await asyncio.sleep(0.01)
+
+        assert manager._monitoring_tasks == {}
+        assert "loop bug" in caplog.text
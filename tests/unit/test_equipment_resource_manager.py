@@ -0,0 +1,112 @@
+"""Tests for resource manager liveness tracking."""
+
+from unittest.mock import MagicMock, PropertyMock, patch
+
+import pytest
+from pyvisa.constants import StatusCode
+from pyvisa.errors import VisaIOError
+
+from server.equipment.base import (BaseEquipment, is_resource_manager_alive,
+                                   release_resource_manager)
+from server.equipment.manager import EquipmentManager
+
+
+class Device(BaseEquipment):
+    """Minimal concrete equipment."""
+
+    async def get_info(self):
+        return MagicMock(id="dev_1")
+
+    async def get_status(self):
+        return None
+
+    async def execute_command(self, command, parameters):
+        return None
+
+
+def closed_resource_manager():
+    rm = MagicMock()
+    type(rm).session = PropertyMock(side_effect=RuntimeError("Invalid session"))
+    return rm
+
+
+@pytest.mark.unit
+class TestResourceManagerLiveness:
+    """Test that liveness checks never scan the bus."""
+
+    def test_alive_checks_session_only(self):
+        """Test liveness of open, closed and missing managers."""
+        rm = MagicMock()
+
+        assert is_resource_manager_alive(rm)
+        assert not is_resource_manager_alive(closed_resource_manager())
+        assert not is_resource_manager_alive(None)
+        rm.list_resources.assert_not_called()
+
+    def test_missing_device_keeps_manager(self):
+        """Test that a device that is not found leaves the manager trusted."""
+        rm = MagicMock()
+        rm.open_resource.side_effect = VisaIOError(StatusCode.error_resource_not_found)
+        device = Device(rm, "TCPIP::192.168.1.10::INSTR")
+
+        with pytest.raises(VisaIOError):
+            device._open_resource()
+
+        assert device._is_resource_manager_valid()
+        rm.list_resources.assert_not_called()
+
+    def test_manager_error_is_confirmed_by_listing(self):
+        """Test that a manager-level error triggers a bus scan, not a rebuild."""
+        rm = MagicMock()
+        rm.open_resource.side_effect = VisaIOError(StatusCode.error_invalid_object)
+        device = Device(rm, "TCPIP::192.168.1.10::INSTR")
+
+        with pytest.raises(VisaIOError):
+            device._open_resource()
+
+        assert device._is_resource_manager_valid()
+        rm.list_resources.assert_called_once()
+
+        device._resource_manager_failed = True
+        rm.list_resources.side_effect = VisaIOError(StatusCode.error_invalid_object)
+        assert not device._is_resource_manager_valid()
+
+    def test_manager_with_open_instruments_is_not_closed(self):
+        """Test that replacing a manager never closes live instruments."""
+        rm = MagicMock()
+        rm.list_opened_resources.return_value = [MagicMock()]
+
+        release_resource_manager(rm)
+        rm.close.assert_not_called()
+
+        rm.list_opened_resources.return_value = []
+        release_resource_manager(rm)
+        rm.close.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_connect_does_not_list_resources(self):
+        """Test that connecting with a live manager skips the bus scan."""
+        rm = MagicMock()
+        rm.open_resource.return_value.query.return_value = "ACME,X,1,1.0\n"
+        manager = EquipmentManager()
+        manager.resource_manager = rm
+        device = Device(rm, "TCPIP::192.168.1.10::INSTR")
+
+        with patch.object(manager, "_create_equipment_instance", return_value=device):
+            equipment_id = await manager.connect_device(
+                "TCPIP::192.168.1.10::INSTR", MagicMock(), "X"
+            )
+
+        assert equipment_id == "dev_1"
+        rm.list_resources.assert_not_called()
+        await device.disconnect()
+
+    def test_closed_manager_is_recreated(self):
+        """Test that a closed manager is replaced on the next connect."""
+        manager = EquipmentManager()
+        manager.resource_manager = closed_resource_manager()
+
+        with patch("server.equipment.manager.ResourceManager") as factory:
+            manager._ensure_resource_manager()
+
+        assert manager.resource_manager is factory.return_value
@@ -0,0 +1,202 @@
+"""Tests for chunked RAW-mode waveform downloads from Rigol scopes."""
+
+import asyncio
+import base64
+import json
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from server.equipment.rigol_scope import RAW_CHUNK_POINTS, RigolDS1104
+
+
+class FakeScopeMemory:
+    """Instrument whose :WAV:DATA? returns the :WAV:STAR..STOP slice."""
+
+    def __init__(self, memory: np.ndarray):
+        self.memory = memory
+        self.start = 1
+        self.stop = len(memory)
+        self.commands = []
+        self.data_queries = 0
+        self.trigger_status = "AUTO"
+        self.mode = "NORM"
+
+    def write(self, message):
+        for command in message.split(";"):
+            self.commands.append(command)
+            header, _, value = command.partition(" ")
+            if header == ":WAV:STAR":
+                self.start = int(value)
+            elif header == ":WAV:STOP":
+                assert int(value) >= self.start
+                self.stop = int(value)
+            elif header == ":WAV:MODE":
+                self.mode = value
+            elif header in (":RUN", ":STOP"):
+                self.trigger_status = header[1:]
+
+    def query(self, message):
+        replies = []
+        for command in message.split(";"):
+            self.commands.append(command)
+            if command == ":TRIG:STAT?":
+                replies.append(self.trigger_status)
+            elif command == ":WAV:MODE?":
+                replies.append(self.mode)
+            elif command == ":WAV:STAR?":
+                replies.append(str(self.start))
+            elif command == ":WAV:STOP?":
+                replies.append(str(self.stop))
+            elif command == ":WAV:PRE?":
+                points = len(self.memory)
+                replies.append(f"0,2,{points},1,1e-06,-0.01,0,0.04,0,127")
+            else:
+                replies.append("0.5")
+        return ";".join(replies) + "\n"
+
+    def query_binary_values(self, command, datatype, is_big_endian, container):
+        assert container is np.ndarray
+        self.data_queries += 1
+        block = self.memory[self.start - 1:self.stop].tobytes()
+        return np.frombuffer(block, dtype="<" + datatype)
+
+
+def make_scope(memory):
+    scope = RigolDS1104(MagicMock(), "USB0::0x1AB1::0x04CE::DS1ZA1::INSTR")
+    scope.instrument = FakeScopeMemory(memory)
+    scope.connected = True
+    scope._ensure_connected = MagicMock(side_effect=lambda: asyncio.sleep(0))
+    return scope
+
+
+@pytest.mark.unit
+class TestRigolRawMemory:
+    """Test RigolDS1104.get_waveform_deep()."""
+
+    @pytest.mark.asyncio
+    async def test_reads_memory_in_chunks(self):
+        """Test that deep memory is stitched from STAR/STOP chunks in order."""
+        chunk = RAW_CHUNK_POINTS["BYTE"]
+        memory = (np.arange(chunk * 2 + 10) % 256).astype(np.uint8)
+        scope = make_scope(memory)
+        progress = []
+
+        volts, info = await scope.get_waveform_deep(
+            channel=2, progress_callback=lambda done, total: progress.append(done)
+        )
+
+        assert scope.instrument.data_queries == 3
+        assert progress == [chunk, chunk * 2, chunk * 2 + 10]
+        assert info["points"] == len(memory)
+        assert info["sample_rate"] == pytest.approx(1e6)
+        assert volts.dtype == np.float32
+        expected = (memory.astype(np.float32) - 127) * 0.04
+        np.testing.assert_allclose(volts, expected, rtol=1e-6)
+        assert ":STOP" in scope.instrument.commands
+        assert ":WAV:MODE RAW" in scope.instrument.commands
+
+    @pytest.mark.asyncio
+    async def test_word_format(self):
+        """Test that WORD format decodes 16-bit samples."""
+        memory = np.array([100, 127, 300, 1000], dtype=np.uint16)
+        scope = make_scope(memory)
+
+        volts, _ = await scope.get_waveform_deep(word=True)
+
+        assert ":WAV:FORM WORD" in scope.instrument.commands
+        np.testing.assert_allclose(volts, (memory - 127.0) * 0.04, rtol=1e-6)
+
+    @pytest.mark.asyncio
+    async def test_point_limit(self):
+        """Test that only the requested number of points is read."""
+        scope = make_scope(np.arange(100, dtype=np.uint8))
+
+        volts, info = await scope.get_waveform_deep(points=10)
+
+        assert len(volts) == 10
+        assert info["points"] == 10
+
+    @pytest.mark.asyncio
+    async def test_invalid_channel(self):
+        """Test that an out-of-range channel is rejected."""
+        scope = make_scope(np.zeros(10, dtype=np.uint8))
+
+        with pytest.raises(ValueError):
+            await scope.get_waveform_deep(channel=5)
+
+    @pytest.mark.asyncio
+    async def test_restores_run_state_and_mode(self):
+        """Test that a running scope is left running in its original mode."""
+        scope = make_scope(np.arange(10, dtype=np.uint8))
+
+        await scope.get_waveform_deep()
+
+        assert scope.instrument.mode == "NORM"
+        assert scope.instrument.trigger_status == "RUN"
+
+    @pytest.mark.asyncio
+    async def test_normal_reads_use_restored_range(self):
+        """Test that a screen read after a deep read gets the original window."""
+        chunk = RAW_CHUNK_POINTS["BYTE"]
+        memory = (np.arange(chunk + 1500) % 256).astype(np.uint8)
+        scope = make_scope(memory)
+        scope.instrument.stop = 1200
+
+        await scope.get_waveform_deep()
+        await scope.get_waveform(channel=1)
+        raw = await scope.get_waveform_raw(channel=1)
+
+        assert (scope.instrument.start, scope.instrument.stop) == (1, 1200)
+        assert len(raw) == 1200
+        assert scope.instrument.mode == "NORM"
+        assert "WAV:STAR" not in scope._settings_cache
+        assert "WAV:STOP" not in scope._settings_cache
+
+    @pytest.mark.asyncio
+    async def test_restores_after_failure(self):
+        """Test that a failed download still restores a stopped scope's mode."""
+        scope = make_scope(np.zeros(10, dtype=np.uint8))
+        scope.instrument.trigger_status = "STOP"
+        scope.instrument.mode = "MAX"
+        scope.instrument.query_binary_values = MagicMock(side_effect=OSError("gone"))
+
+        with pytest.raises(OSError):
+            await scope.get_waveform_deep()
+
+        assert scope.instrument.mode == "MAX"
+        assert scope.instrument.trigger_status == "STOP"
+        assert ":RUN" not in scope.instrument.commands
+
+
+@pytest.mark.unit
+class TestDeepWaveformEndpoint:
+    """Test the streaming deep-memory download endpoint."""
+
+    def test_streams_progress_then_data(self):
+        """Test that progress events precede the base64 voltages."""
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+
+        from server.api import waveform as waveform_api
+
+        chunk = RAW_CHUNK_POINTS["BYTE"]
+        memory = (np.arange(chunk + 5) % 256).astype(np.uint8)
+        scope = make_scope(memory)
+        manager = MagicMock()
+        manager.equipment_manager.get_equipment.return_value = scope
+        waveform_api.init_waveform_api(manager)
+        app = FastAPI()
+        app.include_router(waveform_api.router)
+
+        response = TestClient(app).post(
+            "/api/waveform/deep", json={"equipment_id": "scope_1"}
+        )
+
+        events = [json.loads(line) for line in response.text.splitlines()]
+        assert [e["type"] for e in events] == ["progress", "progress", "complete"]
+        assert events[0]["points_read"] == chunk
+        assert events[-1]["points"] == len(memory)
+        volts = np.frombuffer(base64.b64decode(events[-1]["data"]), dtype="<f4")
+        np.testing.assert_allclose(volts, (memory - 127.0) * 0.04, rtol=1e-6)
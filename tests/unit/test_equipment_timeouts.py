@@ -0,0 +1,238 @@
+"""Tests for adaptive I/O timeouts and circuit breaking."""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+from pyvisa.constants import StatusCode
+from pyvisa.errors import VisaIOError
+
+from server.equipment.base import BaseEquipment
+from server.equipment.error_handler import (CircuitOpenError, RetryHandler,
+                                            is_timeout_error)
+from server.equipment.timeouts import AdaptiveTimeout, CircuitBreaker
+
+
+class Device(BaseEquipment):
+    """Minimal concrete equipment for exercising BaseEquipment I/O."""
+
+    async def get_info(self):
+        return None
+
+    async def get_status(self):
+        return None
+
+    async def execute_command(self, command, parameters):
+        return None
+
+
+def make_device(query=None):
+    """Create a connected device with a mock instrument."""
+    device = Device(MagicMock(), "TCPIP::192.168.1.10::INSTR")
+    device.instrument = MagicMock()
+    device.instrument.query = MagicMock(side_effect=query)
+    device.connected = True
+    device._ensure_connected = MagicMock(side_effect=lambda: asyncio.sleep(0))
+    return device
+
+
+def visa_timeout():
+    return VisaIOError(StatusCode.error_timeout)
+
+
+@pytest.mark.unit
+class TestAdaptiveTimeout:
+    """Test AdaptiveTimeout."""
+
+    def test_default_until_enough_samples(self):
+        """Test that the default applies before latencies are known."""
+        timeout = AdaptiveTimeout(10000, min_samples=5)
+        for _ in range(4):
+            timeout.record(10.0)
+
+        assert timeout.timeout_ms == 10000
+
+    def test_p99_times_multiplier(self):
+        """Test that the timeout follows p99 latency times the multiplier."""
+        timeout = AdaptiveTimeout(10000, multiplier=4.0, floor_ms=10, min_samples=5)
+        for latency in [10.0] * 99 + [100.0]:
+            timeout.record(latency)
+
+        assert timeout.percentile(99) == 10.0
+        assert timeout.timeout_ms == 40
+
+        timeout.record(100.0)
+        assert timeout.timeout_ms == 400
+
+    def test_clamped_to_floor_and_ceiling(self):
+        """Test that the timeout stays within its floor and ceiling."""
+        fast = AdaptiveTimeout(10000, floor_ms=250, min_samples=1)
+        fast.record(1.0)
+        slow = AdaptiveTimeout(1000, ceiling_ms=5000, min_samples=1)
+        slow.record(3000.0)
+
+        assert fast.timeout_ms == 250
+        assert slow.timeout_ms == 5000
+
+    def test_disabled(self):
+        """Test that a disabled timeout never adapts."""
+        timeout = AdaptiveTimeout(2000, enabled=False, min_samples=1)
+        timeout.record(1.0)
+
+        assert timeout.timeout_ms == 2000
+
+
+@pytest.mark.unit
+class TestCircuitBreaker:
+    """Test CircuitBreaker."""
+
+    def test_opens_after_consecutive_timeouts(self):
+        """Test that repeated timeouts open the circuit."""
+        circuit = CircuitBreaker("dev", threshold=3, reset_sec=60)
+        for _ in range(2):
+            circuit.before_call()
+            circuit.record_timeout()
+        circuit.before_call()
+        circuit.record_success()  # Resets the count
+        for _ in range(3):
+            circuit.before_call()
+            circuit.record_timeout()
+
+        assert circuit.state == CircuitBreaker.OPEN
+        with pytest.raises(CircuitOpenError):
+            circuit.before_call()
+        assert circuit.trips == 1
+        assert circuit.rejected == 1
+
+    def test_half_open_admits_one_probe(self):
+        """Test that after the reset time one probe decides the state."""
+        circuit = CircuitBreaker("dev", threshold=1, reset_sec=0.01)
+        circuit.before_call()
+        circuit.record_timeout()
+
+        with patch("server.equipment.timeouts.time.monotonic",
+                   return_value=circuit._opened_at + 1):
+            circuit.before_call()
+            assert circuit.state == CircuitBreaker.HALF_OPEN
+            with pytest.raises(CircuitOpenError):
+                circuit.before_call()  # Probe already in flight
+
+            circuit.record_success()
+            assert circuit.state == CircuitBreaker.CLOSED
+
+    def test_failed_probe_reopens(self):
+        """Test that a probe timing out opens the circuit again."""
+        circuit = CircuitBreaker("dev", threshold=3, reset_sec=0.01)
+        for _ in range(3):
+            circuit.record_timeout()
+
+        with patch("server.equipment.timeouts.time.monotonic",
+                   return_value=circuit._opened_at + 1):
+            circuit.before_call()
+            circuit.record_timeout()
+
+        assert circuit.state == CircuitBreaker.OPEN
+        assert circuit.trips == 2
+
+
+@pytest.mark.unit
+class TestEquipmentTimeouts:
+    """Test timeouts and circuit breaking on BaseEquipment I/O."""
+
+    @pytest.mark.asyncio
+    async def test_adapts_session_timeout(self):
+        """Test that I/O runs under the adaptive timeout once learned."""
+        device = make_device(query=lambda command: "1.0\n")
+        device._timeouts = AdaptiveTimeout(10000, floor_ms=50, min_samples=1)
+
+        await device._query("MEAS:VOLT?")
+        assert device.instrument.timeout == 10000
+
+        device._timeouts.record(5.0)
+        await device._query("MEAS:VOLT?")
+        assert device.instrument.timeout == device._timeouts.timeout_ms == 50
+
+    @pytest.mark.asyncio
+    async def test_command_override(self):
+        """Test that slow commands get their fixed timeout and are not sampled."""
+        device = make_device()
+        device._timeouts = AdaptiveTimeout(2000, floor_ms=50, min_samples=1)
+        device._timeouts.record(5.0)
+
+        await device._write(":AUT")
+
+        assert device.instrument.timeout == 30000
+        assert device._timeouts.get_stats()["samples"] == 1
+
+        device.set_command_timeout(":SING", 8000)
+        assert device.io_timeout_ms([":SING"]) == (8000, False)
+        device.set_command_timeout(":AUT", None)
+        assert device.io_timeout_ms([":AUT"]) == (50, True)
+
+    @pytest.mark.asyncio
+    async def test_fails_fast_after_timeouts(self):
+        """Test that an open circuit rejects I/O without touching the device."""
+        def hang(command):
+            raise visa_timeout()
+
+        device = make_device(query=hang)
+        device._circuit = CircuitBreaker("dev", threshold=2, reset_sec=60)
+
+        for _ in range(2):
+            with pytest.raises(VisaIOError):
+                await device._query("MEAS:VOLT?")
+
+        with pytest.raises(CircuitOpenError):
+            await device._query("MEAS:VOLT?")
+        assert device.instrument.query.call_count == 2
+        assert device.get_timeout_stats()["circuit"]["state"] == "open"
+
+    @pytest.mark.asyncio
+    async def test_other_errors_do_not_trip(self):
+        """Test that errors other than timeouts leave the circuit closed."""
+        def fail(command):
+            raise VisaIOError(StatusCode.error_io)
+
+        device = make_device(query=fail)
+        device._circuit = CircuitBreaker("dev", threshold=1, reset_sec=60)
+
+        with pytest.raises(VisaIOError):
+            await device._query("MEAS:VOLT?")
+
+        assert device._circuit.state == CircuitBreaker.CLOSED
+
+
+@pytest.mark.unit
+class TestRetryHandler:
+    """Test latency-aware retries."""
+
+    def test_is_timeout_error(self):
+        """Test timeout classification of VISA and framing errors."""
+        assert is_timeout_error(visa_timeout())
+        assert is_timeout_error(TimeoutError("no terminator"))
+        assert not is_timeout_error(VisaIOError(StatusCode.error_io))
+
+    @pytest.mark.asyncio
+    async def test_circuit_open_is_not_retried(self):
+        """Test that a fast-failed call is not retried."""
+        handler = RetryHandler()
+        handler.enabled = True
+        func = MagicMock(side_effect=CircuitOpenError("dev", 5.0))
+
+        async def call():
+            return func()
+
+        with pytest.raises(CircuitOpenError):
+            await handler.execute_with_retry(call)
+        assert func.call_count == 1
+
+    def test_backoff_is_capped_and_jittered(self):
+        """Test retry delays stay within the cap, and short after timeouts."""
+        handler = RetryHandler()
+        handler.retry_delay_ms = 100
+        handler.max_delay_ms = 300
+
+        for attempt in range(5):
+            delay = handler._retry_delay_ms(attempt, ValueError())
+            assert 50 <= delay <= 300
+            assert handler._retry_delay_ms(attempt, visa_timeout()) <= 100
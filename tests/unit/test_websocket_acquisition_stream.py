@@ -0,0 +1,268 @@
+"""Tests for delta-only acquisition streaming with per-client cursors."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import numpy as np
+import pytest
+
+from server.acquisition.manager import AcquisitionManager
+from server.acquisition.models import CircularBuffer
+from server.websocket import acquisition_stream
+from server.websocket.acquisition_stream import AcquisitionCursor
+from server.websocket.frames import FrameFormat, decode_acquisition_frame
+
+try:
+    from client.utils.websocket_manager import WebSocketManager
+    CLIENT_AVAILABLE = True
+except ImportError:
+    CLIENT_AVAILABLE = False
+
+STATUS = {"state": "acquiring", "stats": {"total_samples": 0}}
+
+
+def make_manager(size=100):
+    """Create an acquisition manager with one two-channel buffer."""
+    manager = AcquisitionManager()
+    manager._buffers["acq"] = CircularBuffer(size=size, num_channels=2)
+    return manager
+
+
+def add_samples(manager, count):
+    """Append samples numbered by their sequence."""
+    buffer = manager._buffers["acq"]
+    start = buffer.sequence
+    sequence = np.arange(start, start + count, dtype=np.float64)
+    buffer.add_many(np.vstack([sequence, -sequence]), 1000.0 + sequence)
+
+
+@pytest.mark.unit
+class TestAcquisitionCursor:
+    """Test AcquisitionCursor."""
+
+    def test_sends_only_new_samples(self):
+        """Test that each update carries only samples not sent before."""
+        manager = make_manager()
+        add_samples(manager, 30)
+        cursor = AcquisitionCursor(num_samples=10)
+
+        fields, data, timestamps = cursor.next_update(manager, "acq", STATUS)
+        assert (fields["sequence"], fields["next_sequence"]) == (20, 30)
+        assert fields["state"] == "acquiring"
+        np.testing.assert_array_equal(data[0], np.arange(20, 30))
+
+        assert cursor.next_update(manager, "acq", STATUS) is None
+
+        add_samples(manager, 5)
+        fields, data, _ = cursor.next_update(manager, "acq", STATUS)
+        assert (fields["sequence"], fields["next_sequence"]) == (30, 35)
+        assert "state" not in fields and "stats" not in fields
+        np.testing.assert_array_equal(data[1], -np.arange(30, 35))
+
+    def test_status_change_alone_is_sent(self):
+        """Test that a status change is sent without samples."""
+        manager = make_manager()
+        cursor = AcquisitionCursor()
+        cursor.next_update(manager, "acq", STATUS)
+
+        stopped = {**STATUS, "state": "stopped"}
+        fields, _, timestamps = cursor.next_update(manager, "acq", stopped)
+
+        assert fields["state"] == "stopped"
+        assert len(timestamps) == 0
+        assert cursor.next_update(manager, "acq", stopped) is None
+
+    def test_reports_overwritten_samples(self):
+        """Test that a client behind the buffer learns how much it lost."""
+        manager = make_manager(size=20)
+        cursor = AcquisitionCursor()
+        cursor.next_update(manager, "acq", STATUS)
+
+        add_samples(manager, 50)
+        fields, data, _ = cursor.next_update(manager, "acq", STATUS)
+
+        assert fields["gap"] == 30
+        assert (fields["sequence"], fields["next_sequence"]) == (30, 50)
+        assert data[0, 0] == 30
+
+    def test_resync_from_sequence(self):
+        """Test that a resync resends from the requested sample with status."""
+        manager = make_manager()
+        add_samples(manager, 40)
+        cursor = AcquisitionCursor(num_samples=5)
+        cursor.next_update(manager, "acq", STATUS)
+
+        cursor.resync(25)
+        fields, data, _ = cursor.next_update(manager, "acq", STATUS)
+
+        assert fields["resync"] is True
+        assert fields["state"] == "acquiring"
+        assert (fields["sequence"], fields["next_sequence"]) == (25, 40)
+        assert not cursor.resynced
+
+    def test_large_backlog_is_split(self):
+        """Test that a client far behind catches up over several updates."""
+        manager = make_manager()
+        add_samples(manager, 25)
+        cursor = AcquisitionCursor(num_samples=25)
+
+        with patch.object(acquisition_stream, "MAX_UPDATE_SAMPLES", 10):
+            updates = [cursor.next_update(manager, "acq", STATUS) for _ in range(4)]
+
+        assert [len(u[2]) for u in updates[:3]] == [10, 10, 5]
+        assert [u[0]["sequence"] for u in updates[:3]] == [0, 10, 20]
+        assert updates[3] is None
+
+
+@pytest.mark.unit
+class TestAcquisitionStreamManager:
+    """Test delta streaming in the basic StreamManager."""
+
+    @pytest.mark.asyncio
+    async def test_clients_at_same_position_share_updates(self):
+        """Test per-client cursors, shared encoding and silence when idle."""
+        from server.websocket_server import StreamManager
+
+        manager = make_manager()
+        add_samples(manager, 10)
+        session = SimpleNamespace(
+            state="acquiring",
+            stats=MagicMock(model_dump=MagicMock(return_value={})),
+            config=SimpleNamespace(channels=["CH1", "CH2"]),
+        )
+        stream_manager = StreamManager()
+        first = MagicMock(send_bytes=AsyncMock())
+        late = MagicMock(send_bytes=AsyncMock())
+        stream_manager.subscribe_acquisition(first, "acq", 4, FrameFormat.BINARY)
+
+        ticks = iter(range(5))
+
+        def get_session(acquisition_id):
+            tick = next(ticks, None)
+            if tick == 1:
+                stream_manager.subscribe_acquisition(
+                    late, "acq", 4, FrameFormat.BINARY
+                )
+                add_samples(manager, 3)
+            elif tick == 2:
+                add_samples(manager, 2)
+            return session if tick is not None and tick < 4 else None
+
+        manager.get_session = get_session
+        with patch("acquisition.acquisition_manager", manager):
+            await stream_manager._stream_acquisition("acq", 1)
+        for subscriber in stream_manager.subscribers.values():
+            await subscriber.drain()
+            subscriber.close()
+
+        first_frames = [
+            decode_acquisition_frame(c.args[0]) for c in first.send_bytes.call_args_list
+        ]
+        assert [f["sequence"] for f in first_frames] == [6, 10, 13]
+        late_frames = [c.args[0] for c in late.send_bytes.call_args_list]
+        assert decode_acquisition_frame(late_frames[0])["sequence"] == 9
+        # Both clients are at sample 13 after the second tick
+        assert late_frames[1] is first.send_bytes.call_args_list[2].args[0]
+
+    @pytest.mark.asyncio
+    async def test_new_clients_get_their_own_backlog(self):
+        """Test that clients joining together with different num_samples differ."""
+        from server.websocket_server import StreamManager
+
+        manager = make_manager()
+        add_samples(manager, 10)
+        session = SimpleNamespace(
+            state="acquiring",
+            stats=MagicMock(model_dump=MagicMock(return_value={})),
+            config=SimpleNamespace(channels=["CH1", "CH2"]),
+        )
+        stream_manager = StreamManager()
+        short = MagicMock(send_bytes=AsyncMock())
+        long = MagicMock(send_bytes=AsyncMock())
+        stream_manager.subscribe_acquisition(short, "acq", 2, FrameFormat.BINARY)
+        stream_manager.subscribe_acquisition(long, "acq", 8, FrameFormat.BINARY)
+
+        ticks = iter([session])
+        manager.get_session = lambda acquisition_id: next(ticks, None)
+        with patch("acquisition.acquisition_manager", manager):
+            await stream_manager._stream_acquisition("acq", 1)
+        for subscriber in stream_manager.subscribers.values():
+            await subscriber.drain()
+            subscriber.close()
+
+        short_frame = decode_acquisition_frame(short.send_bytes.call_args.args[0])
+        long_frame = decode_acquisition_frame(long.send_bytes.call_args.args[0])
+        assert (short_frame["sequence"], long_frame["sequence"]) == (8, 2)
+
+    @pytest.mark.asyncio
+    async def test_stream_stops_with_last_subscriber(self):
+        """Test that a shared acquisition stream outlives all but its last client."""
+        from server.websocket_server import StreamManager, acquisition_topic
+
+        manager = make_manager()
+        manager.get_session = MagicMock(
+            return_value=SimpleNamespace(
+                state="acquiring",
+                stats=MagicMock(model_dump=MagicMock(return_value={})),
+                config=SimpleNamespace(channels=["CH1", "CH2"]),
+            )
+        )
+        stream_manager = StreamManager()
+        first = MagicMock(send_text=AsyncMock())
+        second = MagicMock(send_text=AsyncMock())
+        with patch("acquisition.acquisition_manager", manager):
+            await stream_manager.start_acquisition_stream("acq", websocket=first)
+            task = stream_manager.streaming_tasks[acquisition_topic("acq")]
+            await stream_manager.start_acquisition_stream("acq", websocket=second)
+
+            # The second client joins the running stream
+            assert stream_manager.streaming_tasks[acquisition_topic("acq")] is task
+
+            await stream_manager.stop_acquisition_stream("acq", first)
+            assert not task.cancelled()
+            assert set(stream_manager.acquisition_cursors["acq"]) == {second}
+
+            stream_manager.disconnect(second)
+            await asyncio.sleep(0)
+
+        assert task.cancelled()
+        assert acquisition_topic("acq") not in stream_manager.streaming_tasks
+        for subscriber in stream_manager.subscribers.values():
+            subscriber.close()
+
+
+@pytest.mark.unit
+@pytest.mark.skipif(not CLIENT_AVAILABLE, reason="Client dependencies not available")
+class TestClientGapDetection:
+    """Test missed update detection in the client WebSocketManager."""
+
+    @pytest.mark.asyncio
+    async def test_missed_update_requests_resync(self):
+        """Test that a jump in sequence triggers one resync request."""
+        client = WebSocketManager()
+        client._send_message = AsyncMock()
+        received = []
+        client.on_acquisition_data(received.append)
+
+        def update(sequence, next_sequence, **fields):
+            return {
+                "type": "acquisition_stream",
+                "acquisition_id": "acq",
+                "sequence": sequence,
+                "next_sequence": next_sequence,
+                **fields,
+            }
+
+        await client._handle_message(update(0, 10))
+        await client._handle_message(update(15, 20))  # 10-15 missed
+        await client._handle_message(update(20, 25))  # In flight, dropped
+        await client._handle_message(update(10, 25, resync=True))
+        await client._handle_message(update(25, 30))
+
+        assert [m["sequence"] for m in received] == [0, 10, 25]
+        client._send_message.assert_awaited_once()
+        request = client._send_message.call_args.args[0]
+        assert request["type"] == "resync_acquisition_stream"
+        assert request["sequence"] == 10
+        assert client.get_statistics()["acquisition_resyncs"] == 1
@@ -0,0 +1,193 @@
+"""Tests for binary acquisition stream frames."""
+
+import asyncio
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import numpy as np
+import pytest
+
+from server.websocket.enhanced_features import BackpressureConfig, MessagePriority
+from server.websocket.enhanced_manager import EnhancedStreamManager
+from server.websocket.frames import (FrameFormat, acquisition_data_dict,
+                                     decode_acquisition_frame,
+                                     encode_acquisition_frame,
+                                     frame_to_json_message,
+                                     is_acquisition_frame)
+
+try:
+    from client.utils.websocket_manager import \
+        decode_acquisition_frame as client_decode
+    CLIENT_AVAILABLE = True
+except ImportError:
+    CLIENT_AVAILABLE = False
+
+CHANNELS = ["CH1", "CH2", "CH3"]
+META = {
+    "type": "acquisition_stream",
+    "acquisition_id": "acq_1",
+    "state": "acquiring",
+    "stats": {"total_samples": 50},
+}
+
+
+def make_samples(num_samples=50):
+    """Create samples and timestamps at 100 Hz."""
+    rng = np.random.default_rng(0)
+    data = rng.normal(size=(len(CHANNELS), num_samples))
+    timestamps = 1_700_000_000.0 + np.arange(num_samples) * 0.01
+    return data, timestamps
+
+
+@pytest.mark.unit
+class TestAcquisitionFrames:
+    """Test encoding and decoding of acquisition frames."""
+
+    def test_round_trip(self):
+        """Test that samples and metadata survive a round trip exactly."""
+        data, timestamps = make_samples()
+
+        frame = encode_acquisition_frame(META, CHANNELS, data, timestamps)
+        message = decode_acquisition_frame(frame)
+
+        assert is_acquisition_frame(frame)
+        assert message["acquisition_id"] == "acq_1"
+        assert message["stats"] == {"total_samples": 50}
+        assert message["channels"] == CHANNELS
+        assert message["data"]["count"] == 50
+        np.testing.assert_array_equal(message["data"]["timestamps"], timestamps)
+        for i, channel in enumerate(CHANNELS):
+            np.testing.assert_array_equal(message["data"]["values"][channel], data[i])
+
+    def test_float32_timestamps(self):
+        """Test that float32 offsets shrink the frame and keep microseconds."""
+        data, timestamps = make_samples()
+
+        frame64 = encode_acquisition_frame(META, CHANNELS, data, timestamps)
+        frame32 = encode_acquisition_frame(
+            META, CHANNELS, data, timestamps, timestamp_dtype="float32"
+        )
+        decoded = decode_acquisition_frame(frame32)["data"]["timestamps"]
+
+        assert len(frame64) - len(frame32) == 50 * 4
+        np.testing.assert_allclose(decoded, timestamps, rtol=0, atol=1e-6)
+
+    def test_much_smaller_than_json(self):
+        """Test the binary frame against the JSON message it replaces."""
+        data, timestamps = make_samples(100)
+        json_message = {
+            **META,
+            "data": acquisition_data_dict(CHANNELS, data, timestamps),
+        }
+
+        frame = encode_acquisition_frame(META, CHANNELS, data, timestamps)
+
+        assert len(frame) * 2 < len(json.dumps(json_message))
+
+    def test_status_only_frame(self):
+        """Test that a frame without samples decodes with data None."""
+        frame = encode_acquisition_frame(META, CHANNELS, np.array([]), np.array([]))
+
+        assert decode_acquisition_frame(frame)["data"] is None
+
+    def test_rejects_other_payloads(self):
+        """Test that a compressed JSON message is not taken for a frame."""
+        payload = b"z" + bytes(40)
+
+        assert not is_acquisition_frame(payload)
+        with pytest.raises(ValueError):
+            decode_acquisition_frame(payload)
+
+    def test_json_equivalent(self):
+        """Test conversion of a frame back to the JSON message format."""
+        data, timestamps = make_samples(3)
+        frame = encode_acquisition_frame(META, CHANNELS, data, timestamps)
+
+        message = frame_to_json_message(frame)
+
+        assert message["data"] == acquisition_data_dict(CHANNELS, data, timestamps)
+        json.dumps(message)
+
+    @pytest.mark.skipif(
+        not CLIENT_AVAILABLE, reason="Client dependencies not available"
+    )
+    def test_client_decoder(self):
+        """Test that the client decodes server frames."""
+        data, timestamps = make_samples()
+        frame = encode_acquisition_frame(
+            META, CHANNELS, data.astype(np.float32), timestamps
+        )
+
+        message = client_decode(frame)
+
+        assert message["data"]["values"]["CH2"].dtype == np.float32
+        np.testing.assert_array_equal(
+            message["data"]["values"]["CH2"], data[1].astype(np.float32)
+        )
+        np.testing.assert_array_equal(message["data"]["timestamps"], timestamps)
+
+
+@pytest.mark.unit
+class TestAcquisitionFrameStreaming:
+    """Test sending acquisition frames over WebSocket."""
+
+    @pytest.mark.asyncio
+    async def test_stream_sends_binary_frames(self):
+        """Test that a binary acquisition stream broadcasts encoded frames."""
+        from server.websocket_server import StreamManager
+
+        data, timestamps = make_samples(10)
+        session = SimpleNamespace(
+            state="acquiring",
+            stats=MagicMock(model_dump=MagicMock(return_value={"total_samples": 10})),
+            config=SimpleNamespace(channels=CHANNELS),
+        )
+        acquisition_manager = MagicMock()
+        acquisition_manager.get_session.side_effect = [session, None]
+        acquisition_manager.get_buffer_sequence.return_value = 10
+        acquisition_manager.get_buffer_data_since.return_value = (
+            data, timestamps, 10, 0
+        )
+
+        manager = StreamManager()
+        websocket = MagicMock(send_bytes=AsyncMock(), send_json=AsyncMock())
+        manager.subscribe_acquisition(
+            websocket, "acq_1", frame_format=FrameFormat.BINARY
+        )
+
+        with patch("acquisition.acquisition_manager", acquisition_manager):
+            await manager._stream_acquisition("acq_1", 1)
+        await manager.subscribers[websocket].drain()
+        manager.disconnect(websocket)
+
+        frame = websocket.send_bytes.call_args.args[0]
+        message = decode_acquisition_frame(frame)
+        assert message["acquisition_id"] == "acq_1"
+        np.testing.assert_array_equal(message["data"]["values"]["CH3"], data[2])
+        websocket.send_json.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_enhanced_manager_sends_frames_as_is(self):
+        """Test that queued frames bypass JSON encoding and compression."""
+        manager = EnhancedStreamManager(
+            backpressure_config=BackpressureConfig(rate_limit_enabled=False)
+        )
+        websocket = MagicMock(
+            accept=AsyncMock(), send_bytes=AsyncMock(), send_text=AsyncMock()
+        )
+        await manager.connect(websocket, "client_1")
+
+        data, timestamps = make_samples(5)
+        frame = encode_acquisition_frame(META, CHANNELS, data, timestamps)
+        await manager.send_to_client("client_1", frame, MessagePriority.NORMAL)
+
+        for _ in range(100):
+            if websocket.send_bytes.called:
+                break
+            await asyncio.sleep(0.01)
+        manager.disconnect("client_1")
+
+        websocket.send_bytes.assert_called_once_with(frame)
+        capabilities = websocket.send_text.call_args.args[0]
+        assert manager.stats["total_bytes_sent"] == len(capabilities) + len(frame)
@@ -0,0 +1,149 @@
+"""Tests for topic-based WebSocket fan-out."""
+
+import asyncio
+import json
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from server.websocket import pubsub
+from server.websocket.enhanced_features import CompressionType
+from server.websocket.pubsub import EncodedMessage, Subscriber, TopicHub
+
+
+def make_websocket():
+    """Create a mock WebSocket."""
+    return MagicMock(send_text=AsyncMock(), send_bytes=AsyncMock())
+
+
+@pytest.mark.unit
+class TestEncodedMessage:
+    """Test EncodedMessage."""
+
+    def test_json_message(self):
+        """Test compact JSON encoding with ISO datetimes."""
+        message = EncodedMessage({"type": "x", "at": datetime(2024, 1, 2, 3, 4, 5)})
+
+        assert json.loads(message.text) == {"type": "x", "at": "2024-01-02T03:04:05"}
+        assert message.data is None
+        assert message.size == len(message.text)
+
+    def test_compressed_once(self):
+        """Test that each compression type is computed once."""
+        message = EncodedMessage({"values": list(range(100))})
+
+        with patch.object(
+            pubsub.MessageCompressor, "compress", return_value=b"c"
+        ) as compress:
+            message.compressed(CompressionType.ZLIB)
+            message.compressed(CompressionType.ZLIB)
+
+        compress.assert_called_once()
+
+
+@pytest.mark.unit
+class TestTopicHub:
+    """Test TopicHub."""
+
+    @pytest.mark.asyncio
+    async def test_publish_encodes_once_for_subscribers(self):
+        """Test that only subscribers receive the message, encoded once."""
+        hub = TopicHub()
+        subscribers = [Subscriber(make_websocket()) for _ in range(3)]
+        for subscriber in subscribers:
+            subscriber.start()
+        hub.subscribe("a", subscribers[0])
+        hub.subscribe("a", subscribers[1])
+        hub.subscribe("b", subscribers[2])
+
+        with patch.object(pubsub.json, "dumps", wraps=json.dumps) as dumps:
+            assert hub.publish("a", {"type": "stream_data"}) == 2
+        for subscriber in subscribers:
+            await subscriber.drain()
+            subscriber.close()
+
+        dumps.assert_called_once()
+        first, second, other = (s.websocket.send_text for s in subscribers)
+        assert first.call_args.args[0] is second.call_args.args[0]
+        other.assert_not_called()
+
+    def test_publish_without_subscribers_skips_encoding(self):
+        """Test that nothing is encoded for a topic nobody follows."""
+        hub = TopicHub()
+
+        with patch.object(pubsub, "EncodedMessage") as encoded:
+            assert hub.publish("a", {"type": "stream_data"}) == 0
+
+        encoded.assert_not_called()
+
+    def test_unsubscribe_all_reports_emptied_topics(self):
+        """Test that topics left without subscribers are reported."""
+        hub = TopicHub()
+        first, second = Subscriber(make_websocket()), Subscriber(make_websocket())
+        hub.subscribe("a", first)
+        hub.subscribe("b", first)
+        hub.subscribe("b", second)
+
+        assert hub.unsubscribe_all(first) == ["a"]
+        assert hub.topics() == ["b"]
+        assert hub.unsubscribe("b", second) == 0
+
+
+@pytest.mark.unit
+class TestSubscriber:
+    """Test Subscriber."""
+
+    @pytest.mark.asyncio
+    async def test_slow_subscriber_does_not_block_others(self):
+        """Test that a stalled client neither delays others nor the publisher."""
+        stalled = asyncio.Event()
+
+        async def stall(text):
+            await stalled.wait()
+
+        slow_websocket = make_websocket()
+        slow_websocket.send_text.side_effect = stall
+        slow = Subscriber(slow_websocket, max_queue_size=2)
+        fast = Subscriber(make_websocket())
+        hub = TopicHub()
+        for subscriber in (slow, fast):
+            subscriber.start()
+            hub.subscribe("a", subscriber)
+
+        hub.publish("a", {"n": 0})
+        await asyncio.sleep(0)
+        for i in range(1, 5):
+            hub.publish("a", {"n": i})
+        await fast.drain()
+
+        assert fast.messages_sent == 5
+        assert slow.messages_sent == 0
+        # One message is in flight, the queue holds the two newest
+        assert slow.messages_dropped == 2
+        assert slow.queue_size == 2
+
+        stalled.set()
+        await slow.drain()
+        sent = [
+            json.loads(c.args[0])["n"] for c in slow_websocket.send_text.call_args_list
+        ]
+        assert sent == [0, 3, 4]
+        slow.close()
+        fast.close()
+
+    @pytest.mark.asyncio
+    async def test_send_error_reported_once(self):
+        """Test that a failed send stops the subscriber and reports it."""
+        websocket = make_websocket()
+        websocket.send_bytes.side_effect = RuntimeError("closed")
+        on_error = MagicMock()
+        subscriber = Subscriber(websocket, on_error=on_error)
+        subscriber.start()
+
+        subscriber.enqueue(EncodedMessage(b"frame"))
+        subscriber.enqueue(EncodedMessage(b"frame"))
+        await asyncio.sleep(0.01)
+
+        on_error.assert_called_once_with(subscriber)
+        assert websocket.send_bytes.await_count == 1